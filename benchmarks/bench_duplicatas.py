@@ -0,0 +1,50 @@
+"""Benchmark da detecção de quase-duplicatas (MinHash/LSH).
+
+Uso:
+    PYTHONPATH=. python benchmarks/bench_duplicatas.py [quantidade]
+"""
+import random
+import sys
+import time
+
+from modelo.duplicatas import DetectorDuplicatas
+
+SILABAS = ["ma", "ri", "an", "jo", "se", "lu", "ca", "ro", "pe", "dro",
+           "li", "na", "ta", "fe", "be", "to", "ra", "el", "vi", "go"]
+
+
+def gerar_textos(quantidade: int, taxa_copias: float = 0.2, semente: int = 42) -> list:
+    """Textos aleatórios, parte deles cópias de anteriores com uma palavra trocada."""
+    aleatorio = random.Random(semente)
+    vocabulario = ["".join(aleatorio.choice(SILABAS) for _ in range(aleatorio.randint(2, 4)))
+                   for _ in range(5000)]
+    textos = []
+    for _ in range(quantidade):
+        if textos and aleatorio.random() < taxa_copias:
+            palavras = aleatorio.choice(textos).split()
+            palavras[aleatorio.randrange(len(palavras))] = aleatorio.choice(vocabulario)
+        else:
+            palavras = [aleatorio.choice(vocabulario) for _ in range(aleatorio.randint(6, 12))]
+            palavras.append(str(aleatorio.randrange(10 ** 6)))
+        textos.append(" ".join(palavras))
+    return textos
+
+
+def main(quantidade: int = 100_000) -> None:
+    textos = gerar_textos(quantidade)
+    detector = DetectorDuplicatas()
+
+    inicio = time.perf_counter()
+    suspeitas = sum(bool(detector.adicionar(i, texto)) for i, texto in enumerate(textos))
+    total = time.perf_counter() - inicio
+    print(f"indexação de {quantidade} textos: {total:.2f} s "
+          f"({total / quantidade * 1e6:.1f} µs/texto, {suspeitas} suspeitas)")
+
+    inicio = time.perf_counter()
+    grupos = detector.agrupar()
+    print(f"agrupar(): {time.perf_counter() - inicio:.2f} s, {len(grupos)} grupos, "
+          f"{sum(map(len, grupos))} tarefas")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
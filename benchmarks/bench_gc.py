@@ -0,0 +1,105 @@
+"""Benchmark das pausas do coletor cíclico com um modelo grande em memória.
+
+Mede a coleta completa e as pausas enquanto o modelo cresce (criação,
+conclusão e remoção de tarefas), com o modelo rastreado pelo coletor e
+depois de ``congelar_para_coletor``; por fim, confere que o modelo inteiro é
+liberado pela contagem de referências (nenhum objeto inalcançável).
+
+Uso:
+    PYTHONPATH=. python benchmarks/bench_gc.py [tarefas]
+"""
+import gc
+import sys
+import time
+from datetime import date, timedelta
+
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.membro import Membro
+from modelo.projeto import Projeto
+
+PROJETOS = 200
+MEMBROS = 50
+
+
+def montar() -> GerenciadorProjetos:
+    gerenciador = GerenciadorProjetos()
+    for m in range(MEMBROS):
+        gerenciador.cadastrar_membro(Membro(f"Membro {m}", "Dev"))
+    hoje = date.today()
+    for p in range(PROJETOS):
+        gerenciador.adicionar_projeto(Projeto(f"Projeto {p}", "", hoje + timedelta(days=90)))
+        for k in range(5):
+            gerenciador.adicionar_membro_projeto(f"Projeto {p}", f"Membro {(p + k) % MEMBROS}")
+    return gerenciador
+
+
+def crescer(gerenciador: GerenciadorProjetos, inicio: int, quantidade: int) -> None:
+    """Cria tarefas (um terço concluídas) e remove uma a cada dez já criadas."""
+    hoje = date.today()
+    for i in range(inicio, inicio + quantidade):
+        p = i % PROJETOS
+        tarefa = gerenciador.criar_tarefa(f"Projeto {p}", f"Tarefa {i}", "",
+                                          f"Membro {(p + i % 5) % MEMBROS}",
+                                          prazo=hoje + timedelta(days=i % 60))
+        if i % 3 == 0:
+            tarefa.concluir()
+        if i % 10 == 9:
+            gerenciador.remover_tarefa(f"Projeto {p}", f"Tarefa {i}")
+
+
+def medir_pausas(rotulo: str, acao) -> None:
+    pausas = {0: [], 1: [], 2: []}
+    marca = [0.0]
+
+    def cronometro(fase, info):
+        if fase == "start":
+            marca[0] = time.perf_counter()
+        else:
+            pausas[info["generation"]].append(time.perf_counter() - marca[0])
+
+    gc.callbacks.append(cronometro)
+    try:
+        inicio = time.perf_counter()
+        acao()
+        total = time.perf_counter() - inicio
+    finally:
+        gc.callbacks.remove(cronometro)
+    todas = [p for lista in pausas.values() for p in lista]
+    print(f"{rotulo}: {total:.1f} s; {len(pausas[2])} coletas completas, "
+          f"maior pausa {max(todas, default=0) * 1000:.1f} ms, "
+          f"soma das pausas {sum(todas) * 1000:.0f} ms")
+
+
+def coleta_completa() -> float:
+    inicio = time.perf_counter()
+    gc.collect()
+    return (time.perf_counter() - inicio) * 1000
+
+
+def main(quantidade: int = 1_000_000) -> None:
+    gerenciador = montar()
+    medir_pausas(f"montagem com {quantidade} tarefas",
+                 lambda: crescer(gerenciador, 0, quantidade))
+    acrescimo = max(1000, quantidade // 2)
+    print(f"rastreado: coleta completa {coleta_completa():.1f} ms")
+    medir_pausas(f"rastreado: +{acrescimo} tarefas",
+                 lambda: crescer(gerenciador, quantidade, acrescimo))
+
+    print(f"congelados {gerenciador.congelar_para_coletor()} objetos")
+    print(f"congelado: coleta completa {coleta_completa():.1f} ms")
+    medir_pausas(f"congelado: +{acrescimo} tarefas",
+                 lambda: crescer(gerenciador, quantidade + acrescimo, acrescimo))
+
+    gc.unfreeze()
+    gc.collect()
+    gc.disable()
+    inicio = time.perf_counter()
+    del gerenciador
+    liberacao = (time.perf_counter() - inicio) * 1000
+    print(f"liberação por contagem de referências: {liberacao:.0f} ms, "
+          f"{gc.collect()} objetos inalcançáveis restantes")
+    gc.enable()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,62 @@
+"""Benchmark das operações por nome contra as mesmas operações por id.
+
+Uso:
+    PYTHONPATH=. python benchmarks/bench_ids.py [tarefas]
+"""
+import sys
+import time
+
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.membro import Membro
+from modelo.projeto import Projeto
+
+
+def preparar(projetos: int = 100, membros: int = 20) -> GerenciadorProjetos:
+    gerenciador = GerenciadorProjetos()
+    for m in range(membros):
+        gerenciador.cadastrar_membro(Membro(f"Membro Com Nome Longo {m}", "Dev"))
+    for p in range(projetos):
+        gerenciador.adicionar_projeto(Projeto(f"Projeto Com Nome Longo {p}", "Benchmark"))
+        for m in range(membros):
+            gerenciador.adicionar_membro_projeto(f"Projeto Com Nome Longo {p}",
+                                                 f"Membro Com Nome Longo {m}")
+    return gerenciador
+
+
+def medir(rotulo: str, quantidade: int, operacao) -> None:
+    inicio = time.perf_counter()
+    for i in range(quantidade):
+        operacao(i)
+    total = time.perf_counter() - inicio
+    print(f"{rotulo}: {total:.2f} s ({quantidade / total:,.0f} op/s)")
+
+
+def main(quantidade: int = 100_000) -> None:
+    projetos, membros = 100, 20
+    g = preparar(projetos, membros)
+    nomes_projeto = [p.nome for p in g.projetos]
+    nomes_membro = [m.nome for m in g.membros]
+    medir("criar_tarefa (nomes)", quantidade, lambda i: g.criar_tarefa(
+        nomes_projeto[i % projetos], f"Nome {i}", "", nomes_membro[i % membros]))
+    titulos = [(t.titulo, g._projeto_da_tarefa[t].nome) for t in g.tarefas]
+    medir("concluir_tarefa (nomes)", quantidade,
+          lambda i: g.concluir_tarefa(titulos[i][1], titulos[i][0]))
+
+    g = preparar(projetos, membros)
+    ids_projeto = [p.id for p in g.projetos]
+    ids_membro = [m.id for m in g.membros]
+    ids_tarefa = []
+    medir("criar_tarefa_por_id", quantidade, lambda i: ids_tarefa.append(g.criar_tarefa_por_id(
+        ids_projeto[i % projetos], f"Id {i}", "", ids_membro[i % membros]).id))
+    medir("concluir_tarefa_por_id", quantidade,
+          lambda i: g.concluir_tarefa_por_id(ids_tarefa[i]))
+
+    # Só a resolução, sem o custo de manter os índices
+    medir("buscar_projeto + buscar_membro", quantidade, lambda i: (
+        g.buscar_projeto(nomes_projeto[i % projetos]), g.buscar_membro(nomes_membro[i % membros])))
+    medir("projeto_por_id + membro_por_id", quantidade, lambda i: (
+        g.projeto_por_id(ids_projeto[i % projetos]), g.membro_por_id(ids_membro[i % membros])))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
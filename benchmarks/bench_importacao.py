@@ -0,0 +1,69 @@
+"""Benchmark do custo de importação do pacote (``python -X importtime``).
+
+Cada cenário roda num interpretador novo; o custo é a soma do tempo próprio
+dos módulos que o cenário importa além dos da inicialização do Python
+(``-c pass``), na mediana das repetições. Com ``orcamento_ms``, o script
+termina com código 1 se algum cenário passar do orçamento.
+
+Uso:
+    PYTHONPATH=. python benchmarks/bench_importacao.py [repeticoes] [orcamento_ms]
+"""
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+CENARIOS = {
+    "import modelo": "import modelo",
+    "modelo.GerenciadorProjetos": "import modelo; modelo.GerenciadorProjetos",
+    "gerenciador + camada fria": ("from modelo.gerenciador import GerenciadorProjetos; "
+                                  "GerenciadorProjetos().configurar_armazenamento_frio()"),
+    "gerenciador + duplicatas": ("from modelo.gerenciador import GerenciadorProjetos; "
+                                 "GerenciadorProjetos().ativar_deteccao_duplicatas()"),
+}
+
+
+def tempos_importacao(codigo: str) -> Dict[str, int]:
+    """Tempo próprio (µs) de cada módulo importado ao executar ``codigo``."""
+    saida = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo],
+                           capture_output=True, text=True, check=True,
+                           env=dict(os.environ, PYTHONPATH=os.getcwd())).stderr
+    tempos = {}
+    for linha in saida.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        proprio, _, nome = linha[len("import time:"):].split("|")
+        tempos[nome.strip()] = int(proprio)
+    return tempos
+
+
+def medir(codigo: str, base: set, repeticoes: int) -> Tuple[float, List[Tuple[str, int]]]:
+    totais = []
+    por_modulo: Dict[str, List[int]] = {}
+    for _ in range(repeticoes):
+        tempos = {nome: us for nome, us in tempos_importacao(codigo).items() if nome not in base}
+        totais.append(sum(tempos.values()))
+        for nome, us in tempos.items():
+            por_modulo.setdefault(nome, []).append(us)
+    maiores = sorted(((nome, int(statistics.median(us))) for nome, us in por_modulo.items()),
+                     key=lambda par: -par[1])[:5]
+    return statistics.median(totais) / 1000, maiores
+
+
+def main(repeticoes: int = 7, orcamento_ms: Optional[float] = None) -> int:
+    base = set(tempos_importacao("pass"))
+    estourou = False
+    for rotulo, codigo in CENARIOS.items():
+        total, maiores = medir(codigo, base, repeticoes)
+        aviso = ""
+        if orcamento_ms is not None and total > orcamento_ms:
+            aviso, estourou = f"  ACIMA DO ORÇAMENTO ({orcamento_ms:.1f} ms)", True
+        print(f"{rotulo}: {total:.1f} ms{aviso}")
+        print("    " + ", ".join(f"{nome} {us / 1000:.1f}" for nome, us in maiores))
+    return 1 if estourou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 7,
+                  float(sys.argv[2]) if len(sys.argv) > 2 else None))
@@ -0,0 +1,37 @@
+"""Benchmark da migração de projetos legados (refatoracao) para o modelo.
+
+Uso:
+    PYTHONPATH=. python benchmarks/bench_migracao.py [projetos] [tarefas_por_projeto]
+"""
+import sys
+
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.migracao import MigradorLegado
+from refatoracao import entidades_principais as legado
+
+
+def gerar_projetos(quantidade: int, tarefas: int, membros: int = 500):
+    """Projetos legados gerados sob demanda, com membros repetidos entre eles."""
+    for p in range(quantidade):
+        projeto = legado.Projeto(f"Projeto {p}", "31/12/2030", "Migrado")
+        nomes = [f"Membro {(p * 3 + k) % membros}" for k in range(5)]
+        for nome in nomes:
+            projeto.adicionar_membro(nome, "Dev")
+        for t in range(tarefas):
+            projeto.adicionar_tarefa(f"Tarefa {p}-{t}", "", nomes[t % 5].upper())
+            if t % 3 == 0:
+                projeto.tarefas[-1].concluir()
+        yield projeto
+
+
+def main(projetos: int = 2000, tarefas: int = 50) -> None:
+    migrador = MigradorLegado(GerenciadorProjetos())
+    relatorio = migrador.migrar(gerar_projetos(projetos, tarefas))
+    print(f"{relatorio.projetos} projetos, {relatorio.tarefas} tarefas, "
+          f"{relatorio.membros} membros em {relatorio.segundos:.2f} s "
+          f"({relatorio.tarefas_por_segundo:,.0f} tarefas/s)")
+    print(f"anomalias: {relatorio.anomalias or 'nenhuma'}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
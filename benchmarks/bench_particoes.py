@@ -0,0 +1,80 @@
+"""Benchmark de vazão de escrita do gerenciador particionado por número de partições.
+
+Cada rodada cria tarefas e depois inicia e conclui todas, em lotes
+enviados com ``executar_lote``; a linha de base é um único
+``GerenciadorProjetos`` no próprio processo. A escala só aparece com
+núcleos livres (uma partição por núcleo).
+
+Uso:
+    PYTHONPATH=. python benchmarks/bench_particoes.py [tarefas] [max_particoes]
+"""
+import os
+import sys
+import time
+
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.membro import Membro
+from modelo.particionamento import GerenciadorParticionado
+from modelo.projeto import Projeto
+
+PROJETOS = 200
+MEMBROS = 20
+LOTE = 5000
+
+
+def operacoes(quantidade: int) -> list:
+    criar, iniciar, concluir = [], [], []
+    for i in range(quantidade):
+        projeto = f"Projeto {i % PROJETOS}"
+        titulo = f"Tarefa {i}"
+        criar.append(("criar_tarefa", (projeto, titulo, "Desc", f"Membro {i % MEMBROS}"), {}))
+        iniciar.append(("iniciar_tarefa", (projeto, titulo), {}))
+        concluir.append(("concluir_tarefa", (projeto, titulo), {}))
+    return criar + iniciar + concluir
+
+
+def preparar(gerenciador) -> None:
+    for m in range(MEMBROS):
+        gerenciador.cadastrar_membro(Membro(f"Membro {m}", "Dev"))
+    for p in range(PROJETOS):
+        nome = f"Projeto {p}"
+        gerenciador.adicionar_projeto(Projeto(nome, "Desc"))
+        for m in range(MEMBROS):
+            gerenciador.adicionar_membro_projeto(nome, f"Membro {m}")
+
+
+def medir_unico(lista: list) -> float:
+    gerenciador = GerenciadorProjetos()
+    preparar(gerenciador)
+    inicio = time.perf_counter()
+    for metodo, args, kwargs in lista:
+        getattr(gerenciador, metodo)(*args, **kwargs)
+    return len(lista) / (time.perf_counter() - inicio)
+
+
+def medir_particionado(lista: list, particoes: int) -> float:
+    with GerenciadorParticionado(particoes) as gerenciador:
+        preparar(gerenciador)
+        inicio = time.perf_counter()
+        for posicao in range(0, len(lista), LOTE):
+            for resultado in gerenciador.executar_lote(lista[posicao:posicao + LOTE]):
+                if isinstance(resultado, Exception):
+                    raise resultado
+        return len(lista) / (time.perf_counter() - inicio)
+
+
+def main(tarefas: int = 50_000, max_particoes: int = 0) -> None:
+    max_particoes = max_particoes or os.cpu_count() or 1
+    lista = operacoes(tarefas)
+    print(f"{len(lista)} operações, {os.cpu_count()} núcleos")
+    base = medir_unico(lista)
+    print(f"{'processo único':<20} {base:12,.0f} ops/s")
+    particoes = 1
+    while particoes <= max_particoes:
+        vazao = medir_particionado(lista, particoes)
+        print(f"{f'{particoes} partição(ões)':<20} {vazao:12,.0f} ops/s  ({vazao / base:.2f}x)")
+        particoes *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
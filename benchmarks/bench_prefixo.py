@@ -0,0 +1,63 @@
+"""Benchmark da busca por prefixo (autocompletar) com 100 mil nomes.
+
+Uso:
+    PYTHONPATH=. python benchmarks/bench_prefixo.py [quantidade]
+"""
+import random
+import sys
+import time
+
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.membro import Membro
+
+SILABAS = ["ma", "ri", "an", "jo", "se", "lu", "ca", "ro", "pe", "dro",
+           "li", "na", "ta", "fe", "be", "to", "ra", "el", "vi", "go"]
+
+
+def gerar_nomes(quantidade: int, semente: int = 42) -> list:
+    aleatorio = random.Random(semente)
+    nomes = set()
+    while len(nomes) < quantidade:
+        primeiro = "".join(aleatorio.choice(SILABAS) for _ in range(aleatorio.randint(2, 4)))
+        ultimo = "".join(aleatorio.choice(SILABAS) for _ in range(aleatorio.randint(2, 4)))
+        nomes.add(f"{primeiro.title()} {ultimo.title()}")
+    return sorted(nomes, key=lambda _: aleatorio.random())
+
+
+def medir(descricao: str, funcao, repeticoes: int) -> None:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    total = time.perf_counter() - inicio
+    print(f"{descricao:<40} {total / repeticoes * 1e6:10.1f} µs/op")
+
+
+def main(quantidade: int = 100_000) -> None:
+    nomes = gerar_nomes(quantidade)
+    gerenciador = GerenciadorProjetos()
+
+    inicio = time.perf_counter()
+    for nome in nomes:
+        gerenciador.cadastrar_membro(Membro(nome, "Dev"))
+    print(f"cadastro de {quantidade} membros: {time.perf_counter() - inicio:.2f} s")
+
+    aleatorio = random.Random(7)
+    prefixos = [nome[:aleatorio.randint(1, 6)] for nome in aleatorio.sample(nomes, 200)]
+    com_erro = [p[:-1] + "x" if len(p) > 2 else p for p in prefixos]
+    membros = gerenciador.membros
+
+    def varredura():
+        prefixo = aleatorio.choice(prefixos).lower()
+        return [m for m in membros if m.nome.lower().startswith(prefixo)][:10]
+
+    medir("varredura linear (referência)", varredura, 20)
+    medir("buscar_membro (exato)",
+          lambda: gerenciador.buscar_membro(aleatorio.choice(nomes)), 10_000)
+    medir("sugerir_membros (top 10)",
+          lambda: gerenciador.sugerir_membros(aleatorio.choice(prefixos)), 10_000)
+    medir("sugerir_membros (tolerância, top 10)",
+          lambda: gerenciador.sugerir_membros(aleatorio.choice(com_erro), tolerancia=True), 500)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,276 @@
+"""Gerador de carga sintética e reprodução de traces contra um gerenciador.
+
+O trace é uma sequência de operações do gerenciador, cada uma um par
+``(operacao, argumentos)`` serializável em JSON (uma por linha):
+
+- preparação: ``cadastrar_membro``, ``adicionar_projeto`` e
+  ``adicionar_membro_projeto``;
+- regime: ``criar_tarefa``, ``iniciar_tarefa``, ``concluir_tarefa``
+  (escritas) e ``relatorio_projeto``, ``relatorio_membro`` (leituras),
+  na proporção dada por ``escrita``.
+
+Projetos são escolhidos por uma distribuição de Zipf (poucos projetos
+concentram a maior parte das tarefas e consultas) e uma fração de membros
+"quentes" participa de mais projetos e recebe a maior parte das tarefas.
+Iniciar e concluir sempre se referem a tarefas que o próprio trace criou
+e que estão no status certo, então o trace reproduz sem erros.
+
+``reproduzir`` executa o trace contra qualquer objeto com essa API
+(``GerenciadorProjetos``, ``GerenciadorParticionado``...) e mede, por
+tipo de operação, a vazão e os percentis de latência.
+
+Uso:
+    PYTHONPATH=. python benchmarks/carga.py [operacoes] [--escrita 0.5] [--zipf 1.1]
+        [--quentes 0.1] [--peso-quentes 0.6] [--alvo gerenciador|particionado]
+        [--particoes 4] [--salvar trace.jsonl] [--trace trace.jsonl]
+"""
+import argparse
+import bisect
+import itertools
+import json
+import random
+import time
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from modelo.membro import Membro
+from modelo.projeto import Projeto
+
+Operacao = Tuple[str, Dict]
+
+
+class _Zipf:
+    """Amostrador de índices 0..n-1 com probabilidade proporcional a 1/(i+1)^s."""
+
+    def __init__(self, n: int, s: float, aleatorio: random.Random):
+        self._acumulado = list(itertools.accumulate(1 / (i + 1) ** s for i in range(n)))
+        self._aleatorio = aleatorio
+
+    def __call__(self) -> int:
+        alvo = self._aleatorio.random() * self._acumulado[-1]
+        return bisect.bisect_right(self._acumulado, alvo)
+
+
+def gerar_carga(operacoes: int = 100_000, projetos: int = 200, membros: int = 500,
+                membros_por_projeto: int = 8, escrita: float = 0.5, zipf: float = 1.1,
+                quentes: float = 0.1, peso_quentes: float = 0.6,
+                semente: int = 42) -> Iterator[Operacao]:
+    """Gera o trace: preparação seguida de ``operacoes`` operações de regime.
+
+    Args:
+        operacoes (int): Operações de regime (sem contar a preparação)
+        projetos (int): Quantidade de projetos
+        membros (int): Quantidade de membros cadastrados
+        membros_por_projeto (int): Membros vinculados a cada projeto
+        escrita (float): Fração de escritas no regime (0 a 1)
+        zipf (float): Expoente de Zipf da popularidade dos projetos
+        quentes (float): Fração de membros quentes
+        peso_quentes (float): Probabilidade de escolher um membro quente,
+            quando o projeto tem algum, ao vincular e ao atribuir
+        semente (int): Semente do gerador pseudoaleatório
+    """
+    aleatorio = random.Random(semente)
+    hoje = date.today()
+    nomes_membros = [f"Membro {m}" for m in range(membros)]
+    total_quentes = max(1, int(membros * quentes))
+    nomes_quentes = set(nomes_membros[:total_quentes])
+    for nome in nomes_membros:
+        yield "cadastrar_membro", {"nome": nome, "funcao": "Dev"}
+
+    equipes: List[List[str]] = []
+    quentes_da_equipe: List[List[str]] = []
+    for p in range(projetos):
+        nome = f"Projeto {p}"
+        yield "adicionar_projeto", {"nome": nome, "descricao": "Carga sintética",
+                                    "prazo": (hoje + timedelta(days=aleatorio.randint(30, 365)))
+                                    .isoformat()}
+        equipe: Dict[str, None] = {}
+        while len(equipe) < min(membros_por_projeto, membros):
+            if aleatorio.random() < peso_quentes:
+                equipe[nomes_membros[aleatorio.randrange(total_quentes)]] = None
+            else:
+                equipe[aleatorio.choice(nomes_membros)] = None
+        for membro in equipe:
+            yield "adicionar_membro_projeto", {"projeto": nome, "membro": membro}
+        equipes.append(list(equipe))
+        quentes_da_equipe.append([m for m in equipe if m in nomes_quentes])
+
+    projeto_zipf = _Zipf(projetos, zipf, aleatorio)
+    membro_zipf = _Zipf(membros, zipf, aleatorio)
+    # Tarefas por status, para que iniciar e concluir sempre sejam válidos
+    pendentes: List[Tuple[str, str]] = []
+    em_andamento: List[Tuple[str, str]] = []
+    criadas = 0
+
+    def retirar(lista: List[Tuple[str, str]]) -> Tuple[str, str]:
+        i = aleatorio.randrange(len(lista))
+        lista[i], lista[-1] = lista[-1], lista[i]
+        return lista.pop()
+
+    for _ in range(operacoes):
+        if aleatorio.random() < escrita:
+            sorteio = aleatorio.random()
+            if sorteio < 0.2 and pendentes:
+                projeto, titulo = retirar(pendentes)
+                em_andamento.append((projeto, titulo))
+                yield "iniciar_tarefa", {"projeto": projeto, "titulo": titulo}
+            elif sorteio < 0.4 and em_andamento:
+                projeto, titulo = retirar(em_andamento)
+                yield "concluir_tarefa", {"projeto": projeto, "titulo": titulo}
+            else:
+                p = projeto_zipf()
+                quentes_p = quentes_da_equipe[p]
+                if quentes_p and aleatorio.random() < peso_quentes:
+                    responsavel = aleatorio.choice(quentes_p)
+                else:
+                    responsavel = aleatorio.choice(equipes[p])
+                titulo = f"Tarefa {criadas}"
+                criadas += 1
+                pendentes.append((f"Projeto {p}", titulo))
+                yield "criar_tarefa", {
+                    "projeto": f"Projeto {p}", "titulo": titulo, "descricao": "",
+                    "responsavel": responsavel, "prioridade": aleatorio.randint(1, 5),
+                    "prazo": (hoje + timedelta(days=aleatorio.randint(-10, 60))).isoformat()}
+        elif aleatorio.random() < 0.7:
+            yield "relatorio_projeto", {"projeto": f"Projeto {projeto_zipf()}"}
+        else:
+            yield "relatorio_membro", {"membro": nomes_membros[membro_zipf() % membros]}
+
+
+def salvar_trace(caminho: str, trace: Iterable[Operacao]) -> int:
+    quantidade = 0
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for operacao in trace:
+            arquivo.write(json.dumps(operacao, ensure_ascii=False) + "\n")
+            quantidade += 1
+    return quantidade
+
+
+def carregar_trace(caminho: str) -> Iterator[Operacao]:
+    with open(caminho, encoding="utf-8") as arquivo:
+        for linha in arquivo:
+            operacao, argumentos = json.loads(linha)
+            yield operacao, argumentos
+
+
+def _preparar_chamada(alvo, operacao: str, argumentos: Dict):
+    """Converte a operação do trace numa chamada sem argumentos ao alvo."""
+    a = argumentos
+    if operacao == "cadastrar_membro":
+        membro = Membro(a["nome"], a["funcao"])
+        return lambda: alvo.cadastrar_membro(membro)
+    if operacao == "adicionar_projeto":
+        projeto = Projeto(a["nome"], a["descricao"], date.fromisoformat(a["prazo"]))
+        return lambda: alvo.adicionar_projeto(projeto)
+    if operacao == "adicionar_membro_projeto":
+        return lambda: alvo.adicionar_membro_projeto(a["projeto"], a["membro"])
+    if operacao == "criar_tarefa":
+        prazo = date.fromisoformat(a["prazo"])
+        return lambda: alvo.criar_tarefa(a["projeto"], a["titulo"], a["descricao"],
+                                         a["responsavel"], prazo=prazo,
+                                         prioridade=a["prioridade"])
+    if operacao in ("iniciar_tarefa", "concluir_tarefa"):
+        metodo = getattr(alvo, operacao)
+        return lambda: metodo(a["projeto"], a["titulo"])
+    if operacao == "relatorio_projeto":
+        return lambda: alvo.relatorio_projeto(a["projeto"])
+    if operacao == "relatorio_membro":
+        return lambda: alvo.relatorio_membro(a["membro"])
+    raise ValueError(f"Operação desconhecida no trace: {operacao!r}")
+
+
+def _percentil(ordenados: List[int], fracao: float) -> int:
+    return ordenados[min(len(ordenados) - 1, int(fracao * len(ordenados)))]
+
+
+def reproduzir(alvo, trace: Iterable[Operacao]) -> Dict[str, Dict]:
+    """Executa o trace contra ``alvo`` medindo cada chamada.
+
+    Erros não interrompem a reprodução; são contados por operação.
+
+    Returns:
+        Dict[str, Dict]: Por operação (e ``total``): quantidade, erros,
+        segundos, operações por segundo e latências p50/p90/p99/máxima em µs
+    """
+    latencias: Dict[str, List[int]] = {}
+    erros: Dict[str, int] = {}
+    relogio = time.perf_counter_ns
+    for operacao, argumentos in trace:
+        chamada = _preparar_chamada(alvo, operacao, argumentos)
+        inicio = relogio()
+        try:
+            chamada()
+        except Exception:
+            erros[operacao] = erros.get(operacao, 0) + 1
+        latencias.setdefault(operacao, []).append(relogio() - inicio)
+    latencias["total"] = [ns for lista in latencias.values() for ns in lista]
+    erros["total"] = sum(erros.values())
+    resultado = {}
+    for operacao, medidas in latencias.items():
+        medidas.sort()
+        segundos = sum(medidas) / 1e9
+        resultado[operacao] = {
+            "quantidade": len(medidas),
+            "erros": erros.get(operacao, 0),
+            "segundos": round(segundos, 4),
+            "ops_por_segundo": round(len(medidas) / segundos) if segundos else 0,
+            "p50_us": round(_percentil(medidas, 0.50) / 1000, 1),
+            "p90_us": round(_percentil(medidas, 0.90) / 1000, 1),
+            "p99_us": round(_percentil(medidas, 0.99) / 1000, 1),
+            "max_us": round(medidas[-1] / 1000, 1),
+        }
+    return resultado
+
+
+def imprimir(resultado: Dict[str, Dict]) -> None:
+    print(f"{'operação':<26}{'qtde':>9}{'erros':>7}{'op/s':>10}"
+          f"{'p50 µs':>9}{'p90 µs':>9}{'p99 µs':>9}{'máx µs':>10}")
+    for operacao, r in resultado.items():
+        print(f"{operacao:<26}{r['quantidade']:>9}{r['erros']:>7}{r['ops_por_segundo']:>10}"
+              f"{r['p50_us']:>9}{r['p90_us']:>9}{r['p99_us']:>9}{r['max_us']:>10}")
+
+
+def criar_alvo(nome: str, particoes: int):
+    if nome == "particionado":
+        from modelo.particionamento import GerenciadorParticionado
+        return GerenciadorParticionado(particoes)
+    from modelo.gerenciador import GerenciadorProjetos
+    return GerenciadorProjetos()
+
+
+def main(argumentos=None) -> None:
+    parser = argparse.ArgumentParser(description="Gera e reproduz carga sintética")
+    parser.add_argument("operacoes", type=int, nargs="?", default=100_000)
+    parser.add_argument("--projetos", type=int, default=200)
+    parser.add_argument("--membros", type=int, default=500)
+    parser.add_argument("--escrita", type=float, default=0.5)
+    parser.add_argument("--zipf", type=float, default=1.1)
+    parser.add_argument("--quentes", type=float, default=0.1)
+    parser.add_argument("--peso-quentes", type=float, default=0.6)
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--alvo", choices=("gerenciador", "particionado"), default="gerenciador")
+    parser.add_argument("--particoes", type=int, default=4)
+    parser.add_argument("--salvar", help="grava o trace gerado (JSONL) e sai")
+    parser.add_argument("--trace", help="reproduz um trace gravado em vez de gerar")
+    opcoes = parser.parse_args(argumentos)
+
+    if opcoes.trace:
+        trace = list(carregar_trace(opcoes.trace))
+    else:
+        trace = list(gerar_carga(opcoes.operacoes, opcoes.projetos, opcoes.membros,
+                                 escrita=opcoes.escrita, zipf=opcoes.zipf,
+                                 quentes=opcoes.quentes, peso_quentes=opcoes.peso_quentes,
+                                 semente=opcoes.semente))
+    if opcoes.salvar:
+        print(f"{salvar_trace(opcoes.salvar, trace)} operações gravadas em {opcoes.salvar}")
+        return
+    alvo = criar_alvo(opcoes.alvo, opcoes.particoes)
+    try:
+        imprimir(reproduzir(alvo, trace))
+    finally:
+        if hasattr(alvo, "fechar"):
+            alvo.fechar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Perfil de memória do modelo (tracemalloc) com orçamentos por entidade.
+
+Imprime o detalhamento em JSON e termina com código 1 se alguma entidade
+passar do orçamento (os padrões estão em ``modelo.memoria.ORCAMENTOS_PADRAO``).
+
+Uso:
+    PYTHONPATH=. python benchmarks/perfil_memoria.py [projetos] [membros] [tarefas_por_projeto]
+        [--membros-por-projeto N] [--orcamento Tarefa=2400 ...]
+"""
+import argparse
+import json
+import sys
+
+from modelo.memoria import ORCAMENTOS_PADRAO, perfil_memoria, verificar_orcamentos
+
+
+def main(argumentos=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("projetos", type=int, nargs="?", default=200)
+    parser.add_argument("membros", type=int, nargs="?", default=100)
+    parser.add_argument("tarefas_por_projeto", type=int, nargs="?", default=50)
+    parser.add_argument("--membros-por-projeto", type=int, default=5)
+    parser.add_argument("--orcamento", action="append", default=[], metavar="ENTIDADE=BYTES",
+                        help="substitui o orçamento de uma entidade (pode repetir)")
+    opcoes = parser.parse_args(argumentos)
+
+    orcamentos = dict(ORCAMENTOS_PADRAO)
+    for item in opcoes.orcamento:
+        entidade, _, limite = item.partition("=")
+        if entidade not in orcamentos or not limite.isdigit():
+            parser.error(f"orçamento inválido: {item!r}")
+        orcamentos[entidade] = int(limite)
+
+    perfil = perfil_memoria(opcoes.projetos, opcoes.membros, opcoes.tarefas_por_projeto,
+                            opcoes.membros_por_projeto)
+    violacoes = verificar_orcamentos(perfil, orcamentos)
+    perfil["orcamentos"] = orcamentos
+    perfil["violacoes"] = violacoes
+    print(json.dumps(perfil, indent=2, ensure_ascii=False))
+    return 1 if violacoes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
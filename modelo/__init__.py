@@ -0,0 +1,51 @@
+"""Pacote de gerenciamento de projetos.
+
+Os nomes públicos são resolvidos sob demanda (PEP 562): ``import modelo``
+não carrega nenhum submódulo, e ``modelo.GerenciadorProjetos`` importa só
+o que o gerenciador usa no primeiro acesso.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .gerenciador import GerenciadorProjetos
+    from .membro import Membro
+    from .projeto import Projeto
+    from .tarefa import Tarefa
+    from .excecoes import (
+        ProjetoError,
+        ProjetoNaoEncontradoError,
+        TarefaNaoEncontradaError,
+        MembroNaoEncontradoError,
+        ResponsavelNaoEMembroError
+    )
+
+# Nome exportado -> submódulo que o define
+_EXPORTACOES = {
+    'GerenciadorProjetos': 'gerenciador',
+    'Membro': 'membro',
+    'Projeto': 'projeto',
+    'Tarefa': 'tarefa',
+    'ProjetoError': 'excecoes',
+    'ProjetoNaoEncontradoError': 'excecoes',
+    'TarefaNaoEncontradaError': 'excecoes',
+    'MembroNaoEncontradoError': 'excecoes',
+    'ResponsavelNaoEMembroError': 'excecoes',
+}
+
+# Lista única de tudo o que deve ser exportado
+__all__ = list(_EXPORTACOES)
+
+
+def __getattr__(nome: str):
+    modulo = _EXPORTACOES.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+    valor = getattr(import_module(f".{modulo}", __name__), nome)
+    # Os próximos acessos não passam mais por aqui
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,56 @@
+"""Executa um lote de comandos contra o estado gravado em arquivo.
+
+Uso:
+    python -m modelo [comandos.jsonl] [--estado estado.jsonl] [--salvar estado.jsonl]
+        [--lote 1000]
+
+Sem arquivo de comandos (ou com ``-``), lê da entrada padrão. Os
+resultados saem em JSON Lines na saída padrão e o resumo na saída de erro;
+o código de saída é 1 se algum comando falhou. Os formatos estão descritos
+em ``modelo.comandos``. O arquivo de estado não guarda o histórico de
+transições de status: ao recarregá-lo, vazão, WIP e tempos de ciclo
+recomeçam a partir da carga.
+"""
+import argparse
+import json
+import os
+import sys
+
+
+def main(argumentos=None) -> int:
+    from .comandos import ExecutorComandos, carregar_estado, executar_lote, salvar_estado
+    from .gerenciador import GerenciadorProjetos
+
+    parser = argparse.ArgumentParser(
+        prog="python -m modelo", description="Executa comandos em lote (JSON Lines)",
+        epilog="O arquivo de estado guarda projetos, membros e tarefas com o status "
+               "atual; o histórico de transições de status não é gravado, então "
+               "vazão, WIP e tempos de ciclo recomeçam ao carregá-lo.")
+    parser.add_argument("comandos", nargs="?", default="-",
+                        help="arquivo de comandos (padrão: entrada padrão)")
+    parser.add_argument("--estado", help="carrega o estado deste arquivo, se existir")
+    parser.add_argument("--salvar",
+                        help="grava o estado final neste arquivo (sem o histórico de status)")
+    parser.add_argument("--lote", type=int, default=1000,
+                        help="linhas de resultado acumuladas por escrita")
+    opcoes = parser.parse_args(argumentos)
+
+    if opcoes.estado and os.path.exists(opcoes.estado):
+        gerenciador = carregar_estado(opcoes.estado)
+    else:
+        gerenciador = GerenciadorProjetos()
+    executor = ExecutorComandos(gerenciador)
+    if opcoes.comandos == "-":
+        resumo = executar_lote(executor, sys.stdin, sys.stdout, opcoes.lote)
+    else:
+        with open(opcoes.comandos, encoding="utf-8") as arquivo:
+            resumo = executar_lote(executor, arquivo, sys.stdout, opcoes.lote)
+    sys.stdout.flush()
+    if opcoes.salvar:
+        resumo["eventos_gravados"] = salvar_estado(gerenciador, opcoes.salvar)
+    print(json.dumps(resumo), file=sys.stderr)
+    return 1 if resumo["erros"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
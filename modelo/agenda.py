@@ -0,0 +1,98 @@
+import heapq
+from datetime import date
+from itertools import count
+from typing import TYPE_CHECKING, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from modelo.projeto import Projeto
+    from modelo.tarefa import Tarefa
+
+
+class AvisoAtraso(NamedTuple):
+    """Aviso emitido no primeiro dia em que uma tarefa ou projeto fica atrasado."""
+    tipo: str  # 'tarefa' ou 'projeto'
+    alvo: Union['Tarefa', 'Projeto']
+    prazo: date
+
+
+class AgendadorAtrasos:
+    """Agenda de vencimentos em heap mínimo, no lugar de varrer ``esta_atrasada``.
+
+    Cada tarefa aberta e cada projeto com prazo ocupa uma entrada com o dia
+    em que passa a contar como atrasado (o dia seguinte ao prazo). Mudanças
+    de prazo e cancelamentos invalidam a entrada antiga sem tirá-la do
+    heap; ela é ignorada quando chega ao topo. ``verificar`` custa
+    O(k log n) para k vencimentos, e cada registro avisa uma única vez.
+    """
+
+    def __init__(self, hoje: Callable[[], date] = date.today):
+        self._hoje = hoje
+        self._heap: List[Tuple[int, int, str, object]] = []
+        self._registros: Dict[object, int] = {}
+        self._contador = count()
+        self._assinantes: List[Callable[[AvisoAtraso], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._registros)
+
+    def assinar(self, assinante: Callable[[AvisoAtraso], None]) -> None:
+        """Registra uma função chamada a cada aviso de atraso."""
+        self._assinantes.append(assinante)
+
+    def cancelar_assinatura(self, assinante: Callable[[AvisoAtraso], None]) -> None:
+        self._assinantes.remove(assinante)
+
+    def registrar_tarefa(self, tarefa: 'Tarefa') -> None:
+        """Agenda (ou reagenda) o vencimento de uma tarefa aberta."""
+        if tarefa.prazo is None or tarefa.status == tarefa.STATUS_CONCLUIDA:
+            self.cancelar(tarefa)
+        else:
+            self._agendar('tarefa', tarefa, tarefa.prazo)
+
+    def registrar_projeto(self, projeto: 'Projeto') -> None:
+        """Agenda (ou reagenda) o vencimento do prazo de um projeto."""
+        if projeto.prazo is None:
+            self.cancelar(projeto)
+        else:
+            self._agendar('projeto', projeto, projeto.prazo)
+
+    def cancelar(self, alvo: object) -> None:
+        """Retira uma tarefa ou projeto da agenda (se estiver agendado)."""
+        self._registros.pop(alvo, None)
+        if len(self._heap) > 2 * len(self._registros) + 64:
+            self._compactar()
+
+    def proximo_vencimento(self) -> Optional[date]:
+        """Primeiro dia em que algum registro ficará atrasado."""
+        while self._heap and self._registros.get(self._heap[0][3]) != self._heap[0][1]:
+            heapq.heappop(self._heap)
+        return date.fromordinal(self._heap[0][0]) if self._heap else None
+
+    def verificar(self) -> List[AvisoAtraso]:
+        """Emite os avisos de tudo que ficou atrasado desde a última verificação.
+
+        Returns:
+            List[AvisoAtraso]: Avisos em ordem de prazo (também entregues aos
+            assinantes)
+        """
+        hoje = self._hoje().toordinal()
+        avisos = []
+        while self._heap and self._heap[0][0] <= hoje:
+            vencimento, marca, tipo, alvo = heapq.heappop(self._heap)
+            if self._registros.get(alvo) != marca:
+                continue
+            del self._registros[alvo]
+            avisos.append(AvisoAtraso(tipo, alvo, date.fromordinal(vencimento - 1)))
+        for aviso in avisos:
+            for assinante in self._assinantes:
+                assinante(aviso)
+        return avisos
+
+    def _agendar(self, tipo: str, alvo: object, prazo: date) -> None:
+        marca = next(self._contador)
+        self._registros[alvo] = marca
+        heapq.heappush(self._heap, (prazo.toordinal() + 1, marca, tipo, alvo))
+
+    def _compactar(self) -> None:
+        self._heap = [e for e in self._heap if self._registros.get(e[3]) == e[1]]
+        heapq.heapify(self._heap)
@@ -0,0 +1,143 @@
+import hashlib
+import math
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Ordem das colunas de cada linha devolvida pelo armazém
+COLUNAS = ('id', 'projeto', 'titulo', 'descricao', 'responsavel', 'prazo', 'prioridade',
+           'estimativa_dias', 'criacao', 'conclusao', 'codigo_historico')
+
+Linha = Tuple
+
+
+class FiltroBloom:
+    """Filtro de Bloom sobre strings: responde "talvez" ou "com certeza não".
+
+    Usa ``k`` posições derivadas de um único hash de 128 bits (duplo hash).
+    Não aceita remoção; chaves removidas só causam sondagens a mais.
+    """
+
+    def __init__(self, capacidade: int = 100_000, taxa_falsos: float = 0.01):
+        self.capacidade = capacidade
+        self._bits_total = max(64, int(-capacidade * math.log(taxa_falsos) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._bits_total / capacidade * math.log(2)))
+        self._bits = bytearray((self._bits_total + 7) // 8)
+        self._taxa_falsos = taxa_falsos
+        self.quantidade = 0
+
+    def adicionar(self, chave: str) -> None:
+        for posicao in self._posicoes(chave):
+            self._bits[posicao >> 3] |= 1 << (posicao & 7)
+        self.quantidade += 1
+
+    def __contains__(self, chave: str) -> bool:
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._posicoes(chave))
+
+    def _posicoes(self, chave: str) -> Iterator[int]:
+        resumo = hashlib.blake2b(chave.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(resumo[:8], 'little')
+        h2 = int.from_bytes(resumo[8:], 'little') | 1
+        return ((h1 + i * h2) % self._bits_total for i in range(self._hashes))
+
+
+class ArmazemFrio:
+    """Camada em disco (SQLite) para tarefas concluídas tiradas da memória.
+
+    As buscas por título passam antes por um filtro de Bloom, que evita ir
+    ao disco para títulos que nunca foram descarregados. O filtro é
+    reconstruído com o dobro da capacidade quando enche.
+    """
+
+    def __init__(self, caminho: str = ':memory:', capacidade_bloom: int = 100_000):
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._conexao.execute(
+            "CREATE TABLE IF NOT EXISTS tarefas ("
+            "id INTEGER PRIMARY KEY, projeto TEXT, titulo TEXT, descricao TEXT, "
+            "responsavel TEXT, prazo INTEGER, prioridade INTEGER, estimativa_dias INTEGER, "
+            "criacao INTEGER, conclusao INTEGER, codigo_historico INTEGER, "
+            "projeto_chave TEXT, titulo_chave TEXT, responsavel_chave TEXT)")
+        self._conexao.execute(
+            "CREATE INDEX IF NOT EXISTS tarefas_titulo ON tarefas (titulo_chave, projeto_chave)")
+        self._conexao.execute(
+            "CREATE INDEX IF NOT EXISTS tarefas_projeto ON tarefas (projeto_chave)")
+        self._conexao.execute(
+            "CREATE INDEX IF NOT EXISTS tarefas_periodo ON tarefas (criacao, conclusao)")
+        self._filtro = FiltroBloom(capacidade_bloom)
+        self._reconstruir_filtro()
+        self.sondagens = 0
+        self.evitadas = 0
+
+    def __len__(self) -> int:
+        return self._conexao.execute("SELECT COUNT(*) FROM tarefas").fetchone()[0]
+
+    def guardar(self, linhas: Iterable[Tuple]) -> None:
+        """Grava tarefas (na ordem de ``COLUNAS``, com o id da tarefa) em uma transação."""
+        registros = []
+        for linha in linhas:
+            registros.append(tuple(linha) + (linha[1].lower(), linha[2].lower(), linha[4].lower()))
+            self._filtro.adicionar(linha[2].lower())
+        with self._conexao:
+            self._conexao.executemany(
+                "INSERT INTO tarefas (id, projeto, titulo, descricao, responsavel, prazo, "
+                "prioridade, estimativa_dias, criacao, conclusao, codigo_historico, projeto_chave, "
+                "titulo_chave, responsavel_chave) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", registros)
+        if self._filtro.quantidade > self._filtro.capacidade:
+            self._filtro = FiltroBloom(self._filtro.capacidade * 2)
+            self._reconstruir_filtro()
+
+    def buscar(self, titulo: str, projeto: Optional[str] = None) -> List[Linha]:
+        chave = titulo.lower()
+        if chave not in self._filtro:
+            self.evitadas += 1
+            return []
+        self.sondagens += 1
+        if projeto is None:
+            return self._selecionar("titulo_chave = ? ORDER BY id LIMIT 1", (chave,))
+        return self._selecionar("titulo_chave = ? AND projeto_chave = ? ORDER BY id LIMIT 1",
+                                (chave, projeto.lower()))
+
+    def por_id(self, id_tarefa: int) -> List[Linha]:
+        return self._selecionar("id = ?", (id_tarefa,))
+
+    def do_projeto(self, projeto: str) -> List[Linha]:
+        return self._selecionar("projeto_chave = ? ORDER BY id", (projeto.lower(),))
+
+    def entre(self, inicio: int, fim: int, responsavel: Optional[str] = None) -> List[Linha]:
+        """Tarefas cujo período (criação até conclusão) cruza ``[inicio, fim]``."""
+        if responsavel is None:
+            return self._selecionar("criacao <= ? AND conclusao >= ? ORDER BY id", (fim, inicio))
+        return self._selecionar("criacao <= ? AND conclusao >= ? AND responsavel_chave = ? "
+                                "ORDER BY id", (fim, inicio, responsavel.lower()))
+
+    def todas(self, lote: int = 1000) -> Iterator[Linha]:
+        cursor = self._conexao.execute(f"SELECT {', '.join(COLUNAS)} FROM tarefas ORDER BY id")
+        while True:
+            linhas = cursor.fetchmany(lote)
+            if not linhas:
+                return
+            yield from linhas
+
+    def contar_por_projeto(self) -> Dict[str, int]:
+        """Quantidade de tarefas em disco de cada projeto (pelo nome gravado)."""
+        return dict(self._conexao.execute(
+            "SELECT MIN(projeto), COUNT(*) FROM tarefas GROUP BY projeto_chave"))
+
+    def remover(self, ids: Iterable[int]) -> None:
+        with self._conexao:
+            self._conexao.executemany("DELETE FROM tarefas WHERE id = ?", ((i,) for i in ids))
+
+    def estatisticas(self) -> Dict:
+        return {"em_disco": len(self), "sondagens": self.sondagens,
+                "evitadas_pelo_filtro": self.evitadas}
+
+    def fechar(self) -> None:
+        self._conexao.close()
+
+    def _selecionar(self, condicao: str, parametros: Tuple) -> List[Linha]:
+        return self._conexao.execute(
+            f"SELECT {', '.join(COLUNAS)} FROM tarefas WHERE {condicao}", parametros).fetchall()
+
+    def _reconstruir_filtro(self) -> None:
+        for (chave,) in self._conexao.execute("SELECT titulo_chave FROM tarefas"):
+            self._filtro.adicionar(chave)
@@ -0,0 +1,186 @@
+import heapq
+from datetime import date
+from itertools import count
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+
+from .indices import normalizar_nome
+
+if TYPE_CHECKING:
+    from modelo.membro import Membro
+    from modelo.projeto import Projeto
+    from modelo.tarefa import Tarefa
+
+_Grupo = Tuple['Projeto', Optional[str]]
+
+
+def peso_tarefa(tarefa: 'Tarefa', hoje: Optional[date] = None) -> float:
+    """Peso de uma tarefa aberta na carga do responsável.
+
+    A prioridade (1 a 5) é multiplicada por um fator de urgência: 2 para
+    prazos vencidos ou nos próximos 3 dias, 1.5 para os próximos 7 dias.
+    """
+    fator = 1.0
+    if tarefa.prazo is not None:
+        dias = (tarefa.prazo - (hoje or date.today())).days
+        if dias <= 3:
+            fator = 2.0
+        elif dias <= 7:
+            fator = 1.5
+    return tarefa.prioridade * fator
+
+
+def proxima_virada(prazo: date, hoje: date) -> Optional[int]:
+    """Dia (ordinal) em que o fator de urgência de um prazo vai mudar, se mudar."""
+    dias = (prazo - hoje).days
+    if dias > 7:
+        return prazo.toordinal() - 7
+    if dias > 3:
+        return prazo.toordinal() - 3
+    return None
+
+
+class BalanceadorCarga:
+    """Mantém a carga aberta de cada membro em min-heaps por projeto/função.
+
+    Cada projeto tem um heap com todos os seus membros e um heap por
+    função. As entradas são invalidadas de forma preguiçosa: quando a carga
+    de um membro muda, uma nova entrada é empilhada e as antigas são
+    descartadas ao chegarem ao topo. Escolher o membro menos carregado custa
+    O(log M) amortizado.
+
+    Como um membro pode estar em muitos projetos, a mudança de carga só o
+    marca como pendente; as novas entradas são empilhadas na próxima
+    escolha, uma vez por membro, por mais que a carga tenha mudado.
+
+    Tarefas abertas com prazo ficam agrupadas pelo dia em que o fator de
+    urgência delas muda (como em ``ContadorAtrasos``); quando o dia vira,
+    só essas têm o peso recalculado.
+    """
+
+    def __init__(self, hoje: Callable[[], date] = date.today):
+        self._hoje = hoje
+        self._dia = hoje().toordinal()
+        self._viradas: Dict[int, Dict['Tarefa', None]] = {}
+        self._virada_tarefa: Dict['Tarefa', int] = {}
+        self._carga: Dict['Membro', float] = {}
+        self._pesos: Dict['Tarefa', float] = {}
+        self._heaps: Dict[_Grupo, List[Tuple[float, int, 'Membro']]] = {}
+        self._membros_grupo: Dict[_Grupo, Dict['Membro', None]] = {}
+        self._grupos_membro: Dict['Membro', Dict[_Grupo, None]] = {}
+        self._pendentes: Dict['Membro', None] = {}
+        self._seq = count()
+
+    def carga(self, membro: 'Membro') -> float:
+        self._avancar()
+        return self._carga.get(membro, 0.0)
+
+    def adicionar_membro(self, projeto: 'Projeto', membro: 'Membro') -> None:
+        """Torna o membro elegível para tarefas do projeto."""
+        for grupo in ((projeto, None), (projeto, normalizar_nome(membro.funcao))):
+            self._membros_grupo.setdefault(grupo, {})[membro] = None
+            self._grupos_membro.setdefault(membro, {})[grupo] = None
+            self._empilhar(grupo, membro)
+
+    def remover_membro(self, projeto: 'Projeto', membro: 'Membro') -> None:
+        """Retira o membro dos heaps do projeto (a carga global é mantida)."""
+        for grupo in ((projeto, None), (projeto, normalizar_nome(membro.funcao))):
+            membros = self._membros_grupo.get(grupo)
+            if membros is not None:
+                membros.pop(membro, None)
+                if not membros:
+                    del self._membros_grupo[grupo]
+                    del self._heaps[grupo]
+            grupos = self._grupos_membro.get(membro)
+            if grupos is not None:
+                grupos.pop(grupo, None)
+                if not grupos:
+                    del self._grupos_membro[membro]
+
+    def remover_projeto(self, projeto: 'Projeto') -> None:
+        """Descarta os heaps do projeto, em O(membros do projeto)."""
+        for membro in list(self._membros_grupo.get((projeto, None), ())):
+            self.remover_membro(projeto, membro)
+
+    def atualizar_tarefa(self, tarefa: 'Tarefa') -> None:
+        """Soma ou retira a tarefa da carga conforme ela esteja aberta ou não."""
+        self._avancar()
+        aberta = tarefa.status != tarefa.STATUS_CONCLUIDA
+        if aberta and tarefa not in self._pesos:
+            self._pesar(tarefa)
+        elif not aberta and tarefa in self._pesos:
+            self.remover_tarefa(tarefa)
+
+    def remover_tarefa(self, tarefa: 'Tarefa') -> None:
+        peso = self._pesos.pop(tarefa, None)
+        if peso is not None:
+            self._ajustar(tarefa.responsavel, -peso)
+            self._desagendar(tarefa)
+
+    def escolher(self, projeto: 'Projeto', funcao: Optional[str] = None) -> Optional['Membro']:
+        """Retorna o membro elegível menos carregado (ou None se não houver)."""
+        self._avancar()
+        for pendente in self._pendentes:
+            for grupo in self._grupos_membro.get(pendente, ()):
+                self._empilhar(grupo, pendente)
+        self._pendentes.clear()
+        grupo = (projeto, normalizar_nome(funcao) if funcao else None)
+        heap = self._heaps.get(grupo)
+        membros = self._membros_grupo.get(grupo)
+        while heap:
+            carga, _, membro = heap[0]
+            if membro in membros and carga == self._carga.get(membro, 0.0):
+                return membro
+            heapq.heappop(heap)
+        return None
+
+    def _pesar(self, tarefa: 'Tarefa') -> None:
+        """(Re)calcula o peso de uma tarefa aberta com a data corrente."""
+        hoje = date.fromordinal(self._dia)
+        peso = peso_tarefa(tarefa, hoje)
+        anterior = self._pesos.get(tarefa, 0.0)
+        if peso != anterior:
+            self._ajustar(tarefa.responsavel, peso - anterior)
+            self._pesos[tarefa] = peso
+        virada = proxima_virada(tarefa.prazo, hoje) if tarefa.prazo is not None else None
+        if virada is not None:
+            self._viradas.setdefault(virada, {})[tarefa] = None
+            self._virada_tarefa[tarefa] = virada
+
+    def _desagendar(self, tarefa: 'Tarefa') -> None:
+        virada = self._virada_tarefa.pop(tarefa, None)
+        if virada is not None:
+            tarefas = self._viradas[virada]
+            del tarefas[tarefa]
+            if not tarefas:
+                del self._viradas[virada]
+
+    def _avancar(self) -> None:
+        """Repesa as tarefas cujo fator de urgência mudou desde o último dia visto."""
+        dia = self._hoje().toordinal()
+        if dia <= self._dia:
+            return
+        anterior, self._dia = self._dia, dia
+        if dia - anterior <= len(self._viradas):
+            vencidas = [v for v in range(anterior + 1, dia + 1) if v in self._viradas]
+        else:
+            vencidas = [v for v in self._viradas if v <= dia]
+        for virada in vencidas:
+            for tarefa in self._viradas.pop(virada):
+                del self._virada_tarefa[tarefa]
+                self._pesar(tarefa)
+
+    def _ajustar(self, membro: 'Membro', delta: float) -> None:
+        carga = self._carga.get(membro, 0.0) + delta
+        if abs(carga) < 1e-9:
+            self._carga.pop(membro, None)
+        else:
+            self._carga[membro] = carga
+        self._pendentes[membro] = None
+
+    def _empilhar(self, grupo: _Grupo, membro: 'Membro') -> None:
+        heap = self._heaps.setdefault(grupo, [])
+        heapq.heappush(heap, (self._carga.get(membro, 0.0), next(self._seq), membro))
+        if len(heap) > 4 * len(self._membros_grupo[grupo]) + 16:
+            membros = self._membros_grupo[grupo]
+            heap[:] = [(self._carga.get(m, 0.0), next(self._seq), m) for m in membros]
+            heapq.heapify(heap)
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from datetime import date
+from typing import Callable, Dict, Hashable, Tuple
+
+
+def _copiar(relatorio: Dict) -> Dict:
+    return {chave: list(valor) if isinstance(valor, list) else valor
+            for chave, valor in relatorio.items()}
+
+
+class CacheRelatorios:
+    """Cache LRU de relatórios invalidado por contadores de versão.
+
+    Cada entidade (projeto ou membro) tem um contador monotônico que é
+    incrementado sempre que algo que afeta seu relatório muda. Uma entrada
+    só é reaproveitada se foi gerada na versão atual e no mesmo dia, já que
+    a contagem de tarefas atrasadas depende da data.
+    """
+
+    def __init__(self, capacidade: int = 1024, hoje: Callable[[], date] = date.today):
+        self._capacidade = capacidade
+        self._hoje = hoje
+        self._entradas: 'OrderedDict[Hashable, Tuple[int, date, Dict]]' = OrderedDict()
+        self._versoes: Dict[Hashable, int] = {}
+        self.acertos = 0
+        self.falhas = 0
+        self.expiradas = 0
+        self.despejos = 0
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def versao(self, entidade: Hashable) -> int:
+        return self._versoes.get(entidade, 0)
+
+    def invalidar(self, *entidades: Hashable) -> None:
+        """Avança a versão das entidades afetadas por uma mudança."""
+        for entidade in entidades:
+            self._versoes[entidade] = self._versoes.get(entidade, 0) + 1
+
+    def esquecer(self, entidade: Hashable) -> None:
+        """Descarta versão e relatório de uma entidade removida."""
+        self._versoes.pop(entidade, None)
+        self._entradas.pop(entidade, None)
+
+    def obter(self, entidade: Hashable, gerar: Callable[[], Dict]) -> Dict:
+        """Retorna uma cópia do relatório em cache ou gera um novo."""
+        versao = self._versoes.get(entidade, 0)
+        hoje = self._hoje()
+        entrada = self._entradas.get(entidade)
+        if entrada is not None and entrada[0] == versao:
+            if entrada[1] == hoje:
+                self.acertos += 1
+                self._entradas.move_to_end(entidade)
+                return _copiar(entrada[2])
+            self.expiradas += 1
+        self.falhas += 1
+        relatorio = gerar()
+        self._entradas[entidade] = (versao, hoje, relatorio)
+        self._entradas.move_to_end(entidade)
+        if len(self._entradas) > self._capacidade:
+            self._entradas.popitem(last=False)
+            self.despejos += 1
+        return _copiar(relatorio)
+
+    def estatisticas(self) -> Dict:
+        consultas = self.acertos + self.falhas
+        return {
+            "entradas": len(self._entradas),
+            "capacidade": self._capacidade,
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "expiradas": self.expiradas,
+            "despejos": self.despejos,
+            "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+        }
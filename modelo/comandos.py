@@ -0,0 +1,282 @@
+"""Execução em lote de comandos e persistência do estado em arquivo.
+
+Comandos chegam como JSON, um por linha: um objeto com ``op`` e os
+argumentos (``{"op": "concluir_tarefa", "projeto": "Portal", "titulo":
+"Login"}``) ou o par ``[op, argumentos]`` dos traces de
+``benchmarks/carga.py``. Cada comando produz uma linha de resultado:
+
+    {"linha": 3, "ok": true, "resultado": {...}}
+    {"linha": 4, "ok": false, "erro": "TarefaNaoEncontradaError", "mensagem": "..."}
+
+O estado é gravado como JSON Lines: um cabeçalho com os projetos
+arquivados seguido dos eventos de ``gerar_instantaneo``, com datas no
+formato ISO. Carregar o arquivo reproduz esses eventos num gerenciador novo.
+O arquivo guarda o estado, não a trajetória: o histórico de transições de
+status (base de ``vazao``, ``wip`` e ``percentis_tempo``) não é gravado, e
+ao carregar cada tarefa é registrada de novo, no instante da carga.
+"""
+import json
+import os
+import time
+from datetime import date
+from typing import IO, Callable, Dict, Iterable, Optional
+
+from .excecoes import (
+    MembroNaoEncontradoError,
+    ProjetoError,
+    ProjetoNaoEncontradoError,
+    ResponsavelNaoEMembroError,
+    TarefaNaoEncontradaError,
+)
+from .gerenciador import GerenciadorProjetos
+from .membro import Membro
+from .projeto import Projeto
+from .replicacao import aplicar_evento, gerar_instantaneo
+from .tarefa import Tarefa
+
+FORMATO_ESTADO = 1
+_CAMPOS_DATA = ("prazo", "data_criacao", "data_conclusao")
+_CAMPOS_TEXTO = ("nome", "funcao", "email", "descricao", "projeto", "membro", "titulo",
+                 "responsavel")
+_CAMPOS_INTEIROS = ("prioridade", "estimativa_dias")
+
+
+def _data(valor) -> Optional[date]:
+    return date.fromisoformat(valor) if valor else None
+
+
+def _validar(comando: Dict) -> None:
+    # Antes de qualquer mutação: um tipo errado no meio de uma operação
+    # deixaria a tarefa ou o membro registrado pela metade
+    for campo in _CAMPOS_TEXTO:
+        if campo in comando and not isinstance(comando[campo], str):
+            raise TypeError(f"Campo '{campo}' deve ser texto, não "
+                            f"{type(comando[campo]).__name__}")
+    for campo in _CAMPOS_INTEIROS:
+        valor = comando.get(campo)
+        if campo in comando and (not isinstance(valor, int) or isinstance(valor, bool)):
+            raise TypeError(f"Campo '{campo}' deve ser inteiro, não {type(valor).__name__}")
+    if comando.get("prazo") is not None and not isinstance(comando["prazo"], str):
+        raise TypeError(f"Campo 'prazo' deve ser uma data ISO, não "
+                        f"{type(comando['prazo']).__name__}")
+
+
+def _serializar(valor):
+    if isinstance(valor, date):
+        return valor.isoformat()
+    raise TypeError(f"{type(valor).__name__} não é serializável")
+
+
+def salvar_estado(gerenciador: GerenciadorProjetos, caminho: str) -> int:
+    """Grava o estado do gerenciador em ``caminho``, substituindo-o atomicamente.
+
+    Returns:
+        int: Quantidade de eventos gravados
+    """
+    instantaneo = gerar_instantaneo(gerenciador)
+    temporario = f"{caminho}.tmp"
+    with open(temporario, "w", encoding="utf-8") as arquivo:
+        arquivo.write(json.dumps({"formato": FORMATO_ESTADO,
+                                  "arquivados": instantaneo.arquivados},
+                                 ensure_ascii=False, default=_serializar) + "\n")
+        arquivo.writelines(json.dumps(evento, ensure_ascii=False, default=_serializar) + "\n"
+                           for evento in instantaneo.eventos)
+    os.replace(temporario, caminho)
+    return len(instantaneo.eventos)
+
+
+def carregar_estado(caminho: str,
+                    gerenciador: Optional[GerenciadorProjetos] = None) -> GerenciadorProjetos:
+    """Reconstrói um gerenciador a partir de um arquivo de ``salvar_estado``.
+
+    Raises:
+        ValueError: Se o arquivo não tem o formato esperado
+    """
+    gerenciador = gerenciador or GerenciadorProjetos()
+    with open(caminho, encoding="utf-8") as arquivo:
+        cabecalho = json.loads(next(arquivo, "{}"))
+        if cabecalho.get("formato") != FORMATO_ESTADO:
+            raise ValueError(f"{caminho}: formato de estado desconhecido")
+        for linha in arquivo:
+            tipo, dados = json.loads(linha)
+            for campo in _CAMPOS_DATA:
+                if campo in dados:
+                    dados[campo] = _data(dados[campo])
+            aplicar_evento(gerenciador, tipo, dados)
+    gerenciador._arquivo.update(cabecalho["arquivados"])
+    return gerenciador
+
+
+class ExecutorComandos:
+    """Aplica comandos a um gerenciador resolvendo cada nome uma única vez.
+
+    Projetos e membros já resolvidos ficam num dicionário pelo nome exato
+    usado no comando, e as operações vão direto aos caminhos internos do
+    gerenciador com os objetos em mãos. Nenhum comando remove projetos ou
+    membros, então as entradas não envelhecem enquanto o executor for o
+    único a alterar o gerenciador.
+    """
+
+    def __init__(self, gerenciador: GerenciadorProjetos):
+        self.gerenciador = gerenciador
+        self._projetos: Dict[str, Projeto] = {}
+        self._membros: Dict[str, Membro] = {}
+        self._operacoes: Dict[str, Callable[[Dict], object]] = {
+            "cadastrar_membro": self._cadastrar_membro,
+            "adicionar_projeto": self._adicionar_projeto,
+            "adicionar_membro_projeto": self._adicionar_membro_projeto,
+            "criar_tarefa": self._criar_tarefa,
+            "iniciar_tarefa": self._iniciar_tarefa,
+            "concluir_tarefa": self._concluir_tarefa,
+            "reatribuir_tarefa": self._reatribuir_tarefa,
+            "relatorio_projeto": lambda c: self.gerenciador.relatorio_projeto(c["projeto"]),
+            "relatorio_membro": lambda c: self.gerenciador.relatorio_membro(c["membro"]),
+        }
+
+    @property
+    def operacoes(self):
+        return list(self._operacoes)
+
+    def executar(self, comando: Dict) -> object:
+        """Executa um comando já decodificado.
+
+        Args:
+            comando (Dict): ``op`` e os argumentos da operação
+
+        Returns:
+            object: Resultado serializável em JSON (ou None)
+
+        Raises:
+            ValueError: Se a operação é desconhecida
+            KeyError: Se falta um argumento obrigatório
+            TypeError: Se um argumento tem o tipo errado
+            ProjetoError: Erros do próprio gerenciador
+        """
+        operacao = self._operacoes.get(comando.get("op"))
+        if operacao is None:
+            raise ValueError(f"Operação desconhecida: {comando.get('op')!r}")
+        _validar(comando)
+        return operacao(comando)
+
+    def _projeto(self, nome: str) -> Projeto:
+        projeto = self._projetos.get(nome)
+        if projeto is None:
+            projeto = self.gerenciador.buscar_projeto(nome)
+            if projeto is None:
+                raise ProjetoNaoEncontradoError(nome)
+            self._projetos[nome] = projeto
+        return projeto
+
+    def _membro(self, nome: str) -> Membro:
+        membro = self._membros.get(nome)
+        if membro is None:
+            membro = self.gerenciador.buscar_membro(nome)
+            if membro is None:
+                raise MembroNaoEncontradoError(nome)
+            self._membros[nome] = membro
+        return membro
+
+    def _tarefa(self, comando: Dict) -> Tarefa:
+        tarefa = self.gerenciador._buscar_tarefa_projeto(self._projeto(comando["projeto"]),
+                                                          comando["titulo"])
+        if tarefa is None:
+            raise TarefaNaoEncontradaError(comando["titulo"])
+        return tarefa
+
+    def _cadastrar_membro(self, c: Dict) -> Dict:
+        membro = Membro(c["nome"], c.get("funcao", ""), c.get("email", ""))
+        self.gerenciador.cadastrar_membro(membro)
+        return {"id": membro.id}
+
+    def _adicionar_projeto(self, c: Dict) -> Dict:
+        projeto = Projeto(c["nome"], c.get("descricao", ""), _data(c.get("prazo")))
+        self.gerenciador.adicionar_projeto(projeto)
+        return {"id": projeto.id}
+
+    def _adicionar_membro_projeto(self, c: Dict) -> None:
+        self.gerenciador._adicionar_membro_projeto(self._projeto(c["projeto"]),
+                                                   self._membro(c["membro"]))
+
+    def _criar_tarefa(self, c: Dict) -> Dict:
+        opcionais = {campo: c[campo] for campo in ("prioridade", "estimativa_dias") if campo in c}
+        if c.get("prazo"):
+            opcionais["prazo"] = _data(c["prazo"])
+        tarefa = self.gerenciador._criar_tarefa(self._projeto(c["projeto"]), c["titulo"],
+                                                c.get("descricao", ""),
+                                                self._membro(c["responsavel"]), **opcionais)
+        return {"id": tarefa.id, "status": tarefa.status}
+
+    def _iniciar_tarefa(self, c: Dict) -> Dict:
+        tarefa = self._tarefa(c)
+        tarefa.iniciar()
+        return {"id": tarefa.id, "status": tarefa.status}
+
+    def _concluir_tarefa(self, c: Dict) -> Dict:
+        tarefa = self._tarefa(c)
+        tarefa.concluir()
+        return {"id": tarefa.id, "status": tarefa.status}
+
+    def _reatribuir_tarefa(self, c: Dict) -> Dict:
+        projeto = self._projeto(c["projeto"])
+        tarefa = self._tarefa(c)
+        responsavel = self._membro(c["responsavel"])
+        if not projeto.possui_membro(responsavel):
+            raise ResponsavelNaoEMembroError(responsavel.nome)
+        self.gerenciador._mover_tarefa(projeto, tarefa, responsavel)
+        return {"id": tarefa.id, "responsavel": responsavel.nome}
+
+
+def _decodificar(linha: str) -> Dict:
+    comando = json.loads(linha)
+    if isinstance(comando, list):
+        operacao, argumentos = comando
+        comando = dict(argumentos, op=operacao)
+    elif not isinstance(comando, dict):
+        raise ValueError("Comando deve ser um objeto JSON ou um par [op, argumentos]")
+    return comando
+
+
+def executar_lote(executor: ExecutorComandos, linhas: Iterable[str], saida: IO[str],
+                  lote: int = 1000) -> Dict:
+    """Executa cada linha como um comando e escreve um resultado JSON por linha.
+
+    Linhas vazias são ignoradas. Um comando com erro não interrompe o lote:
+    o erro vai para a sua linha de resultado. As linhas de saída são
+    acumuladas e escritas de ``lote`` em ``lote``; as acumuladas são
+    escritas mesmo se o lote for interrompido por uma exceção inesperada.
+
+    Returns:
+        Dict: ``comandos``, ``erros``, ``segundos`` e ``comandos_por_segundo``
+    """
+    pendentes = []
+    comandos = erros = 0
+    inicio = time.perf_counter()
+    try:
+        for numero, linha in enumerate(linhas, 1):
+            if not linha.strip():
+                continue
+            comandos += 1
+            try:
+                resultado = executor.executar(_decodificar(linha))
+                texto = json.dumps({"linha": numero, "ok": True, "resultado": resultado},
+                                   ensure_ascii=False, default=_serializar)
+            except (ProjetoError, KeyError, TypeError, ValueError) as erro:
+                erros += 1
+                mensagem = (f"Argumento obrigatório ausente: {erro.args[0]}"
+                            if isinstance(erro, KeyError) else str(erro))
+                texto = json.dumps({"linha": numero, "ok": False, "erro": type(erro).__name__,
+                                    "mensagem": mensagem}, ensure_ascii=False)
+            pendentes.append(texto)
+            if len(pendentes) >= lote:
+                saida.write("\n".join(pendentes) + "\n")
+                pendentes.clear()
+    finally:
+        if pendentes:
+            saida.write("\n".join(pendentes) + "\n")
+    segundos = time.perf_counter() - inicio
+    return {
+        "comandos": comandos,
+        "erros": erros,
+        "segundos": round(segundos, 3),
+        "comandos_por_segundo": round(comandos / segundos) if segundos else 0,
+    }
@@ -0,0 +1,231 @@
+import heapq
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+
+from .excecoes import DependenciaCiclicaError
+
+if TYPE_CHECKING:
+    from modelo.tarefa import Tarefa
+
+
+def _duracao(tarefa: 'Tarefa') -> int:
+    return 0 if tarefa.status == tarefa.STATUS_CONCLUIDA else tarefa.estimativa_dias
+
+
+class GrafoDependencias:
+    """Dependências entre as tarefas de um projeto, com caminho crítico incremental.
+
+    Cada tarefa é um nó inteiro; ``a -> b`` significa que ``a`` bloqueia
+    ``b``. A ordem topológica é mantida pelo algoritmo de Pearce–Kelly: uma
+    nova aresta só reordena os nós entre as posições das duas pontas, e a
+    mesma busca detecta ciclos. O término mais cedo de cada nó (em dias a
+    partir de hoje, sem limite de pessoas) é o maior término entre os
+    bloqueadores mais a própria estimativa; mudanças são propagadas só pelos
+    nós cujo valor realmente muda, em ordem topológica.
+    """
+
+    def __init__(self):
+        self._ids: Dict['Tarefa', int] = {}
+        self._tarefas: List[Optional['Tarefa']] = []
+        self._livres: List[int] = []
+        self._sucessores: List[Optional[List[int]]] = []
+        self._predecessores: List[Optional[List[int]]] = []
+        self._ordem = array('l')
+        self._duracao = array('l')
+        self._termino = array('l')
+        self._maior_termino = 0
+        self._maior_desatualizado = False
+        self.arestas = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def adicionar_tarefa(self, tarefa: 'Tarefa') -> None:
+        if self._livres:
+            no = self._livres.pop()
+            self._tarefas[no] = tarefa
+        else:
+            no = len(self._tarefas)
+            self._tarefas.append(tarefa)
+            self._sucessores.append(None)
+            self._predecessores.append(None)
+            self._ordem.append(no)
+            self._duracao.append(0)
+            self._termino.append(0)
+        self._ids[tarefa] = no
+        self._duracao[no] = _duracao(tarefa)
+        self._definir_termino(no, self._duracao[no])
+
+    def remover_tarefa(self, tarefa: 'Tarefa') -> None:
+        no = self._ids.pop(tarefa)
+        afetados = self._sucessores[no] or []
+        for sucessor in afetados:
+            self._predecessores[sucessor].remove(no)
+        for predecessor in self._predecessores[no] or ():
+            self._sucessores[predecessor].remove(no)
+        self.arestas -= len(afetados) + len(self._predecessores[no] or ())
+        self._sucessores[no] = self._predecessores[no] = None
+        self._tarefas[no] = None
+        self._duracao[no] = 0
+        self._definir_termino(no, 0)
+        self._livres.append(no)
+        self._propagar(afetados)
+
+    def adicionar_dependencia(self, tarefa: 'Tarefa', bloqueadora: 'Tarefa') -> None:
+        """Registra que ``tarefa`` só pode terminar depois de ``bloqueadora``.
+
+        Raises:
+            DependenciaCiclicaError: Se a dependência fecharia um ciclo
+        """
+        origem, destino = self._ids[bloqueadora], self._ids[tarefa]
+        if origem == destino:
+            raise DependenciaCiclicaError(tarefa.titulo, bloqueadora.titulo)
+        sucessores = self._sucessores[origem]
+        if sucessores is not None and destino in sucessores:
+            return
+        if self._ordem[origem] > self._ordem[destino]:
+            self._reordenar(origem, destino, tarefa, bloqueadora)
+        if sucessores is None:
+            sucessores = self._sucessores[origem] = []
+        sucessores.append(destino)
+        if self._predecessores[destino] is None:
+            self._predecessores[destino] = []
+        self._predecessores[destino].append(origem)
+        self.arestas += 1
+        candidato = self._termino[origem] + self._duracao[destino]
+        if candidato > self._termino[destino]:
+            self._definir_termino(destino, candidato)
+            self._propagar_aumento(destino)
+
+    def remover_dependencia(self, tarefa: 'Tarefa', bloqueadora: 'Tarefa') -> bool:
+        origem, destino = self._ids[bloqueadora], self._ids[tarefa]
+        sucessores = self._sucessores[origem]
+        if sucessores is None or destino not in sucessores:
+            return False
+        sucessores.remove(destino)
+        self._predecessores[destino].remove(origem)
+        self.arestas -= 1
+        self._propagar((destino,))
+        return True
+
+    def possui_dependencias(self, tarefa: 'Tarefa') -> bool:
+        no = self._ids[tarefa]
+        return bool(self._sucessores[no] or self._predecessores[no])
+
+    def bloqueadoras(self, tarefa: 'Tarefa') -> List['Tarefa']:
+        return [self._tarefas[n] for n in self._predecessores[self._ids[tarefa]] or ()]
+
+    def atualizar_tarefa(self, tarefa: 'Tarefa') -> None:
+        """Recalcula a partir de uma tarefa cujo status ou estimativa mudou."""
+        no = self._ids.get(tarefa)
+        if no is not None and self._duracao[no] != _duracao(tarefa):
+            self._duracao[no] = _duracao(tarefa)
+            self._propagar((no,))
+
+    def termino_mais_cedo(self, tarefa: 'Tarefa') -> int:
+        """Dias, a partir de hoje, até a tarefa poder estar concluída."""
+        return self._termino[self._ids[tarefa]]
+
+    @property
+    def duracao_total(self) -> int:
+        """Dias até a conclusão de todas as tarefas (comprimento do caminho crítico)."""
+        if self._maior_desatualizado:
+            self._maior_termino = max(self._termino, default=0)
+            self._maior_desatualizado = False
+        return self._maior_termino
+
+    def caminho_critico(self) -> List['Tarefa']:
+        """Cadeia de tarefas abertas que determina o término do projeto."""
+        if not self.duracao_total:
+            return []
+        no = self._termino.index(self._maior_termino)
+        caminho = []
+        while True:
+            if self._duracao[no]:
+                caminho.append(self._tarefas[no])
+            anterior = self._termino[no] - self._duracao[no]
+            if not anterior:
+                break
+            no = next(p for p in self._predecessores[no] if self._termino[p] == anterior)
+        caminho.reverse()
+        return caminho
+
+    def _reordenar(self, origem: int, destino: int,
+                   tarefa: 'Tarefa', bloqueadora: 'Tarefa') -> None:
+        """Pearce–Kelly: reposiciona só os nós entre ``destino`` e ``origem``."""
+        ordem = self._ordem
+        inferior, superior = ordem[destino], ordem[origem]
+        frente = self._alcancaveis(destino, self._sucessores, ordem, -1, superior, origem)
+        if frente is None:
+            raise DependenciaCiclicaError(tarefa.titulo, bloqueadora.titulo)
+        tras = self._alcancaveis(origem, self._predecessores, ordem, inferior, superior + 1, -1)
+        nos = sorted(tras, key=ordem.__getitem__) + sorted(frente, key=ordem.__getitem__)
+        for no, posicao in zip(nos, sorted(ordem[n] for n in nos)):
+            ordem[no] = posicao
+
+    @staticmethod
+    def _alcancaveis(inicio: int, arestas: List[Optional[List[int]]], ordem: array,
+                     minimo: int, maximo: int, proibido: int) -> Optional[Set[int]]:
+        """Nós alcançáveis com posição estritamente entre ``minimo`` e ``maximo``.
+
+        Retorna None se a busca encontrar ``proibido`` (o que indica ciclo).
+        """
+        vistos = {inicio}
+        pilha = [inicio]
+        while pilha:
+            for vizinho in arestas[pilha.pop()] or ():
+                if vizinho == proibido:
+                    return None
+                if vizinho not in vistos and minimo < ordem[vizinho] < maximo:
+                    vistos.add(vizinho)
+                    pilha.append(vizinho)
+        return vistos
+
+    def _propagar(self, inicio: Iterable[int]) -> None:
+        """Reavalia os términos em ordem topológica, parando onde nada muda."""
+        ordem = self._ordem
+        fila = [(ordem[n], n) for n in inicio]
+        heapq.heapify(fila)
+        pendentes = {n for _, n in fila}
+        while fila:
+            _, no = heapq.heappop(fila)
+            pendentes.discard(no)
+            predecessores = self._predecessores[no]
+            novo = self._duracao[no] + (
+                max(map(self._termino.__getitem__, predecessores)) if predecessores else 0)
+            if novo == self._termino[no]:
+                continue
+            self._definir_termino(no, novo)
+            for sucessor in self._sucessores[no] or ():
+                if sucessor not in pendentes:
+                    pendentes.add(sucessor)
+                    heapq.heappush(fila, (ordem[sucessor], sucessor))
+
+    def _propagar_aumento(self, inicio: int) -> None:
+        """Variante para quando os términos só podem crescer (nova dependência).
+
+        Basta comparar cada sucessor com o término do nó que mudou, sem
+        reavaliar todos os seus bloqueadores.
+        """
+        ordem, termino, duracao = self._ordem, self._termino, self._duracao
+        fila = [(ordem[inicio], inicio)]
+        pendentes = {inicio}
+        while fila:
+            _, no = heapq.heappop(fila)
+            pendentes.discard(no)
+            for sucessor in self._sucessores[no] or ():
+                candidato = termino[no] + duracao[sucessor]
+                if candidato > termino[sucessor]:
+                    self._definir_termino(sucessor, candidato)
+                    if sucessor not in pendentes:
+                        pendentes.add(sucessor)
+                        heapq.heappush(fila, (ordem[sucessor], sucessor))
+
+    def _definir_termino(self, no: int, valor: int) -> None:
+        # O maior término só é recalculado (em C, sobre o array) na próxima
+        # leitura, e apenas se um nó que o detinha diminuiu.
+        if valor >= self._maior_termino:
+            self._maior_termino = valor
+        elif self._termino[no] == self._maior_termino:
+            self._maior_desatualizado = True
+        self._termino[no] = valor
@@ -0,0 +1,173 @@
+import hashlib
+import operator
+from array import array
+from typing import Dict, Generic, Hashable, Iterator, List, Set, Tuple, TypeVar
+
+T = TypeVar('T', bound=Hashable)
+
+# Cada resumo blake2b de 64 bytes fornece 16 hashes independentes de 32 bits
+_HASHES_POR_RESUMO = 16
+# Trechos de 3 caracteres se repetem muito entre tarefas; guardar os hashes
+# de até tantos trechos evita recalculá-los (256 bytes cada, com 64 permutações)
+_CACHE_FRAGMENTOS = 65_536
+
+
+def normalizar_texto(texto: str) -> str:
+    """Minúsculas e espaços simples, para que pequenas diferenças não contem."""
+    return " ".join(texto.lower().split())
+
+
+def fragmentos(texto: str, tamanho: int = 3) -> Set[str]:
+    """Conjunto de trechos de ``tamanho`` caracteres (shingles) do texto."""
+    texto = normalizar_texto(texto)
+    if len(texto) <= tamanho:
+        return {texto}
+    return {texto[i:i + tamanho] for i in range(len(texto) - tamanho + 1)}
+
+
+class DetectorDuplicatas(Generic[T]):
+    """Detecção de quase-duplicatas por MinHash com LSH em bandas.
+
+    Cada item vira uma assinatura de ``permutacoes`` mínimos de hash sobre
+    os seus trechos de texto; a fração de posições iguais entre duas
+    assinaturas estima a similaridade de Jaccard. A assinatura é dividida
+    em ``bandas`` e cada banda vai para um balde, de modo que só itens que
+    coincidem em alguma banda inteira são comparados. Com os valores
+    padrão (16 bandas de 4 linhas), pares com Jaccard 0,7 se encontram com
+    probabilidade de ~98%, e pares com 0,3 com ~12%.
+    """
+
+    def __init__(self, permutacoes: int = 64, bandas: int = 16, tamanho_fragmento: int = 3,
+                 limiar: float = 0.7, semente: int = 1):
+        if permutacoes % bandas:
+            raise ValueError("O número de permutações deve ser múltiplo do de bandas")
+        if permutacoes % _HASHES_POR_RESUMO:
+            raise ValueError(f"O número de permutações deve ser múltiplo de {_HASHES_POR_RESUMO}")
+        # Uma chave por resumo faz de cada bloco de 16 hashes uma família independente
+        self._chaves_hash = [f"{semente}:{i}".encode()
+                             for i in range(permutacoes // _HASHES_POR_RESUMO)]
+        self._cache: Dict[str, array] = {}
+        self._bandas = bandas
+        self._linhas = permutacoes // bandas
+        self._tamanho_fragmento = tamanho_fragmento
+        self.limiar = limiar
+        self._assinaturas: Dict[T, array] = {}
+        self._baldes: Dict[Tuple[int, int], Dict[T, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._assinaturas)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._assinaturas
+
+    def assinatura(self, texto: str) -> array:
+        """Mínimo de cada uma das ``permutacoes`` funções de hash sobre os trechos."""
+        cache = self._cache
+        linhas = []
+        for fragmento in fragmentos(texto, self._tamanho_fragmento):
+            linha = cache.get(fragmento)
+            if linha is None:
+                dados = fragmento.encode()
+                linha = array('I')
+                for chave in self._chaves_hash:
+                    linha.frombytes(hashlib.blake2b(dados, digest_size=64, key=chave).digest())
+                if len(cache) >= _CACHE_FRAGMENTOS:
+                    cache.clear()
+                cache[fragmento] = linha
+            linhas.append(linha)
+        return array('I', map(min, zip(*linhas)))
+
+    def adicionar(self, item: T, texto: str) -> List[Tuple[T, float]]:
+        """Indexa um item e retorna os já indexados que parecem duplicatas dele.
+
+        Returns:
+            List[Tuple[T, float]]: (item, similaridade estimada), da mais alta
+            para a mais baixa, só acima do limiar
+        """
+        if item in self._assinaturas:
+            self.remover(item)
+        assinatura = self.assinatura(texto)
+        semelhantes = self._consultar(assinatura, item)
+        self._assinaturas[item] = assinatura
+        for chave in self._chaves(assinatura):
+            self._baldes.setdefault(chave, {})[item] = None
+        return semelhantes
+
+    def remover(self, item: T) -> None:
+        assinatura = self._assinaturas.pop(item, None)
+        if assinatura is None:
+            return
+        for chave in self._chaves(assinatura):
+            balde = self._baldes[chave]
+            del balde[item]
+            if not balde:
+                del self._baldes[chave]
+
+    def semelhantes(self, item: T) -> List[Tuple[T, float]]:
+        """Duplicatas prováveis de um item já indexado."""
+        return self._consultar(self._assinaturas[item], item)
+
+    def semelhantes_ao_texto(self, texto: str) -> List[Tuple[T, float]]:
+        """Duplicatas prováveis de um texto ainda não indexado."""
+        return self._consultar(self.assinatura(texto), None)
+
+    def similaridade(self, a: T, b: T) -> float:
+        return self._comparar(self._assinaturas[a], self._assinaturas[b])
+
+    def agrupar(self) -> List[List[T]]:
+        """Agrupa todos os itens em conjuntos de prováveis duplicatas.
+
+        Une (union-find) cada item aos seus candidatos dos baldes cuja
+        similaridade estimada passa do limiar, de modo que os grupos são os
+        componentes ligados de ``semelhantes``. Pares já no mesmo grupo não
+        são comparados, e nunca se comparam todos os pares.
+
+        Returns:
+            List[List[T]]: Grupos com dois ou mais itens, na ordem de inserção
+        """
+        pais: Dict[T, T] = {}
+
+        def raiz(item: T) -> T:
+            caminho = []
+            while item in pais:
+                caminho.append(item)
+                item = pais[item]
+            for no in caminho:
+                pais[no] = item
+            return item
+
+        for item, assinatura in self._assinaturas.items():
+            for outro in self._candidatos(assinatura, item):
+                raiz_item, raiz_outro = raiz(item), raiz(outro)
+                if (raiz_item != raiz_outro and
+                        self._comparar(assinatura, self._assinaturas[outro]) >= self.limiar):
+                    pais[raiz_outro] = raiz_item
+        grupos: Dict[T, List[T]] = {}
+        for item in self._assinaturas:
+            grupos.setdefault(raiz(item), []).append(item)
+        return [grupo for grupo in grupos.values() if len(grupo) > 1]
+
+    def _candidatos(self, assinatura: array, ignorar) -> Dict[T, None]:
+        candidatos: Dict[T, None] = {}
+        for chave in self._chaves(assinatura):
+            candidatos.update(self._baldes.get(chave, ()))
+        candidatos.pop(ignorar, None)
+        return candidatos
+
+    def _consultar(self, assinatura: array, ignorar) -> List[Tuple[T, float]]:
+        resultado = []
+        for candidato in self._candidatos(assinatura, ignorar):
+            similaridade = self._comparar(assinatura, self._assinaturas[candidato])
+            if similaridade >= self.limiar:
+                resultado.append((candidato, similaridade))
+        resultado.sort(key=lambda par: -par[1])
+        return resultado
+
+    def _chaves(self, assinatura: array) -> Iterator[Tuple[int, int]]:
+        linhas = self._linhas
+        for banda in range(self._bandas):
+            yield banda, hash(tuple(assinatura[banda * linhas:(banda + 1) * linhas]))
+
+    @staticmethod
+    def _comparar(a: array, b: array) -> float:
+        return sum(map(operator.eq, a, b)) / len(a)
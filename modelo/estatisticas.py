@@ -0,0 +1,253 @@
+from datetime import date
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from modelo.tarefa import Tarefa
+
+PERCENTIS_RELATORIO = (50, 90, 99)
+
+
+def _hoje(hoje: Optional[date]) -> int:
+    return (hoje or date.today()).toordinal()
+
+
+class EsbocoDatas:
+    """Esboço de quantis para datas, com memória limitada e suporte a remoção.
+
+    É um histograma de dias cuja largura dos baldes dobra sempre que o
+    número de baldes passa de ``capacidade``. Enquanto as datas cabem em
+    ``capacidade`` baldes o esboço é exato; depois, o erro de cada quantil
+    fica limitado a meia largura de balde. Diferente de KLL/t-digest, as
+    contagens permitem retirar valores (tarefas que são concluídas), e dois
+    esboços podem ser mesclados.
+    """
+
+    def __init__(self, capacidade: int = 256):
+        self._capacidade = capacidade
+        self._escala = 0
+        self._baldes: Dict[int, int] = {}
+        self._total = 0
+
+    def __len__(self) -> int:
+        return self._total
+
+    @property
+    def largura(self) -> int:
+        """Largura, em dias, de cada balde (limita o erro dos quantis)."""
+        return 1 << self._escala
+
+    def adicionar(self, dia: int, quantidade: int = 1) -> None:
+        chave = dia >> self._escala
+        self._baldes[chave] = self._baldes.get(chave, 0) + quantidade
+        self._total += quantidade
+        if len(self._baldes) > self._capacidade:
+            self._compactar(self._escala + 1)
+
+    def remover(self, dia: int, quantidade: int = 1) -> None:
+        chave = dia >> self._escala
+        restante = self._baldes.get(chave, 0) - quantidade
+        if restante < 0:
+            raise ValueError(f"Dia {dia} não está no esboço")
+        if restante:
+            self._baldes[chave] = restante
+        else:
+            del self._baldes[chave]
+        self._total -= quantidade
+
+    def mesclar(self, outro: 'EsbocoDatas') -> None:
+        """Incorpora as contagens de outro esboço (ex.: de outro processo)."""
+        if outro._escala > self._escala:
+            self._compactar(outro._escala)
+        deslocamento = self._escala - outro._escala
+        for chave, quantidade in outro._baldes.items():
+            nova = chave >> deslocamento
+            self._baldes[nova] = self._baldes.get(nova, 0) + quantidade
+        self._total += outro._total
+        while len(self._baldes) > self._capacidade:
+            self._compactar(self._escala + 1)
+
+    def quantis_distancia(self, referencia: int, percentis: Iterable[float],
+                          somente_anteriores: bool = False) -> Dict[float, float]:
+        """Quantis de ``referencia - dia`` (em dias) sobre as datas do esboço.
+
+        Args:
+            referencia (int): Dia de referência (ordinal), normalmente hoje
+            percentis (Iterable[float]): Percentis desejados (0 a 100)
+            somente_anteriores (bool): Considera apenas datas antes da referência
+
+        Returns:
+            Dict[float, float]: Percentil -> distância em dias (0 se vazio)
+        """
+        largura = 1 << self._escala
+        distancias: List[Tuple[float, int]] = []
+        for chave, quantidade in self._baldes.items():
+            inicio = chave << self._escala
+            fim = inicio + largura - 1
+            if somente_anteriores:
+                if inicio >= referencia:
+                    continue
+                fim = min(fim, referencia - 1)
+            distancias.append((referencia - (inicio + fim) / 2, quantidade))
+        distancias.sort()
+        total = sum(q for _, q in distancias)
+        resultado = {}
+        for p in percentis:
+            if not total:
+                resultado[p] = 0.0
+                continue
+            posicao = max(1, -(-total * p // 100))
+            acumulado = 0
+            for distancia, quantidade in distancias:
+                acumulado += quantidade
+                if acumulado >= posicao:
+                    resultado[p] = float(distancia)
+                    break
+        return resultado
+
+    def _compactar(self, escala: int) -> None:
+        deslocamento = escala - self._escala
+        baldes: Dict[int, int] = {}
+        for chave, quantidade in self._baldes.items():
+            nova = chave >> deslocamento
+            baldes[nova] = baldes.get(nova, 0) + quantidade
+        self._baldes = baldes
+        self._escala = escala
+
+
+class ContadorAtrasos:
+    """Conta tarefas abertas com prazo vencido sem varrer as tarefas.
+
+    Prazos já vencidos entram direto no contador; os futuros ficam
+    agrupados por dia e são transferidos quando o dia vira, com custo
+    proporcional aos dias decorridos (ou aos prazos pendentes, se menor).
+    """
+
+    def __init__(self):
+        self._dia = date.today().toordinal()
+        self._vencidas = 0
+        self._futuras: Dict[int, int] = {}
+
+    def adicionar(self, prazo: int, hoje: Optional[date] = None) -> None:
+        self._avancar(_hoje(hoje))
+        if prazo < self._dia:
+            self._vencidas += 1
+        else:
+            self._futuras[prazo] = self._futuras.get(prazo, 0) + 1
+
+    def remover(self, prazo: int, hoje: Optional[date] = None) -> None:
+        self._avancar(_hoje(hoje))
+        if prazo < self._dia:
+            self._vencidas -= 1
+        elif self._futuras[prazo] == 1:
+            del self._futuras[prazo]
+        else:
+            self._futuras[prazo] -= 1
+
+    def vencidas(self, hoje: Optional[date] = None) -> int:
+        self._avancar(_hoje(hoje))
+        return self._vencidas
+
+    def mesclar(self, outro: 'ContadorAtrasos') -> None:
+        """Soma as contagens de outro contador (ex.: de outro processo)."""
+        dia = max(self._dia, outro._dia)
+        self._avancar(dia)
+        outro._avancar(dia)
+        self._vencidas += outro._vencidas
+        for prazo, quantidade in outro._futuras.items():
+            self._futuras[prazo] = self._futuras.get(prazo, 0) + quantidade
+
+    def _avancar(self, dia: int) -> None:
+        if dia <= self._dia:
+            return
+        if dia - self._dia <= len(self._futuras):
+            for vencido in range(self._dia, dia):
+                self._vencidas += self._futuras.pop(vencido, 0)
+        else:
+            for prazo in [p for p in self._futuras if p < dia]:
+                self._vencidas += self._futuras.pop(prazo)
+        self._dia = dia
+
+
+class EstatisticasTarefas:
+    """Agregados de um conjunto de tarefas, mantidos a cada mudança.
+
+    Guarda as contagens por status, o número de tarefas atrasadas e
+    esboços das datas de criação e de prazo das tarefas abertas, de onde
+    saem os percentis de idade e de dias de atraso dos relatórios.
+    """
+
+    def __init__(self, capacidade_esboco: int = 256):
+        self.por_status: Dict[str, int] = {}
+        self.atrasos = ContadorAtrasos()
+        self.criacao_abertas = EsbocoDatas(capacidade_esboco)
+        self.prazo_abertas = EsbocoDatas(capacidade_esboco)
+
+    @property
+    def total(self) -> int:
+        return sum(self.por_status.values())
+
+    def adicionar(self, tarefa: 'Tarefa') -> None:
+        self._contar(tarefa.status, 1)
+        if tarefa.status != tarefa.STATUS_CONCLUIDA:
+            self._abrir(tarefa)
+
+    def remover(self, tarefa: 'Tarefa') -> None:
+        self._contar(tarefa.status, -1)
+        if tarefa.status != tarefa.STATUS_CONCLUIDA:
+            self._fechar(tarefa)
+
+    def alterar_status(self, tarefa: 'Tarefa', anterior: str) -> None:
+        self._contar(anterior, -1)
+        self._contar(tarefa.status, 1)
+        estava_aberta = anterior != tarefa.STATUS_CONCLUIDA
+        esta_aberta = tarefa.status != tarefa.STATUS_CONCLUIDA
+        if estava_aberta and not esta_aberta:
+            self._fechar(tarefa)
+        elif esta_aberta and not estava_aberta:
+            self._abrir(tarefa)
+
+    def alterar_prazo(self, tarefa: 'Tarefa', anterior: Optional[date]) -> None:
+        """Move uma tarefa aberta do prazo ``anterior`` para o atual."""
+        if tarefa.status == tarefa.STATUS_CONCLUIDA:
+            return
+        if anterior is not None:
+            self.prazo_abertas.remover(anterior.toordinal())
+            self.atrasos.remover(anterior.toordinal())
+        if tarefa.prazo is not None:
+            self.prazo_abertas.adicionar(tarefa.prazo.toordinal())
+            self.atrasos.adicionar(tarefa.prazo.toordinal())
+
+    def mesclar(self, outra: 'EstatisticasTarefas') -> None:
+        """Incorpora os agregados de outro conjunto (disjunto) de tarefas."""
+        for status, quantidade in outra.por_status.items():
+            self._contar(status, quantidade)
+        self.atrasos.mesclar(outra.atrasos)
+        self.criacao_abertas.mesclar(outra.criacao_abertas)
+        self.prazo_abertas.mesclar(outra.prazo_abertas)
+
+    def percentis(self, hoje: Optional[date] = None,
+                  percentis: Iterable[float] = PERCENTIS_RELATORIO) -> Dict[str, float]:
+        """Percentis de idade e de atraso das tarefas abertas, em dias."""
+        referencia = _hoje(hoje)
+        percentis = list(percentis)
+        idade = self.criacao_abertas.quantis_distancia(referencia, percentis)
+        atraso = self.prazo_abertas.quantis_distancia(referencia, percentis,
+                                                     somente_anteriores=True)
+        resultado = {f"idade_p{p}": idade[p] for p in percentis}
+        resultado.update({f"atraso_p{p}": atraso[p] for p in percentis})
+        return resultado
+
+    def _contar(self, status: str, delta: int) -> None:
+        self.por_status[status] = self.por_status.get(status, 0) + delta
+
+    def _abrir(self, tarefa: 'Tarefa') -> None:
+        self.criacao_abertas.adicionar(tarefa.data_criacao.toordinal())
+        if tarefa.prazo is not None:
+            self.prazo_abertas.adicionar(tarefa.prazo.toordinal())
+            self.atrasos.adicionar(tarefa.prazo.toordinal())
+
+    def _fechar(self, tarefa: 'Tarefa') -> None:
+        self.criacao_abertas.remover(tarefa.data_criacao.toordinal())
+        if tarefa.prazo is not None:
+            self.prazo_abertas.remover(tarefa.prazo.toordinal())
+            self.atrasos.remover(tarefa.prazo.toordinal())
@@ -0,0 +1,233 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Set
+
+from .excecoes import SequenciaIndisponivelError
+
+
+class Evento:
+    """Mudança de estado emitida pelo gerenciador.
+
+    ``dados`` contém apenas valores simples (nomes, datas, números), de
+    modo que o evento pode ser copiado para outros processos e sistemas.
+    """
+
+    PROJETO_ADICIONADO = "projeto_adicionado"
+    PROJETO_REMOVIDO = "projeto_removido"
+    PROJETO_ARQUIVADO = "projeto_arquivado"
+    MEMBRO_CADASTRADO = "membro_cadastrado"
+    MEMBRO_ENTROU_PROJETO = "membro_entrou_projeto"
+    MEMBRO_SAIU_PROJETO = "membro_saiu_projeto"
+    TAREFA_CRIADA = "tarefa_criada"
+    TAREFA_INICIADA = "tarefa_iniciada"
+    TAREFA_CONCLUIDA = "tarefa_concluida"
+    TAREFA_REABERTA = "tarefa_reaberta"
+    TAREFA_REATRIBUIDA = "tarefa_reatribuida"
+    TAREFA_PRAZO_ALTERADO = "tarefa_prazo_alterado"
+    TAREFA_REMOVIDA = "tarefa_removida"
+    DEPENDENCIA_ADICIONADA = "dependencia_adicionada"
+    DEPENDENCIA_REMOVIDA = "dependencia_removida"
+    TAREFA_PAI_DEFINIDO = "tarefa_pai_definido"
+    DUPLICATA_SUSPEITA = "duplicata_suspeita"
+
+    __slots__ = ('seq', 'tipo', 'instante', 'dados')
+
+    def __init__(self, seq: int, tipo: str, instante: float, dados: Dict):
+        self.seq = seq
+        self.tipo = tipo
+        self.instante = instante
+        self.dados = dados
+
+    def __eq__(self, outro) -> bool:
+        return (isinstance(outro, Evento) and
+                (self.seq, self.tipo, self.dados) == (outro.seq, outro.tipo, outro.dados))
+
+    def __repr__(self) -> str:
+        return f"Evento(seq={self.seq}, tipo='{self.tipo}', dados={self.dados})"
+
+
+class FilaEventos:
+    """Consumidor assíncrono com fila limitada, lotes e contrapressão.
+
+    Com ``bloquear=True`` o publicador espera enquanto a fila está cheia
+    (até ``timeout`` segundos); com ``bloquear=False`` os eventos excedentes
+    são descartados e contados em ``descartados`` — o consumidor pode
+    recuperá-los com ``BarramentoEventos.desde`` se houver retenção.
+    """
+
+    def __init__(self, barramento: 'BarramentoEventos', capacidade: int,
+                 tipos: Optional[Set[str]], bloquear: bool, timeout: Optional[float]):
+        self._barramento = barramento
+        self._capacidade = capacidade
+        self._tipos = tipos
+        self._bloquear = bloquear
+        self._timeout = timeout
+        self._itens: Deque[Evento] = deque()
+        self._condicao = threading.Condition()
+        self._fechada = False
+        self.descartados = 0
+        self.ultimo_seq = 0
+
+    def __len__(self) -> int:
+        return len(self._itens)
+
+    def _entregar(self, evento: Evento) -> None:
+        if self._tipos is not None and evento.tipo not in self._tipos:
+            return
+        with self._condicao:
+            if len(self._itens) >= self._capacidade and self._bloquear:
+                self._condicao.wait_for(
+                    lambda: len(self._itens) < self._capacidade or self._fechada, self._timeout)
+            if len(self._itens) >= self._capacidade or self._fechada:
+                self.descartados += 1
+                return
+            self._itens.append(evento)
+            self._condicao.notify_all()
+
+    def _preencher(self, eventos: Iterable[Evento]) -> None:
+        # Reenvio da retenção antes de a fila ser registrada: não há
+        # consumidor ainda, então nada espera e nada é descartado (a fila
+        # pode passar da capacidade até ser esvaziada)
+        with self._condicao:
+            self._itens.extend(evento for evento in eventos
+                               if self._tipos is None or evento.tipo in self._tipos)
+
+    def lote(self, maximo: int = 100, timeout: Optional[float] = 0.0) -> List[Evento]:
+        """Retira até ``maximo`` eventos, esperando até ``timeout`` pelo primeiro."""
+        with self._condicao:
+            if not self._itens and timeout != 0.0:
+                self._condicao.wait_for(lambda: self._itens or self._fechada, timeout)
+            eventos = [self._itens.popleft() for _ in range(min(maximo, len(self._itens)))]
+            if eventos:
+                self.ultimo_seq = eventos[-1].seq
+                self._condicao.notify_all()
+            return eventos
+
+    def __iter__(self) -> Iterator[Evento]:
+        """Gera eventos até a fila ser fechada e esvaziada."""
+        while True:
+            eventos = self.lote(timeout=None)
+            if not eventos and self._fechada:
+                return
+            yield from eventos
+
+    def fechar(self) -> None:
+        self._barramento._remover_fila(self)
+        with self._condicao:
+            self._fechada = True
+            self._condicao.notify_all()
+
+
+class BarramentoEventos:
+    """Barramento de eventos de mudança (change data capture) do gerenciador.
+
+    Assinantes síncronos recebem cada evento logo após a mutação; filas
+    permitem consumo em outra thread. Os números de sequência são
+    contínuos, e com ``retencao`` > 0 os últimos eventos ficam guardados
+    para que um consumidor retome de onde parou. Sem assinantes nem
+    retenção, ``ativo`` é falso e o gerenciador nem monta os eventos.
+    """
+
+    def __init__(self, retencao: int = 0, relogio: Callable[[], float] = time.time):
+        self._relogio = relogio
+        self._seq = 0
+        self._retidos: Deque[Evento] = deque(maxlen=retencao or None)
+        self._retencao = retencao
+        self._assinantes: List[Callable[[Evento], None]] = []
+        self._filas: List[FilaEventos] = []
+        self._trava = threading.Lock()
+        self.ativo = retencao > 0
+
+    @property
+    def seq(self) -> int:
+        """Número de sequência do último evento publicado."""
+        return self._seq
+
+    @property
+    def retencao(self) -> int:
+        """Quantos dos últimos eventos ficam guardados (0 = nenhum)."""
+        return self._retencao
+
+    def configurar_retencao(self, retencao: int) -> None:
+        self._retencao = retencao
+        self._retidos = deque(self._retidos, maxlen=retencao or None) if retencao else deque()
+        self._atualizar_estado()
+
+    def assinar(self, assinante: Callable[[Evento], None],
+                tipos: Optional[Iterable[str]] = None) -> Callable[[Evento], None]:
+        """Registra um consumidor síncrono (opcionalmente filtrado por tipo)."""
+        if tipos is not None:
+            filtro = set(tipos)
+            original = assinante
+            assinante = lambda evento: original(evento) if evento.tipo in filtro else None
+        self._assinantes.append(assinante)
+        self._atualizar_estado()
+        return assinante
+
+    def cancelar_assinatura(self, assinante: Callable[[Evento], None]) -> None:
+        self._assinantes.remove(assinante)
+        self._atualizar_estado()
+
+    def fila(self, capacidade: int = 1000, tipos: Optional[Iterable[str]] = None,
+             bloquear: bool = True, timeout: Optional[float] = None,
+             desde: Optional[int] = None) -> FilaEventos:
+        """Cria um consumidor com fila limitada.
+
+        Args:
+            capacidade (int): Máximo de eventos pendentes na fila
+            tipos (Optional[Iterable[str]]): Tipos de evento desejados
+            bloquear (bool): Segura o publicador quando a fila enche
+            timeout (Optional[float]): Espera máxima do publicador, em segundos
+            desde (Optional[int]): Reenvia os eventos retidos após esta sequência;
+                eles entram na fila antes de qualquer evento novo, mesmo
+                que passem da capacidade
+
+        Raises:
+            SequenciaIndisponivelError: Se ``desde`` já saiu da retenção
+        """
+        fila = FilaEventos(self, capacidade, set(tipos) if tipos is not None else None,
+                           bloquear, timeout)
+        with self._trava:
+            if desde is not None:
+                fila._preencher(self._retidos_desde(desde))
+            self._filas.append(fila)
+            self.ativo = True
+        return fila
+
+    def desde(self, seq: int) -> List[Evento]:
+        """Eventos retidos com sequência maior que ``seq``.
+
+        Raises:
+            SequenciaIndisponivelError: Se parte dos eventos já foi descartada
+        """
+        with self._trava:
+            return self._retidos_desde(seq)
+
+    def publicar(self, tipo: str, **dados) -> Evento:
+        with self._trava:
+            self._seq += 1
+            evento = Evento(self._seq, tipo, self._relogio(), dados)
+            if self._retencao:
+                self._retidos.append(evento)
+            filas = list(self._filas)
+        for assinante in list(self._assinantes):
+            assinante(evento)
+        for fila in filas:
+            fila._entregar(evento)
+        return evento
+
+    def _retidos_desde(self, seq: int) -> List[Evento]:
+        primeiro = self._retidos[0].seq if self._retidos else self._seq + 1
+        if seq < self._seq and seq + 1 < primeiro:
+            raise SequenciaIndisponivelError(seq, primeiro)
+        return [evento for evento in self._retidos if evento.seq > seq]
+
+    def _remover_fila(self, fila: FilaEventos) -> None:
+        with self._trava:
+            if fila in self._filas:
+                self._filas.remove(fila)
+        self._atualizar_estado()
+
+    def _atualizar_estado(self) -> None:
+        self.ativo = bool(self._assinantes or self._filas or self._retencao)
@@ -1,6 +1,20 @@
+from typing import Optional
+
+
+def _recriar(classe, args, atributos):
+    erro = classe.__new__(classe)
+    erro.args = args
+    erro.__dict__.update(atributos)
+    return erro
+
+
 class ProjetoError(Exception):
     """Classe base para erros do sistema de gerenciamento de projetos."""
-    pass
+
+    def __reduce__(self):
+        # Os construtores das subclasses recebem nomes, não a mensagem; ao
+        # atravessar processos (pickle) o erro é recriado sem chamá-los.
+        return _recriar, (type(self), self.args, self.__dict__)
 
 
 class ProjetoNaoEncontradoError(ProjetoError):
@@ -42,6 +56,40 @@ class ResponsavelNaoEMembroError(ProjetoError):
         self.nome_responsavel = nome_responsavel
 
 
+class SemMembroElegivelError(ProjetoError):
+    def __init__(self, nome_projeto: str, funcao: Optional[str] = None):
+        detalhe = f" com a função '{funcao}'" if funcao else ""
+        super().__init__(f"Projeto '{nome_projeto}' não tem membros{detalhe} para receber tarefas")
+        self.nome_projeto = nome_projeto
+        self.funcao = funcao
+
+
+class DependenciaCiclicaError(ProjetoError):
+    def __init__(self, titulo_tarefa: str, titulo_bloqueadora: str):
+        super().__init__(
+            f"Tarefa '{titulo_tarefa}' não pode depender de '{titulo_bloqueadora}': "
+            "a dependência criaria um ciclo"
+        )
+        self.titulo_tarefa = titulo_tarefa
+        self.titulo_bloqueadora = titulo_bloqueadora
+
+
+class SequenciaIndisponivelError(ProjetoError):
+    def __init__(self, seq: int, primeiro_retido: int):
+        super().__init__(
+            f"Eventos após a sequência {seq} não estão mais retidos "
+            f"(o mais antigo disponível é {primeiro_retido})"
+        )
+        self.seq = seq
+        self.primeiro_retido = primeiro_retido
+
+
+class FilaCheiaError(ProjetoError):
+    def __init__(self, capacidade: int):
+        super().__init__(f"Fila de ingestão cheia ({capacidade} pedidos pendentes)")
+        self.capacidade = capacidade
+
+
 class OperacaoTarefaError(ProjetoError):
     """Erro durante operação com tarefa (criação/conclusão/atribuição)"""
     pass
@@ -55,5 +103,9 @@ __all__ = [
     'MembroNaoEncontradoError',
     'MembroJaExistenteError',
     'ResponsavelNaoEMembroError',
+    'SemMembroElegivelError',
+    'DependenciaCiclicaError',
+    'SequenciaIndisponivelError',
+    'FilaCheiaError',
     'OperacaoTarefaError'
 ]
\ No newline at end of file
@@ -1,23 +1,68 @@
-from typing import List, Dict, Optional
-from datetime import date
+import gc
+import weakref
+from typing import TYPE_CHECKING, Callable, Iterator, List, Dict, Optional
+from datetime import date, timedelta
 from .projeto import Projeto
 from .membro import Membro
 from .tarefa import Tarefa
+from .indices import IndicePrefixo, TabelaIds
+from .intervalos import IndiceCronograma
+from .atribuicao import BalanceadorCarga
+from .historico import HistoricoStatus
+from .estatisticas import EstatisticasTarefas
+from .cache import CacheRelatorios
+from .painel import PainelOperacional
+from .eventos import BarramentoEventos, Evento
+from .agenda import AgendadorAtrasos
 from .excecoes import (
     ProjetoNaoEncontradoError,
     TarefaNaoEncontradaError,
     MembroNaoEncontradoError,
-    ResponsavelNaoEMembroError
+    ResponsavelNaoEMembroError,
+    SemMembroElegivelError,
+    OperacaoTarefaError
 )
 
+if TYPE_CHECKING:
+    # Subsistemas opcionais (sqlite3, hashlib) só são importados ao serem ativados
+    from .armazenamento import ArmazemFrio
+    from .duplicatas import DetectorDuplicatas
+
 
 class GerenciadorProjetos:
     """Classe principal que gerencia todas as operações do sistema de projetos."""
     
     def __init__(self):
-        self._projetos: List[Projeto] = []
+        # Dicionários usados como conjuntos ordenados (remoção em O(1))
+        self._projetos: Dict[Projeto, None] = {}
         self._membros: List[Membro] = []
-        self._tarefas: List[Tarefa] = []
+        self._tarefas: Dict[Tarefa, None] = {}
+        self._tarefas_por_titulo: Dict[str, List[Tarefa]] = {}
+        self._projeto_da_tarefa: Dict[Tarefa, Projeto] = {}
+        self._projetos_do_membro: Dict[Membro, Dict[Projeto, None]] = {}
+        self._estatisticas_projeto: Dict[Projeto, EstatisticasTarefas] = {}
+        self._estatisticas_membro: Dict[Membro, EstatisticasTarefas] = {}
+        self._indice_projetos: IndicePrefixo[Projeto] = IndicePrefixo()
+        self._indice_membros: IndicePrefixo[Membro] = IndicePrefixo()
+        self._arquivo: Dict[str, Dict] = {}
+        self._cronograma = IndiceCronograma()
+        self._balanceador = BalanceadorCarga()
+        self._historico = HistoricoStatus()
+        self._cache = CacheRelatorios()
+        self._paineis: List[PainelOperacional] = []
+        self._eventos = BarramentoEventos()
+        self._agendadores: List[AgendadorAtrasos] = []
+        # Camada fria opcional (ver configurar_armazenamento_frio)
+        self._frio: Optional['ArmazemFrio'] = None
+        self._concluidas_residentes: Dict[Tarefa, None] = {}
+        self._idade_minima_frio = timedelta(days=30)
+        self._orcamento_tarefas: Optional[int] = None
+        self._duplicatas: Optional['DetectorDuplicatas[Tarefa]'] = None
+        self._ids_projetos: TabelaIds[Projeto] = TabelaIds()
+        self._ids_membros: TabelaIds[Membro] = TabelaIds()
+        self._ids_tarefas: TabelaIds[Tarefa] = TabelaIds()
+        # Uma única referência fraca compartilhada por todas as tarefas
+        self._observador_tarefas = weakref.ref(self)
     
     @property
     def projetos(self) -> List[Projeto]:
@@ -26,7 +71,7 @@ class GerenciadorProjetos:
         Returns:
             List[Projeto]: Lista de todos os projetos cadastrados
         """
-        return self._projetos.copy()
+        return list(self._projetos)
     
     @property
     def membros(self) -> List[Membro]:
@@ -41,10 +86,24 @@ class GerenciadorProjetos:
     def tarefas(self) -> List[Tarefa]:
         """Retorna uma cópia da lista de tarefas.
         
+        Com a camada fria ativa, as tarefas em disco são recarregadas antes;
+        para exportar sem trazê-las à memória use ``exportar_tarefas``.
+        
         Returns:
             List[Tarefa]: Lista de todas as tarefas cadastradas
         """
-        return self._tarefas.copy()
+        if self._frio is not None:
+            self._carregar(list(self._frio.todas()))
+        return list(self._tarefas)
+
+    @property
+    def eventos(self) -> BarramentoEventos:
+        """Barramento com os eventos de mudança (projetos, membros, tarefas).
+        
+        Returns:
+            BarramentoEventos: Barramento para assinar ou consumir em fila
+        """
+        return self._eventos
 
     def adicionar_projeto(self, projeto: Projeto) -> None:
         """Adiciona um novo projeto ao sistema.
@@ -55,9 +114,29 @@ class GerenciadorProjetos:
         Raises:
             ValueError: Se o projeto já existe no sistema
         """
+        self._adicionar_projeto(projeto)
+
+    def _adicionar_projeto(self, projeto: Projeto, id_projeto: Optional[int] = None) -> None:
+        # ``id_projeto`` reaproveita o id de outro gerenciador (réplicas e
+        # arquivos de estado), como em ``_registrar_tarefa``
         if projeto in self._projetos:
             raise ValueError(f"Projeto '{projeto.nome}' já existe no sistema")
-        self._projetos.append(projeto)
+        if id_projeto is not None:
+            self._ids_projetos.fixar(id_projeto, projeto)
+        self._projetos[projeto] = None
+        projeto.id = (self._ids_projetos.atribuir(projeto) if id_projeto is None
+                      else id_projeto)
+        self._estatisticas_projeto[projeto] = EstatisticasTarefas()
+        self._indice_projetos.adicionar(projeto.nome, projeto)
+        self._cronograma.adicionar_projeto(projeto)
+        for painel in self._paineis:
+            painel.projeto_adicionado(projeto)
+        for agendador in self._agendadores:
+            agendador.registrar_projeto(projeto)
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.PROJETO_ADICIONADO, id=projeto.id, nome=projeto.nome,
+                                   descricao=projeto.descricao, prazo=projeto.prazo,
+                                   data_criacao=projeto.data_criacao)
 
     def cadastrar_membro(self, membro: Membro) -> None:
         """Cadastra um novo membro no sistema.
@@ -68,9 +147,20 @@ class GerenciadorProjetos:
         Raises:
             ValueError: Se o membro já existe no sistema
         """
-        if any(m.nome.lower() == membro.nome.lower() for m in self._membros):
+        self._cadastrar_membro(membro)
+
+    def _cadastrar_membro(self, membro: Membro, id_membro: Optional[int] = None) -> None:
+        if membro.nome in self._indice_membros:
             raise ValueError(f"Membro '{membro.nome}' já está cadastrado")
+        if id_membro is not None:
+            self._ids_membros.fixar(id_membro, membro)
         self._membros.append(membro)
+        membro.id = self._ids_membros.atribuir(membro) if id_membro is None else id_membro
+        self._estatisticas_membro[membro] = EstatisticasTarefas()
+        self._indice_membros.adicionar(membro.nome, membro)
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.MEMBRO_CADASTRADO, id=membro.id, nome=membro.nome,
+                                   funcao=membro.funcao, email=membro.email)
 
     def buscar_projeto(self, nome_projeto: str) -> Optional[Projeto]:
         """Busca um projeto pelo nome.
@@ -81,10 +171,7 @@ class GerenciadorProjetos:
         Returns:
             Optional[Projeto]: O projeto encontrado ou None
         """
-        for projeto in self._projetos:
-            if projeto.nome.lower() == nome_projeto.lower():
-                return projeto
-        return None
+        return self._indice_projetos.buscar(nome_projeto)
 
     def buscar_membro(self, nome_membro: str) -> Optional[Membro]:
         """Busca um membro pelo nome.
@@ -95,10 +182,35 @@ class GerenciadorProjetos:
         Returns:
             Optional[Membro]: O membro encontrado ou None
         """
-        for membro in self._membros:
-            if membro.nome.lower() == nome_membro.lower():
-                return membro
-        return None
+        return self._indice_membros.buscar(nome_membro)
+
+    def sugerir_projetos(self, prefixo: str, limite: int = 10,
+                         tolerancia: bool = False) -> List[Projeto]:
+        """Autocompleta nomes de projetos a partir de um prefixo.
+        
+        Args:
+            prefixo (str): Início do nome digitado
+            limite (int): Quantidade máxima de sugestões
+            tolerancia (bool): Aceita um erro de digitação no prefixo
+            
+        Returns:
+            List[Projeto]: Projetos em ordem alfabética de nome
+        """
+        return self._indice_projetos.buscar_prefixo(prefixo, limite, tolerancia)
+
+    def sugerir_membros(self, prefixo: str, limite: int = 10,
+                        tolerancia: bool = False) -> List[Membro]:
+        """Autocompleta nomes de membros a partir de um prefixo.
+        
+        Args:
+            prefixo (str): Início do nome digitado
+            limite (int): Quantidade máxima de sugestões
+            tolerancia (bool): Aceita um erro de digitação no prefixo
+            
+        Returns:
+            List[Membro]: Membros em ordem alfabética de nome
+        """
+        return self._indice_membros.buscar_prefixo(prefixo, limite, tolerancia)
 
     def buscar_tarefa(self, titulo_tarefa: str) -> Optional[Tarefa]:
         """Busca uma tarefa pelo título.
@@ -109,11 +221,22 @@ class GerenciadorProjetos:
         Returns:
             Optional[Tarefa]: A tarefa encontrada ou None
         """
-        for tarefa in self._tarefas:
-            if tarefa.titulo.lower() == titulo_tarefa.lower():
-                return tarefa
+        tarefas = self._tarefas_por_titulo.get(titulo_tarefa.lower())
+        if tarefas:
+            return tarefas[0]
+        if self._frio is not None:
+            carregadas = self._carregar(self._frio.buscar(titulo_tarefa))
+            return carregadas[0] if carregadas else None
         return None
 
+    def _buscar_tarefa_projeto(self, projeto: Projeto, titulo_tarefa: str) -> Optional[Tarefa]:
+        """Busca no projeto e, se preciso, na camada fria."""
+        tarefa = projeto.buscar_tarefa(titulo_tarefa)
+        if tarefa is None and self._frio is not None:
+            carregadas = self._carregar(self._frio.buscar(titulo_tarefa, projeto.nome))
+            tarefa = carregadas[0] if carregadas else None
+        return tarefa
+
     def adicionar_membro_projeto(self, nome_projeto: str, nome_membro: str) -> None:
         """Adiciona um membro existente a um projeto.
         
@@ -133,7 +256,18 @@ class GerenciadorProjetos:
         if not membro:
             raise MembroNaoEncontradoError(nome_membro)
             
+        self._adicionar_membro_projeto(projeto, membro)
+
+    def _adicionar_membro_projeto(self, projeto: Projeto, membro: Membro) -> None:
         projeto.adicionar_membro(membro)
+        self._projetos_do_membro.setdefault(membro, {})[projeto] = None
+        self._balanceador.adicionar_membro(projeto, membro)
+        self._cache.invalidar(projeto, membro)
+        for painel in self._paineis:
+            painel.membro_adicionado(projeto, membro)
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.MEMBRO_ENTROU_PROJETO, projeto=projeto.nome,
+                                   membro=membro.nome)
 
     def criar_tarefa(self, nome_projeto: str, titulo: str, descricao: str, 
                     responsavel_nome: str, **kwargs) -> Tarefa:
@@ -162,14 +296,192 @@ class GerenciadorProjetos:
         if not responsavel:
             raise MembroNaoEncontradoError(responsavel_nome)
             
-        if responsavel not in projeto.membros:
-            raise ResponsavelNaoEMembroError(responsavel_nome)
+        return self._criar_tarefa(projeto, titulo, descricao, responsavel, **kwargs)
+
+    def _criar_tarefa(self, projeto: Projeto, titulo: str, descricao: str,
+                      responsavel: Membro, id_tarefa: Optional[int] = None,
+                      **kwargs) -> Tarefa:
+        if not projeto.possui_membro(responsavel):
+            raise ResponsavelNaoEMembroError(responsavel.nome)
             
         tarefa = Tarefa(titulo, descricao, responsavel, **kwargs)
+        self._registrar_tarefa(projeto, tarefa, id_tarefa)
+        return tarefa
+
+    def criar_tarefa_automatica(self, nome_projeto: str, titulo: str, descricao: str,
+                                funcao: Optional[str] = None, **kwargs) -> Tarefa:
+        """Cria uma tarefa atribuindo-a ao membro menos carregado do projeto.
+        
+        A carga de cada membro é a soma dos pesos das suas tarefas abertas
+        em todos os projetos (prioridade ponderada pela proximidade do prazo).
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            titulo (str): Título da tarefa
+            descricao (str): Descrição da tarefa
+            funcao (Optional[str]): Restringe a escolha a membros desta função
+            **kwargs: Argumentos adicionais para a Tarefa
+            
+        Returns:
+            Tarefa: A tarefa criada
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            SemMembroElegivelError: Se nenhum membro do projeto é elegível
+        """
+        return self.criar_tarefas_automaticas(
+            nome_projeto, [dict(kwargs, titulo=titulo, descricao=descricao)], funcao)[0]
+
+    def criar_tarefas_automaticas(self, nome_projeto: str, especificacoes: List[Dict],
+                                  funcao: Optional[str] = None) -> List[Tarefa]:
+        """Cria um lote de tarefas distribuindo-as pela carga dos membros.
+        
+        Cada tarefa vai para o membro elegível menos carregado no momento,
+        já considerando as tarefas anteriores do lote. O lote custa
+        O(N log M) para N tarefas e M membros.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            especificacoes (List[Dict]): Argumentos de cada Tarefa
+                (titulo, descricao, prazo, prioridade)
+            funcao (Optional[str]): Restringe a escolha a membros desta função
+            
+        Returns:
+            List[Tarefa]: As tarefas criadas, na ordem das especificações
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            SemMembroElegivelError: Se nenhum membro do projeto é elegível
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+            
+        tarefas = []
+        for especificacao in especificacoes:
+            responsavel = self._balanceador.escolher(projeto, funcao)
+            if responsavel is None:
+                raise SemMembroElegivelError(nome_projeto, funcao)
+            tarefa = Tarefa(responsavel=responsavel, **especificacao)
+            self._registrar_tarefa(projeto, tarefa)
+            tarefas.append(tarefa)
+        return tarefas
+
+    def _registrar_tarefa(self, projeto: Projeto, tarefa: Tarefa,
+                          id_tarefa: Optional[int] = None) -> None:
+        """Adiciona uma tarefa já validada ao projeto e a todos os índices.
+
+        ``id_tarefa`` reaproveita o id de outro gerenciador (réplicas e
+        arquivos de estado); sem ele, um id novo é atribuído.
+        """
+        if id_tarefa is not None:
+            self._ids_tarefas.fixar(id_tarefa, tarefa)
         projeto.adicionar_tarefa(tarefa)
-        self._tarefas.append(tarefa)
+        self._tarefas[tarefa] = None
+        tarefa.id = (self._ids_tarefas.atribuir(tarefa) if id_tarefa is None else id_tarefa)
+        self._tarefas_por_titulo.setdefault(tarefa.titulo.lower(), []).append(tarefa)
+        self._projeto_da_tarefa[tarefa] = projeto
+        self._cronograma.adicionar_tarefa(tarefa)
+        self._balanceador.atualizar_tarefa(tarefa)
+        self._historico.registrar_criacao(tarefa, projeto.nome)
+        self._estatisticas_projeto[projeto].adicionar(tarefa)
+        self._estatisticas_membro[tarefa.responsavel].adicionar(tarefa)
+        self._cache.invalidar(projeto, tarefa.responsavel)
+        for painel in self._paineis:
+            painel.tarefa_adicionada(projeto, tarefa)
+        for agendador in self._agendadores:
+            agendador.registrar_tarefa(tarefa)
+        tarefa._observador = self._observador_tarefas
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.TAREFA_CRIADA, projeto=projeto.nome,
+                                   id=tarefa.id, titulo=tarefa.titulo, descricao=tarefa.descricao,
+                                   responsavel=tarefa.responsavel.nome, prazo=tarefa.prazo,
+                                   prioridade=tarefa.prioridade,
+                                   estimativa_dias=tarefa.estimativa_dias,
+                                   data_criacao=tarefa.data_criacao)
+        if self._duplicatas is not None:
+            semelhantes = self._duplicatas.adicionar(tarefa, self._texto_tarefa(tarefa))
+            if semelhantes and self._eventos.ativo:
+                self._eventos.publicar(
+                    Evento.DUPLICATA_SUSPEITA, projeto=projeto.nome, titulo=tarefa.titulo,
+                    semelhantes=[(self._projeto_da_tarefa[t].nome, t.titulo, similaridade)
+                                 for t, similaridade in semelhantes])
+
+    _TIPOS_EVENTO_STATUS = {
+        Tarefa.STATUS_PENDENTE: Evento.TAREFA_REABERTA,
+        Tarefa.STATUS_EM_ANDAMENTO: Evento.TAREFA_INICIADA,
+        Tarefa.STATUS_CONCLUIDA: Evento.TAREFA_CONCLUIDA,
+    }
+
+    def _ao_alterar_status(self, tarefa: Tarefa, status_anterior: str) -> None:
+        """Mantém os índices em dia quando o status de uma tarefa muda."""
+        self._cronograma.atualizar_tarefa(tarefa)
+        self._balanceador.atualizar_tarefa(tarefa)
+        self._historico.registrar_status(tarefa)
+        projeto = self._projeto_da_tarefa[tarefa]
+        projeto.status_alterado(tarefa, status_anterior)
+        self._estatisticas_projeto[projeto].alterar_status(tarefa, status_anterior)
+        self._estatisticas_membro[tarefa.responsavel].alterar_status(tarefa, status_anterior)
+        self._cache.invalidar(projeto, tarefa.responsavel)
+        for painel in self._paineis:
+            painel.status_alterado(projeto, tarefa, status_anterior)
+        if Tarefa.STATUS_CONCLUIDA in (tarefa.status, status_anterior):
+            # Só concluir ou reabrir muda a agenda; iniciar uma tarefa já
+            # avisada não pode reagendá-la (e avisá-la de novo)
+            for agendador in self._agendadores:
+                agendador.registrar_tarefa(tarefa)
+        if self._eventos.ativo:
+            self._eventos.publicar(self._TIPOS_EVENTO_STATUS[tarefa.status],
+                                   projeto=projeto.nome, id=tarefa.id, titulo=tarefa.titulo,
+                                   status=tarefa.status, anterior=status_anterior,
+                                   data_conclusao=tarefa.data_conclusao)
+        if self._frio is not None:
+            if tarefa.status == Tarefa.STATUS_CONCLUIDA:
+                self._concluidas_residentes[tarefa] = None
+                self._respeitar_orcamento()
+            else:
+                self._concluidas_residentes.pop(tarefa, None)
+
+    def _ao_alterar_prazo(self, tarefa: Tarefa, prazo_anterior: Optional[date]) -> None:
+        """Mantém os índices em dia quando o prazo de uma tarefa muda."""
+        projeto = self._projeto_da_tarefa[tarefa]
+        self._cronograma.atualizar_tarefa(tarefa)
+        # O peso de urgência é fixado na entrada da carga: entra de novo
+        self._balanceador.remover_tarefa(tarefa)
+        self._balanceador.atualizar_tarefa(tarefa)
+        projeto.prazo_alterado(tarefa, prazo_anterior)
+        self._estatisticas_projeto[projeto].alterar_prazo(tarefa, prazo_anterior)
+        self._estatisticas_membro[tarefa.responsavel].alterar_prazo(tarefa, prazo_anterior)
+        self._cache.invalidar(projeto, tarefa.responsavel)
+        for painel in self._paineis:
+            painel.prazo_alterado(projeto, tarefa, prazo_anterior)
+        for agendador in self._agendadores:
+            agendador.registrar_tarefa(tarefa)
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.TAREFA_PRAZO_ALTERADO, projeto=projeto.nome,
+                                   id=tarefa.id, titulo=tarefa.titulo, prazo=tarefa.prazo,
+                                   anterior=prazo_anterior)
+
+    def iniciar_tarefa(self, nome_projeto: str, titulo_tarefa: str) -> None:
+        """Marca uma tarefa como em andamento.
         
-        return tarefa
+        Args:
+            nome_projeto (str): Nome do projeto
+            titulo_tarefa (str): Título da tarefa
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            TarefaNaoEncontradaError: Se tarefa não existe no projeto
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+            
+        tarefa = self._buscar_tarefa_projeto(projeto, titulo_tarefa)
+        if not tarefa:
+            raise TarefaNaoEncontradaError(titulo_tarefa)
+            
+        tarefa.iniciar()
 
     def concluir_tarefa(self, nome_projeto: str, titulo_tarefa: str) -> None:
         """Marca uma tarefa como concluída.
@@ -186,14 +498,712 @@ class GerenciadorProjetos:
         if not projeto:
             raise ProjetoNaoEncontradoError(nome_projeto)
             
-        tarefa = next((t for t in projeto.tarefas 
-                      if t.titulo.lower() == titulo_tarefa.lower()), None)
-        
+        tarefa = self._buscar_tarefa_projeto(projeto, titulo_tarefa)
         if not tarefa:
             raise TarefaNaoEncontradaError(titulo_tarefa)
             
         tarefa.concluir()
 
+    def adicionar_dependencia(self, nome_projeto: str, titulo_tarefa: str,
+                              titulo_bloqueadora: str) -> None:
+        """Registra que uma tarefa só pode terminar depois de outra do mesmo projeto.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            titulo_tarefa (str): Título da tarefa bloqueada
+            titulo_bloqueadora (str): Título da tarefa que a bloqueia
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            TarefaNaoEncontradaError: Se alguma das tarefas não existe no projeto
+            DependenciaCiclicaError: Se a dependência criaria um ciclo
+        """
+        self._adicionar_dependencia(*self._resolver_dependencia(
+            nome_projeto, titulo_tarefa, titulo_bloqueadora))
+
+    def _adicionar_dependencia(self, projeto: Projeto, tarefa: Tarefa,
+                               bloqueadora: Tarefa) -> None:
+        projeto.adicionar_dependencia(tarefa, bloqueadora)
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.DEPENDENCIA_ADICIONADA, projeto=projeto.nome,
+                                   id=tarefa.id, titulo=tarefa.titulo,
+                                   id_bloqueadora=bloqueadora.id,
+                                   bloqueadora=bloqueadora.titulo)
+
+    def remover_dependencia(self, nome_projeto: str, titulo_tarefa: str,
+                            titulo_bloqueadora: str) -> bool:
+        """Desfaz uma dependência entre tarefas de um projeto.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            titulo_tarefa (str): Título da tarefa bloqueada
+            titulo_bloqueadora (str): Título da tarefa que a bloqueia
+            
+        Returns:
+            bool: False se a dependência não existia
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            TarefaNaoEncontradaError: Se alguma das tarefas não existe no projeto
+        """
+        return self._remover_dependencia(*self._resolver_dependencia(
+            nome_projeto, titulo_tarefa, titulo_bloqueadora))
+
+    def _remover_dependencia(self, projeto: Projeto, tarefa: Tarefa,
+                             bloqueadora: Tarefa) -> bool:
+        removida = projeto.remover_dependencia(tarefa, bloqueadora)
+        if removida and self._eventos.ativo:
+            self._eventos.publicar(Evento.DEPENDENCIA_REMOVIDA, projeto=projeto.nome,
+                                   id=tarefa.id, titulo=tarefa.titulo,
+                                   id_bloqueadora=bloqueadora.id,
+                                   bloqueadora=bloqueadora.titulo)
+        return removida
+
+    def _resolver_dependencia(self, nome_projeto: str, titulo_tarefa: str,
+                              titulo_bloqueadora: str):
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+        tarefas = []
+        for titulo in (titulo_tarefa, titulo_bloqueadora):
+            tarefa = self._buscar_tarefa_projeto(projeto, titulo)
+            if not tarefa:
+                raise TarefaNaoEncontradaError(titulo)
+            tarefas.append(tarefa)
+        return projeto, tarefas[0], tarefas[1]
+
+    def definir_tarefa_pai(self, nome_projeto: str, titulo_tarefa: str,
+                           titulo_pai: Optional[str]) -> None:
+        """Coloca uma tarefa sob um épico (ou outra tarefa) do mesmo projeto.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            titulo_tarefa (str): Título da tarefa a ser movida, com suas subtarefas
+            titulo_pai (Optional[str]): Título do novo pai; None a leva para a raiz
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            TarefaNaoEncontradaError: Se alguma das tarefas não existe no projeto
+            OperacaoTarefaError: Se o pai está dentro da subárvore da tarefa
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+        tarefa = self._buscar_tarefa_projeto(projeto, titulo_tarefa)
+        if not tarefa:
+            raise TarefaNaoEncontradaError(titulo_tarefa)
+        pai = None
+        if titulo_pai is not None:
+            pai = self._buscar_tarefa_projeto(projeto, titulo_pai)
+            if not pai:
+                raise TarefaNaoEncontradaError(titulo_pai)
+        self._definir_tarefa_pai(projeto, tarefa, pai)
+
+    def _definir_tarefa_pai(self, projeto: Projeto, tarefa: Tarefa,
+                            pai: Optional[Tarefa]) -> None:
+        try:
+            projeto.definir_tarefa_pai(tarefa, pai)
+        except ValueError as erro:
+            raise OperacaoTarefaError(str(erro)) from erro
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.TAREFA_PAI_DEFINIDO, projeto=projeto.nome,
+                                   id=tarefa.id, titulo=tarefa.titulo,
+                                   id_pai=pai.id if pai else None,
+                                   pai=pai.titulo if pai else None)
+
+    def resumo_tarefa(self, nome_projeto: str, titulo_tarefa: str) -> Dict:
+        """Gera o resumo de uma tarefa somado ao de todas as suas subtarefas.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            titulo_tarefa (str): Título da tarefa (épico)
+            
+        Returns:
+            Dict: Contagens por status, percentual de conclusão, soma das
+            prioridades, último prazo e tarefas atrasadas da subárvore
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            TarefaNaoEncontradaError: Se tarefa não existe no projeto
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+        tarefa = self._buscar_tarefa_projeto(projeto, titulo_tarefa)
+        if not tarefa:
+            raise TarefaNaoEncontradaError(titulo_tarefa)
+        return projeto.resumo_subarvore(tarefa)
+
+    def ativar_deteccao_duplicatas(self, limiar: float = 0.7) -> None:
+        """Passa a procurar quase-duplicatas (título e descrição) a cada nova tarefa.
+        
+        As tarefas atuais são indexadas de uma vez; depois, cada tarefa
+        criada é comparada só com as que caem nos mesmos baldes de LSH, e
+        suspeitas são publicadas no barramento como ``duplicata_suspeita``.
+        Tarefas na camada fria não participam até serem recarregadas.
+        
+        Args:
+            limiar (float): Similaridade de Jaccard estimada (0 a 1) para suspeitar
+        """
+        from .duplicatas import DetectorDuplicatas
+        self._duplicatas = DetectorDuplicatas(limiar=limiar)
+        for tarefa in self._tarefas:
+            self._duplicatas.adicionar(tarefa, self._texto_tarefa(tarefa))
+
+    def possiveis_duplicatas(self, nome_projeto: str, titulo_tarefa: str) -> List[Tarefa]:
+        """Lista as tarefas, de qualquer projeto, parecidas com a tarefa informada.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            titulo_tarefa (str): Título da tarefa
+            
+        Returns:
+            List[Tarefa]: Tarefas da mais para a menos parecida
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            TarefaNaoEncontradaError: Se tarefa não existe no projeto
+            OperacaoTarefaError: Se a detecção de duplicatas não foi ativada
+        """
+        if self._duplicatas is None:
+            raise OperacaoTarefaError("Detecção de duplicatas não ativada")
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+        tarefa = self._buscar_tarefa_projeto(projeto, titulo_tarefa)
+        if not tarefa:
+            raise TarefaNaoEncontradaError(titulo_tarefa)
+        return [t for t, _ in self._duplicatas.semelhantes(tarefa)]
+
+    def grupos_duplicados(self) -> List[List[Tarefa]]:
+        """Agrupa todas as tarefas indexadas em conjuntos de prováveis duplicatas.
+        
+        Returns:
+            List[List[Tarefa]]: Grupos com duas ou mais tarefas
+            
+        Raises:
+            OperacaoTarefaError: Se a detecção de duplicatas não foi ativada
+        """
+        if self._duplicatas is None:
+            raise OperacaoTarefaError("Detecção de duplicatas não ativada")
+        return self._duplicatas.agrupar()
+
+    @staticmethod
+    def _texto_tarefa(tarefa: Tarefa) -> str:
+        return f"{tarefa.titulo} {tarefa.descricao}"
+
+    def caminho_critico(self, nome_projeto: str) -> List[Tarefa]:
+        """Lista a cadeia de tarefas abertas que determina o término do projeto.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            
+        Returns:
+            List[Tarefa]: Tarefas em ordem de execução
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+        return projeto.caminho_critico()
+
+    def prazo_em_risco(self, nome_projeto: str) -> bool:
+        """Indica se o caminho crítico termina depois do prazo do projeto.
+        
+        Cada tarefa aberta leva ``estimativa_dias`` e só começa depois das
+        que a bloqueiam; tarefas sem dependência correm em paralelo.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            
+        Returns:
+            bool: True se a previsão de conclusão passa do prazo
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+        return projeto.prazo_em_risco()
+
+    def remover_tarefa(self, nome_projeto: str, titulo_tarefa: str) -> Tarefa:
+        """Exclui uma tarefa do projeto, do responsável e de todos os índices.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            titulo_tarefa (str): Título da tarefa
+            
+        Returns:
+            Tarefa: A tarefa removida
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            TarefaNaoEncontradaError: Se tarefa não existe no projeto
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+            
+        tarefa = self._buscar_tarefa_projeto(projeto, titulo_tarefa)
+        if not tarefa:
+            raise TarefaNaoEncontradaError(titulo_tarefa)
+            
+        self._remover_tarefa(projeto, tarefa)
+        return tarefa
+
+    def _remover_tarefa(self, projeto: Projeto, tarefa: Tarefa) -> None:
+        id_tarefa = tarefa.id
+        projeto.remover_tarefa(tarefa)
+        self._descartar_tarefa(tarefa)
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.TAREFA_REMOVIDA, projeto=projeto.nome,
+                                   id=id_tarefa, titulo=tarefa.titulo)
+
+    def remover_projeto(self, nome_projeto: str) -> Projeto:
+        """Exclui um projeto e, em cascata, todas as suas tarefas.
+        
+        As tarefas deixam de constar nas listas dos responsáveis e nos
+        índices do gerenciador; os membros continuam cadastrados. O custo é
+        proporcional ao tamanho do projeto removido.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            
+        Returns:
+            Projeto: O projeto removido
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+            
+        self._remover_projeto(projeto)
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.PROJETO_REMOVIDO, nome=projeto.nome)
+        return projeto
+
+    def _remover_projeto(self, projeto: Projeto) -> None:
+        if self._frio is not None:
+            self._carregar(self._frio.do_projeto(projeto.nome))
+        for tarefa in projeto.tarefas:
+            self._descartar_tarefa(tarefa)
+        self._balanceador.remover_projeto(projeto)
+        for membro in projeto.membros:
+            self._desvincular_membro(projeto, membro)
+        del self._projetos[projeto]
+        self._ids_projetos.liberar(projeto.id)
+        del self._estatisticas_projeto[projeto]
+        self._cache.esquecer(projeto)
+        for painel in self._paineis:
+            painel.projeto_removido(projeto)
+        for agendador in self._agendadores:
+            agendador.cancelar(projeto)
+        self._indice_projetos.remover(projeto.nome, projeto)
+        self._cronograma.remover_projeto(projeto)
+
+    def arquivar_projeto(self, nome_projeto: str) -> Dict:
+        """Arquiva um projeto concluído, guardando apenas o relatório final.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            
+        Returns:
+            Dict: Relatório final do projeto, mantido no arquivo
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            OperacaoTarefaError: Se o projeto ainda tem tarefas abertas
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+            
+        if not self._projeto_concluido(projeto):
+            raise OperacaoTarefaError(f"Projeto '{projeto.nome}' ainda não foi concluído")
+            
+        relatorio = self.relatorio_projeto(nome_projeto)
+        self._remover_projeto(projeto)
+        self._arquivo[projeto.nome.lower()] = relatorio
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.PROJETO_ARQUIVADO, nome=projeto.nome)
+        return relatorio
+
+    def _projeto_concluido(self, projeto: Projeto) -> bool:
+        # Pelos contadores, que incluem as tarefas na camada fria
+        # (``Projeto.concluido`` só enxerga as residentes)
+        estatisticas = self._estatisticas_projeto[projeto]
+        total = estatisticas.total
+        return bool(total) and estatisticas.por_status.get(Tarefa.STATUS_CONCLUIDA, 0) == total
+
+    def arquivar_projetos_concluidos(self) -> List[str]:
+        """Arquiva todos os projetos cujas tarefas estão concluídas.
+        
+        Returns:
+            List[str]: Nomes dos projetos arquivados
+        """
+        concluidos = [p.nome for p in self._projetos if self._projeto_concluido(p)]
+        for nome in concluidos:
+            self.arquivar_projeto(nome)
+        return concluidos
+
+    def relatorio_arquivado(self, nome_projeto: str) -> Dict:
+        """Retorna o relatório final de um projeto arquivado.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            
+        Returns:
+            Dict: Relatório gerado no momento do arquivamento
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não foi arquivado
+        """
+        relatorio = self._arquivo.get(nome_projeto.lower())
+        if relatorio is None:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+        return dict(relatorio)
+
+    def _descartar_tarefa(self, tarefa: Tarefa) -> None:
+        """Desfaz todas as referências do gerenciador a uma tarefa."""
+        projeto = self._projeto_da_tarefa[tarefa]
+        self._estatisticas_projeto[projeto].remover(tarefa)
+        self._estatisticas_membro[tarefa.responsavel].remover(tarefa)
+        self._cache.invalidar(projeto, tarefa.responsavel)
+        for painel in self._paineis:
+            painel.tarefa_removida(projeto, tarefa)
+        for agendador in self._agendadores:
+            agendador.cancelar(tarefa)
+        self._concluidas_residentes.pop(tarefa, None)
+        self._ids_tarefas.liberar(tarefa.id)
+        self._historico.registrar_remocao(tarefa)
+        self._desindexar_tarefa(tarefa)
+
+    def _desindexar_tarefa(self, tarefa: Tarefa) -> Optional[int]:
+        """Tira a tarefa das estruturas que guardam o objeto (não dos contadores).
+        
+        Returns:
+            Optional[int]: Código da tarefa no histórico
+        """
+        del self._tarefas[tarefa]
+        del self._projeto_da_tarefa[tarefa]
+        mesmo_titulo = self._tarefas_por_titulo[tarefa.titulo.lower()]
+        mesmo_titulo.remove(tarefa)
+        if not mesmo_titulo:
+            del self._tarefas_por_titulo[tarefa.titulo.lower()]
+        self._cronograma.remover_tarefa(tarefa)
+        self._balanceador.remover_tarefa(tarefa)
+        tarefa.responsavel.remover_tarefa(tarefa)
+        tarefa._observador = None
+        if self._duplicatas is not None:
+            self._duplicatas.remover(tarefa)
+        return self._historico.esquecer(tarefa)
+
+    def configurar_armazenamento_frio(self, caminho: str = ':memory:',
+                                      idade_minima_dias: int = 30,
+                                      orcamento_tarefas: Optional[int] = None) -> None:
+        """Ativa a camada em disco para tarefas concluídas.
+        
+        Tarefas concluídas há pelo menos ``idade_minima_dias`` saem da
+        memória em ``descarregar_concluidas``; com ``orcamento_tarefas``, as
+        concluídas residentes mais antigas também saem sempre que o total
+        passa do orçamento. Contadores, relatórios, painéis e histórico não
+        mudam. Buscas por título, consultas de cronograma e exportações
+        recarregam as tarefas de forma transparente. Tarefas com
+        dependências ou em épicos ficam sempre na memória. Reconfigurar
+        traz de volta as tarefas da camada anterior antes de trocar de arquivo.
+        
+        Args:
+            caminho (str): Arquivo SQLite (':memory:' para testes)
+            idade_minima_dias (int): Dias desde a conclusão para descarregar
+            orcamento_tarefas (Optional[int]): Máximo de tarefas concluídas em memória
+        """
+        if self._frio is not None:
+            self._carregar(list(self._frio.todas()))
+            self._frio.fechar()
+        from .armazenamento import ArmazemFrio
+        self._frio = ArmazemFrio(caminho)
+        self._idade_minima_frio = timedelta(days=idade_minima_dias)
+        self._orcamento_tarefas = orcamento_tarefas
+        self._concluidas_residentes = {t: None for t in self._tarefas
+                                       if t.status == Tarefa.STATUS_CONCLUIDA}
+        self._respeitar_orcamento()
+
+    def descarregar_concluidas(self, hoje: Optional[date] = None) -> int:
+        """Grava em disco as tarefas concluídas antes do limite de idade.
+        
+        Args:
+            hoje (Optional[date]): Data de referência (padrão: hoje)
+            
+        Returns:
+            int: Quantidade de tarefas descarregadas
+            
+        Raises:
+            OperacaoTarefaError: Se a camada fria não foi configurada
+        """
+        if self._frio is None:
+            raise OperacaoTarefaError("Armazenamento frio não configurado")
+        limite = (hoje or date.today()) - self._idade_minima_frio
+        return self._descarregar([t for t in self._concluidas_residentes
+                                  if t.data_conclusao <= limite])
+
+    def exportar_tarefas(self) -> Iterator[Dict]:
+        """Percorre todas as tarefas, inclusive as em disco, sem recarregá-las.
+        
+        Returns:
+            Iterator[Dict]: Um dicionário por tarefa (id, projeto, título,
+            descrição, responsável, prazo, prioridade, estimativa, status e datas)
+        """
+        for tarefa in list(self._tarefas):
+            yield {
+                "id": tarefa.id,
+                "projeto": self._projeto_da_tarefa[tarefa].nome,
+                "titulo": tarefa.titulo,
+                "descricao": tarefa.descricao,
+                "responsavel": tarefa.responsavel.nome,
+                "prazo": tarefa.prazo,
+                "prioridade": tarefa.prioridade,
+                "estimativa_dias": tarefa.estimativa_dias,
+                "status": tarefa.status,
+                "data_criacao": tarefa.data_criacao,
+                "data_conclusao": tarefa.data_conclusao,
+            }
+        if self._frio is not None:
+            from .armazenamento import COLUNAS
+            for linha in self._frio.todas():
+                dados = dict(zip(COLUNAS, linha))
+                yield {
+                    "id": dados["id"],
+                    "projeto": dados["projeto"],
+                    "titulo": dados["titulo"],
+                    "descricao": dados["descricao"],
+                    "responsavel": dados["responsavel"],
+                    "prazo": date.fromordinal(dados["prazo"]) if dados["prazo"] else None,
+                    "prioridade": dados["prioridade"],
+                    "estimativa_dias": dados["estimativa_dias"],
+                    "status": Tarefa.STATUS_CONCLUIDA,
+                    "data_criacao": date.fromordinal(dados["criacao"]),
+                    "data_conclusao": date.fromordinal(dados["conclusao"]),
+                }
+
+    def estatisticas_armazenamento(self) -> Dict:
+        """Retorna quantas tarefas estão em memória e em disco e as sondagens feitas.
+        
+        Returns:
+            Dict: Residentes, concluídas residentes, em disco, sondagens ao
+            disco e sondagens evitadas pelo filtro de Bloom
+        """
+        estatisticas = {"residentes": len(self._tarefas),
+                        "concluidas_residentes": len(self._concluidas_residentes)}
+        if self._frio is not None:
+            estatisticas.update(self._frio.estatisticas())
+        return estatisticas
+
+    def congelar_para_coletor(self) -> int:
+        """Tira os objetos vivos do rastreamento do coletor cíclico (``gc.freeze``).
+        
+        Indicado depois de carregar um modelo grande e de vida longa: as
+        coletas seguintes deixam de percorrer esses objetos. Como as
+        referências de volta (membro -> tarefas, tarefa -> gerenciador) são
+        fracas, o que for descartado depois continua sendo liberado pela
+        contagem de referências. Vale para o processo inteiro; use
+        ``gc.unfreeze()`` para desfazer.
+        
+        Returns:
+            int: Quantidade de objetos congelados no processo
+        """
+        gc.collect()
+        gc.freeze()
+        return gc.get_freeze_count()
+
+    def _respeitar_orcamento(self) -> None:
+        if self._orcamento_tarefas is None:
+            return
+        excedente = len(self._concluidas_residentes) - self._orcamento_tarefas
+        if excedente > 0:
+            candidatas = []
+            for tarefa in self._concluidas_residentes:
+                if len(candidatas) == excedente:
+                    break
+                candidatas.append(tarefa)
+            self._descarregar(candidatas)
+
+    def _descarregar(self, tarefas: List[Tarefa]) -> int:
+        linhas = []
+        for tarefa in tarefas:
+            projeto = self._projeto_da_tarefa[tarefa]
+            if not projeto.tarefa_isolada(tarefa):
+                continue
+            del self._concluidas_residentes[tarefa]
+            projeto.remover_tarefa(tarefa)
+            codigo = self._desindexar_tarefa(tarefa)
+            self._ids_tarefas.reservar(tarefa.id)
+            linhas.append((tarefa.id, projeto.nome, tarefa.titulo, tarefa.descricao,
+                           tarefa.responsavel.nome,
+                           tarefa.prazo.toordinal() if tarefa.prazo else None,
+                           tarefa.prioridade, tarefa.estimativa_dias,
+                           tarefa.data_criacao.toordinal(), tarefa.data_conclusao.toordinal(),
+                           codigo))
+        if linhas:
+            self._frio.guardar(linhas)
+        return len(linhas)
+
+    def _carregar(self, linhas: List) -> List[Tarefa]:
+        """Traz tarefas da camada fria de volta à memória, sem recontá-las."""
+        from .armazenamento import COLUNAS
+        tarefas = []
+        for linha in linhas:
+            dados = dict(zip(COLUNAS, linha))
+            projeto = self._indice_projetos.buscar(dados["projeto"])
+            tarefa = Tarefa(dados["titulo"], dados["descricao"],
+                            self._indice_membros.buscar(dados["responsavel"]),
+                            date.fromordinal(dados["prazo"]) if dados["prazo"] else None,
+                            dados["prioridade"], dados["estimativa_dias"])
+            tarefa.status = Tarefa.STATUS_CONCLUIDA
+            tarefa.data_criacao = date.fromordinal(dados["criacao"])
+            tarefa.data_conclusao = date.fromordinal(dados["conclusao"])
+            projeto.adicionar_tarefa(tarefa)
+            self._tarefas[tarefa] = None
+            tarefa.id = dados["id"]
+            if not self._ids_tarefas.restaurar(tarefa.id, tarefa):
+                # Linha gravada por outro gerenciador no mesmo arquivo
+                tarefa.id = self._ids_tarefas.atribuir(tarefa)
+            self._tarefas_por_titulo.setdefault(tarefa.titulo.lower(), []).append(tarefa)
+            self._projeto_da_tarefa[tarefa] = projeto
+            self._cronograma.adicionar_tarefa(tarefa)
+            if dados["codigo_historico"] is not None:
+                self._historico.restaurar(tarefa, dados["codigo_historico"])
+            self._concluidas_residentes[tarefa] = None
+            tarefa._observador = self._observador_tarefas
+            if self._duplicatas is not None:
+                self._duplicatas.adicionar(tarefa, self._texto_tarefa(tarefa))
+            tarefas.append(tarefa)
+        if linhas:
+            self._frio.remover(linha[0] for linha in linhas)
+        return tarefas
+
+    def reatribuir_tarefa(self, nome_projeto: str, titulo_tarefa: str,
+                          novo_responsavel_nome: str) -> Tarefa:
+        """Transfere uma tarefa para outro membro do projeto.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            titulo_tarefa (str): Título da tarefa
+            novo_responsavel_nome (str): Nome do novo responsável
+            
+        Returns:
+            Tarefa: A tarefa reatribuída
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            TarefaNaoEncontradaError: Se tarefa não existe no projeto
+            MembroNaoEncontradoError: Se membro não existe
+            ResponsavelNaoEMembroError: Se novo responsável não é membro do projeto
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+            
+        tarefa = self._buscar_tarefa_projeto(projeto, titulo_tarefa)
+        if not tarefa:
+            raise TarefaNaoEncontradaError(titulo_tarefa)
+            
+        responsavel = self.buscar_membro(novo_responsavel_nome)
+        if not responsavel:
+            raise MembroNaoEncontradoError(novo_responsavel_nome)
+            
+        if not projeto.possui_membro(responsavel):
+            raise ResponsavelNaoEMembroError(novo_responsavel_nome)
+            
+        self._mover_tarefa(projeto, tarefa, responsavel)
+        return tarefa
+
+    def remover_membro_projeto(self, nome_projeto: str, nome_membro: str,
+                               redistribuir: bool = True) -> List[Tarefa]:
+        """Retira um membro de um projeto, redistribuindo suas tarefas abertas.
+        
+        As tarefas abertas do membro no projeto vão, uma a uma, para o membro
+        restante menos carregado. Tarefas concluídas continuam registradas em
+        nome de quem as concluiu. O custo é proporcional às tarefas do membro
+        no projeto, não ao total de tarefas do sistema.
+        
+        Args:
+            nome_projeto (str): Nome do projeto
+            nome_membro (str): Nome do membro que sai do projeto
+            redistribuir (bool): Se False, a saída só é permitida quando o
+                membro não tem tarefas abertas no projeto
+            
+        Returns:
+            List[Tarefa]: Tarefas que mudaram de responsável
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            MembroNaoEncontradoError: Se membro não existe ou não está no projeto
+            SemMembroElegivelError: Se não sobra ninguém para receber as tarefas
+            OperacaoTarefaError: Se há tarefas abertas e redistribuir é False
+        """
+        projeto = self.buscar_projeto(nome_projeto)
+        if not projeto:
+            raise ProjetoNaoEncontradoError(nome_projeto)
+            
+        membro = self.buscar_membro(nome_membro)
+        if not membro or not projeto.possui_membro(membro):
+            raise MembroNaoEncontradoError(nome_membro)
+            
+        abertas = [t for t in projeto.tarefas_do_membro(membro)
+                   if t.status != Tarefa.STATUS_CONCLUIDA]
+        if abertas and not redistribuir:
+            raise OperacaoTarefaError(
+                f"Membro '{membro.nome}' tem {len(abertas)} tarefas abertas no projeto")
+        if abertas and len(projeto.membros) < 2:
+            raise SemMembroElegivelError(nome_projeto)
+            
+        self._retirar_membro(projeto, membro)
+        for tarefa in abertas:
+            self._mover_tarefa(projeto, tarefa, self._balanceador.escolher(projeto))
+        return abertas
+
+    def _retirar_membro(self, projeto: Projeto, membro: Membro) -> None:
+        """Tira o membro do projeto sem mexer nas tarefas dele."""
+        projeto.remover_membro(membro)
+        self._desvincular_membro(projeto, membro)
+        self._balanceador.remover_membro(projeto, membro)
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.MEMBRO_SAIU_PROJETO, projeto=projeto.nome,
+                                   membro=membro.nome)
+
+    def _desvincular_membro(self, projeto: Projeto, membro: Membro) -> None:
+        projetos = self._projetos_do_membro[membro]
+        del projetos[projeto]
+        if not projetos:
+            del self._projetos_do_membro[membro]
+        self._cache.invalidar(projeto, membro)
+        for painel in self._paineis:
+            painel.membro_removido(projeto, membro)
+
+    def _mover_tarefa(self, projeto: Projeto, tarefa: Tarefa, responsavel: Membro) -> None:
+        """Troca o responsável de uma tarefa mantendo os índices coerentes."""
+        self._cronograma.remover_tarefa(tarefa)
+        self._balanceador.remover_tarefa(tarefa)
+        self._estatisticas_membro[tarefa.responsavel].remover(tarefa)
+        self._cache.invalidar(projeto, tarefa.responsavel, responsavel)
+        anterior = tarefa.responsavel
+        projeto.reatribuir_tarefa(tarefa, responsavel)
+        self._cronograma.adicionar_tarefa(tarefa)
+        self._balanceador.atualizar_tarefa(tarefa)
+        self._estatisticas_membro[responsavel].adicionar(tarefa)
+        for painel in self._paineis:
+            painel.responsavel_alterado(tarefa, anterior)
+        self._historico.registrar_responsavel(tarefa)
+        if self._eventos.ativo:
+            self._eventos.publicar(Evento.TAREFA_REATRIBUIDA, projeto=projeto.nome,
+                                   id=tarefa.id, titulo=tarefa.titulo, responsavel=responsavel.nome,
+                                   anterior=anterior.nome)
+
     def relatorio_projeto(self, nome_projeto: str) -> Dict:
         """Gera um relatório detalhado de um projeto.
         
@@ -201,7 +1211,9 @@ class GerenciadorProjetos:
             nome_projeto (str): Nome do projeto
             
         Returns:
-            Dict: Dicionário com estatísticas do projeto
+            Dict: Dicionário com estatísticas do projeto, incluindo os
+            percentis (p50/p90/p99) de idade das tarefas abertas e de dias
+            de atraso das tarefas vencidas
             
         Raises:
             ProjetoNaoEncontradoError: Se projeto não existe
@@ -210,21 +1222,17 @@ class GerenciadorProjetos:
         if not projeto:
             raise ProjetoNaoEncontradoError(nome_projeto)
             
-        return {
+        return self._cache.obter(projeto, lambda: self._gerar_relatorio_projeto(projeto))
+
+    def _gerar_relatorio_projeto(self, projeto: Projeto) -> Dict:
+        relatorio = {
             "nome": projeto.nome,
             "descricao": projeto.descricao,
             "prazo": projeto.prazo.strftime('%d/%m/%Y') if projeto.prazo else None,
             "total_membros": len(projeto.membros),
-            "total_tarefas": len(projeto.tarefas),
-            "tarefas_pendentes": len([t for t in projeto.tarefas 
-                                    if t.status == Tarefa.STATUS_PENDENTE]),
-            "tarefas_andamento": len([t for t in projeto.tarefas 
-                                    if t.status == Tarefa.STATUS_EM_ANDAMENTO]),
-            "tarefas_concluidas": len([t for t in projeto.tarefas 
-                                     if t.status == Tarefa.STATUS_CONCLUIDA]),
-            "tarefas_atrasadas": len([t for t in projeto.tarefas 
-                                    if t.esta_atrasada()])
         }
+        relatorio.update(self._resumo_estatisticas(self._estatisticas_projeto[projeto]))
+        return relatorio
 
     def relatorio_membro(self, nome_membro: str) -> Dict:
         """Gera um relatório das atividades de um membro.
@@ -233,7 +1241,8 @@ class GerenciadorProjetos:
             nome_membro (str): Nome do membro
             
         Returns:
-            Dict: Dicionário com estatísticas do membro
+            Dict: Dicionário com estatísticas do membro, incluindo os
+            mesmos percentis de idade e de atraso do relatório de projeto
             
         Raises:
             MembroNaoEncontradoError: Se membro não existe
@@ -242,19 +1251,333 @@ class GerenciadorProjetos:
         if not membro:
             raise MembroNaoEncontradoError(nome_membro)
             
-        tarefas = [t for t in self._tarefas if t.responsavel == membro]
-        
-        return {
+        return self._cache.obter(membro, lambda: self._gerar_relatorio_membro(membro))
+
+    def _gerar_relatorio_membro(self, membro: Membro) -> Dict:
+        relatorio = {
             "nome": membro.nome,
             "funcao": membro.funcao,
-            "total_tarefas": len(tarefas),
-            "tarefas_pendentes": len([t for t in tarefas 
-                                     if t.status == Tarefa.STATUS_PENDENTE]),
-            "tarefas_andamento": len([t for t in tarefas 
-                                    if t.status == Tarefa.STATUS_EM_ANDAMENTO]),
-            "tarefas_concluidas": len([t for t in tarefas 
-                                     if t.status == Tarefa.STATUS_CONCLUIDA]),
-            "tarefas_atrasadas": len([t for t in tarefas 
-                                    if t.esta_atrasada()]),
-            "projetos": [p.nome for p in self._projetos if membro in p.membros]
-        }
\ No newline at end of file
+        }
+        relatorio.update(self._resumo_estatisticas(self._estatisticas_membro[membro]))
+        relatorio["projetos"] = [p.nome for p in self._projetos_do_membro.get(membro, ())]
+        return relatorio
+
+    def projeto_por_id(self, id_projeto: int) -> Projeto:
+        """Resolve um projeto pelo id, sem normalizar nem procurar o nome.
+        
+        Os ids valem só neste gerenciador e só enquanto o projeto existir:
+        o id de um projeto removido não resolve para nenhum outro.
+        
+        Args:
+            id_projeto (int): Id do projeto (``projeto.id``)
+            
+        Returns:
+            Projeto: O projeto com esse id
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se o id não existe ou o projeto foi removido
+        """
+        projeto = self._ids_projetos.obter(id_projeto)
+        if projeto is None:
+            raise ProjetoNaoEncontradoError(f"#{id_projeto}")
+        return projeto
+
+    def membro_por_id(self, id_membro: int) -> Membro:
+        """Resolve um membro pelo id.
+        
+        Args:
+            id_membro (int): Id do membro (``membro.id``)
+            
+        Returns:
+            Membro: O membro com esse id
+            
+        Raises:
+            MembroNaoEncontradoError: Se o id não existe
+        """
+        membro = self._ids_membros.obter(id_membro)
+        if membro is None:
+            raise MembroNaoEncontradoError(f"#{id_membro}")
+        return membro
+
+    def tarefa_por_id(self, id_tarefa: int) -> Tarefa:
+        """Resolve uma tarefa pelo id, recarregando-a da camada fria se preciso.
+        
+        O id se mantém quando a tarefa vai para o disco e volta.
+        
+        Args:
+            id_tarefa (int): Id da tarefa (``tarefa.id``)
+            
+        Returns:
+            Tarefa: A tarefa com esse id
+            
+        Raises:
+            TarefaNaoEncontradaError: Se o id não existe ou a tarefa foi removida
+        """
+        tarefa = self._ids_tarefas.obter(id_tarefa)
+        if tarefa is None and self._frio is not None:
+            carregadas = self._carregar(self._frio.por_id(id_tarefa))
+            tarefa = carregadas[0] if carregadas else None
+        if tarefa is None:
+            raise TarefaNaoEncontradaError(f"#{id_tarefa}")
+        return tarefa
+
+    def adicionar_membro_projeto_por_id(self, id_projeto: int, id_membro: int) -> None:
+        """Como ``adicionar_membro_projeto``, identificando projeto e membro por id.
+        
+        Raises:
+            ProjetoNaoEncontradoError: Se o projeto não existe
+            MembroNaoEncontradoError: Se o membro não existe
+        """
+        self._adicionar_membro_projeto(self.projeto_por_id(id_projeto),
+                                       self.membro_por_id(id_membro))
+
+    def criar_tarefa_por_id(self, id_projeto: int, titulo: str, descricao: str,
+                            id_responsavel: int, **kwargs) -> Tarefa:
+        """Como ``criar_tarefa``, identificando projeto e responsável por id.
+        
+        Returns:
+            Tarefa: A tarefa criada (o seu id fica em ``tarefa.id``)
+            
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+            MembroNaoEncontradoError: Se membro não existe
+            ResponsavelNaoEMembroError: Se responsável não é membro do projeto
+        """
+        return self._criar_tarefa(self.projeto_por_id(id_projeto), titulo, descricao,
+                                  self.membro_por_id(id_responsavel), **kwargs)
+
+    def iniciar_tarefa_por_id(self, id_tarefa: int) -> None:
+        """Marca como em andamento a tarefa com esse id.
+        
+        Raises:
+            TarefaNaoEncontradaError: Se a tarefa não existe
+        """
+        self.tarefa_por_id(id_tarefa).iniciar()
+
+    def concluir_tarefa_por_id(self, id_tarefa: int) -> None:
+        """Marca como concluída a tarefa com esse id.
+        
+        Raises:
+            TarefaNaoEncontradaError: Se a tarefa não existe
+        """
+        self.tarefa_por_id(id_tarefa).concluir()
+
+    def relatorio_projeto_por_id(self, id_projeto: int) -> Dict:
+        """Como ``relatorio_projeto``, identificando o projeto por id.
+        
+        Raises:
+            ProjetoNaoEncontradoError: Se projeto não existe
+        """
+        projeto = self.projeto_por_id(id_projeto)
+        return self._cache.obter(projeto, lambda: self._gerar_relatorio_projeto(projeto))
+
+    def relatorio_membro_por_id(self, id_membro: int) -> Dict:
+        """Como ``relatorio_membro``, identificando o membro por id.
+        
+        Raises:
+            MembroNaoEncontradoError: Se membro não existe
+        """
+        membro = self.membro_por_id(id_membro)
+        return self._cache.obter(membro, lambda: self._gerar_relatorio_membro(membro))
+
+    def criar_painel(self) -> PainelOperacional:
+        """Cria uma visão materializada do portfólio mantida a cada mutação.
+        
+        A visão é construída uma vez a partir do estado atual e depois
+        atualizada em O(1) por mudança; use ``assinar`` para ser avisado.
+        
+        Returns:
+            PainelOperacional: A visão criada
+        """
+        painel = PainelOperacional()
+        painel.reconstruir(self._projetos, self._concluidas_em_disco())
+        self._paineis.append(painel)
+        return painel
+
+    def verificar_painel(self, painel: PainelOperacional, hoje: Optional[date] = None) -> bool:
+        """Confere uma visão contra uma reconstrução, contando a camada fria.
+        
+        Args:
+            painel (PainelOperacional): Visão a ser conferida
+            hoje (Optional[date]): Data de referência para os atrasos
+            
+        Returns:
+            bool: True se a visão incremental bate com a reconstrução
+        """
+        return painel.verificar(self._projetos, hoje, self._concluidas_em_disco())
+
+    def _concluidas_em_disco(self) -> Dict[Projeto, int]:
+        if self._frio is None:
+            return {}
+        return {self.buscar_projeto(nome): quantidade
+                for nome, quantidade in self._frio.contar_por_projeto().items()}
+
+    def remover_painel(self, painel: PainelOperacional) -> None:
+        """Deixa de alimentar uma visão criada por ``criar_painel``.
+        
+        Args:
+            painel (PainelOperacional): Visão a ser desligada
+        """
+        self._paineis.remove(painel)
+
+    def criar_agendador_atrasos(self, hoje: Callable[[], date] = date.today
+                                ) -> AgendadorAtrasos:
+        """Cria uma agenda que avisa quando tarefas e projetos ficam atrasados.
+        
+        A agenda recebe as tarefas abertas e os projetos atuais e passa a ser
+        mantida a cada mutação: tarefas concluídas ou removidas saem dela.
+        Chame ``verificar`` periodicamente; cada atraso é avisado uma vez.
+        
+        Args:
+            hoje (Callable[[], date]): Relógio usado para saber a data atual
+            
+        Returns:
+            AgendadorAtrasos: A agenda criada
+        """
+        agendador = AgendadorAtrasos(hoje)
+        for projeto in self._projetos:
+            agendador.registrar_projeto(projeto)
+        for tarefa in self._tarefas:
+            agendador.registrar_tarefa(tarefa)
+        self._agendadores.append(agendador)
+        return agendador
+
+    def remover_agendador_atrasos(self, agendador: AgendadorAtrasos) -> None:
+        """Deixa de alimentar uma agenda criada por ``criar_agendador_atrasos``.
+        
+        Args:
+            agendador (AgendadorAtrasos): Agenda a ser desligada
+        """
+        self._agendadores.remove(agendador)
+
+    def estatisticas_cache(self) -> Dict:
+        """Retorna acertos, falhas, expirações e despejos do cache de relatórios.
+        
+        Returns:
+            Dict: Contadores e taxa de acerto do cache
+        """
+        return self._cache.estatisticas()
+
+    @staticmethod
+    def _resumo_estatisticas(estatisticas: EstatisticasTarefas) -> Dict:
+        """Contagens e percentis de idade/atraso mantidos incrementalmente."""
+        resumo = {
+            "total_tarefas": estatisticas.total,
+            "tarefas_pendentes": estatisticas.por_status.get(Tarefa.STATUS_PENDENTE, 0),
+            "tarefas_andamento": estatisticas.por_status.get(Tarefa.STATUS_EM_ANDAMENTO, 0),
+            "tarefas_concluidas": estatisticas.por_status.get(Tarefa.STATUS_CONCLUIDA, 0),
+            "tarefas_atrasadas": estatisticas.atrasos.vencidas(),
+        }
+        resumo.update(estatisticas.percentis())
+        return resumo
+
+    def tarefas_ativas_entre(self, inicio: date, fim: date) -> List[Tarefa]:
+        """Lista as tarefas cujo período de atividade cruza o intervalo.
+        
+        Args:
+            inicio (date): Primeiro dia do intervalo
+            fim (date): Último dia do intervalo (inclusive)
+            
+        Returns:
+            List[Tarefa]: Tarefas ordenadas pela data de criação
+        """
+        if self._frio is not None:
+            self._carregar(self._frio.entre(inicio.toordinal(), fim.toordinal()))
+        return self._cronograma.tarefas_entre(inicio, fim)
+
+    def tarefas_ativas_em(self, dia: date) -> List[Tarefa]:
+        """Lista as tarefas ativas em um dia específico.
+        
+        Args:
+            dia (date): Dia consultado
+            
+        Returns:
+            List[Tarefa]: Tarefas ordenadas pela data de criação
+        """
+        if self._frio is not None:
+            self._carregar(self._frio.entre(dia.toordinal(), dia.toordinal()))
+        return self._cronograma.tarefas_em(dia)
+
+    def projetos_ativos_entre(self, inicio: date, fim: date) -> List[Projeto]:
+        """Lista os projetos cujo período (criação até prazo) cruza o intervalo.
+        
+        Args:
+            inicio (date): Primeiro dia do intervalo
+            fim (date): Último dia do intervalo (inclusive)
+            
+        Returns:
+            List[Projeto]: Projetos ordenados pela data de criação
+        """
+        return self._cronograma.projetos_entre(inicio, fim)
+
+    def projetos_ativos_em(self, dia: date) -> List[Projeto]:
+        """Lista os projetos ativos em um dia específico.
+        
+        Args:
+            dia (date): Dia consultado
+            
+        Returns:
+            List[Projeto]: Projetos ordenados pela data de criação
+        """
+        return self._cronograma.projetos_em(dia)
+
+    def carga_membro_no_dia(self, nome_membro: str, dia: date) -> int:
+        """Conta quantas tarefas de um membro estão ativas em um dia.
+        
+        Args:
+            nome_membro (str): Nome do membro
+            dia (date): Dia consultado
+            
+        Returns:
+            int: Número de tarefas ativas do membro no dia
+            
+        Raises:
+            MembroNaoEncontradoError: Se membro não existe
+        """
+        membro = self.buscar_membro(nome_membro)
+        if not membro:
+            raise MembroNaoEncontradoError(nome_membro)
+        if self._frio is not None:
+            self._carregar(self._frio.entre(dia.toordinal(), dia.toordinal(), membro.nome))
+        return len(self._cronograma.tarefas_membro_em(membro, dia))
+
+    def vazao(self, periodo: str = 'dia', nome_projeto: Optional[str] = None,
+              nome_membro: Optional[str] = None) -> Dict[date, int]:
+        """Conta as tarefas concluídas por dia ou por semana.
+        
+        Args:
+            periodo (str): 'dia' ou 'semana' (semanas começam na segunda-feira)
+            nome_projeto (Optional[str]): Restringe a um projeto
+            nome_membro (Optional[str]): Restringe a um membro
+            
+        Returns:
+            Dict[date, int]: Conclusões por dia (ou início de semana)
+        """
+        return self._historico.vazao(periodo, nome_projeto, nome_membro)
+
+    def wip_por_dia(self, nome_projeto: Optional[str] = None,
+                    nome_membro: Optional[str] = None) -> Dict[date, int]:
+        """Calcula o trabalho em andamento ao final de cada dia com mudanças.
+        
+        Args:
+            nome_projeto (Optional[str]): Restringe a um projeto
+            nome_membro (Optional[str]): Restringe a um membro
+            
+        Returns:
+            Dict[date, int]: Tarefas em andamento por dia
+        """
+        return self._historico.wip(nome_projeto, nome_membro)
+
+    def percentis_tempo(self, medida: str = 'ciclo', agrupar_por: Optional[str] = None,
+                        percentis=(50, 90, 99)) -> Dict:
+        """Calcula percentis de tempo de ciclo ou de lead time, em dias.
+        
+        Args:
+            medida (str): 'ciclo' (início até conclusão) ou 'lead' (criação até conclusão)
+            agrupar_por (Optional[str]): None, 'projeto' ou 'membro'
+            percentis: Percentis desejados (0 a 100)
+            
+        Returns:
+            Dict: Percentis gerais ou por nome de projeto/membro
+        """
+        return self._historico.percentis_tempo(medida, agrupar_por, percentis)
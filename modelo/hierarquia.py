@@ -0,0 +1,178 @@
+from datetime import date
+from typing import Dict, Iterator, List, Optional
+
+from .estatisticas import ContadorAtrasos
+from .tarefa import Tarefa
+
+
+class ResumoSubarvore:
+    """Agregados de uma tarefa e de todas as suas descendentes."""
+
+    __slots__ = ('por_status', 'soma_prioridades', 'atrasos', '_prazos', '_ultimo_prazo')
+
+    def __init__(self):
+        self.por_status: Dict[str, int] = {}
+        self.soma_prioridades = 0
+        self.atrasos = ContadorAtrasos()
+        self._prazos: Dict[int, int] = {}
+        self._ultimo_prazo = 0
+
+    @property
+    def total(self) -> int:
+        return sum(self.por_status.values())
+
+    @property
+    def ultimo_prazo(self) -> Optional[date]:
+        if self._ultimo_prazo not in self._prazos:
+            self._ultimo_prazo = max(self._prazos, default=0)
+        return date.fromordinal(self._ultimo_prazo) if self._ultimo_prazo else None
+
+    def aplicar(self, tarefa: Tarefa, sinal: int) -> None:
+        """Soma (sinal 1) ou retira (sinal -1) a contribuição de uma tarefa."""
+        self._contar(tarefa.status, sinal)
+        self.soma_prioridades += sinal * tarefa.prioridade
+        self._contar_prazo(tarefa, tarefa.prazo, sinal)
+
+    def alterar_prazo(self, tarefa: Tarefa, anterior: Optional[date]) -> None:
+        self._contar_prazo(tarefa, anterior, -1)
+        self._contar_prazo(tarefa, tarefa.prazo, 1)
+
+    def alterar_status(self, tarefa: Tarefa, anterior: str) -> None:
+        self._contar(anterior, -1)
+        self._contar(tarefa.status, 1)
+        estava_aberta = anterior != tarefa.STATUS_CONCLUIDA
+        esta_aberta = tarefa.status != tarefa.STATUS_CONCLUIDA
+        if tarefa.prazo is not None and estava_aberta != esta_aberta:
+            self._atraso(tarefa.prazo.toordinal(), 1 if esta_aberta else -1)
+
+    def como_dict(self, hoje: Optional[date] = None) -> Dict:
+        total = self.total
+        concluidas = self.por_status.get(Tarefa.STATUS_CONCLUIDA, 0)
+        return {
+            "total_tarefas": total,
+            "tarefas_pendentes": self.por_status.get(Tarefa.STATUS_PENDENTE, 0),
+            "tarefas_andamento": self.por_status.get(Tarefa.STATUS_EM_ANDAMENTO, 0),
+            "tarefas_concluidas": concluidas,
+            "percentual_conclusao": 100.0 * concluidas / total if total else 0.0,
+            "soma_prioridades": self.soma_prioridades,
+            "ultimo_prazo": self.ultimo_prazo,
+            "tarefas_atrasadas": self.atrasos.vencidas(hoje),
+        }
+
+    def _contar(self, status: str, delta: int) -> None:
+        restante = self.por_status.get(status, 0) + delta
+        if restante:
+            self.por_status[status] = restante
+        else:
+            self.por_status.pop(status, None)
+
+    def _contar_prazo(self, tarefa: Tarefa, dia: Optional[date], sinal: int) -> None:
+        if dia is None:
+            return
+        prazo = dia.toordinal()
+        restante = self._prazos.get(prazo, 0) + sinal
+        if restante:
+            self._prazos[prazo] = restante
+            self._ultimo_prazo = max(self._ultimo_prazo, prazo)
+        else:
+            del self._prazos[prazo]
+        if tarefa.status != tarefa.STATUS_CONCLUIDA:
+            self._atraso(prazo, sinal)
+
+    def _atraso(self, prazo: int, sinal: int) -> None:
+        if sinal > 0:
+            self.atrasos.adicionar(prazo)
+        else:
+            self.atrasos.remover(prazo)
+
+
+class HierarquiaTarefas:
+    """Relações de épico/subtarefa com agregados mantidos em cada nível.
+
+    Toda tarefa que tem filhas guarda um ``ResumoSubarvore`` de si mesma e
+    das descendentes. Uma mudança de status percorre só a cadeia de
+    ancestrais (O(profundidade)) e ler o resumo de qualquer subárvore é
+    O(1). Mover uma subárvore custa O(tamanho × profundidade), já que cada
+    tarefa movida sai dos resumos antigos e entra nos novos.
+    """
+
+    def __init__(self):
+        self._pai: Dict[Tarefa, Tarefa] = {}
+        self._filhos: Dict[Tarefa, Dict[Tarefa, None]] = {}
+        self._resumos: Dict[Tarefa, ResumoSubarvore] = {}
+
+    def pai(self, tarefa: Tarefa) -> Optional[Tarefa]:
+        return self._pai.get(tarefa)
+
+    def participa(self, tarefa: Tarefa) -> bool:
+        return tarefa in self._pai or tarefa in self._filhos
+
+    def filhos(self, tarefa: Tarefa) -> List[Tarefa]:
+        return list(self._filhos.get(tarefa, ()))
+
+    def definir_pai(self, tarefa: Tarefa, pai: Optional[Tarefa]) -> None:
+        """Coloca a tarefa (com sua subárvore) sob ``pai``, ou na raiz se None."""
+        ancestral = pai
+        while ancestral is not None:
+            if ancestral is tarefa:
+                raise ValueError(
+                    f"Tarefa '{tarefa.titulo}' não pode ficar sob a própria subárvore")
+            ancestral = self._pai.get(ancestral)
+        subarvore = list(self._subarvore(tarefa))
+        anterior = self._pai.pop(tarefa, None)
+        if anterior is not None:
+            self._propagar(anterior, subarvore, -1)
+            irmas = self._filhos[anterior]
+            del irmas[tarefa]
+            if not irmas:
+                del self._filhos[anterior]
+                del self._resumos[anterior]
+        if pai is not None:
+            if pai not in self._filhos:
+                self._filhos[pai] = {}
+                self._resumos[pai] = resumo = ResumoSubarvore()
+                resumo.aplicar(pai, 1)
+            self._filhos[pai][tarefa] = None
+            self._pai[tarefa] = pai
+            self._propagar(pai, subarvore, 1)
+
+    def remover_tarefa(self, tarefa: Tarefa) -> None:
+        """Retira uma tarefa; as filhas sobem para o pai dela."""
+        avo = self._pai.get(tarefa)
+        if avo is not None:
+            self.definir_pai(tarefa, None)
+        for filha in list(self._filhos.get(tarefa, ())):
+            self.definir_pai(filha, avo)
+
+    def alterar_status(self, tarefa: Tarefa, anterior: str) -> None:
+        no = tarefa if tarefa in self._resumos else self._pai.get(tarefa)
+        while no is not None:
+            self._resumos[no].alterar_status(tarefa, anterior)
+            no = self._pai.get(no)
+
+    def alterar_prazo(self, tarefa: Tarefa, anterior: Optional[date]) -> None:
+        no = tarefa if tarefa in self._resumos else self._pai.get(tarefa)
+        while no is not None:
+            self._resumos[no].alterar_prazo(tarefa, anterior)
+            no = self._pai.get(no)
+
+    def resumo(self, tarefa: Tarefa, hoje: Optional[date] = None) -> Dict:
+        resumo = self._resumos.get(tarefa)
+        if resumo is None:
+            resumo = ResumoSubarvore()
+            resumo.aplicar(tarefa, 1)
+        return resumo.como_dict(hoje)
+
+    def _subarvore(self, tarefa: Tarefa) -> Iterator[Tarefa]:
+        pilha = [tarefa]
+        while pilha:
+            atual = pilha.pop()
+            yield atual
+            pilha.extend(self._filhos.get(atual, ()))
+
+    def _propagar(self, no: Optional[Tarefa], tarefas: List[Tarefa], sinal: int) -> None:
+        while no is not None:
+            resumo = self._resumos[no]
+            for tarefa in tarefas:
+                resumo.aplicar(tarefa, sinal)
+            no = self._pai.get(no)
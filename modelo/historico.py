@@ -0,0 +1,240 @@
+import sys
+import time
+from array import array
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .tarefa import Tarefa
+
+CODIGOS_STATUS = {
+    Tarefa.STATUS_PENDENTE: 0,
+    Tarefa.STATUS_EM_ANDAMENTO: 1,
+    Tarefa.STATUS_CONCLUIDA: 2,
+}
+_PENDENTE, _ANDAMENTO, _CONCLUIDA = 0, 1, 2
+# Evento terminal de uma tarefa excluída: sai do WIP e das concluídas
+_REMOVIDA = 3
+_SEGUNDOS_DIA = 86400.0
+
+
+def percentil(ordenados: List[float], p: float) -> float:
+    """Percentil com interpolação linear sobre uma lista já ordenada."""
+    if not ordenados:
+        return 0.0
+    posicao = (len(ordenados) - 1) * p / 100
+    base = int(posicao)
+    if base + 1 >= len(ordenados):
+        return ordenados[-1]
+    return ordenados[base] + (ordenados[base + 1] - ordenados[base]) * (posicao - base)
+
+
+def percentis_por_grupo(grupos: Dict[Optional[str], List[float]], percentis: Iterable[float],
+                        agrupado: bool) -> Dict:
+    """Percentis de cada lista de durações (as listas são ordenadas no lugar)."""
+    percentis = list(percentis)
+    resultado = {}
+    for chave, duracoes in grupos.items():
+        duracoes.sort()
+        resultado[chave] = {p: percentil(duracoes, p) for p in percentis}
+    if not agrupado:
+        return resultado.get(None, {p: 0.0 for p in percentis})
+    return resultado
+
+
+class HistoricoStatus:
+    """Log compacto, somente de acréscimo, das mudanças de status das tarefas.
+
+    Cada evento ocupa três posições em arrays paralelos (instante, código
+    da tarefa e código do status), sem um objeto por evento. Projetos e
+    membros são guardados como códigos inteiros, então o histórico
+    sobrevive à remoção das tarefas.
+    """
+
+    def __init__(self, relogio: Callable[[], float] = time.time):
+        self._relogio = relogio
+        self._instantes = array('d')
+        self._eventos_tarefa = array('l')
+        self._eventos_status = array('b')
+        self._projeto_tarefa = array('l')
+        self._membro_tarefa = array('l')
+        self._codigos: Dict[Tarefa, int] = {}
+        self._nomes_projetos: List[str] = []
+        self._nomes_membros: List[str] = []
+        self._codigo_projeto: Dict[str, int] = {}
+        self._codigo_membro: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._instantes)
+
+    def tamanho_em_bytes(self) -> int:
+        """Memória ocupada pelos arrays do log (eventos e dados por tarefa)."""
+        return sum(sys.getsizeof(a) for a in (
+            self._instantes, self._eventos_tarefa, self._eventos_status,
+            self._projeto_tarefa, self._membro_tarefa))
+
+    def registrar_criacao(self, tarefa: Tarefa, nome_projeto: str) -> None:
+        codigo = len(self._projeto_tarefa)
+        self._codigos[tarefa] = codigo
+        self._projeto_tarefa.append(self._internar(nome_projeto, self._codigo_projeto,
+                                                   self._nomes_projetos))
+        self._membro_tarefa.append(self._internar(tarefa.responsavel.nome, self._codigo_membro,
+                                                  self._nomes_membros))
+        self._anotar(codigo, CODIGOS_STATUS[tarefa.status])
+
+    def registrar_status(self, tarefa: Tarefa) -> None:
+        codigo = self._codigos.get(tarefa)
+        if codigo is not None:
+            self._anotar(codigo, CODIGOS_STATUS[tarefa.status])
+
+    def registrar_responsavel(self, tarefa: Tarefa) -> None:
+        """Métricas por membro passam a contar para o novo responsável."""
+        codigo = self._codigos.get(tarefa)
+        if codigo is not None:
+            self._membro_tarefa[codigo] = self._internar(
+                tarefa.responsavel.nome, self._codigo_membro, self._nomes_membros)
+
+    def registrar_remocao(self, tarefa: Tarefa) -> None:
+        """Encerra o histórico de uma tarefa excluída (não da que vai para o disco)."""
+        codigo = self._codigos.get(tarefa)
+        if codigo is not None:
+            self._anotar(codigo, _REMOVIDA)
+
+    def esquecer(self, tarefa: Tarefa) -> Optional[int]:
+        """Libera a referência à tarefa, preservando os eventos já gravados.
+
+        Returns:
+            Optional[int]: Código da tarefa no log, para ``restaurar`` depois
+        """
+        return self._codigos.pop(tarefa, None)
+
+    def restaurar(self, tarefa: Tarefa, codigo: int) -> None:
+        """Religa uma tarefa recarregada ao seu código no log."""
+        self._codigos[tarefa] = codigo
+
+    def vazao(self, periodo: str = 'dia', projeto: Optional[str] = None,
+              membro: Optional[str] = None) -> Dict[date, int]:
+        """Conclusões por dia (ou por semana, iniciada na segunda-feira)."""
+        filtro = self._filtro(projeto, membro)
+        contagem: Dict[date, int] = {}
+        for instante, codigo, status in self._eventos():
+            if status == _CONCLUIDA and filtro(codigo):
+                dia = self._periodo(instante, periodo)
+                contagem[dia] = contagem.get(dia, 0) + 1
+        return contagem
+
+    def wip(self, projeto: Optional[str] = None,
+            membro: Optional[str] = None) -> Dict[date, int]:
+        """Tarefas em andamento ao final de cada dia em que houve mudança."""
+        filtro = self._filtro(projeto, membro)
+        ultimo = array('b', [-1]) * len(self._projeto_tarefa)
+        em_andamento = 0
+        serie: Dict[date, int] = {}
+        for instante, codigo, status in self._eventos():
+            if not filtro(codigo):
+                continue
+            em_andamento += (status == _ANDAMENTO) - (ultimo[codigo] == _ANDAMENTO)
+            ultimo[codigo] = status
+            serie[date.fromtimestamp(instante)] = em_andamento
+        return serie
+
+    def percentis_tempo(self, medida: str = 'ciclo', agrupar_por: Optional[str] = None,
+                        percentis: Iterable[float] = (50, 90, 99)) -> Dict:
+        """Percentis, em dias, dos tempos das tarefas atualmente concluídas.
+
+        Tarefas excluídas depois de concluídas não entram.
+
+        Args:
+            medida (str): 'ciclo' (primeiro início até a conclusão) ou
+                'lead' (criação até a conclusão). Tarefas concluídas sem
+                passar por andamento não entram no tempo de ciclo.
+            agrupar_por (Optional[str]): None, 'projeto' ou 'membro'
+            percentis (Iterable[float]): Percentis desejados (0 a 100)
+
+        Returns:
+            Dict: {percentil: dias}, ou {nome do grupo: {percentil: dias}}
+            quando agrupado
+        """
+        return percentis_por_grupo(self.duracoes(medida, agrupar_por), percentis,
+                                   agrupar_por is not None)
+
+    def duracoes(self, medida: str = 'ciclo',
+                 agrupar_por: Optional[str] = None) -> Dict[Optional[str], List[float]]:
+        """Tempos, em dias, das tarefas concluídas, sem ordenar, por grupo.
+
+        É a base de ``percentis_tempo``; as listas de vários históricos
+        podem ser juntadas antes de calcular os percentis.
+
+        Returns:
+            Dict[Optional[str], List[float]]: Durações por nome do grupo
+            (a chave é None quando não há agrupamento)
+        """
+        if medida not in ('ciclo', 'lead'):
+            raise ValueError(f"Medida '{medida}' inválida: use 'ciclo' ou 'lead'")
+        if agrupar_por not in (None, 'projeto', 'membro'):
+            raise ValueError(f"Agrupamento '{agrupar_por}' inválido")
+        criacao, inicio, conclusao, ultimo = self._marcos()
+        grupos: Dict[Optional[str], List[float]] = {}
+        for codigo, status in enumerate(ultimo):
+            if status != _CONCLUIDA:
+                continue
+            partida = criacao[codigo] if medida == 'lead' else inicio[codigo]
+            if partida < 0:
+                continue
+            if agrupar_por == 'projeto':
+                chave = self._nomes_projetos[self._projeto_tarefa[codigo]]
+            elif agrupar_por == 'membro':
+                chave = self._nomes_membros[self._membro_tarefa[codigo]]
+            else:
+                chave = None
+            grupos.setdefault(chave, []).append((conclusao[codigo] - partida) / _SEGUNDOS_DIA)
+        return grupos
+
+    def _marcos(self) -> Tuple[array, array, array, array]:
+        """Uma única passada: criação, primeiro início, última conclusão e status final."""
+        total = len(self._projeto_tarefa)
+        criacao = array('d', [-1.0]) * total
+        inicio = array('d', [-1.0]) * total
+        conclusao = array('d', [-1.0]) * total
+        ultimo = array('b', [-1]) * total
+        for instante, codigo, status in self._eventos():
+            if ultimo[codigo] < 0:
+                criacao[codigo] = instante
+            if status == _ANDAMENTO and inicio[codigo] < 0:
+                inicio[codigo] = instante
+            if status == _CONCLUIDA:
+                conclusao[codigo] = instante
+            ultimo[codigo] = status
+        return criacao, inicio, conclusao, ultimo
+
+    def _eventos(self) -> Iterable[Tuple[float, int, int]]:
+        return zip(self._instantes, self._eventos_tarefa, self._eventos_status)
+
+    def _filtro(self, projeto: Optional[str], membro: Optional[str]) -> Callable[[int], bool]:
+        codigo_projeto = self._codigo_projeto.get(projeto.lower(), -2) if projeto else -1
+        codigo_membro = self._codigo_membro.get(membro.lower(), -2) if membro else -1
+        projetos, membros = self._projeto_tarefa, self._membro_tarefa
+        return lambda codigo: ((codigo_projeto == -1 or projetos[codigo] == codigo_projeto) and
+                               (codigo_membro == -1 or membros[codigo] == codigo_membro))
+
+    def _anotar(self, codigo: int, status: int) -> None:
+        self._instantes.append(self._relogio())
+        self._eventos_tarefa.append(codigo)
+        self._eventos_status.append(status)
+
+    @staticmethod
+    def _periodo(instante: float, periodo: str) -> date:
+        dia = date.fromtimestamp(instante)
+        if periodo == 'semana':
+            return dia - timedelta(days=dia.weekday())
+        if periodo != 'dia':
+            raise ValueError(f"Período '{periodo}' inválido: use 'dia' ou 'semana'")
+        return dia
+
+    @staticmethod
+    def _internar(nome: str, codigos: Dict[str, int], nomes: List[str]) -> int:
+        chave = nome.lower()
+        codigo = codigos.get(chave)
+        if codigo is None:
+            codigo = codigos[chave] = len(nomes)
+            nomes.append(nome)
+        return codigo
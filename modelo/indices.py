@@ -0,0 +1,195 @@
+from bisect import bisect_left, insort
+from typing import Dict, Generic, Iterable, List, Optional, Set, TypeVar
+
+T = TypeVar('T')
+
+
+def normalizar_nome(nome: str) -> str:
+    """Forma canônica usada em todas as buscas por nome (case insensitive)."""
+    return nome.lower()
+
+
+class IndicePrefixo(Generic[T]):
+    """Índice de nomes normalizados para busca exata e por prefixo.
+
+    Mantém as chaves num array ordenado (busca binária com ``bisect``) e
+    um dicionário chave -> itens. Uma busca por prefixo custa
+    O(log n + N) para os N primeiros resultados, em vez de varrer todos
+    os nomes cadastrados.
+    """
+
+    def __init__(self):
+        self._chaves: List[str] = []
+        self._itens: Dict[str, List[T]] = {}
+        self._alfabeto: Set[str] = set()
+
+    def __len__(self) -> int:
+        return sum(len(itens) for itens in self._itens.values())
+
+    def __contains__(self, nome: str) -> bool:
+        return normalizar_nome(nome) in self._itens
+
+    def adicionar(self, nome: str, item: T) -> None:
+        """Indexa um item pelo nome.
+
+        Nomes repetidos são permitidos; a busca exata devolve o primeiro
+        item indexado com aquele nome.
+        """
+        chave = normalizar_nome(nome)
+        itens = self._itens.get(chave)
+        if itens is None:
+            insort(self._chaves, chave)
+            self._itens[chave] = [item]
+            self._alfabeto.update(chave)
+        else:
+            itens.append(item)
+
+    def remover(self, nome: str, item: T) -> None:
+        """Remove um item do índice (ignora itens não indexados)."""
+        chave = normalizar_nome(nome)
+        itens = self._itens.get(chave)
+        if not itens or item not in itens:
+            return
+        itens.remove(item)
+        if not itens:
+            del self._itens[chave]
+            del self._chaves[bisect_left(self._chaves, chave)]
+
+    def buscar(self, nome: str) -> Optional[T]:
+        """Busca exata (case insensitive) em O(1)."""
+        itens = self._itens.get(normalizar_nome(nome))
+        return itens[0] if itens else None
+
+    def buscar_prefixo(self, prefixo: str, limite: int = 10,
+                       tolerancia: bool = False) -> List[T]:
+        """Retorna até ``limite`` itens cujo nome começa com ``prefixo``.
+
+        Args:
+            prefixo (str): Início do nome digitado
+            limite (int): Quantidade máxima de resultados
+            tolerancia (bool): Se True, completa também prefixos a uma
+                edição (inserção, remoção ou troca de letra) do digitado
+
+        Returns:
+            List[T]: Itens em ordem alfabética; com tolerância, as
+            correspondências exatas vêm antes das aproximadas
+        """
+        prefixo = normalizar_nome(prefixo)
+        resultado: List[T] = []
+        vistos: Set[str] = set()
+        self._coletar(prefixo, limite, resultado, vistos)
+        if tolerancia and len(resultado) < limite:
+            for variante in self._variantes(prefixo):
+                self._coletar(variante, limite, resultado, vistos)
+                if len(resultado) >= limite:
+                    break
+        return resultado
+
+    def _coletar(self, prefixo: str, limite: int, resultado: List[T],
+                 vistos: Set[str]) -> None:
+        chaves = self._chaves
+        i = bisect_left(chaves, prefixo)
+        while i < len(chaves) and len(resultado) < limite:
+            chave = chaves[i]
+            if not chave.startswith(prefixo):
+                break
+            if chave not in vistos:
+                vistos.add(chave)
+                for item in self._itens[chave]:
+                    if len(resultado) >= limite:
+                        break
+                    resultado.append(item)
+            i += 1
+
+    def _variantes(self, prefixo: str) -> Iterable[str]:
+        """Prefixos a distância de edição 1, limitados ao alfabeto indexado.
+
+        Inserções no final são omitidas, pois já são cobertas pela própria
+        busca por prefixo.
+        """
+        alfabeto = sorted(self._alfabeto)
+        gerados: Set[str] = {prefixo}
+        for i in range(len(prefixo)):
+            candidatos = [prefixo[:i] + prefixo[i + 1:]]
+            candidatos.extend(prefixo[:i] + c + prefixo[i + 1:] for c in alfabeto)
+            candidatos.extend(prefixo[:i] + c + prefixo[i:] for c in alfabeto)
+            for candidato in candidatos:
+                if candidato and candidato not in gerados:
+                    gerados.add(candidato)
+                    yield candidato
+
+
+class TabelaIds(Generic[T]):
+    """Ids inteiros para entidades, resolvidos por posição numa lista densa.
+
+    O id junta a posição (32 bits baixos) e a geração da posição. Posições
+    liberadas são reaproveitadas, o que mantém a lista do tamanho do maior
+    número de entidades vivas, mas o id antigo deixa de resolver porque a
+    geração avançou.
+    """
+
+    _BITS_POSICAO = 32
+    _MASCARA = (1 << _BITS_POSICAO) - 1
+
+    def __init__(self):
+        self._itens: List[Optional[T]] = []
+        self._geracoes: List[int] = []
+        self._livres: Dict[int, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._itens) - len(self._livres)
+
+    def atribuir(self, item: T) -> int:
+        if self._livres:
+            posicao, _ = self._livres.popitem()
+            self._itens[posicao] = item
+        else:
+            posicao = len(self._itens)
+            self._itens.append(item)
+            self._geracoes.append(0)
+        return self._geracoes[posicao] << self._BITS_POSICAO | posicao
+
+    def obter(self, id_item: int) -> Optional[T]:
+        posicao = id_item & self._MASCARA
+        if (id_item < 0 or posicao >= len(self._itens)
+                or self._geracoes[posicao] != id_item >> self._BITS_POSICAO):
+            return None
+        return self._itens[posicao]
+
+    def liberar(self, id_item: int) -> None:
+        """Invalida o id e devolve a posição para reuso."""
+        posicao = id_item & self._MASCARA
+        self._itens[posicao] = None
+        self._geracoes[posicao] += 1
+        self._livres[posicao] = None
+
+    def reservar(self, id_item: int) -> None:
+        """Tira o item da memória mantendo o id válido (ver ``restaurar``)."""
+        self._itens[id_item & self._MASCARA] = None
+
+    def fixar(self, id_item: int, item: T) -> None:
+        """Coloca o item exatamente no id dado (réplicas copiam os ids do primário).
+
+        Raises:
+            ValueError: Se a posição do id já está ocupada
+        """
+        posicao = id_item & self._MASCARA
+        while len(self._itens) <= posicao:
+            self._livres[len(self._itens)] = None
+            self._itens.append(None)
+            self._geracoes.append(0)
+        if self._itens[posicao] is not None:
+            raise ValueError(f"Id {id_item} já está em uso")
+        self._livres.pop(posicao, None)
+        self._itens[posicao] = item
+        self._geracoes[posicao] = id_item >> self._BITS_POSICAO
+
+    def restaurar(self, id_item: int, item: T) -> bool:
+        """Devolve um item reservado à sua posição; False se o id não é mais dele."""
+        posicao = id_item & self._MASCARA
+        if (id_item < 0 or posicao >= len(self._itens)
+                or self._geracoes[posicao] != id_item >> self._BITS_POSICAO
+                or self._itens[posicao] is not None or posicao in self._livres):
+            return False
+        self._itens[posicao] = item
+        return True
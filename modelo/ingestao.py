@@ -0,0 +1,324 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from .excecoes import (
+    FilaCheiaError,
+    MembroNaoEncontradoError,
+    ProjetoNaoEncontradoError,
+    ResponsavelNaoEMembroError,
+    TarefaNaoEncontradaError,
+)
+from .gerenciador import GerenciadorProjetos
+from .membro import Membro
+from .projeto import Projeto
+from .tarefa import Tarefa
+
+
+class _Pedido(NamedTuple):
+    operacao: str
+    args: tuple
+    kwargs: dict
+    futuro: Future
+    instante: float
+
+
+class _Resolucao:
+    """Nomes já resolvidos dentro de um lote (cada um é buscado uma vez)."""
+
+    def __init__(self, gerenciador: GerenciadorProjetos):
+        self.gerenciador = gerenciador
+        self._projetos: Dict[str, Projeto] = {}
+        self._membros: Dict[str, Membro] = {}
+
+    def projeto(self, nome: str) -> Projeto:
+        projeto = self._projetos.get(nome)
+        if projeto is None:
+            projeto = self.gerenciador.buscar_projeto(nome)
+            if projeto is None:
+                raise ProjetoNaoEncontradoError(nome)
+            self._projetos[nome] = projeto
+        return projeto
+
+    def membro(self, nome: str) -> Membro:
+        membro = self._membros.get(nome)
+        if membro is None:
+            membro = self.gerenciador.buscar_membro(nome)
+            if membro is None:
+                raise MembroNaoEncontradoError(nome)
+            self._membros[nome] = membro
+        return membro
+
+    def tarefa(self, projeto: Projeto, titulo: str) -> Tarefa:
+        tarefa = self.gerenciador._buscar_tarefa_projeto(projeto, titulo)
+        if tarefa is None:
+            raise TarefaNaoEncontradaError(titulo)
+        return tarefa
+
+
+def _criar_tarefa(r: _Resolucao, nome_projeto: str, titulo: str, descricao: str,
+                  responsavel_nome: str, **kwargs) -> Tarefa:
+    return r.gerenciador._criar_tarefa(r.projeto(nome_projeto), titulo, descricao,
+                                       r.membro(responsavel_nome), **kwargs)
+
+
+def _iniciar_tarefa(r: _Resolucao, nome_projeto: str, titulo_tarefa: str) -> None:
+    r.tarefa(r.projeto(nome_projeto), titulo_tarefa).iniciar()
+
+
+def _concluir_tarefa(r: _Resolucao, nome_projeto: str, titulo_tarefa: str) -> None:
+    r.tarefa(r.projeto(nome_projeto), titulo_tarefa).concluir()
+
+
+def _reatribuir_tarefa(r: _Resolucao, nome_projeto: str, titulo_tarefa: str,
+                       novo_responsavel_nome: str) -> Tarefa:
+    projeto = r.projeto(nome_projeto)
+    tarefa = r.tarefa(projeto, titulo_tarefa)
+    responsavel = r.membro(novo_responsavel_nome)
+    if not projeto.possui_membro(responsavel):
+        raise ResponsavelNaoEMembroError(novo_responsavel_nome)
+    r.gerenciador._mover_tarefa(projeto, tarefa, responsavel)
+    return tarefa
+
+
+def _adicionar_membro_projeto(r: _Resolucao, nome_projeto: str, nome_membro: str) -> None:
+    r.gerenciador._adicionar_membro_projeto(r.projeto(nome_projeto), r.membro(nome_membro))
+
+
+# Operações aceitas, com a mesma assinatura e retorno do método do gerenciador
+_APLICAR = {
+    "criar_tarefa": _criar_tarefa,
+    "iniciar_tarefa": _iniciar_tarefa,
+    "concluir_tarefa": _concluir_tarefa,
+    "reatribuir_tarefa": _reatribuir_tarefa,
+    "adicionar_membro_projeto": _adicionar_membro_projeto,
+}
+
+
+class FilaIngestao:
+    """Fila limitada de escritas aplicadas ao gerenciador por uma única thread.
+
+    Produtores chamam ``enviar`` (ou os atalhos ``criar_tarefa``,
+    ``concluir_tarefa``...) de qualquer thread e recebem um
+    ``concurrent.futures.Future`` com o que o método do gerenciador
+    devolveria, ou com a exceção que ele lançaria. A thread aplicadora
+    retira até ``tamanho_lote`` pedidos por vez; depois de chegar o
+    primeiro, espera até ``espera`` segundos para o lote encher. Em cada
+    lote os nomes de projetos e membros são resolvidos uma única vez, e
+    todo o lote é aplicado com ``trava`` adquirida uma vez (leitores que
+    a usam veem lotes inteiros). Os futuros são completados depois de
+    soltar a trava.
+
+    Com a fila cheia, ``bloquear=True`` faz o produtor esperar até
+    ``timeout`` segundos por espaço; sem espaço (ou com ``bloquear=False``)
+    ``enviar`` lança ``FilaCheiaError``. Enquanto a fila estiver aberta,
+    o gerenciador só deve ser alterado por ela.
+    """
+
+    def __init__(self, gerenciador: GerenciadorProjetos, capacidade: int = 10_000,
+                 tamanho_lote: int = 256, espera: float = 0.002, bloquear: bool = True,
+                 timeout: Optional[float] = None):
+        if capacidade < 1 or tamanho_lote < 1:
+            raise ValueError("Capacidade e tamanho do lote devem ser positivos")
+        self.gerenciador = gerenciador
+        self.trava = threading.RLock()
+        self._capacidade = capacidade
+        self._tamanho_lote = tamanho_lote
+        self._espera = espera
+        self._bloquear = bloquear
+        self._timeout = timeout
+        self._pedidos: Deque[_Pedido] = deque()
+        # Uma trava para a fila e duas condições: a aplicadora espera pedidos,
+        # produtores (e ``esvaziar``) esperam espaço. Cada lado só acorda o
+        # outro quando há progresso possível, não a cada pedido.
+        trava_fila = threading.Lock()
+        self._ha_pedidos = threading.Condition(trava_fila)
+        self._ha_espaco = threading.Condition(trava_fila)
+        self._esperando_espaco = 0
+        self._fechada = False
+        self._em_aplicacao = 0
+        self._inicio = time.perf_counter()
+        self._enviados = 0
+        self._rejeitados = 0
+        self._contrapressao = 0
+        self._aplicados = 0
+        self._erros = 0
+        self._cancelados = 0
+        self._lotes = 0
+        self._maior_lote = 0
+        self._segundos_aplicando = 0.0
+        self._segundos_em_espera = 0.0
+        self._aplicadora = threading.Thread(target=self._aplicar_continuamente, daemon=True)
+        self._aplicadora.start()
+
+    def __len__(self) -> int:
+        return len(self._pedidos)
+
+    def enviar(self, operacao: str, *args, **kwargs) -> Future:
+        """Enfileira uma operação do gerenciador.
+
+        Args:
+            operacao (str): ``criar_tarefa``, ``iniciar_tarefa``,
+                ``concluir_tarefa``, ``reatribuir_tarefa`` ou
+                ``adicionar_membro_projeto``
+            *args, **kwargs: Argumentos do método do gerenciador
+
+        Returns:
+            Future: Resultado (ou exceção) da operação quando aplicada
+
+        Raises:
+            ValueError: Se a operação não é aceita
+            FilaCheiaError: Se não houve espaço na fila a tempo
+            RuntimeError: Se a fila já foi fechada
+        """
+        if operacao not in _APLICAR:
+            raise ValueError(f"Operação não aceita pela fila de ingestão: {operacao!r}")
+        futuro: Future = Future()
+        with self._ha_espaco:
+            if self._fechada:
+                raise RuntimeError("Fila de ingestão fechada")
+            if len(self._pedidos) >= self._capacidade and self._bloquear:
+                self._contrapressao += 1
+                self._esperando_espaco += 1
+                try:
+                    self._ha_espaco.wait_for(
+                        lambda: len(self._pedidos) < self._capacidade or self._fechada,
+                        self._timeout)
+                finally:
+                    self._esperando_espaco -= 1
+                if self._fechada:
+                    raise RuntimeError("Fila de ingestão fechada")
+            if len(self._pedidos) >= self._capacidade:
+                self._rejeitados += 1
+                raise FilaCheiaError(self._capacidade)
+            self._pedidos.append(_Pedido(operacao, args, kwargs, futuro, time.perf_counter()))
+            self._enviados += 1
+            # A aplicadora espera o primeiro pedido ou, na espera, o lote encher
+            if len(self._pedidos) in (1, self._tamanho_lote):
+                self._ha_pedidos.notify()
+        return futuro
+
+    def criar_tarefa(self, *args, **kwargs) -> Future:
+        return self.enviar("criar_tarefa", *args, **kwargs)
+
+    def iniciar_tarefa(self, *args, **kwargs) -> Future:
+        return self.enviar("iniciar_tarefa", *args, **kwargs)
+
+    def concluir_tarefa(self, *args, **kwargs) -> Future:
+        return self.enviar("concluir_tarefa", *args, **kwargs)
+
+    def reatribuir_tarefa(self, *args, **kwargs) -> Future:
+        return self.enviar("reatribuir_tarefa", *args, **kwargs)
+
+    def adicionar_membro_projeto(self, *args, **kwargs) -> Future:
+        return self.enviar("adicionar_membro_projeto", *args, **kwargs)
+
+    def esvaziar(self, timeout: Optional[float] = None) -> bool:
+        """Espera todos os pedidos já enviados serem aplicados; False se o tempo acabar."""
+        with self._ha_espaco:
+            return self._ha_espaco.wait_for(
+                lambda: not self._pedidos and not self._em_aplicacao, timeout)
+
+    def fechar(self, timeout: Optional[float] = None) -> None:
+        """Para de aceitar pedidos, aplica os pendentes e encerra a thread aplicadora."""
+        with self._ha_pedidos:
+            self._fechada = True
+            self._ha_pedidos.notify_all()
+            self._ha_espaco.notify_all()
+        self._aplicadora.join(timeout)
+
+    def __enter__(self) -> 'FilaIngestao':
+        return self
+
+    def __exit__(self, *excecao) -> None:
+        self.fechar()
+
+    def estatisticas(self) -> Dict:
+        """Contadores e vazão da fila desde a criação.
+
+        Returns:
+            Dict: Pedidos enviados, rejeitados, aplicados, com erro e
+            cancelados; pendentes; produtores que esperaram por espaço
+            (``contrapressao``); lotes e seus tamanhos médio e máximo;
+            ``ops_por_segundo`` (aplicados por segundo desde a criação),
+            ``ocupacao`` (fração do tempo aplicando lotes) e latência média
+            entre o envio e a conclusão, em ms
+        """
+        with self._ha_pedidos:
+            decorridos = time.perf_counter() - self._inicio
+            concluidos = self._aplicados + self._erros
+            retirados = concluidos + self._cancelados
+            return {
+                "enviados": self._enviados,
+                "rejeitados": self._rejeitados,
+                "aplicados": self._aplicados,
+                "erros": self._erros,
+                "cancelados": self._cancelados,
+                "pendentes": len(self._pedidos) + self._em_aplicacao,
+                "contrapressao": self._contrapressao,
+                "lotes": self._lotes,
+                "tamanho_medio_lote": round(retirados / self._lotes, 1) if self._lotes else 0.0,
+                "maior_lote": self._maior_lote,
+                "ops_por_segundo": round(concluidos / decorridos) if decorridos else 0,
+                "ocupacao": round(self._segundos_aplicando / decorridos, 3) if decorridos else 0.0,
+                "latencia_media_ms": (round(self._segundos_em_espera / concluidos * 1000, 3)
+                                      if concluidos else 0.0),
+            }
+
+    def _proximo_lote(self) -> List[_Pedido]:
+        with self._ha_pedidos:
+            self._ha_pedidos.wait_for(lambda: self._pedidos or self._fechada)
+            if len(self._pedidos) < self._tamanho_lote and not self._fechada and self._espera:
+                self._ha_pedidos.wait_for(
+                    lambda: len(self._pedidos) >= self._tamanho_lote or self._fechada,
+                    self._espera)
+            lote = [self._pedidos.popleft()
+                    for _ in range(min(self._tamanho_lote, len(self._pedidos)))]
+            self._em_aplicacao = len(lote)
+            if self._esperando_espaco:
+                self._ha_espaco.notify(len(lote))
+            return lote
+
+    def _aplicar_continuamente(self) -> None:
+        while True:
+            lote = self._proximo_lote()
+            if not lote:
+                return
+            self._aplicar(lote)
+
+    def _aplicar(self, lote: List[_Pedido]) -> None:
+        resolucao = _Resolucao(self.gerenciador)
+        resultados: List[Tuple[Future, bool, object]] = []
+        cancelados = 0
+        inicio = time.perf_counter()
+        with self.trava:
+            for pedido in lote:
+                if not pedido.futuro.set_running_or_notify_cancel():
+                    cancelados += 1
+                    continue
+                try:
+                    valor = _APLICAR[pedido.operacao](resolucao, *pedido.args, **pedido.kwargs)
+                except Exception as erro:
+                    resultados.append((pedido.futuro, False, erro))
+                else:
+                    resultados.append((pedido.futuro, True, valor))
+        fim = time.perf_counter()
+        for futuro, ok, valor in resultados:
+            if ok:
+                futuro.set_result(valor)
+            else:
+                futuro.set_exception(valor)
+        erros = sum(1 for _, ok, _ in resultados if not ok)
+        with self._ha_espaco:
+            self._aplicados += len(resultados) - erros
+            self._erros += erros
+            self._cancelados += cancelados
+            self._lotes += 1
+            self._maior_lote = max(self._maior_lote, len(lote))
+            self._segundos_aplicando += fim - inicio
+            self._segundos_em_espera += sum(fim - pedido.instante for pedido in lote
+                                            if not pedido.futuro.cancelled())
+            self._em_aplicacao = 0
+            self._ha_espaco.notify_all()
@@ -0,0 +1,198 @@
+import random
+from datetime import date
+from typing import TYPE_CHECKING, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from modelo.membro import Membro
+    from modelo.projeto import Projeto
+    from modelo.tarefa import Tarefa
+
+T = TypeVar('T', bound=Hashable)
+
+SEM_FIM = date.max.toordinal()
+
+
+class _No:
+    __slots__ = ('inicio', 'seq', 'fim', 'item', 'peso', 'max_fim', 'esq', 'dir')
+
+    def __init__(self, inicio: int, seq: int, fim: int, item):
+        self.inicio = inicio
+        self.seq = seq
+        self.fim = fim
+        self.item = item
+        self.peso = random.random()
+        self.max_fim = fim
+        self.esq: Optional['_No'] = None
+        self.dir: Optional['_No'] = None
+
+    def atualizar(self) -> None:
+        maior = self.fim
+        if self.esq is not None and self.esq.max_fim > maior:
+            maior = self.esq.max_fim
+        if self.dir is not None and self.dir.max_fim > maior:
+            maior = self.dir.max_fim
+        self.max_fim = maior
+
+
+def _dividir(no: Optional[_No], chave: Tuple[int, int]) -> Tuple[Optional[_No], Optional[_No]]:
+    """Separa a árvore em (chaves < chave, chaves >= chave)."""
+    if no is None:
+        return None, None
+    if (no.inicio, no.seq) < chave:
+        no.dir, direita = _dividir(no.dir, chave)
+        no.atualizar()
+        return no, direita
+    esquerda, no.esq = _dividir(no.esq, chave)
+    no.atualizar()
+    return esquerda, no
+
+
+def _unir(esquerda: Optional[_No], direita: Optional[_No]) -> Optional[_No]:
+    if esquerda is None:
+        return direita
+    if direita is None:
+        return esquerda
+    if esquerda.peso > direita.peso:
+        esquerda.dir = _unir(esquerda.dir, direita)
+        esquerda.atualizar()
+        return esquerda
+    direita.esq = _unir(esquerda, direita.esq)
+    direita.atualizar()
+    return direita
+
+
+class ArvoreIntervalos(Generic[T]):
+    """Árvore de intervalos fechados de dias (treap aumentada com o maior fim).
+
+    Inserção e remoção custam O(log n) esperado; consultas de sobreposição
+    custam O(log n + k) para k intervalos encontrados.
+    """
+
+    def __init__(self):
+        self._raiz: Optional[_No] = None
+        self._nos: Dict[T, _No] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._nos)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._nos
+
+    def intervalo(self, item: T) -> Optional[Tuple[int, int]]:
+        no = self._nos.get(item)
+        return (no.inicio, no.fim) if no else None
+
+    def inserir(self, item: T, inicio: int, fim: int) -> None:
+        """Insere (ou reposiciona) o intervalo [inicio, fim] de um item."""
+        if item in self._nos:
+            self.remover(item)
+        self._seq += 1
+        novo = _No(inicio, self._seq, max(inicio, fim), item)
+        esquerda, direita = _dividir(self._raiz, (inicio, self._seq))
+        self._raiz = _unir(_unir(esquerda, novo), direita)
+        self._nos[item] = novo
+
+    def remover(self, item: T) -> None:
+        no = self._nos.pop(item, None)
+        if no is None:
+            return
+        esquerda, resto = _dividir(self._raiz, (no.inicio, no.seq))
+        _, direita = _dividir(resto, (no.inicio, no.seq + 1))
+        self._raiz = _unir(esquerda, direita)
+
+    def sobrepostos(self, inicio: int, fim: int) -> List[T]:
+        """Itens cujo intervalo intersecta [inicio, fim], ordenados pelo início."""
+        resultado: List[T] = []
+        pilha: List[Tuple[_No, bool]] = []
+        if self._raiz is not None:
+            pilha.append((self._raiz, False))
+        while pilha:
+            no, expandido = pilha.pop()
+            if expandido:
+                if no.fim >= inicio:
+                    resultado.append(no.item)
+                continue
+            if no.max_fim < inicio:
+                continue
+            if no.inicio <= fim and no.dir is not None:
+                pilha.append((no.dir, False))
+            if no.inicio <= fim:
+                pilha.append((no, True))
+            if no.esq is not None:
+                pilha.append((no.esq, False))
+        return resultado
+
+    def contendo(self, dia: int) -> List[T]:
+        """Consulta de perfuração: itens ativos no dia informado."""
+        return self.sobrepostos(dia, dia)
+
+
+def _ordinal(dia: Optional[date], padrao: int) -> int:
+    return dia.toordinal() if dia is not None else padrao
+
+
+class IndiceCronograma:
+    """Índice de períodos de atividade de tarefas e projetos.
+
+    Uma tarefa aberta ocupa de ``data_criacao`` até ``prazo`` (sem prazo,
+    fica em aberto); ao ser concluída, o período passa a terminar em
+    ``data_conclusao``. Projetos ocupam de ``data_criacao`` até ``prazo``.
+    """
+
+    def __init__(self):
+        self._tarefas: ArvoreIntervalos['Tarefa'] = ArvoreIntervalos()
+        self._projetos: ArvoreIntervalos['Projeto'] = ArvoreIntervalos()
+        self._por_membro: Dict['Membro', ArvoreIntervalos['Tarefa']] = {}
+
+    @staticmethod
+    def _periodo_tarefa(tarefa: 'Tarefa') -> Tuple[int, int]:
+        inicio = tarefa.data_criacao.toordinal()
+        if tarefa.data_conclusao is not None:
+            return inicio, tarefa.data_conclusao.toordinal()
+        return inicio, _ordinal(tarefa.prazo, SEM_FIM)
+
+    def adicionar_tarefa(self, tarefa: 'Tarefa') -> None:
+        inicio, fim = self._periodo_tarefa(tarefa)
+        self._tarefas.inserir(tarefa, inicio, fim)
+        arvore = self._por_membro.get(tarefa.responsavel)
+        if arvore is None:
+            arvore = self._por_membro[tarefa.responsavel] = ArvoreIntervalos()
+        arvore.inserir(tarefa, inicio, fim)
+
+    def atualizar_tarefa(self, tarefa: 'Tarefa') -> None:
+        """Recalcula o período de uma tarefa já indexada (ex.: após conclusão)."""
+        if tarefa in self._tarefas and self._tarefas.intervalo(tarefa) != self._periodo_tarefa(tarefa):
+            self.remover_tarefa(tarefa)
+            self.adicionar_tarefa(tarefa)
+
+    def remover_tarefa(self, tarefa: 'Tarefa') -> None:
+        self._tarefas.remover(tarefa)
+        arvore = self._por_membro.get(tarefa.responsavel)
+        if arvore is not None:
+            arvore.remover(tarefa)
+            if not len(arvore):
+                del self._por_membro[tarefa.responsavel]
+
+    def adicionar_projeto(self, projeto: 'Projeto') -> None:
+        self._projetos.inserir(projeto, projeto.data_criacao.toordinal(),
+                               _ordinal(projeto.prazo, SEM_FIM))
+
+    def remover_projeto(self, projeto: 'Projeto') -> None:
+        self._projetos.remover(projeto)
+
+    def tarefas_entre(self, inicio: date, fim: date) -> List['Tarefa']:
+        return self._tarefas.sobrepostos(inicio.toordinal(), fim.toordinal())
+
+    def tarefas_em(self, dia: date) -> List['Tarefa']:
+        return self._tarefas.contendo(dia.toordinal())
+
+    def projetos_entre(self, inicio: date, fim: date) -> List['Projeto']:
+        return self._projetos.sobrepostos(inicio.toordinal(), fim.toordinal())
+
+    def projetos_em(self, dia: date) -> List['Projeto']:
+        return self._projetos.contendo(dia.toordinal())
+
+    def tarefas_membro_em(self, membro: 'Membro', dia: date) -> List['Tarefa']:
+        arvore = self._por_membro.get(membro)
+        return arvore.contendo(dia.toordinal()) if arvore is not None else []
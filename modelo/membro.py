@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import List, TYPE_CHECKING
+import weakref
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from modelo.tarefa import Tarefa  # Só para type checking
@@ -9,16 +10,36 @@ class Membro:
         self.nome = nome
         self.funcao = funcao
         self.email = email
-        self.tarefas_atribuidas: List['Tarefa'] = []  # Usando string type hint
+        # Posição nas listas por id do gerenciador (atribuída ao cadastrar)
+        self.id: Optional[int] = None
+        # Conjunto ordenado com referências fracas: a tarefa aponta para o
+        # responsável e o caminho de volta não forma ciclo, então tarefas
+        # descartadas são liberadas pela contagem de referências
+        self._tarefas_atribuidas: weakref.WeakKeyDictionary['Tarefa', None] = (
+            weakref.WeakKeyDictionary())
+
+    @property
+    def tarefas_atribuidas(self) -> List['Tarefa']:
+        """Retorna uma cópia da lista de tarefas atribuídas"""
+        return list(self._tarefas_atribuidas)
 
     def adicionar_tarefa(self, tarefa: 'Tarefa') -> None:
         """Método que será chamado pela Tarefa posteriormente"""
-        if tarefa not in self.tarefas_atribuidas:
-            self.tarefas_atribuidas.append(tarefa)
+        self._tarefas_atribuidas[tarefa] = None
 
     def remover_tarefa(self, tarefa: 'Tarefa') -> None:
-        if tarefa in self.tarefas_atribuidas:
-            self.tarefas_atribuidas.remove(tarefa)
+        self._tarefas_atribuidas.pop(tarefa, None)
+
+    def __getstate__(self) -> dict:
+        # WeakKeyDictionary não é serializável; as tarefas vão numa lista
+        estado = self.__dict__.copy()
+        estado['_tarefas_atribuidas'] = list(self._tarefas_atribuidas)
+        return estado
+
+    def __setstate__(self, estado: dict) -> None:
+        tarefas = estado.pop('_tarefas_atribuidas')
+        self.__dict__.update(estado)
+        self._tarefas_atribuidas = weakref.WeakKeyDictionary(dict.fromkeys(tarefas))
 
     def __str__(self) -> str:
         return f"{self.nome} ({self.funcao})" + (f" - {self.email}" if self.email else "")
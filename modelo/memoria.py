@@ -0,0 +1,210 @@
+import gc
+import sys
+import tracemalloc
+from datetime import date, timedelta
+from types import FunctionType, ModuleType
+from typing import Dict, Iterable, List, Set
+
+from .gerenciador import GerenciadorProjetos
+from .membro import Membro
+from .projeto import Projeto
+from .tarefa import Tarefa
+
+# Bytes por entidade aceitos sem acusar regressão (custo total na memória,
+# incluindo índices, estatísticas e histórico). Medidos com a forma padrão
+# de ``perfil_memoria`` e arredondados para cima com folga de ~30%.
+ORCAMENTOS_PADRAO: Dict[str, int] = {
+    "Membro": 2_700,
+    "Projeto": 3_600,
+    "vinculo": 900,
+    "Tarefa": 2_400,
+}
+
+# Objetos compartilhados que não pertencem a nenhuma coleção
+_IGNORADOS = (type, ModuleType, FunctionType)
+_ENTIDADES = (Tarefa, Membro, Projeto, GerenciadorProjetos)
+
+
+def tamanho_profundo(raiz: object, vistos: Set[int], fronteira: tuple = _ENTIDADES) -> int:
+    """Soma de ``sys.getsizeof`` de tudo que é alcançável a partir de ``raiz``.
+
+    A busca não atravessa objetos dos tipos em ``fronteira`` (contados à
+    parte) nem classes, módulos e funções. Objetos em ``vistos`` já foram
+    atribuídos a outra estrutura e não são contados de novo.
+    """
+    total = 0
+    pilha = [raiz]
+    while pilha:
+        objeto = pilha.pop()
+        if id(objeto) in vistos or isinstance(objeto, _IGNORADOS):
+            continue
+        if objeto is not raiz and isinstance(objeto, fronteira):
+            continue
+        vistos.add(id(objeto))
+        total += sys.getsizeof(objeto)
+        pilha.extend(gc.get_referents(objeto))
+    return total
+
+
+def _medir(acao) -> int:
+    gc.collect()
+    antes, _ = tracemalloc.get_traced_memory()
+    acao()
+    gc.collect()
+    depois, _ = tracemalloc.get_traced_memory()
+    return depois - antes
+
+
+def montar_conjunto(gerenciador: GerenciadorProjetos, projetos: int, membros: int,
+                    tarefas_por_projeto: int, membros_por_projeto: int = 5) -> Dict[str, int]:
+    """Popula o gerenciador por fases e mede o custo de cada uma com tracemalloc.
+
+    Um terço das tarefas é concluído e um terço iniciado, com prazos
+    espalhados por 60 dias, para que índices e histórico tenham o
+    tamanho de um uso real.
+
+    Returns:
+        Dict[str, int]: Bytes alocados em cada fase (membros, projetos,
+        vinculos, tarefas)
+    """
+    hoje = date.today()
+    membros_por_projeto = min(membros_por_projeto, membros)
+
+    def cadastrar():
+        for m in range(membros):
+            gerenciador.cadastrar_membro(Membro(f"Membro {m}", "Dev", f"membro{m}@empresa.com"))
+
+    def criar_projetos():
+        for p in range(projetos):
+            gerenciador.adicionar_projeto(Projeto(f"Projeto {p}", "Projeto do perfil",
+                                                  hoje + timedelta(days=90)))
+
+    def vincular():
+        for p in range(projetos):
+            for k in range(membros_por_projeto):
+                gerenciador.adicionar_membro_projeto(f"Projeto {p}",
+                                                     f"Membro {(p + k) % membros}")
+
+    def criar_tarefas():
+        for p in range(projetos):
+            for t in range(tarefas_por_projeto):
+                tarefa = gerenciador.criar_tarefa(
+                    f"Projeto {p}", f"Tarefa {p}-{t}", "Descrição da tarefa",
+                    f"Membro {(p + t % membros_por_projeto) % membros}",
+                    prazo=hoje + timedelta(days=t % 60), prioridade=t % 5 + 1)
+                if t % 3 == 1:
+                    tarefa.iniciar()
+                elif t % 3 == 2:
+                    tarefa.concluir()
+
+    return {
+        "membros": _medir(cadastrar),
+        "projetos": _medir(criar_projetos),
+        "vinculos": _medir(vincular),
+        "tarefas": _medir(criar_tarefas),
+    }
+
+
+def colecoes(gerenciador: GerenciadorProjetos) -> Dict[str, int]:
+    """Bytes de cada coleção e índice interno, sem contar as próprias entidades.
+
+    Os objetos das entidades (atributos e textos) vêm primeiro, sob
+    ``objetos.<Classe>``; depois cada atributo do gerenciador e, somados
+    sobre todas as instâncias, os atributos internos de projetos e
+    membros. Um objeto compartilhado conta só para o primeiro dono.
+    """
+    vistos: Set[int] = set()
+    resultado: Dict[str, int] = {}
+    projetos = gerenciador.projetos
+    membros = gerenciador.membros
+    tarefas = gerenciador.tarefas
+
+    def somar(chave: str, raizes: Iterable[object]) -> None:
+        resultado[chave] = resultado.get(chave, 0) + sum(
+            tamanho_profundo(raiz, vistos) for raiz in raizes)
+
+    # Objetos das entidades: o próprio objeto, o __dict__ e os valores simples
+    for classe, entidades in ((Tarefa, tarefas), (Membro, membros), (Projeto, projetos)):
+        chave = f"objetos.{classe.__name__}"
+        resultado[chave] = 0
+        for entidade in entidades:
+            atributos = {nome: valor for nome, valor in vars(entidade).items()
+                         if not nome.startswith("_") and not isinstance(valor, _ENTIDADES)}
+            vistos.add(id(entidade))
+            resultado[chave] += sys.getsizeof(entidade) + sys.getsizeof(vars(entidade))
+            somar(chave, atributos.values())
+    for nome, valor in vars(gerenciador).items():
+        somar(f"GerenciadorProjetos.{nome}", [valor])
+    for classe, entidades in ((Projeto, projetos), (Membro, membros), (Tarefa, tarefas)):
+        for entidade in entidades:
+            for nome, valor in vars(entidade).items():
+                if nome.startswith("_"):
+                    somar(f"{classe.__name__}.{nome}", [valor])
+    return dict(sorted(resultado.items(), key=lambda par: -par[1]))
+
+
+def perfil_memoria(projetos: int = 200, membros: int = 100, tarefas_por_projeto: int = 50,
+                   membros_por_projeto: int = 5) -> Dict:
+    """Monta um conjunto de dados com a forma pedida e detalha a memória usada.
+
+    Args:
+        projetos (int): Quantidade de projetos
+        membros (int): Quantidade de membros cadastrados
+        tarefas_por_projeto (int): Tarefas criadas em cada projeto
+        membros_por_projeto (int): Membros vinculados a cada projeto
+
+    Returns:
+        Dict: ``forma``, ``bytes_por_entidade`` (custo incremental medido
+        com tracemalloc, com todos os índices), ``colecoes`` (bytes de cada
+        estrutura interna), ``alocacoes_por_arquivo`` e ``total_bytes``
+    """
+    ja_rastreando = tracemalloc.is_tracing()
+    if not ja_rastreando:
+        tracemalloc.start()
+    try:
+        gerenciador = GerenciadorProjetos()
+        fases = montar_conjunto(gerenciador, projetos, membros, tarefas_por_projeto,
+                                membros_por_projeto)
+        instantaneo = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(True, f"*{__package__}*")])
+    finally:
+        if not ja_rastreando:
+            tracemalloc.stop()
+    vinculos = projetos * min(membros_por_projeto, membros)
+    total_tarefas = projetos * tarefas_por_projeto
+    por_arquivo = {}
+    for estatistica in instantaneo.statistics("filename"):
+        arquivo = estatistica.traceback[0].filename
+        nome = arquivo[arquivo.rfind(__package__):].replace("\\", "/")
+        por_arquivo[nome] = estatistica.size
+    return {
+        "forma": {"projetos": projetos, "membros": membros,
+                  "tarefas_por_projeto": tarefas_por_projeto,
+                  "membros_por_projeto": min(membros_por_projeto, membros),
+                  "tarefas": total_tarefas},
+        "bytes_por_entidade": {
+            "Membro": round(fases["membros"] / membros) if membros else 0,
+            "Projeto": round(fases["projetos"] / projetos) if projetos else 0,
+            "vinculo": round(fases["vinculos"] / vinculos) if vinculos else 0,
+            "Tarefa": round(fases["tarefas"] / total_tarefas) if total_tarefas else 0,
+        },
+        "colecoes": colecoes(gerenciador),
+        "alocacoes_por_arquivo": por_arquivo,
+        "total_bytes": sum(fases.values()),
+    }
+
+
+def verificar_orcamentos(perfil: Dict, orcamentos: Dict[str, int] = ORCAMENTOS_PADRAO
+                         ) -> List[str]:
+    """Compara os bytes por entidade do perfil com os orçamentos.
+
+    Returns:
+        List[str]: Uma mensagem por entidade acima do orçamento (vazia se
+        todas couberem)
+    """
+    violacoes = []
+    for entidade, limite in orcamentos.items():
+        medido = perfil["bytes_por_entidade"][entidade]
+        if medido > limite:
+            violacoes.append(f"{entidade}: {medido} bytes por entidade (orçamento {limite})")
+    return violacoes
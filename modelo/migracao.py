@@ -0,0 +1,209 @@
+import time
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional
+
+from .gerenciador import GerenciadorProjetos
+from .indices import normalizar_nome
+from .membro import Membro
+from .projeto import Projeto
+from .tarefa import Tarefa
+
+# Status do pacote legado (strings livres) -> status do modelo
+_STATUS = {
+    "pendente": Tarefa.STATUS_PENDENTE,
+    "em_andamento": Tarefa.STATUS_EM_ANDAMENTO,
+    "em andamento": Tarefa.STATUS_EM_ANDAMENTO,
+    "concluída": Tarefa.STATUS_CONCLUIDA,
+    "concluida": Tarefa.STATUS_CONCLUIDA,
+}
+_FORMATOS_PRAZO = ("%d/%m/%Y", "%d/%m/%y")
+
+
+class RelatorioMigracao:
+    """Contagens, vazão e anomalias de uma migração, sem saída por item.
+
+    Cada anomalia é contada por tipo; só as primeiras ``EXEMPLOS_POR_TIPO``
+    de cada tipo guardam um exemplo, para que migrações grandes não
+    acumulem um registro por item.
+    """
+
+    EXEMPLOS_POR_TIPO = 5
+
+    def __init__(self):
+        self.projetos = 0
+        self.membros = 0
+        self.tarefas = 0
+        self.segundos = 0.0
+        self.anomalias: Dict[str, int] = {}
+        self.exemplos: Dict[str, List[str]] = {}
+
+    @property
+    def tarefas_por_segundo(self) -> float:
+        return self.tarefas / self.segundos if self.segundos else 0.0
+
+    @property
+    def projetos_por_segundo(self) -> float:
+        return self.projetos / self.segundos if self.segundos else 0.0
+
+    def registrar_anomalia(self, tipo: str, detalhe: str) -> None:
+        self.anomalias[tipo] = self.anomalias.get(tipo, 0) + 1
+        exemplos = self.exemplos.setdefault(tipo, [])
+        if len(exemplos) < self.EXEMPLOS_POR_TIPO:
+            exemplos.append(detalhe)
+
+    def resumo(self) -> Dict:
+        """Dicionário com contagens, tempo, vazão e anomalias por tipo."""
+        return {
+            "projetos": self.projetos,
+            "membros_cadastrados": self.membros,
+            "tarefas": self.tarefas,
+            "segundos": round(self.segundos, 3),
+            "tarefas_por_segundo": round(self.tarefas_por_segundo, 1),
+            "anomalias": dict(self.anomalias),
+        }
+
+
+class MigradorLegado:
+    """Converte grafos de ``refatoracao.entidades_principais.Projeto`` para o modelo.
+
+    Os projetos legados são consumidos um a um de qualquer iterável (um
+    gerador que os lê do disco não precisa caber na memória). Membros são
+    deduplicados pelo nome normalizado num único dicionário, que vale para
+    todos os projetos migrados e para os membros já cadastrados no
+    gerenciador. As inserções usam os caminhos internos do gerenciador já
+    com projeto e membro resolvidos, sem buscar nomes a cada tarefa.
+
+    Anomalias registradas (o item é corrigido ou ignorado, nunca aborta):
+
+    - ``projeto_sem_nome`` / ``projeto_existente``: projeto ignorado
+    - ``prazo_invalido``: projeto migrado sem prazo
+    - ``membro_sem_nome``: membro sem nome (ou com nome que não é texto), ignorado
+    - ``membro_repetido``: o mesmo membro listado duas vezes no projeto
+    - ``funcao_divergente``: mesmo nome com outra função; vale a primeira
+    - ``tarefa_sem_titulo``: tarefa sem título (ou com título que não é texto), ignorada
+    - ``responsavel_invalido``: tarefa sem responsável utilizável, ignorada
+    - ``responsavel_fora_do_projeto``: o responsável é incluído no projeto
+    - ``status_desconhecido``: tarefa migrada como pendente
+    """
+
+    def __init__(self, gerenciador: GerenciadorProjetos):
+        self._gerenciador = gerenciador
+        self._membros: Dict[str, Membro] = {}
+        self.relatorio = RelatorioMigracao()
+
+    def migrar(self, projetos: Iterable) -> RelatorioMigracao:
+        """Migra os projetos legados, acumulando no mesmo relatório.
+
+        Args:
+            projetos (Iterable): Projetos do pacote legado (ou objetos com
+                ``nome``, ``prazo``, ``descricao``, ``membros`` e ``tarefas``)
+
+        Returns:
+            RelatorioMigracao: Relatório acumulado deste migrador
+        """
+        inicio = time.perf_counter()
+        try:
+            for legado in projetos:
+                self._migrar_projeto(legado)
+        finally:
+            self.relatorio.segundos += time.perf_counter() - inicio
+        return self.relatorio
+
+    def _migrar_projeto(self, legado) -> None:
+        nome = legado.nome.strip() if isinstance(legado.nome, str) else ""
+        if not nome:
+            self.relatorio.registrar_anomalia("projeto_sem_nome", repr(legado.descricao))
+            return
+        if self._gerenciador.buscar_projeto(nome) is not None:
+            self.relatorio.registrar_anomalia("projeto_existente", nome)
+            return
+        projeto = Projeto(nome, legado.descricao or "", self._converter_prazo(nome, legado.prazo))
+        self._gerenciador.adicionar_projeto(projeto)
+        for membro_legado in legado.membros:
+            membro = self._membro(membro_legado.nome, membro_legado.funcao)
+            if membro is None:
+                continue
+            if projeto.possui_membro(membro):
+                self.relatorio.registrar_anomalia("membro_repetido", f"{nome}: {membro.nome}")
+                continue
+            self._gerenciador._adicionar_membro_projeto(projeto, membro)
+        for tarefa_legada in legado.tarefas:
+            self._migrar_tarefa(projeto, tarefa_legada)
+        self.relatorio.projetos += 1
+
+    def _migrar_tarefa(self, projeto: Projeto, legada) -> None:
+        if not isinstance(legada.titulo, str) or not legada.titulo.strip():
+            self.relatorio.registrar_anomalia("tarefa_sem_titulo",
+                                              f"{projeto.nome}: {legada.titulo!r}")
+            return
+        # O legado aceita tanto o objeto Membro quanto só o nome
+        responsavel = legada.responsavel
+        nome_responsavel = getattr(responsavel, "nome", responsavel)
+        membro = None
+        if isinstance(nome_responsavel, str):
+            membro = self._membro(nome_responsavel, getattr(responsavel, "funcao", ""))
+        if membro is None:
+            self.relatorio.registrar_anomalia("responsavel_invalido",
+                                              f"{projeto.nome}: {legada.titulo}")
+            return
+        if not projeto.possui_membro(membro):
+            self.relatorio.registrar_anomalia("responsavel_fora_do_projeto",
+                                              f"{projeto.nome}: {membro.nome}")
+            self._gerenciador._adicionar_membro_projeto(projeto, membro)
+        status = _STATUS.get(str(legada.status).strip().lower())
+        if status is None:
+            self.relatorio.registrar_anomalia("status_desconhecido",
+                                              f"{projeto.nome}: {legada.titulo} ({legada.status})")
+            status = Tarefa.STATUS_PENDENTE
+        tarefa = Tarefa(legada.titulo, legada.descricao or "", membro)
+        self._gerenciador._registrar_tarefa(projeto, tarefa)
+        if status != Tarefa.STATUS_PENDENTE:
+            # Pelo observador, para que índices e histórico vejam a transição
+            tarefa._alterar_status(status)
+        self.relatorio.tarefas += 1
+
+    def _membro(self, nome, funcao: str) -> Optional[Membro]:
+        nome = nome.strip() if isinstance(nome, str) else ""
+        if not nome:
+            self.relatorio.registrar_anomalia("membro_sem_nome", repr(funcao))
+            return None
+        chave = normalizar_nome(nome)
+        membro = self._membros.get(chave)
+        if membro is None:
+            membro = self._gerenciador.buscar_membro(nome)
+            if membro is None:
+                membro = Membro(nome, funcao or "")
+                self._gerenciador.cadastrar_membro(membro)
+                self.relatorio.membros += 1
+            self._membros[chave] = membro
+        if funcao and membro.funcao and funcao != membro.funcao:
+            self.relatorio.registrar_anomalia("funcao_divergente",
+                                              f"{membro.nome}: {membro.funcao} / {funcao}")
+        return membro
+
+    def _converter_prazo(self, nome_projeto: str, prazo) -> Optional[date]:
+        if prazo is None or prazo == "":
+            return None
+        if isinstance(prazo, datetime):
+            return prazo.date()
+        if isinstance(prazo, date):
+            return prazo
+        if isinstance(prazo, str):
+            texto = prazo.strip()
+            try:
+                return date.fromisoformat(texto)
+            except ValueError:
+                pass
+            for formato in _FORMATOS_PRAZO:
+                try:
+                    return datetime.strptime(texto, formato).date()
+                except ValueError:
+                    pass
+        self.relatorio.registrar_anomalia("prazo_invalido", f"{nome_projeto}: {prazo!r}")
+        return None
+
+
+def migrar_projetos_legados(gerenciador: GerenciadorProjetos,
+                            projetos: Iterable) -> RelatorioMigracao:
+    """Atalho para migrar um lote com um ``MigradorLegado`` novo."""
+    return MigradorLegado(gerenciador).migrar(projetos)
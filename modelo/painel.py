@@ -0,0 +1,169 @@
+from datetime import date
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional
+
+from .estatisticas import ContadorAtrasos
+
+if TYPE_CHECKING:
+    from modelo.membro import Membro
+    from modelo.projeto import Projeto
+    from modelo.tarefa import Tarefa
+
+Assinante = Callable[['PainelOperacional', str], None]
+
+
+class PainelOperacional:
+    """Visão materializada do portfólio para o painel de operações.
+
+    Mantém, sem varrer as tarefas, as tarefas abertas por prioridade e por
+    função do responsável, o percentual de conclusão de cada projeto, o
+    total de tarefas atrasadas e os membros alocados por função. Cada
+    mutação do gerenciador atualiza a visão em O(1) e as leituras também
+    são O(1) (ou proporcionais ao número de prioridades/funções).
+    """
+
+    def __init__(self):
+        self._abertas_por_prioridade: Dict[int, int] = {}
+        self._abertas_por_funcao: Dict[str, int] = {}
+        self._membros_por_funcao: Dict[str, int] = {}
+        self._conclusao: Dict['Projeto', List[int]] = {}
+        self._atrasos = ContadorAtrasos()
+        self._assinantes: List[Assinante] = []
+
+    def assinar(self, assinante: Assinante) -> None:
+        """Registra uma função chamada a cada atualização da visão."""
+        self._assinantes.append(assinante)
+
+    def cancelar_assinatura(self, assinante: Assinante) -> None:
+        self._assinantes.remove(assinante)
+
+    def abertas_por_prioridade(self) -> Dict[int, int]:
+        return dict(self._abertas_por_prioridade)
+
+    def abertas_por_funcao(self) -> Dict[str, int]:
+        return dict(self._abertas_por_funcao)
+
+    def membros_por_funcao(self) -> Dict[str, int]:
+        return dict(self._membros_por_funcao)
+
+    def percentual_conclusao(self, projeto: 'Projeto') -> float:
+        total, concluidas = self._conclusao.get(projeto, (0, 0))
+        return 100.0 * concluidas / total if total else 0.0
+
+    def atrasadas(self, hoje: Optional[date] = None) -> int:
+        return self._atrasos.vencidas(hoje)
+
+    def leitura(self, hoje: Optional[date] = None) -> Dict:
+        """Fotografia completa da visão (proporcional ao número de projetos)."""
+        return {
+            "abertas_por_prioridade": self.abertas_por_prioridade(),
+            "abertas_por_funcao": self.abertas_por_funcao(),
+            "membros_por_funcao": self.membros_por_funcao(),
+            "conclusao_projetos": {p.nome: self.percentual_conclusao(p) for p in self._conclusao},
+            "tarefas_atrasadas": self.atrasadas(hoje),
+        }
+
+    # Pontos de alimentação, chamados pelo gerenciador a cada mutação
+
+    def projeto_adicionado(self, projeto: 'Projeto') -> None:
+        self._conclusao.setdefault(projeto, [0, 0])
+        self._notificar("projeto_adicionado")
+
+    def projeto_removido(self, projeto: 'Projeto') -> None:
+        self._conclusao.pop(projeto, None)
+        self._notificar("projeto_removido")
+
+    def membro_adicionado(self, projeto: 'Projeto', membro: 'Membro') -> None:
+        self._somar(self._membros_por_funcao, membro.funcao, 1)
+        self._notificar("membro_adicionado")
+
+    def membro_removido(self, projeto: 'Projeto', membro: 'Membro') -> None:
+        self._somar(self._membros_por_funcao, membro.funcao, -1)
+        self._notificar("membro_removido")
+
+    def tarefa_adicionada(self, projeto: 'Projeto', tarefa: 'Tarefa') -> None:
+        self._contar(projeto, tarefa, 1)
+        self._notificar("tarefa_adicionada")
+
+    def tarefa_removida(self, projeto: 'Projeto', tarefa: 'Tarefa') -> None:
+        self._contar(projeto, tarefa, -1)
+        self._notificar("tarefa_removida")
+
+    def status_alterado(self, projeto: 'Projeto', tarefa: 'Tarefa', anterior: str) -> None:
+        estava_aberta = anterior != tarefa.STATUS_CONCLUIDA
+        esta_aberta = tarefa.status != tarefa.STATUS_CONCLUIDA
+        if estava_aberta != esta_aberta:
+            delta = 1 if esta_aberta else -1
+            self._conclusao[projeto][1] -= delta
+            self._contar_aberta(tarefa, tarefa.responsavel, delta)
+        self._notificar("status_alterado")
+
+    def prazo_alterado(self, projeto: 'Projeto', tarefa: 'Tarefa',
+                       anterior: Optional[date]) -> None:
+        if tarefa.status != tarefa.STATUS_CONCLUIDA:
+            if anterior is not None:
+                self._atrasos.remover(anterior.toordinal())
+            if tarefa.prazo is not None:
+                self._atrasos.adicionar(tarefa.prazo.toordinal())
+        self._notificar("prazo_alterado")
+
+    def responsavel_alterado(self, tarefa: 'Tarefa', anterior: 'Membro') -> None:
+        if tarefa.status != tarefa.STATUS_CONCLUIDA:
+            self._somar(self._abertas_por_funcao, anterior.funcao, -1)
+            self._somar(self._abertas_por_funcao, tarefa.responsavel.funcao, 1)
+        self._notificar("responsavel_alterado")
+
+    def reconstruir(self, projetos: Iterable['Projeto'],
+                    em_disco: Optional[Dict['Projeto', int]] = None) -> None:
+        """Recalcula a visão do zero a partir dos projetos (para verificação).
+
+        ``em_disco`` conta, por projeto, as concluídas que estão só na
+        camada fria; elas entram no percentual de conclusão e em nada mais.
+        """
+        assinantes = self._assinantes
+        self.__init__()
+        self._assinantes = assinantes
+        em_disco = em_disco or {}
+        for projeto in projetos:
+            frias = em_disco.get(projeto, 0)
+            self._conclusao[projeto] = [frias, frias]
+            for membro in projeto.membros:
+                self._somar(self._membros_por_funcao, membro.funcao, 1)
+            for tarefa in projeto.tarefas:
+                self._contar(projeto, tarefa, 1)
+        self._notificar("reconstruido")
+
+    def verificar(self, projetos: Iterable['Projeto'], hoje: Optional[date] = None,
+                  em_disco: Optional[Dict['Projeto', int]] = None) -> bool:
+        """Confere a visão incremental contra uma reconstrução completa."""
+        referencia = PainelOperacional()
+        referencia.reconstruir(projetos, em_disco)
+        return referencia.leitura(hoje) == self.leitura(hoje)
+
+    def _contar(self, projeto: 'Projeto', tarefa: 'Tarefa', delta: int) -> None:
+        conclusao = self._conclusao.setdefault(projeto, [0, 0])
+        conclusao[0] += delta
+        if tarefa.status == tarefa.STATUS_CONCLUIDA:
+            conclusao[1] += delta
+        else:
+            self._contar_aberta(tarefa, tarefa.responsavel, delta)
+
+    def _contar_aberta(self, tarefa: 'Tarefa', responsavel: 'Membro', delta: int) -> None:
+        self._somar(self._abertas_por_prioridade, tarefa.prioridade, delta)
+        self._somar(self._abertas_por_funcao, responsavel.funcao, delta)
+        if tarefa.prazo is not None:
+            if delta > 0:
+                self._atrasos.adicionar(tarefa.prazo.toordinal())
+            else:
+                self._atrasos.remover(tarefa.prazo.toordinal())
+
+    @staticmethod
+    def _somar(contagem: Dict, chave, delta: int) -> None:
+        valor = contagem.get(chave, 0) + delta
+        if valor:
+            contagem[chave] = valor
+        else:
+            contagem.pop(chave, None)
+
+    def _notificar(self, evento: str) -> None:
+        for assinante in self._assinantes:
+            assinante(self, evento)
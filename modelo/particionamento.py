@@ -0,0 +1,412 @@
+import multiprocessing
+import threading
+import zlib
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .estatisticas import EstatisticasTarefas
+from .excecoes import MembroNaoEncontradoError
+from .gerenciador import GerenciadorProjetos
+from .historico import percentis_por_grupo
+from .membro import Membro
+from .projeto import Projeto
+from .tarefa import Tarefa
+
+# (método, argumentos posicionais, argumentos nomeados)
+Operacao = Tuple[str, tuple, dict]
+
+
+def particao_do_projeto(nome_projeto: str, particoes: int) -> int:
+    """Partição responsável por um projeto (crc32 do nome normalizado)."""
+    return zlib.crc32(nome_projeto.lower().encode()) % particoes
+
+
+def _copiar_membro(membro: Membro) -> Membro:
+    return Membro(membro.nome, membro.funcao, membro.email)
+
+
+def _copiar_tarefa(tarefa: Tarefa) -> Tarefa:
+    copia = Tarefa.__new__(Tarefa)
+    copia.__dict__.update(tarefa.__dict__)
+    copia.responsavel = _copiar_membro(tarefa.responsavel)
+    copia._observador = None
+    return copia
+
+
+def _copiar_projeto(projeto: Projeto) -> Projeto:
+    copia = Projeto(projeto.nome, projeto.descricao, projeto.prazo)
+    copia.data_criacao = projeto.data_criacao
+    for membro in projeto.membros:
+        copia.adicionar_membro(_copiar_membro(membro))
+    return copia
+
+
+def _desligar(valor: Any) -> Any:
+    """Troca objetos do domínio por cópias que podem sair do processo.
+
+    Tarefas levam uma cópia do responsável e projetos levam só os dados e
+    os membros, sem arrastar o grafo inteiro de objetos da partição.
+    """
+    if isinstance(valor, Tarefa):
+        return _copiar_tarefa(valor)
+    if isinstance(valor, Projeto):
+        return _copiar_projeto(valor)
+    if isinstance(valor, Membro):
+        return _copiar_membro(valor)
+    if isinstance(valor, list):
+        return [_desligar(item) for item in valor]
+    return valor
+
+
+def _parcial_membro(gerenciador: GerenciadorProjetos, nome_membro: str) -> Tuple:
+    membro = gerenciador.buscar_membro(nome_membro)
+    if not membro:
+        raise MembroNaoEncontradoError(nome_membro)
+    return (membro.nome, membro.funcao, gerenciador._estatisticas_membro[membro],
+            [p.nome for p in gerenciador._projetos_do_membro.get(membro, ())])
+
+
+def _ler_atributo(gerenciador: GerenciadorProjetos, nome: str) -> Any:
+    return getattr(gerenciador, nome)
+
+
+def _duracoes(gerenciador: GerenciadorProjetos, medida: str,
+              agrupar_por: Optional[str]) -> Dict[Optional[str], List[float]]:
+    return gerenciador._historico.duracoes(medida, agrupar_por)
+
+
+def _exportar_tarefas(gerenciador: GerenciadorProjetos) -> List[Dict]:
+    return list(gerenciador.exportar_tarefas())
+
+
+# Consultas que só fazem sentido dentro da partição (recebem o gerenciador)
+_INTERNAS = {'_parcial_membro': _parcial_membro, '_ler_atributo': _ler_atributo,
+             '_duracoes': _duracoes, '_exportar_tarefas': _exportar_tarefas}
+
+
+def _executar_particao(conexao) -> None:
+    """Laço do processo de uma partição: recebe lotes e devolve os resultados."""
+    gerenciador = GerenciadorProjetos()
+    while True:
+        lote = conexao.recv()
+        if lote is None:
+            break
+        respostas = []
+        for metodo, args, kwargs in lote:
+            try:
+                interna = _INTERNAS.get(metodo)
+                if interna is not None:
+                    resultado = interna(gerenciador, *args, **kwargs)
+                else:
+                    resultado = getattr(gerenciador, metodo)(*args, **kwargs)
+                respostas.append((True, _desligar(resultado)))
+            except Exception as erro:
+                respostas.append((False, erro))
+        conexao.send(respostas)
+    conexao.close()
+
+
+def _por_projeto(metodo: str):
+    """Encaminha o método à partição do projeto informado no primeiro argumento."""
+    def encaminhar(self, nome_projeto: str, *args, **kwargs):
+        return self._chamar(self.particao_do_projeto(nome_projeto), metodo,
+                            (nome_projeto,) + args, kwargs)
+    encaminhar.__name__ = metodo
+    encaminhar.__doc__ = getattr(GerenciadorProjetos, metodo).__doc__
+    return encaminhar
+
+
+class GerenciadorParticionado:
+    """Gerenciador com os projetos repartidos entre processos de trabalho.
+
+    Cada projeto, com suas tarefas e participações, vive em uma única
+    partição, escolhida pelo crc32 do nome normalizado; os membros são
+    replicados em todas. Operações de um projeto vão a uma partição só,
+    e consultas do portfólio (``relatorio_membro``, listagens, cronograma,
+    vazão) são espalhadas e os resultados reunidos aqui.
+
+    Os objetos devolvidos são cópias: tarefas trazem uma cópia do
+    responsável, e projetos trazem só os dados e os membros. Alterações
+    devem passar pelos métodos do gerenciador. Como cada chamada espera a
+    resposta, o paralelismo aparece ao enviar várias operações de uma vez
+    com ``executar_lote``.
+
+    Não são oferecidos aqui os recursos presos a objetos vivos ou a ids de
+    um só gerenciador: painéis e agendadores de atrasos, o barramento de
+    eventos, a detecção de duplicatas, o armazenamento frio
+    (``configurar_armazenamento_frio``, ``descarregar_concluidas``),
+    ``congelar_para_coletor`` e os métodos ``*_por_id``.
+    """
+
+    def __init__(self, particoes: int = 4, metodo_inicio: Optional[str] = None):
+        if particoes < 1:
+            raise ValueError("É preciso ao menos uma partição")
+        contexto = multiprocessing.get_context(metodo_inicio)
+        self._conexoes = []
+        self._processos = []
+        self._travas = []
+        for _ in range(particoes):
+            local, remota = contexto.Pipe()
+            processo = contexto.Process(target=_executar_particao, args=(remota,), daemon=True)
+            processo.start()
+            remota.close()
+            self._conexoes.append(local)
+            self._processos.append(processo)
+            self._travas.append(threading.Lock())
+
+    @property
+    def particoes(self) -> int:
+        return len(self._conexoes)
+
+    def particao_do_projeto(self, nome_projeto: str) -> int:
+        return particao_do_projeto(nome_projeto, len(self._conexoes))
+
+    def fechar(self) -> None:
+        """Encerra os processos das partições."""
+        for conexao, trava in zip(self._conexoes, self._travas):
+            with trava:
+                if not conexao.closed:
+                    conexao.send(None)
+                    conexao.close()
+        for processo in self._processos:
+            processo.join()
+
+    def __enter__(self) -> 'GerenciadorParticionado':
+        return self
+
+    def __exit__(self, *excecao) -> None:
+        self.fechar()
+
+    def executar_lote(self, operacoes: Iterable[Operacao]) -> List[Any]:
+        """Executa várias operações, em paralelo entre as partições.
+
+        Cada operação é ``(metodo, args, kwargs)`` de um método encaminhado
+        por projeto (o primeiro argumento é o nome do projeto). A ordem é
+        mantida dentro de cada partição.
+
+        Returns:
+            List[Any]: Resultado de cada operação, ou a exceção que ela lançou
+        """
+        operacoes = list(operacoes)
+        por_particao: Dict[int, List[int]] = {}
+        for posicao, (_, args, _) in enumerate(operacoes):
+            por_particao.setdefault(self.particao_do_projeto(args[0]), []).append(posicao)
+        respostas = self._espalhar({
+            particao: [operacoes[p] for p in posicoes]
+            for particao, posicoes in por_particao.items()})
+        resultados: List[Any] = [None] * len(operacoes)
+        for particao, posicoes in por_particao.items():
+            for posicao, (_, valor) in zip(posicoes, respostas[particao]):
+                resultados[posicao] = valor
+        return resultados
+
+    def _espalhar(self, lotes: Dict[int, List[Operacao]]) -> Dict[int, List[Tuple[bool, Any]]]:
+        travas = [self._travas[p] for p in sorted(lotes)]
+        for trava in travas:
+            trava.acquire()
+        try:
+            for particao, lote in lotes.items():
+                self._conexoes[particao].send(lote)
+            return {particao: self._conexoes[particao].recv() for particao in lotes}
+        finally:
+            for trava in travas:
+                trava.release()
+
+    def _chamar(self, particao: int, metodo: str, args: tuple = (), kwargs: Optional[dict] = None):
+        (ok, valor), = self._espalhar({particao: [(metodo, args, kwargs or {})]})[particao]
+        if not ok:
+            raise valor
+        return valor
+
+    def _em_todas(self, metodo: str, args: tuple = (), kwargs: Optional[dict] = None) -> List[Any]:
+        operacao = [(metodo, args, kwargs or {})]
+        respostas = self._espalhar({p: operacao for p in range(self.particoes)})
+        for particao in range(self.particoes):
+            ok, valor = respostas[particao][0]
+            if not ok:
+                raise valor
+        return [respostas[p][0][1] for p in range(self.particoes)]
+
+    # Cadastro
+
+    def adicionar_projeto(self, projeto: Projeto) -> None:
+        """Adiciona um projeto na partição que o nome dele indica."""
+        self._chamar(self.particao_do_projeto(projeto.nome), 'adicionar_projeto', (projeto,))
+
+    def cadastrar_membro(self, membro: Membro) -> None:
+        """Cadastra um membro em todas as partições."""
+        self._em_todas('cadastrar_membro', (_copiar_membro(membro),))
+
+    def buscar_membro(self, nome_membro: str) -> Optional[Membro]:
+        return self._chamar(0, 'buscar_membro', (nome_membro,))
+
+    def buscar_projeto(self, nome_projeto: str) -> Optional[Projeto]:
+        return self._chamar(self.particao_do_projeto(nome_projeto), 'buscar_projeto',
+                            (nome_projeto,))
+
+    # Operações de um projeto
+
+    adicionar_membro_projeto = _por_projeto('adicionar_membro_projeto')
+    remover_membro_projeto = _por_projeto('remover_membro_projeto')
+    criar_tarefa = _por_projeto('criar_tarefa')
+    criar_tarefa_automatica = _por_projeto('criar_tarefa_automatica')
+    criar_tarefas_automaticas = _por_projeto('criar_tarefas_automaticas')
+    iniciar_tarefa = _por_projeto('iniciar_tarefa')
+    concluir_tarefa = _por_projeto('concluir_tarefa')
+    reatribuir_tarefa = _por_projeto('reatribuir_tarefa')
+    remover_tarefa = _por_projeto('remover_tarefa')
+    adicionar_dependencia = _por_projeto('adicionar_dependencia')
+    remover_dependencia = _por_projeto('remover_dependencia')
+    definir_tarefa_pai = _por_projeto('definir_tarefa_pai')
+    resumo_tarefa = _por_projeto('resumo_tarefa')
+    caminho_critico = _por_projeto('caminho_critico')
+    prazo_em_risco = _por_projeto('prazo_em_risco')
+    relatorio_projeto = _por_projeto('relatorio_projeto')
+    remover_projeto = _por_projeto('remover_projeto')
+    arquivar_projeto = _por_projeto('arquivar_projeto')
+    relatorio_arquivado = _por_projeto('relatorio_arquivado')
+
+    # Consultas do portfólio
+
+    @property
+    def projetos(self) -> List[Projeto]:
+        return self._concatenar('_ler_atributo', ('projetos',))
+
+    @property
+    def membros(self) -> List[Membro]:
+        return self._chamar(0, '_ler_atributo', ('membros',))
+
+    @property
+    def tarefas(self) -> List[Tarefa]:
+        return self._concatenar('_ler_atributo', ('tarefas',))
+
+    def buscar_tarefa(self, titulo_tarefa: str) -> Optional[Tarefa]:
+        """Busca uma tarefa pelo título em todas as partições (a da menor partição vence)."""
+        return next((t for t in self._em_todas('buscar_tarefa', (titulo_tarefa,)) if t), None)
+
+    def sugerir_projetos(self, prefixo: str, limite: int = 10,
+                         tolerancia: bool = False) -> List[Projeto]:
+        projetos = self._concatenar('sugerir_projetos', (prefixo, limite, tolerancia))
+        return sorted(projetos, key=lambda p: p.nome.lower())[:limite]
+
+    def sugerir_membros(self, prefixo: str, limite: int = 10,
+                        tolerancia: bool = False) -> List[Membro]:
+        return self._chamar(0, 'sugerir_membros', (prefixo, limite, tolerancia))
+
+    def relatorio_membro(self, nome_membro: str) -> Dict:
+        """Gera o relatório de um membro somando o que ele tem em cada partição.
+
+        Os agregados de cada partição (contagens e esboços de datas) são
+        mesclados, então os percentis saem iguais aos de um só gerenciador.
+
+        Raises:
+            MembroNaoEncontradoError: Se membro não existe
+        """
+        partes = self._em_todas('_parcial_membro', (nome_membro,))
+        nome, funcao = partes[0][0], partes[0][1]
+        estatisticas = EstatisticasTarefas()
+        projetos: List[str] = []
+        for _, _, parcial, nomes in partes:
+            estatisticas.mesclar(parcial)
+            projetos.extend(nomes)
+        relatorio = {"nome": nome, "funcao": funcao}
+        relatorio.update(GerenciadorProjetos._resumo_estatisticas(estatisticas))
+        relatorio["projetos"] = projetos
+        return relatorio
+
+    def arquivar_projetos_concluidos(self) -> List[str]:
+        return self._concatenar('arquivar_projetos_concluidos')
+
+    def tarefas_ativas_entre(self, inicio: date, fim: date) -> List[Tarefa]:
+        tarefas = self._concatenar('tarefas_ativas_entre', (inicio, fim))
+        return sorted(tarefas, key=lambda t: t.data_criacao)
+
+    def tarefas_ativas_em(self, dia: date) -> List[Tarefa]:
+        return sorted(self._concatenar('tarefas_ativas_em', (dia,)),
+                      key=lambda t: t.data_criacao)
+
+    def projetos_ativos_entre(self, inicio: date, fim: date) -> List[Projeto]:
+        projetos = self._concatenar('projetos_ativos_entre', (inicio, fim))
+        return sorted(projetos, key=lambda p: p.data_criacao)
+
+    def projetos_ativos_em(self, dia: date) -> List[Projeto]:
+        return sorted(self._concatenar('projetos_ativos_em', (dia,)),
+                      key=lambda p: p.data_criacao)
+
+    def carga_membro_no_dia(self, nome_membro: str, dia: date) -> int:
+        return sum(self._em_todas('carga_membro_no_dia', (nome_membro, dia)))
+
+    def vazao(self, periodo: str = 'dia', nome_projeto: Optional[str] = None,
+              nome_membro: Optional[str] = None) -> Dict[date, int]:
+        """Conclusões por dia ou semana, somadas entre as partições."""
+        args = (periodo, nome_projeto, nome_membro)
+        if nome_projeto is not None:
+            return self._chamar(self.particao_do_projeto(nome_projeto), 'vazao', args)
+        total: Dict[date, int] = {}
+        for parte in self._em_todas('vazao', args):
+            for dia, quantidade in parte.items():
+                total[dia] = total.get(dia, 0) + quantidade
+        return dict(sorted(total.items()))
+
+    def wip_por_dia(self, nome_projeto: Optional[str] = None,
+                    nome_membro: Optional[str] = None) -> Dict[date, int]:
+        """Trabalho em andamento por dia, somado entre as partições.
+
+        Cada partição só informa os dias em que algo mudou nela; nos demais
+        dias vale o último valor informado por ela.
+        """
+        args = (nome_projeto, nome_membro)
+        if nome_projeto is not None:
+            return self._chamar(self.particao_do_projeto(nome_projeto), 'wip_por_dia', args)
+        partes = self._em_todas('wip_por_dia', args)
+        atual = [0] * len(partes)
+        mudancas = sorted((dia, indice, valor) for indice, parte in enumerate(partes)
+                          for dia, valor in parte.items())
+        total: Dict[date, int] = {}
+        for dia, indice, valor in mudancas:
+            atual[indice] = valor
+            total[dia] = sum(atual)
+        return total
+
+    def percentis_tempo(self, medida: str = 'ciclo', agrupar_por: Optional[str] = None,
+                        percentis=(50, 90, 99)) -> Dict:
+        """Percentis de tempo de ciclo ou de lead time, em dias, de todo o portfólio.
+
+        As partições devolvem as durações brutas, então os percentis saem
+        iguais aos de um só gerenciador.
+        """
+        grupos: Dict[Optional[str], List[float]] = {}
+        for parte in self._em_todas('_duracoes', (medida, agrupar_por)):
+            for chave, duracoes in parte.items():
+                grupos.setdefault(chave, []).extend(duracoes)
+        return percentis_por_grupo(grupos, percentis, agrupar_por is not None)
+
+    def exportar_tarefas(self) -> Iterator[Dict]:
+        """Percorre as tarefas de todas as partições, uma partição por vez.
+
+        Os ids são os da partição de cada tarefa e podem se repetir entre
+        partições; o par (projeto, id) identifica a tarefa.
+        """
+        for particao in range(self.particoes):
+            yield from self._chamar(particao, '_exportar_tarefas')
+
+    def estatisticas_cache(self) -> Dict:
+        """Contadores dos caches de relatórios somados entre as partições."""
+        total = self._somar('estatisticas_cache')
+        consultas = total["acertos"] + total["falhas"]
+        total["taxa_acerto"] = total["acertos"] / consultas if consultas else 0.0
+        return total
+
+    def estatisticas_armazenamento(self) -> Dict:
+        """Tarefas residentes e em disco somadas entre as partições."""
+        return self._somar('estatisticas_armazenamento')
+
+    def _somar(self, metodo: str) -> Dict:
+        total: Dict[str, Any] = {}
+        for parte in self._em_todas(metodo):
+            for chave, valor in parte.items():
+                total[chave] = total.get(chave, 0) + valor
+        return total
+
+    def _concatenar(self, metodo: str, args: tuple = ()) -> List[Any]:
+        return [item for parte in self._em_todas(metodo, args) for item in parte]
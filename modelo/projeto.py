@@ -1,7 +1,9 @@
 from typing import List, Dict, Optional
-from datetime import date
+from datetime import date, timedelta
 from .membro import Membro
 from .tarefa import Tarefa
+from .dependencias import GrafoDependencias
+from .hierarquia import HierarquiaTarefas
 
 class Projeto:
     
@@ -10,30 +12,89 @@ class Projeto:
         self.descricao = descricao
         self.prazo = prazo
         self.data_criacao = date.today()
-        self._membros: List[Membro] = []
-        self._tarefas: List[Tarefa] = []
+        # Posição nas listas por id do gerenciador (atribuída ao cadastrar)
+        self.id: Optional[int] = None
+        # Dicionários usados como conjuntos ordenados (pertinência e remoção em O(1))
+        self._membros: Dict[Membro, None] = {}
+        self._tarefas: Dict[Tarefa, None] = {}
+        self._tarefas_por_titulo: Dict[str, List[Tarefa]] = {}
+        self._tarefas_por_membro: Dict[Membro, Dict[Tarefa, None]] = {}
+        self._dependencias = GrafoDependencias()
+        self._hierarquia = HierarquiaTarefas()
 
     @property
     def membros(self) -> List[Membro]:
         """Retorna uma cópia da lista de membros"""
-        return self._membros.copy()
+        return list(self._membros)
 
     @property
     def tarefas(self) -> List[Tarefa]:
         """Retorna uma cópia da lista de tarefas"""
-        return self._tarefas.copy()
+        return list(self._tarefas)
+
+    def possui_membro(self, membro: Membro) -> bool:
+        """Verifica se o membro participa do projeto"""
+        return membro in self._membros
 
     def adicionar_membro(self, membro: Membro) -> None:
         """Adiciona um membro ao projeto"""
         if membro in self._membros:
             raise ValueError(f"Membro {membro.nome} já está no projeto")
-        self._membros.append(membro)
+        self._membros[membro] = None
+
+    def remover_membro(self, membro: Membro) -> None:
+        """Remove um membro do projeto (as tarefas dele permanecem no projeto)"""
+        if membro not in self._membros:
+            raise ValueError(f"Membro {membro.nome} não está no projeto")
+        del self._membros[membro]
 
     def adicionar_tarefa(self, tarefa: Tarefa) -> None:
         """Adiciona uma tarefa existente ao projeto"""
         if tarefa in self._tarefas:
             raise ValueError(f"Tarefa '{tarefa.titulo}' já existe no projeto")
-        self._tarefas.append(tarefa)
+        self._tarefas[tarefa] = None
+        self._tarefas_por_titulo.setdefault(tarefa.titulo.lower(), []).append(tarefa)
+        self._tarefas_por_membro.setdefault(tarefa.responsavel, {})[tarefa] = None
+        self._dependencias.adicionar_tarefa(tarefa)
+
+    def remover_tarefa(self, tarefa: Tarefa) -> None:
+        """Remove uma tarefa do projeto"""
+        if tarefa not in self._tarefas:
+            raise ValueError(f"Tarefa '{tarefa.titulo}' não pertence ao projeto")
+        del self._tarefas[tarefa]
+        mesmo_titulo = self._tarefas_por_titulo[tarefa.titulo.lower()]
+        mesmo_titulo.remove(tarefa)
+        if not mesmo_titulo:
+            del self._tarefas_por_titulo[tarefa.titulo.lower()]
+        self._desindexar_responsavel(tarefa)
+        self._dependencias.remover_tarefa(tarefa)
+        self._hierarquia.remover_tarefa(tarefa)
+
+    def buscar_tarefa(self, titulo: str) -> Optional[Tarefa]:
+        """Busca uma tarefa do projeto pelo título (case insensitive)"""
+        tarefas = self._tarefas_por_titulo.get(titulo.lower())
+        return tarefas[0] if tarefas else None
+
+    def tarefas_do_membro(self, membro: Membro) -> List[Tarefa]:
+        """Retorna as tarefas do projeto atribuídas ao membro"""
+        return list(self._tarefas_por_membro.get(membro, ()))
+
+    def reatribuir_tarefa(self, tarefa: Tarefa, responsavel: Membro) -> None:
+        """Transfere uma tarefa do projeto para outro membro do projeto"""
+        if tarefa not in self._tarefas:
+            raise ValueError(f"Tarefa '{tarefa.titulo}' não pertence ao projeto")
+        if responsavel not in self._membros:
+            raise ValueError(f"Responsável {responsavel.nome} não é membro do projeto")
+        self._desindexar_responsavel(tarefa)
+        tarefa.atribuir(responsavel)
+        self._tarefas_por_membro.setdefault(responsavel, {})[tarefa] = None
+
+    def _desindexar_responsavel(self, tarefa: Tarefa) -> None:
+        tarefas = self._tarefas_por_membro.get(tarefa.responsavel)
+        if tarefas is not None:
+            tarefas.pop(tarefa, None)
+            if not tarefas:
+                del self._tarefas_por_membro[tarefa.responsavel]
 
     def criar_tarefa(self, titulo: str, descricao: str, responsavel: Membro, 
                     **kwargs) -> Tarefa:
@@ -45,6 +106,71 @@ class Projeto:
         self.adicionar_tarefa(tarefa)
         return tarefa
 
+    def concluido(self) -> bool:
+        """Indica se o projeto tem tarefas em memória e todas estão concluídas"""
+        return bool(self._tarefas) and all(
+            t.status == Tarefa.STATUS_CONCLUIDA for t in self._tarefas)
+
+    def adicionar_dependencia(self, tarefa: Tarefa, bloqueadora: Tarefa) -> None:
+        """Registra que ``tarefa`` depende da conclusão de ``bloqueadora``"""
+        for t in (tarefa, bloqueadora):
+            if t not in self._tarefas:
+                raise ValueError(f"Tarefa '{t.titulo}' não pertence ao projeto")
+        self._dependencias.adicionar_dependencia(tarefa, bloqueadora)
+
+    def remover_dependencia(self, tarefa: Tarefa, bloqueadora: Tarefa) -> bool:
+        """Desfaz uma dependência; retorna False se ela não existia"""
+        return self._dependencias.remover_dependencia(tarefa, bloqueadora)
+
+    def bloqueadoras(self, tarefa: Tarefa) -> List[Tarefa]:
+        """Retorna as tarefas das quais a tarefa depende diretamente"""
+        return self._dependencias.bloqueadoras(tarefa)
+
+    def status_alterado(self, tarefa: Tarefa, status_anterior: str) -> None:
+        """Propaga a mudança de status para o caminho crítico e os épicos"""
+        self._dependencias.atualizar_tarefa(tarefa)
+        self._hierarquia.alterar_status(tarefa, status_anterior)
+
+    def prazo_alterado(self, tarefa: Tarefa, prazo_anterior: Optional[date]) -> None:
+        """Propaga a mudança de prazo para os resumos dos épicos"""
+        self._hierarquia.alterar_prazo(tarefa, prazo_anterior)
+
+    def definir_tarefa_pai(self, tarefa: Tarefa, pai: Optional[Tarefa]) -> None:
+        """Coloca a tarefa sob um épico (ou tarefa-mãe); None a leva para a raiz"""
+        for t in (tarefa, pai):
+            if t is not None and t not in self._tarefas:
+                raise ValueError(f"Tarefa '{t.titulo}' não pertence ao projeto")
+        self._hierarquia.definir_pai(tarefa, pai)
+
+    def tarefa_pai(self, tarefa: Tarefa) -> Optional[Tarefa]:
+        """Retorna o épico (ou tarefa-mãe) da tarefa, se houver"""
+        return self._hierarquia.pai(tarefa)
+
+    def subtarefas(self, tarefa: Tarefa) -> List[Tarefa]:
+        """Retorna as filhas diretas da tarefa"""
+        return self._hierarquia.filhos(tarefa)
+
+    def resumo_subarvore(self, tarefa: Tarefa, hoje: Optional[date] = None) -> Dict:
+        """Contagens, conclusão, prioridades, último prazo e atrasos da subárvore"""
+        return self._hierarquia.resumo(tarefa, hoje)
+
+    def caminho_critico(self) -> List[Tarefa]:
+        """Retorna a cadeia de tarefas abertas que define o término do projeto"""
+        return self._dependencias.caminho_critico()
+
+    def previsao_conclusao(self, hoje: Optional[date] = None) -> date:
+        """Data mais cedo em que todas as tarefas podem estar concluídas"""
+        return (hoje or date.today()) + timedelta(days=self._dependencias.duracao_total)
+
+    def prazo_em_risco(self, hoje: Optional[date] = None) -> bool:
+        """Indica se o caminho crítico ultrapassa o prazo do projeto"""
+        return self.prazo is not None and self.previsao_conclusao(hoje) > self.prazo
+
+    def tarefa_isolada(self, tarefa: Tarefa) -> bool:
+        """Indica se a tarefa não tem dependências nem lugar em épicos"""
+        return (not self._dependencias.possui_dependencias(tarefa) and
+                not self._hierarquia.participa(tarefa))
+
     def calcular_atraso(self) -> int:
         """Calcula dias de atraso do projeto (se aplicável)"""
         if self.prazo and date.today() > self.prazo:
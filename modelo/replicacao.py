@@ -0,0 +1,488 @@
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .eventos import Evento
+from .excecoes import (
+    MembroNaoEncontradoError,
+    ProjetoNaoEncontradoError,
+    SequenciaIndisponivelError,
+    TarefaNaoEncontradaError,
+)
+from .gerenciador import GerenciadorProjetos
+from .membro import Membro
+from .projeto import Projeto
+from .tarefa import Tarefa
+
+# Mensagens trocadas pela conexão (Pipe ou socket Unix de multiprocessing.connection):
+#   réplica -> primário: ("ola", ultimo_seq ou None se nova) ao conectar;
+#                        ("aplicado", seq) após cada lote; ("tchau", seq) ao sair
+#   primário -> réplica: ("inicio", seq_primario) ao aceitar; ("instantaneo", Instantaneo)
+#                        se preciso; ("eventos", seq_primario, lote)
+
+
+class Instantaneo(NamedTuple):
+    """Estado do primário em ``seq``, descrito como eventos que o recriam."""
+    seq: int
+    eventos: List[Tuple[str, Dict]]
+    arquivados: Dict[str, Dict]
+
+
+def gerar_instantaneo(gerenciador: GerenciadorProjetos) -> Instantaneo:
+    """Descreve o estado atual do gerenciador para uma réplica começar do zero.
+
+    O estado (projetos, membros, tarefas, dependências, épicos, arquivados)
+    é exato, com os mesmos ids de projetos, membros e tarefas; o histórico de status não é copiado, então vazão, WIP e
+    percentis de tempo da réplica só contam o que acontecer depois.
+    """
+    eventos: List[Tuple[str, Dict]] = []
+    for membro in gerenciador.membros:
+        eventos.append((Evento.MEMBRO_CADASTRADO, {
+            "id": membro.id, "nome": membro.nome, "funcao": membro.funcao, "email": membro.email}))
+    for projeto in gerenciador.projetos:
+        eventos.append((Evento.PROJETO_ADICIONADO, {
+            "id": projeto.id, "nome": projeto.nome, "descricao": projeto.descricao, "prazo": projeto.prazo,
+            "data_criacao": projeto.data_criacao}))
+        for membro in projeto.membros:
+            eventos.append((Evento.MEMBRO_ENTROU_PROJETO,
+                            {"projeto": projeto.nome, "membro": membro.nome}))
+    # Tarefas concluídas podem continuar com quem já saiu do projeto: o membro
+    # entra de novo só para recebê-las e sai em seguida.
+    membros_projeto = {projeto.nome.lower(): {m.nome for m in projeto.membros}
+                       for projeto in gerenciador.projetos}
+    ausentes: Dict[Tuple[str, str], None] = {}
+    for dados in gerenciador.exportar_tarefas():
+        projeto, responsavel = dados["projeto"], dados["responsavel"]
+        if responsavel not in membros_projeto[projeto.lower()]:
+            membros_projeto[projeto.lower()].add(responsavel)
+            ausentes[(projeto, responsavel)] = None
+            eventos.append((Evento.MEMBRO_ENTROU_PROJETO,
+                            {"projeto": projeto, "membro": responsavel}))
+        eventos.append((Evento.TAREFA_CRIADA, {
+            "projeto": projeto, "id": dados["id"], "titulo": dados["titulo"],
+            "descricao": dados["descricao"], "responsavel": responsavel, "prazo": dados["prazo"],
+            "prioridade": dados["prioridade"], "estimativa_dias": dados["estimativa_dias"],
+            "data_criacao": dados["data_criacao"]}))
+        if dados["status"] != Tarefa.STATUS_PENDENTE:
+            tipo = (Evento.TAREFA_CONCLUIDA if dados["status"] == Tarefa.STATUS_CONCLUIDA
+                    else Evento.TAREFA_INICIADA)
+            eventos.append((tipo, {
+                "projeto": projeto, "id": dados["id"], "titulo": dados["titulo"],
+                "status": dados["status"],
+                "anterior": Tarefa.STATUS_PENDENTE, "data_conclusao": dados["data_conclusao"]}))
+    for projeto, membro in ausentes:
+        eventos.append((Evento.MEMBRO_SAIU_PROJETO, {"projeto": projeto, "membro": membro}))
+    for projeto in gerenciador.projetos:
+        for tarefa in projeto.tarefas:
+            for bloqueadora in projeto.bloqueadoras(tarefa):
+                eventos.append((Evento.DEPENDENCIA_ADICIONADA, {
+                    "projeto": projeto.nome, "id": tarefa.id, "titulo": tarefa.titulo,
+                    "id_bloqueadora": bloqueadora.id, "bloqueadora": bloqueadora.titulo}))
+            pai = projeto.tarefa_pai(tarefa)
+            if pai is not None:
+                eventos.append((Evento.TAREFA_PAI_DEFINIDO, {
+                    "projeto": projeto.nome, "id": tarefa.id, "titulo": tarefa.titulo,
+                    "id_pai": pai.id, "pai": pai.titulo}))
+    return Instantaneo(gerenciador.eventos.seq, eventos, dict(gerenciador._arquivo))
+
+
+def _projeto(gerenciador: GerenciadorProjetos, nome: str) -> Projeto:
+    projeto = gerenciador.buscar_projeto(nome)
+    if projeto is None:
+        raise ProjetoNaoEncontradoError(nome)
+    return projeto
+
+
+def _tarefa(gerenciador: GerenciadorProjetos, dados: Dict, campo: str = "id",
+            titulo: str = "titulo") -> Tarefa:
+    # A réplica usa os mesmos ids do primário: títulos podem se repetir no
+    # projeto. Eventos sem id (arquivos de estado antigos) caem no título.
+    if dados.get(campo) is not None:
+        return gerenciador.tarefa_por_id(dados[campo])
+    tarefa = gerenciador._buscar_tarefa_projeto(_projeto(gerenciador, dados["projeto"]),
+                                                dados[titulo])
+    if tarefa is None:
+        raise TarefaNaoEncontradaError(dados[titulo])
+    return tarefa
+
+
+def _tarefa_criada(gerenciador: GerenciadorProjetos, dados: Dict) -> None:
+    responsavel = gerenciador.buscar_membro(dados["responsavel"])
+    if responsavel is None:
+        raise MembroNaoEncontradoError(dados["responsavel"])
+    gerenciador._criar_tarefa(
+        _projeto(gerenciador, dados["projeto"]), dados["titulo"], dados["descricao"],
+        responsavel, dados.get("id"), prazo=dados["prazo"], prioridade=dados["prioridade"],
+        estimativa_dias=dados["estimativa_dias"], data_criacao=dados["data_criacao"])
+
+
+def _tarefa_reatribuida(gerenciador: GerenciadorProjetos, dados: Dict) -> None:
+    responsavel = gerenciador.buscar_membro(dados["responsavel"])
+    if responsavel is None:
+        raise MembroNaoEncontradoError(dados["responsavel"])
+    tarefa = _tarefa(gerenciador, dados)
+    gerenciador._mover_tarefa(gerenciador._projeto_da_tarefa[tarefa], tarefa, responsavel)
+
+
+def _tarefa_removida(gerenciador: GerenciadorProjetos, dados: Dict) -> None:
+    tarefa = _tarefa(gerenciador, dados)
+    gerenciador._remover_tarefa(gerenciador._projeto_da_tarefa[tarefa], tarefa)
+
+
+def _dependencia(metodo: str) -> Callable[[GerenciadorProjetos, Dict], None]:
+    def aplicar(gerenciador: GerenciadorProjetos, dados: Dict) -> None:
+        tarefa = _tarefa(gerenciador, dados)
+        bloqueadora = _tarefa(gerenciador, dados, "id_bloqueadora", "bloqueadora")
+        getattr(gerenciador, metodo)(gerenciador._projeto_da_tarefa[tarefa], tarefa,
+                                     bloqueadora)
+    return aplicar
+
+
+def _tarefa_pai_definido(gerenciador: GerenciadorProjetos, dados: Dict) -> None:
+    tarefa = _tarefa(gerenciador, dados)
+    pai = (_tarefa(gerenciador, dados, "id_pai", "pai")
+           if dados.get("id_pai") is not None or dados.get("pai") is not None else None)
+    gerenciador._definir_tarefa_pai(gerenciador._projeto_da_tarefa[tarefa], tarefa, pai)
+
+
+def _projeto_adicionado(gerenciador: GerenciadorProjetos, dados: Dict) -> None:
+    projeto = Projeto(dados["nome"], dados["descricao"], dados["prazo"])
+    projeto.data_criacao = dados["data_criacao"]
+    gerenciador._adicionar_projeto(projeto, dados.get("id"))
+
+
+def _membro_cadastrado(gerenciador: GerenciadorProjetos, dados: Dict) -> None:
+    gerenciador._cadastrar_membro(Membro(dados["nome"], dados["funcao"], dados["email"]),
+                                  dados.get("id"))
+
+
+def _membro_saiu(gerenciador: GerenciadorProjetos, dados: Dict) -> None:
+    # As tarefas abertas chegam depois, uma a uma, como tarefa_reatribuida
+    gerenciador._retirar_membro(gerenciador.buscar_projeto(dados["projeto"]),
+                                gerenciador.buscar_membro(dados["membro"]))
+
+
+def _prazo_alterado(gerenciador: GerenciadorProjetos, dados: Dict) -> None:
+    _tarefa(gerenciador, dados).prazo = dados["prazo"]
+
+
+def _status_alterado(gerenciador: GerenciadorProjetos, dados: Dict) -> None:
+    _tarefa(gerenciador, dados)._alterar_status(dados["status"], dados["data_conclusao"])
+
+
+_APLICAR: Dict[str, Callable[[GerenciadorProjetos, Dict], None]] = {
+    Evento.PROJETO_ADICIONADO: _projeto_adicionado,
+    Evento.PROJETO_REMOVIDO: lambda g, d: g.remover_projeto(d["nome"]),
+    Evento.PROJETO_ARQUIVADO: lambda g, d: g.arquivar_projeto(d["nome"]),
+    Evento.MEMBRO_CADASTRADO: _membro_cadastrado,
+    Evento.MEMBRO_ENTROU_PROJETO: lambda g, d: g.adicionar_membro_projeto(
+        d["projeto"], d["membro"]),
+    Evento.MEMBRO_SAIU_PROJETO: _membro_saiu,
+    Evento.TAREFA_CRIADA: _tarefa_criada,
+    Evento.TAREFA_INICIADA: _status_alterado,
+    Evento.TAREFA_CONCLUIDA: _status_alterado,
+    Evento.TAREFA_REABERTA: _status_alterado,
+    Evento.TAREFA_REATRIBUIDA: _tarefa_reatribuida,
+    Evento.TAREFA_PRAZO_ALTERADO: _prazo_alterado,
+    Evento.TAREFA_REMOVIDA: _tarefa_removida,
+    Evento.DEPENDENCIA_ADICIONADA: _dependencia("_adicionar_dependencia"),
+    Evento.DEPENDENCIA_REMOVIDA: _dependencia("_remover_dependencia"),
+    Evento.TAREFA_PAI_DEFINIDO: _tarefa_pai_definido,
+}
+
+
+def aplicar_evento(gerenciador: GerenciadorProjetos, tipo: str, dados: Dict) -> None:
+    """Reproduz no gerenciador a mutação descrita por um evento.
+
+    Eventos só informativos (como ``duplicata_suspeita``) são ignorados.
+    """
+    aplicar = _APLICAR.get(tipo)
+    if aplicar is not None:
+        aplicar(gerenciador, dados)
+
+
+class _Ligacao:
+    """Uma réplica conectada, servida por uma thread do primário."""
+
+    def __init__(self, conexao, fila):
+        self.conexao = conexao
+        self.fila = fila
+        self.confirmado = 0
+        self.ativa = True
+
+
+class PrimarioReplicacao:
+    """Envia, em ordem, as mutações de um gerenciador para réplicas.
+
+    Cada réplica recebe os eventos do barramento por uma fila própria e
+    uma thread de envio. Ao conectar, a réplica informa a última sequência
+    aplicada: se o barramento ainda retém os eventos seguintes, o envio
+    retoma dali; senão (e sempre para réplicas novas, já que o estado
+    anterior à ativação do barramento não virou evento), um instantâneo do
+    estado é mandado antes. Também vai o instantâneo quando a réplica está
+    mais de ``capacidade_fila`` eventos atrás: é mais barato que reenviar
+    a retenção inteira.
+
+    ``conectar`` deve ser chamado da mesma thread que altera o gerenciador,
+    para que o instantâneo e o início da fila peguem o mesmo ponto.
+    """
+
+    def __init__(self, gerenciador: GerenciadorProjetos, retencao: int = 100_000,
+                 capacidade_fila: int = 10_000, espera_maxima: float = 5.0):
+        self._gerenciador = gerenciador
+        self._capacidade = capacidade_fila
+        self._espera = espera_maxima
+        self._ligacoes: List[_Ligacao] = []
+        if gerenciador.eventos.retencao < retencao:
+            gerenciador.eventos.configurar_retencao(retencao)
+        # Eventos anteriores a este ponto podem não ter sido retidos
+        self._base = gerenciador.eventos.seq
+
+    def token(self) -> int:
+        """Sequência da última escrita, para ler a própria escrita numa réplica."""
+        return self._gerenciador.eventos.seq
+
+    def conectar(self, conexao) -> None:
+        """Atende uma réplica (Pipe ou conexão aceita de um socket Unix)."""
+        _, ultimo_seq = conexao.recv()
+        barramento = self._gerenciador.eventos
+        conexao.send(("inicio", barramento.seq))
+        fila = None
+        if (ultimo_seq is not None and ultimo_seq >= self._base and
+                barramento.seq - ultimo_seq <= self._capacidade):
+            try:
+                fila = barramento.fila(self._capacidade, bloquear=True, timeout=self._espera,
+                                       desde=ultimo_seq)
+            except SequenciaIndisponivelError:
+                pass
+        if fila is None:
+            conexao.send(("instantaneo", gerar_instantaneo(self._gerenciador)))
+            fila = barramento.fila(self._capacidade, bloquear=True, timeout=self._espera)
+        ligacao = _Ligacao(conexao, fila)
+        self._ligacoes.append(ligacao)
+        threading.Thread(target=self._enviar, args=(ligacao,), daemon=True).start()
+
+    def aceitar(self, ouvinte) -> None:
+        """Espera uma réplica em um ``multiprocessing.connection.Listener`` e a atende."""
+        self.conectar(ouvinte.accept())
+
+    def replicas(self) -> List[Dict]:
+        """Sequência confirmada e atraso (em eventos) de cada réplica conectada."""
+        seq = self._gerenciador.eventos.seq
+        return [{"confirmado": l.confirmado, "atraso_eventos": seq - l.confirmado}
+                for l in self._ligacoes if l.ativa]
+
+    def fechar(self) -> None:
+        for ligacao in self._ligacoes:
+            ligacao.ativa = False
+            ligacao.fila.fechar()
+
+    def _enviar(self, ligacao: _Ligacao) -> None:
+        barramento = self._gerenciador.eventos
+        try:
+            while ligacao.ativa:
+                lote = ligacao.fila.lote(1000, timeout=0.1)
+                if ligacao.fila.descartados:
+                    break  # réplica lenta demais; ela reconecta e retoma
+                if lote:
+                    ligacao.conexao.send(("eventos", barramento.seq, lote))
+                while ligacao.conexao.poll():
+                    mensagem, ligacao.confirmado = ligacao.conexao.recv()
+                    if mensagem == "tchau":
+                        return
+        except (EOFError, OSError):
+            pass
+        finally:
+            ligacao.ativa = False
+            ligacao.fila.fechar()
+            ligacao.conexao.close()
+
+
+# Consultas atendidas pela réplica (além de relatorio_*, buscar_* e sugerir_*)
+_LEITURAS = {
+    'tarefas_ativas_entre', 'tarefas_ativas_em', 'projetos_ativos_entre',
+    'projetos_ativos_em', 'carga_membro_no_dia', 'vazao', 'wip_por_dia', 'percentis_tempo',
+    'caminho_critico', 'prazo_em_risco', 'resumo_tarefa', 'estatisticas_cache',
+}
+
+
+class Replica:
+    """Cópia somente leitura de um gerenciador, alimentada por ``PrimarioReplicacao``.
+
+    Uma thread recebe os lotes e os aplica a um ``GerenciadorProjetos``
+    próprio. As consultas (``relatorio_*``, ``buscar_*``, ``sugerir_*``,
+    listagens e cronograma) aceitam ``token``: a leitura espera a réplica
+    alcançar aquela sequência do primário, o que garante ler a própria
+    escrita. O histórico de status usa os instantes do primário.
+
+    Se um evento não puder ser aplicado, a réplica para de aplicar, se
+    desconecta e registra o evento e o erro em ``falha``; ao reconectar
+    com ``conectar`` ela recebe um instantâneo novo.
+    """
+
+    def __init__(self, conexao, relogio: Callable[[], float] = time.time):
+        self._relogio = relogio
+        self._trava = threading.Condition(threading.RLock())
+        self._instante = 0.0
+        self._novo_gerenciador()
+        self.seq = 0
+        self._seq_primario = 0
+        self._pendente_desde: Optional[float] = None
+        self._sincronizada = False
+        self._receptor: Optional[threading.Thread] = None
+        self.conectada = False
+        self._desconectada_desde: Optional[float] = None
+        # Evento que não pôde ser aplicado: a réplica para e fica divergente
+        # até reconectar, quando recebe um instantâneo novo
+        self.falha: Optional[Dict] = None
+        self.conectar(conexao)
+
+    @property
+    def gerenciador(self) -> GerenciadorProjetos:
+        """Gerenciador local; só deve ser lido, e com a réplica parada ou em dia."""
+        return self._gerenciador
+
+    def conectar(self, conexao) -> None:
+        """Conecta (ou reconecta) ao primário, retomando da última sequência aplicada."""
+        self._conexao = conexao
+        conexao.send(("ola", self.seq if self._sincronizada else None))
+        self.conectada = True
+        self._desconectada_desde = None
+        self._receptor = threading.Thread(target=self._receber, args=(conexao,), daemon=True)
+        self._receptor.start()
+
+    def aguardar(self, token: int, timeout: Optional[float] = None) -> bool:
+        """Espera a réplica aplicar a sequência ``token``; False se o tempo acabar."""
+        with self._trava:
+            self._trava.wait_for(lambda: self.seq >= token or self.falha is not None, timeout)
+            return self.seq >= token
+
+    def atraso(self) -> Dict:
+        """Eventos já conhecidos e ainda não aplicados, e há quanto tempo esperam.
+
+        ``seq_primario`` é a última sequência informada pelo primário (na
+        conexão ou num lote). Desconectada, a réplica conta como atrasada
+        desde a queda, já que não sabe o que o primário fez depois.
+        """
+        # Lido sem a trava, para responder mesmo durante a aplicação de um lote
+        pendente, seq, seq_primario = self._pendente_desde, self.seq, self._seq_primario
+        conectada, caiu = self.conectada, self._desconectada_desde
+        if not conectada and caiu is not None and (pendente is None or caiu < pendente):
+            pendente = caiu
+        eventos = max(0, seq_primario - seq)
+        return {
+            "seq_aplicado": seq,
+            "seq_primario": seq_primario,
+            "eventos": eventos,
+            "segundos": self._relogio() - pendente if pendente is not None else 0.0,
+            "conectada": conectada,
+            "atrasada": not conectada or eventos > 0 or self.falha is not None,
+            "divergente": self.falha is not None,
+        }
+
+    @property
+    def projetos(self) -> List[Projeto]:
+        with self._trava:
+            return self._gerenciador.projetos
+
+    @property
+    def membros(self) -> List[Membro]:
+        with self._trava:
+            return self._gerenciador.membros
+
+    @property
+    def tarefas(self) -> List[Tarefa]:
+        with self._trava:
+            return self._gerenciador.tarefas
+
+    def __getattr__(self, nome: str):
+        if not (nome.startswith(('relatorio_', 'buscar_', 'sugerir_')) or nome in _LEITURAS):
+            raise AttributeError(nome)
+        metodo = getattr(GerenciadorProjetos, nome)
+
+        def consultar(*args, token: Optional[int] = None, timeout: Optional[float] = None,
+                      **kwargs):
+            with self._trava:
+                if token is not None and not self.aguardar(token, timeout):
+                    if self.falha is not None:
+                        raise RuntimeError(f"Réplica divergente desde a sequência "
+                                           f"{self.falha['seq']}: {self.falha['mensagem']}")
+                    raise TimeoutError(f"Réplica não alcançou a sequência {token}")
+                return metodo(self._gerenciador, *args, **kwargs)
+        consultar.__name__ = nome
+        consultar.__doc__ = metodo.__doc__
+        return consultar
+
+    def fechar(self, timeout: Optional[float] = 5.0) -> None:
+        """Desconecta do primário; o estado local é mantido para reconectar depois."""
+        try:
+            self._conexao.send(("tchau", self.seq))
+        except OSError:
+            pass
+        self._receptor.join(timeout)
+
+    def _novo_gerenciador(self) -> None:
+        self._gerenciador = GerenciadorProjetos()
+        # O histórico registra o instante do evento no primário, não o da aplicação
+        self._gerenciador._historico._relogio = lambda: self._instante
+
+    def _receber(self, conexao) -> None:
+        try:
+            while True:
+                mensagem = conexao.recv()
+                if mensagem[0] == "inicio":
+                    self._seq_primario = max(self._seq_primario, mensagem[1])
+                    continue
+                if mensagem[0] == "instantaneo":
+                    self._carregar(mensagem[1])
+                    if self.falha is not None:
+                        conexao.send(("tchau", self.seq))
+                        return
+                    continue
+                _, seq_primario, lote = mensagem
+                self._seq_primario = max(self._seq_primario, seq_primario)
+                self._pendente_desde = lote[0].instante
+                with self._trava:
+                    for evento in lote:
+                        if evento.seq > self.seq:
+                            self._instante = evento.instante
+                            if not self._aplicar(evento.seq, evento.tipo, evento.dados):
+                                break
+                            self.seq = evento.seq
+                    self._pendente_desde = None
+                    self._trava.notify_all()
+                if self.falha is not None:
+                    conexao.send(("tchau", self.seq))
+                    return
+                conexao.send(("aplicado", self.seq))
+        except (EOFError, OSError):
+            pass
+        finally:
+            self._desconectada_desde = self._relogio()
+            self.conectada = False
+            conexao.close()
+
+    def _aplicar(self, seq: int, tipo: str, dados: Dict) -> bool:
+        """Aplica um evento; se falhar, registra a falha e marca a réplica divergente."""
+        try:
+            aplicar_evento(self._gerenciador, tipo, dados)
+            return True
+        except Exception as erro:
+            self.falha = {"seq": seq, "tipo": tipo, "erro": type(erro).__name__,
+                          "mensagem": str(erro)}
+            self._sincronizada = False
+            return False
+
+    def _carregar(self, instantaneo: Instantaneo) -> None:
+        with self._trava:
+            self._novo_gerenciador()
+            self.falha = None
+            self._instante = self._relogio()
+            for tipo, dados in instantaneo.eventos:
+                if not self._aplicar(instantaneo.seq, tipo, dados):
+                    self._trava.notify_all()
+                    return
+            self._gerenciador._arquivo.update(instantaneo.arquivados)
+            self.seq = self._seq_primario = instantaneo.seq
+            self._sincronizada = True
+            self._trava.notify_all()
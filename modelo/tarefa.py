@@ -1,8 +1,10 @@
 from __future__ import annotations
+import weakref
 from datetime import date
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from refatoracao.entidades_principais import Membro
+if TYPE_CHECKING:
+    from modelo.membro import Membro  # Só para type checking
 
 class Tarefa:
     STATUS_PENDENTE = "pendente"
@@ -10,25 +12,68 @@ class Tarefa:
     STATUS_CONCLUIDA = "concluída"
     
     def __init__(self, titulo: str, descricao: str, responsavel: 'Membro', 
-                 prazo: Optional[date] = None, prioridade: int = 1):
+                 prazo: Optional[date] = None, prioridade: int = 1,
+                 estimativa_dias: int = 1, data_criacao: Optional[date] = None):
         self.titulo = titulo
         self.descricao = descricao
         self.responsavel = responsavel  # Type hint como string
-        self.prazo = prazo
+        self._prazo = prazo
         self.prioridade = min(max(1, prioridade), 5)
+        self.estimativa_dias = max(1, estimativa_dias)
         self.status = self.STATUS_PENDENTE
-        self.data_criacao = date.today()
+        self.data_criacao = data_criacao or date.today()
+        self.data_conclusao: Optional[date] = None
+        # Posição nas listas por id do gerenciador (atribuída ao cadastrar)
+        self.id: Optional[int] = None
+        # Gerenciador avisado a cada mudança de status ou de prazo (definido
+        # por ele); referência fraca para que a tarefa não o mantenha vivo
+        self._observador: Optional[weakref.ref] = None
         
         # Adia a atribuição até que o membro esteja totalmente inicializado
         responsavel.adicionar_tarefa(self)
 
+    @property
+    def prazo(self) -> Optional[date]:
+        return self._prazo
+
+    @prazo.setter
+    def prazo(self, prazo: Optional[date]) -> None:
+        """Troca o prazo; o gerenciador reindexa a tarefa com o prazo antigo em mãos."""
+        anterior = self._prazo
+        self._prazo = prazo
+        gerenciador = self._gerenciador()
+        if gerenciador is not None and prazo != anterior:
+            gerenciador._ao_alterar_prazo(self, anterior)
+
+    def _gerenciador(self):
+        return self._observador() if self._observador is not None else None
+
+    def atribuir(self, responsavel: 'Membro') -> None:
+        """Transfere a tarefa para outro responsável."""
+        self.responsavel.remover_tarefa(self)
+        self.responsavel = responsavel
+        responsavel.adicionar_tarefa(self)
+
     def iniciar(self) -> None:
         """Marca a tarefa como em andamento."""
-        self.status = self.STATUS_EM_ANDAMENTO
+        self._alterar_status(self.STATUS_EM_ANDAMENTO)
 
     def concluir(self) -> None:
         """Marca a tarefa como concluída."""
-        self.status = self.STATUS_CONCLUIDA
+        self._alterar_status(self.STATUS_CONCLUIDA)
+
+    def _alterar_status(self, novo_status: str, data_conclusao: Optional[date] = None) -> None:
+        # ``data_conclusao`` permite reproduzir uma conclusão de outro dia
+        # (réplicas, arquivos de estado) antes de os índices serem avisados
+        anterior = self.status
+        if anterior == novo_status:
+            return
+        self.status = novo_status
+        self.data_conclusao = ((data_conclusao or date.today())
+                               if novo_status == self.STATUS_CONCLUIDA else None)
+        gerenciador = self._gerenciador()
+        if gerenciador is not None:
+            gerenciador._ao_alterar_status(self, anterior)
 
     def esta_atrasada(self) -> bool:
         """Verifica se a tarefa está atrasada."""
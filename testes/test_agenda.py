@@ -0,0 +1,69 @@
+import unittest
+from datetime import date, timedelta
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+
+class TestAgendadorAtrasos(unittest.TestCase):
+    """Testes para os avisos de atraso agendados"""
+
+    def setUp(self):
+        self.hoje = date.today()
+        self.gerenciador = GerenciadorProjetos()
+        self.gerenciador.adicionar_projeto(
+            Projeto("Portal", "Portal", prazo=self.hoje + timedelta(days=5)))
+        self.gerenciador.cadastrar_membro(Membro("Ana", "Dev"))
+        self.gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        self.agendador = self.gerenciador.criar_agendador_atrasos(lambda: self.hoje)
+        self.avisos = []
+        self.agendador.assinar(self.avisos.append)
+
+    def _avancar(self, dias):
+        self.hoje += timedelta(days=dias)
+        return [(a.tipo, a.alvo.titulo if a.tipo == 'tarefa' else a.alvo.nome)
+                for a in self.agendador.verificar()]
+
+    def test_aviso_unico_no_vencimento(self):
+        """Testa que cada atraso é avisado uma única vez, no dia seguinte ao prazo"""
+        self.gerenciador.criar_tarefa("Portal", "Login", "Tela", "Ana",
+                                      prazo=self.hoje + timedelta(days=1))
+        self.gerenciador.criar_tarefa("Portal", "Sem prazo", "Tela", "Ana")
+        self.assertEqual(self._avancar(1), [])
+        self.assertEqual(self._avancar(1), [("tarefa", "Login")])
+        self.assertEqual(self._avancar(1), [])
+        self.assertEqual(self._avancar(3), [("projeto", "Portal")])
+        self.assertEqual(len(self.avisos), 2)
+        self.assertEqual(len(self.agendador), 0)
+
+    def test_concluida_e_removida_saem_da_agenda(self):
+        """Testa o cancelamento de tarefas concluídas ou removidas"""
+        for titulo in ("A", "B", "C"):
+            self.gerenciador.criar_tarefa("Portal", titulo, "Tela", "Ana",
+                                          prazo=self.hoje + timedelta(days=2))
+        self.gerenciador.concluir_tarefa("Portal", "A")
+        self.gerenciador.remover_tarefa("Portal", "B")
+        self.assertEqual(self.agendador.proximo_vencimento(), self.hoje + timedelta(days=3))
+        self.assertEqual(self._avancar(3), [("tarefa", "C")])
+
+    def test_tarefas_existentes_entram_na_agenda(self):
+        """Testa que a agenda criada depois já considera tarefas vencidas"""
+        self.gerenciador.criar_tarefa("Portal", "Antiga", "Tela", "Ana",
+                                      prazo=self.hoje - timedelta(days=3))
+        outro = self.gerenciador.criar_agendador_atrasos(lambda: self.hoje)
+        self.assertEqual([a.alvo.titulo for a in outro.verificar()], ["Antiga"])
+        self.assertEqual(outro.verificar(), [])
+
+    def test_iniciar_tarefa_avisada_nao_repete_aviso(self):
+        """Testa que só a reabertura de uma tarefa concluída a reagenda"""
+        self.gerenciador.criar_tarefa("Portal", "Login", "Tela", "Ana",
+                                      prazo=self.hoje + timedelta(days=1))
+        self.assertEqual(self._avancar(2), [("tarefa", "Login")])
+        self.gerenciador.iniciar_tarefa("Portal", "Login")
+        self.assertEqual(self._avancar(1), [])
+        self.gerenciador.concluir_tarefa("Portal", "Login")
+        self.gerenciador.iniciar_tarefa("Portal", "Login")
+        self.assertEqual(self._avancar(1), [("tarefa", "Login")])
+        self.assertEqual(len(self.avisos), 2)
+
+if __name__ == '__main__':
+    unittest.main()
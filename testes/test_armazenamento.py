@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+from datetime import date, timedelta
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+from modelo.armazenamento import FiltroBloom
+
+class TestArmazenamentoFrio(unittest.TestCase):
+    """Testes para a camada em disco de tarefas concluídas"""
+
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.gerenciador.adicionar_projeto(Projeto("Portal", "Portal"))
+        self.gerenciador.cadastrar_membro(Membro("Ana", "Dev"))
+        self.gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        for i in range(10):
+            self.gerenciador.criar_tarefa("Portal", f"T{i}", "Descrição", "Ana", prioridade=2)
+        for i in range(6):
+            self.gerenciador.concluir_tarefa("Portal", f"T{i}")
+        self.relatorio = self.gerenciador.relatorio_projeto("Portal")
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.gerenciador.configurar_armazenamento_frio(
+            os.path.join(self.diretorio.name, "frio.db"), idade_minima_dias=0)
+
+    def tearDown(self):
+        self.gerenciador._frio.fechar()
+        self.diretorio.cleanup()
+
+    def test_descarregar_mantem_contadores(self):
+        """Testa que relatórios não mudam quando concluídas vão para o disco"""
+        self.assertEqual(self.gerenciador.descarregar_concluidas(), 6)
+        estatisticas = self.gerenciador.estatisticas_armazenamento()
+        self.assertEqual((estatisticas["residentes"], estatisticas["em_disco"]), (4, 6))
+        self.assertEqual(len(self.gerenciador.buscar_membro("Ana").tarefas_atribuidas), 4)
+        self.gerenciador.concluir_tarefa("Portal", "T9")
+        relatorio = self.gerenciador.relatorio_projeto("Portal")
+        self.assertEqual(relatorio["tarefas_concluidas"], 7)
+        self.assertEqual(relatorio["total_tarefas"], self.relatorio["total_tarefas"])
+
+    def test_busca_recarrega_de_forma_transparente(self):
+        """Testa buscas que trazem tarefas de volta e o filtro de Bloom"""
+        self.gerenciador.descarregar_concluidas()
+        tarefa = self.gerenciador.buscar_tarefa("t3")
+        self.assertEqual((tarefa.titulo, tarefa.status), ("T3", "concluída"))
+        self.assertIn(tarefa, self.gerenciador.buscar_projeto("Portal").tarefas)
+        self.assertIsNone(self.gerenciador.buscar_tarefa("Inexistente"))
+        estatisticas = self.gerenciador.estatisticas_armazenamento()
+        self.assertEqual((estatisticas["sondagens"], estatisticas["evitadas_pelo_filtro"]), (1, 1))
+        self.assertEqual(len(self.gerenciador.tarefas_ativas_em(date.today())), 10)
+        self.assertEqual(self.gerenciador.estatisticas_armazenamento()["em_disco"], 0)
+
+    def test_orcamento_e_exportacao(self):
+        """Testa o limite de concluídas em memória e a exportação completa"""
+        self.gerenciador.configurar_armazenamento_frio(idade_minima_dias=30, orcamento_tarefas=2)
+        self.assertEqual(self.gerenciador.estatisticas_armazenamento()["concluidas_residentes"], 2)
+        exportadas = list(self.gerenciador.exportar_tarefas())
+        self.assertEqual(sorted(t["titulo"] for t in exportadas), [f"T{i}" for i in range(10)])
+        self.gerenciador.remover_projeto("Portal")
+        self.assertEqual(self.gerenciador.estatisticas_armazenamento()["em_disco"], 0)
+        self.assertEqual(self.gerenciador.relatorio_membro("Ana")["total_tarefas"], 0)
+
+    def test_painel_e_arquivamento_contam_a_camada_fria(self):
+        """Testa o painel e o arquivamento com tarefas concluídas só em disco"""
+        self.gerenciador.concluir_tarefa("Portal", "T6")
+        self.gerenciador.concluir_tarefa("Portal", "T7")
+        self.gerenciador.remover_tarefa("Portal", "T8")
+        self.gerenciador.remover_tarefa("Portal", "T9")
+        self.gerenciador.adicionar_projeto(Projeto("Site", "Site"))
+        self.gerenciador.adicionar_membro_projeto("Site", "Ana")
+        for titulo in ("S1", "S2", "S3", "S4"):
+            self.gerenciador.criar_tarefa("Site", titulo, "Descrição", "Ana")
+        for titulo in ("S1", "S2", "S3"):
+            self.gerenciador.concluir_tarefa("Site", titulo)
+        self.assertEqual(self.gerenciador.descarregar_concluidas(), 11)
+        site = self.gerenciador.buscar_projeto("Site")
+        painel = self.gerenciador.criar_painel()
+        self.assertEqual(painel.percentual_conclusao(site), 75.0)
+        self.assertEqual(painel.abertas_por_funcao(), {"Dev": 1})
+        self.gerenciador.criar_tarefa("Site", "S5", "Descrição", "Ana")
+        self.assertTrue(self.gerenciador.verificar_painel(painel))
+        self.assertEqual(self.gerenciador.arquivar_projetos_concluidos(), ["Portal"])
+        self.assertEqual(self.gerenciador.relatorio_arquivado("Portal")["tarefas_concluidas"], 8)
+        self.assertTrue(self.gerenciador.verificar_painel(painel))
+        self.assertEqual(self.gerenciador.estatisticas_armazenamento()["em_disco"], 3)
+
+    def test_filtro_bloom(self):
+        """Testa que o filtro nunca nega uma chave inserida"""
+        filtro = FiltroBloom(capacidade=1000)
+        for i in range(1000):
+            filtro.adicionar(f"tarefa {i}")
+        self.assertTrue(all(f"tarefa {i}" in filtro for i in range(1000)))
+        falsos = sum(f"outra {i}" in filtro for i in range(10000))
+        self.assertLess(falsos, 300)
+
+if __name__ == '__main__':
+    unittest.main()
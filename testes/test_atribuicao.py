@@ -0,0 +1,105 @@
+import unittest
+from datetime import date, timedelta
+from modelo.atribuicao import BalanceadorCarga
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.tarefa import Tarefa
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+from modelo.excecoes import SemMembroElegivelError
+
+class TestAtribuicaoAutomatica(unittest.TestCase):
+    """Testes para a atribuição de tarefas por carga"""
+    
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.gerenciador.adicionar_projeto(Projeto("Portal", "Portal corporativo"))
+        for nome, funcao in [("Ana", "Dev"), ("Bruno", "Dev"), ("Carla", "Designer")]:
+            self.gerenciador.cadastrar_membro(Membro(nome, funcao))
+            self.gerenciador.adicionar_membro_projeto("Portal", nome)
+    
+    def test_escolhe_membro_menos_carregado(self):
+        """Testa que a tarefa vai para quem tem menos carga"""
+        self.gerenciador.criar_tarefa("Portal", "A", "Descrição", "Ana", prioridade=3)
+        self.gerenciador.criar_tarefa("Portal", "B", "Descrição", "Carla", prioridade=2)
+        tarefa = self.gerenciador.criar_tarefa_automatica("Portal", "C", "Descrição")
+        self.assertEqual(tarefa.responsavel.nome, "Bruno")
+    
+    def test_filtro_por_funcao_e_lote_balanceado(self):
+        """Testa o filtro por função e a distribuição de um lote"""
+        lote = [{"titulo": f"T{i}", "descricao": "Descrição"} for i in range(6)]
+        tarefas = self.gerenciador.criar_tarefas_automaticas("Portal", lote, funcao="dev")
+        nomes = [t.responsavel.nome for t in tarefas]
+        self.assertEqual(nomes.count("Ana"), 3)
+        self.assertEqual(nomes.count("Bruno"), 3)
+        self.assertNotIn("Carla", nomes)
+    
+    def test_prazo_proximo_pesa_mais(self):
+        """Testa que prazos próximos e conclusões ajustam a carga"""
+        urgente = self.gerenciador.criar_tarefa(
+            "Portal", "Urgente", "Descrição", "Ana", prazo=date.today() + timedelta(days=1))
+        self.gerenciador.criar_tarefa("Portal", "Normal", "Descrição", "Bruno", prioridade=1)
+        self.assertEqual(self.gerenciador.criar_tarefa_automatica(
+            "Portal", "Nova", "Descrição", funcao="Dev").responsavel.nome, "Bruno")
+        urgente.concluir()
+        self.assertEqual(self.gerenciador.criar_tarefa_automatica(
+            "Portal", "Outra", "Descrição", funcao="Dev").responsavel.nome, "Ana")
+    
+    def test_urgencia_recalculada_quando_o_dia_vira(self):
+        """Testa que o fator de urgência acompanha a aproximação do prazo"""
+        dia = [date(2024, 3, 4)]
+        balanceador = BalanceadorCarga(lambda: dia[0])
+        projeto = Projeto("Site", "Site")
+        ana, bruno = Membro("Ana", "Dev"), Membro("Bruno", "Dev")
+        for membro in (ana, bruno):
+            balanceador.adicionar_membro(projeto, membro)
+        tarefa = Tarefa("A", "Descrição", ana, prazo=date(2024, 3, 14), prioridade=2)
+        balanceador.atualizar_tarefa(tarefa)
+        balanceador.atualizar_tarefa(Tarefa("B", "Descrição", bruno, prioridade=3))
+        self.assertIs(balanceador.escolher(projeto), ana)
+        dia[0] = date(2024, 3, 7)
+        self.assertEqual(balanceador.carga(ana), 3.0)
+        dia[0] = date(2024, 3, 11)
+        self.assertIs(balanceador.escolher(projeto), bruno)
+        self.assertEqual(balanceador.carga(ana), 4.0)
+        
+        distante = Tarefa("C", "Descrição", bruno, prazo=date(2024, 4, 30))
+        balanceador.atualizar_tarefa(distante)
+        dia[0] = date(2024, 4, 28)
+        self.assertEqual(balanceador.carga(bruno), 5.0)
+        self.assertIs(balanceador.escolher(projeto), ana)
+        distante.concluir()
+        balanceador.atualizar_tarefa(distante)
+        tarefa.concluir()
+        balanceador.atualizar_tarefa(tarefa)
+        dia[0] = date(2024, 6, 1)
+        self.assertEqual((balanceador.carga(ana), balanceador.carga(bruno)), (0.0, 3.0))
+    
+    def test_carga_compartilhada_entre_projetos(self):
+        """Testa que mudanças de carga em um projeto valem na escolha dos outros"""
+        for nome in ("Intranet", "Site"):
+            self.gerenciador.adicionar_projeto(Projeto(nome, nome))
+            for membro in ("Ana", "Bruno"):
+                self.gerenciador.adicionar_membro_projeto(nome, membro)
+        for i in range(3):
+            self.gerenciador.criar_tarefa("Portal", f"P{i}", "Descrição", "Ana", prioridade=2)
+        self.gerenciador.criar_tarefa("Site", "S0", "Descrição", "Bruno", prioridade=5)
+        self.assertEqual(self.gerenciador.criar_tarefa_automatica(
+            "Intranet", "I0", "Descrição").responsavel.nome, "Bruno")
+        for i in range(3):
+            self.gerenciador.concluir_tarefa("Portal", f"P{i}")
+        self.assertEqual(self.gerenciador.criar_tarefa_automatica(
+            "Site", "S1", "Descrição").responsavel.nome, "Ana")
+        self.gerenciador.reatribuir_tarefa("Intranet", "I0", "Ana")
+        self.gerenciador.remover_tarefa("Site", "S0")
+        self.assertEqual(self.gerenciador.criar_tarefa_automatica(
+            "Portal", "P3", "Descrição", funcao="Dev").responsavel.nome, "Bruno")
+        self.assertEqual(self.gerenciador.criar_tarefa_automatica(
+            "Intranet", "I1", "Descrição").responsavel.nome, "Bruno")
+    
+    def test_sem_membro_elegivel(self):
+        """Testa o erro quando nenhum membro tem a função pedida"""
+        with self.assertRaises(SemMembroElegivelError):
+            self.gerenciador.criar_tarefa_automatica("Portal", "X", "Descrição", funcao="Gerente")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from datetime import date, timedelta
+from modelo.cache import CacheRelatorios
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+
+class TestCacheRelatorios(unittest.TestCase):
+    """Testes para o cache de relatórios"""
+    
+    def setUp(self):
+        self.dia = date(2024, 1, 10)
+        self.cache = CacheRelatorios(capacidade=2, hoje=lambda: self.dia)
+        self.geracoes = 0
+    
+    def _gerar(self):
+        self.geracoes += 1
+        return {"geracao": self.geracoes, "projetos": ["Portal"]}
+    
+    def test_reuso_e_invalidacao_por_versao(self):
+        """Testa acerto, invalidação e cópia defensiva"""
+        primeiro = self.cache.obter("a", self._gerar)
+        primeiro["projetos"].append("Alterado")
+        self.assertEqual(self.cache.obter("a", self._gerar), {"geracao": 1, "projetos": ["Portal"]})
+        self.cache.invalidar("a")
+        self.assertEqual(self.cache.obter("a", self._gerar)["geracao"], 2)
+        self.assertEqual((self.cache.acertos, self.cache.falhas), (1, 2))
+    
+    def test_expira_na_virada_do_dia(self):
+        """Testa que entradas do dia anterior são regeneradas"""
+        self.cache.obter("a", self._gerar)
+        self.dia += timedelta(days=1)
+        self.assertEqual(self.cache.obter("a", self._gerar)["geracao"], 2)
+        self.assertEqual(self.cache.expiradas, 1)
+    
+    def test_despejo_lru(self):
+        """Testa que a entrada menos usada recentemente é despejada"""
+        self.cache.obter("a", self._gerar)
+        self.cache.obter("b", self._gerar)
+        self.cache.obter("a", self._gerar)
+        self.cache.obter("c", self._gerar)
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.despejos, 1)
+        self.assertEqual(self.cache.obter("a", self._gerar)["geracao"], 1)
+        self.assertEqual(self.cache.obter("b", self._gerar)["geracao"], 4)
+    
+    def test_gerenciador_invalida_nas_mutacoes(self):
+        """Testa que mudanças de tarefas invalidam projeto e responsável"""
+        gerenciador = GerenciadorProjetos()
+        gerenciador.adicionar_projeto(Projeto("Portal", "Portal"))
+        gerenciador.cadastrar_membro(Membro("Ana", "Dev"))
+        gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        tarefa = gerenciador.criar_tarefa("Portal", "A", "Descrição", "Ana")
+        
+        self.assertEqual(gerenciador.relatorio_projeto("Portal")["tarefas_pendentes"], 1)
+        gerenciador.relatorio_projeto("Portal")
+        self.assertEqual(gerenciador.estatisticas_cache()["acertos"], 1)
+        tarefa.iniciar()
+        self.assertEqual(gerenciador.relatorio_projeto("Portal")["tarefas_andamento"], 1)
+        self.assertEqual(gerenciador.relatorio_membro("Ana")["tarefas_andamento"], 1)
+        self.assertEqual(gerenciador.estatisticas_cache()["falhas"], 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+from collections import Counter
+from modelo.gerenciador import GerenciadorProjetos
+from benchmarks.carga import carregar_trace, gerar_carga, reproduzir, salvar_trace
+
+ESCRITAS = {"criar_tarefa", "iniciar_tarefa", "concluir_tarefa"}
+LEITURAS = {"relatorio_projeto", "relatorio_membro"}
+
+
+def regime(trace) -> list:
+    return [(op, args) for op, args in trace if op in ESCRITAS | LEITURAS]
+
+class TestCargaSintetica(unittest.TestCase):
+    """Testes para o gerador de carga e a reprodução de traces"""
+
+    def gerar(self, operacoes=3000, **kwargs):
+        return list(gerar_carga(operacoes, projetos=20, membros=40, **kwargs))
+
+    def test_determinismo_e_proporcao_de_escritas(self):
+        """Testa que a semente fixa o trace e que ``escrita`` controla a mistura"""
+        self.assertEqual(self.gerar(semente=7), self.gerar(semente=7))
+        self.assertNotEqual(self.gerar(semente=7), self.gerar(semente=8))
+        for escrita in (0.0, 0.3, 1.0):
+            operacoes = regime(self.gerar(escrita=escrita))
+            self.assertEqual(len(operacoes), 3000)
+            fracao = sum(op in ESCRITAS for op, _ in operacoes) / len(operacoes)
+            self.assertAlmostEqual(fracao, escrita, delta=0.03)
+
+    def test_projetos_com_popularidade_de_zipf(self):
+        """Testa que poucos projetos concentram a maior parte das operações"""
+        contagem = Counter(args["projeto"] for op, args in regime(self.gerar(20000, zipf=1.1))
+                           if op in ("criar_tarefa", "relatorio_projeto"))
+        frequencias = [contagem[f"Projeto {p}"] for p in range(20)]
+        self.assertGreater(frequencias[0], 2 * frequencias[4])
+        self.assertGreater(frequencias[0], 5 * frequencias[19])
+        self.assertGreater(sum(frequencias[:4]), sum(frequencias) / 2)
+        uniforme = Counter(args["projeto"] for op, args in regime(self.gerar(20000, zipf=0.0))
+                           if op in ("criar_tarefa", "relatorio_projeto"))
+        self.assertLess(max(uniforme.values()), 2 * min(uniforme.values()))
+
+    def test_transicoes_validas_e_reproducao(self):
+        """Testa transições sobre tarefas já criadas, ida e volta do trace e reprodução"""
+        trace = self.gerar(2000, escrita=0.8)
+        status = {}
+        for op, args in trace:
+            chave = (args.get("projeto"), args.get("titulo"))
+            if op == "criar_tarefa":
+                self.assertNotIn(chave, status)
+                status[chave] = "pendente"
+            elif op == "iniciar_tarefa":
+                self.assertEqual(status.get(chave), "pendente")
+                status[chave] = "em_andamento"
+            elif op == "concluir_tarefa":
+                self.assertEqual(status.get(chave), "em_andamento")
+                status[chave] = "concluída"
+        self.assertTrue(set(status.values()) >= {"pendente", "em_andamento", "concluída"})
+
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "trace.jsonl")
+            self.assertEqual(salvar_trace(caminho, trace), len(trace))
+            self.assertEqual(list(carregar_trace(caminho)), trace)
+
+        resultado = reproduzir(GerenciadorProjetos(), trace)
+        self.assertEqual(resultado["total"]["erros"], 0)
+        self.assertEqual(resultado["total"]["quantidade"], len(trace))
+        contagem = Counter(op for op, _ in trace)
+        for op, quantidade in contagem.items():
+            medidas = resultado[op]
+            self.assertEqual((medidas["quantidade"], medidas["erros"]), (quantidade, 0))
+            self.assertLessEqual(medidas["p50_us"], medidas["p90_us"])
+            self.assertLessEqual(medidas["p90_us"], medidas["p99_us"])
+            self.assertLessEqual(medidas["p99_us"], medidas["max_us"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import gc
+import unittest
+import weakref
+from datetime import date, timedelta
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+
+class TestColetor(unittest.TestCase):
+    """Testes para a liberação do modelo sem o coletor cíclico"""
+
+    def setUp(self):
+        gc.collect()
+        gc.disable()
+
+    def tearDown(self):
+        gc.unfreeze()
+        gc.enable()
+
+    def _montar(self) -> GerenciadorProjetos:
+        gerenciador = GerenciadorProjetos()
+        for nome in ("Ana", "Bruno"):
+            gerenciador.cadastrar_membro(Membro(nome, "Dev"))
+        gerenciador.adicionar_projeto(Projeto("Portal", "Site", date.today() + timedelta(days=30)))
+        gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        gerenciador.adicionar_membro_projeto("Portal", "Bruno")
+        for i in range(10):
+            gerenciador.criar_tarefa("Portal", f"Tarefa {i}", "", ("Ana", "Bruno")[i % 2],
+                                     prazo=date.today() + timedelta(days=i))
+        gerenciador.adicionar_dependencia("Portal", "Tarefa 1", "Tarefa 0")
+        gerenciador.definir_tarefa_pai("Portal", "Tarefa 3", "Tarefa 2")
+        gerenciador.concluir_tarefa("Portal", "Tarefa 5")
+        gerenciador.relatorio_projeto("Portal")
+        gerenciador.criar_painel()
+        gerenciador.ativar_deteccao_duplicatas()
+        return gerenciador
+
+    def test_modelo_liberado_por_contagem(self):
+        """Testa que o gerenciador e as tarefas morrem sem coleta de ciclos"""
+        gerenciador = self._montar()
+        gerenciador.criar_agendador_atrasos()
+        referencias = [weakref.ref(gerenciador), weakref.ref(gerenciador.tarefas[0]),
+                       weakref.ref(gerenciador.buscar_membro("Ana"))]
+        del gerenciador
+        self.assertTrue(all(r() is None for r in referencias))
+        self.assertEqual(gc.collect(), 0)
+
+    def test_tarefa_removida_sai_do_membro(self):
+        """Testa que as referências fracas não mudam o comportamento observável"""
+        gerenciador = self._montar()
+        ana = gerenciador.buscar_membro("Ana")
+        tarefa = gerenciador.remover_tarefa("Portal", "Tarefa 0")
+        self.assertNotIn(tarefa, ana.tarefas_atribuidas)
+        referencia = weakref.ref(tarefa)
+        del tarefa
+        self.assertIsNone(referencia())
+        gerenciador.concluir_tarefa("Portal", "Tarefa 2")
+        self.assertEqual(gerenciador.relatorio_projeto("Portal")["tarefas_concluidas"], 2)
+        self.assertEqual([t.titulo for t in ana.tarefas_atribuidas],
+                         ["Tarefa 2", "Tarefa 4", "Tarefa 6", "Tarefa 8"])
+
+    def test_congelar_para_coletor(self):
+        """Testa que o modelo congelado sai das gerações do coletor"""
+        gerenciador = self._montar()
+        self.assertGreater(gerenciador.congelar_para_coletor(), 0)
+        gerenciador.criar_tarefa("Portal", "Depois", "", "Ana")
+        self.assertEqual(gerenciador.relatorio_projeto("Portal")["total_tarefas"], 11)
+
+
+if __name__ == '__main__':
+    unittest.main()
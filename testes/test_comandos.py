@@ -0,0 +1,135 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.tarefa import Tarefa
+from modelo.comandos import ExecutorComandos, carregar_estado, executar_lote, salvar_estado
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PREPARACAO = [
+    {"op": "cadastrar_membro", "nome": "Ana", "funcao": "Dev"},
+    {"op": "cadastrar_membro", "nome": "Bruno", "funcao": "QA"},
+    {"op": "adicionar_projeto", "nome": "Portal", "prazo": "2030-06-30"},
+    {"op": "adicionar_membro_projeto", "projeto": "Portal", "membro": "Ana"},
+    {"op": "adicionar_membro_projeto", "projeto": "Portal", "membro": "Bruno"},
+]
+
+
+def linhas(*comandos) -> list:
+    return [json.dumps(comando) + "\n" for comando in comandos]
+
+class TestComandos(unittest.TestCase):
+    """Testes para a execução de comandos em lote"""
+
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.executor = ExecutorComandos(self.gerenciador)
+        self.saida = io.StringIO()
+
+    def executar(self, *comandos, lote=1000):
+        resumo = executar_lote(self.executor, linhas(*PREPARACAO, *comandos), self.saida, lote)
+        resultados = [json.loads(linha) for linha in self.saida.getvalue().splitlines()]
+        return resumo, resultados[len(PREPARACAO):]
+
+    def test_resultados_e_erros_por_linha(self):
+        """Testa um resultado por comando, com erros registrados sem interromper o lote"""
+        resumo, resultados = self.executar(
+            ["criar_tarefa", {"projeto": "Portal", "titulo": "Login", "responsavel": "Ana",
+                              "prazo": "2030-01-01", "prioridade": 2}],
+            {"op": "concluir_tarefa", "projeto": "Portal", "titulo": "Nada"},
+            {"op": "criar_tarefa", "projeto": "Portal", "titulo": "Sem dono"},
+            {"op": "voar"},
+            {"op": "reatribuir_tarefa", "projeto": "Portal", "titulo": "Login",
+             "responsavel": "Bruno"},
+            lote=2)
+        self.assertEqual((resumo["comandos"], resumo["erros"]), (10, 3))
+        self.assertEqual(resultados[0], {"linha": 6, "ok": True,
+                                         "resultado": {"id": 0, "status": "pendente"}})
+        self.assertEqual([r.get("erro") for r in resultados[1:4]],
+                         ["TarefaNaoEncontradaError", "KeyError", "ValueError"])
+        self.assertEqual(resultados[4]["resultado"]["responsavel"], "Bruno")
+        self.assertEqual(self.gerenciador.relatorio_membro("Bruno")["total_tarefas"], 1)
+
+    def test_estado_salvo_e_recarregado(self):
+        """Testa que o arquivo de estado recria projetos, tarefas, status e datas"""
+        self.executar(
+            {"op": "criar_tarefa", "projeto": "Portal", "titulo": "Login", "responsavel": "Ana",
+             "prazo": "2030-01-01"},
+            {"op": "criar_tarefa", "projeto": "Portal", "titulo": "Testes",
+             "responsavel": "Bruno"},
+            {"op": "concluir_tarefa", "projeto": "Portal", "titulo": "Login"})
+        # Títulos repetidos: o arquivo identifica cada tarefa pelo id
+        repetida = self.gerenciador.criar_tarefa("Portal", "Testes", "Segunda", "Ana")
+        self.gerenciador.concluir_tarefa_por_id(repetida.id)
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "estado.jsonl")
+            salvar_estado(self.gerenciador, caminho)
+            recarregado = carregar_estado(caminho)
+        login = recarregado.buscar_tarefa("Login")
+        self.assertEqual(login.status, Tarefa.STATUS_CONCLUIDA)
+        self.assertEqual(login.prazo, self.gerenciador.buscar_tarefa("Login").prazo)
+        self.assertEqual([(t.id, t.status) for t in recarregado.tarefas if t.titulo == "Testes"],
+                         [(1, Tarefa.STATUS_PENDENTE), (repetida.id, Tarefa.STATUS_CONCLUIDA)])
+        self.assertEqual([(p.id, p.nome) for p in recarregado.projetos],
+                         [(p.id, p.nome) for p in self.gerenciador.projetos])
+        self.assertEqual([(m.id, m.nome) for m in recarregado.membros],
+                         [(m.id, m.nome) for m in self.gerenciador.membros])
+        self.assertEqual(recarregado.relatorio_projeto("Portal"),
+                         self.gerenciador.relatorio_projeto("Portal"))
+
+    def test_tipos_invalidos_nao_registram_pela_metade(self):
+        """Testa que argumentos com tipo errado viram erro da linha, sem efeito parcial"""
+        resumo, resultados = self.executar(
+            {"op": "criar_tarefa", "projeto": "Portal", "titulo": 5, "responsavel": "Ana"},
+            {"op": "criar_tarefa", "projeto": None, "titulo": "Login", "responsavel": "Ana"},
+            {"op": "criar_tarefa", "projeto": "Portal", "titulo": "Login", "responsavel": "Ana",
+             "prioridade": "alta"},
+            {"op": "cadastrar_membro", "nome": ["Caio"]},
+            {"op": "criar_tarefa", "projeto": "Portal", "titulo": "Login", "responsavel": "Ana"})
+        self.assertEqual((resumo["comandos"], resumo["erros"]), (10, 4))
+        self.assertEqual({r.get("erro") for r in resultados[:4]}, {"TypeError"})
+        self.assertTrue(resultados[4]["ok"])
+        self.assertEqual(self.gerenciador.relatorio_projeto("Portal")["total_tarefas"], 1)
+        self.assertEqual(len(self.gerenciador.membros), 2)
+
+    def test_saida_escrita_mesmo_com_excecao_inesperada(self):
+        """Testa que os resultados acumulados são escritos antes de a exceção subir"""
+        def falhar(comando):
+            raise RuntimeError("falha inesperada")
+        self.executor._operacoes["concluir_tarefa"] = falhar
+        with self.assertRaises(RuntimeError):
+            self.executar({"op": "concluir_tarefa", "projeto": "Portal", "titulo": "Login"})
+        self.assertEqual(len(self.saida.getvalue().splitlines()), len(PREPARACAO))
+
+    def test_linha_de_comando(self):
+        """Testa ``python -m modelo`` lendo da entrada padrão e gravando o estado"""
+        with tempfile.TemporaryDirectory() as pasta:
+            estado = os.path.join(pasta, "estado.jsonl")
+            entrada = "".join(linhas(*PREPARACAO, {"op": "criar_tarefa", "projeto": "Portal",
+                                                   "titulo": "Login", "responsavel": "Ana"}))
+            processo = subprocess.run(
+                [sys.executable, "-m", "modelo", "--estado", estado, "--salvar", estado],
+                input=entrada, capture_output=True, text=True, cwd=RAIZ,
+                env=dict(os.environ, PYTHONPATH=RAIZ))
+            self.assertEqual(processo.returncode, 0, processo.stderr)
+            self.assertEqual(len(processo.stdout.splitlines()), 6)
+            self.assertEqual(json.loads(processo.stderr)["comandos"], 6)
+
+            processo = subprocess.run(
+                [sys.executable, "-m", "modelo", "--estado", estado],
+                input='{"op": "concluir_tarefa", "projeto": "Portal", "titulo": "Login"}\n'
+                      '{"op": "cadastrar_membro", "nome": "Ana"}\n',
+                capture_output=True, text=True, cwd=RAIZ, env=dict(os.environ, PYTHONPATH=RAIZ))
+        self.assertEqual(processo.returncode, 1)
+        concluida, repetido = [json.loads(linha) for linha in processo.stdout.splitlines()]
+        self.assertTrue(concluida["ok"])
+        self.assertFalse(repetido["ok"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+from datetime import date, timedelta
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+from modelo.tarefa import Tarefa
+from modelo.dependencias import GrafoDependencias
+from modelo.excecoes import DependenciaCiclicaError
+
+class TestDependencias(unittest.TestCase):
+    """Testes para dependências entre tarefas e caminho crítico"""
+
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.gerenciador.adicionar_projeto(
+            Projeto("Portal", "Portal", prazo=date.today() + timedelta(days=5)))
+        self.gerenciador.cadastrar_membro(Membro("Ana", "Dev"))
+        self.gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        for titulo, dias in [("Banco", 2), ("API", 3), ("Tela", 1), ("Docs", 4)]:
+            self.gerenciador.criar_tarefa("Portal", titulo, "Descrição", "Ana",
+                                          estimativa_dias=dias)
+
+    def test_caminho_critico_incremental(self):
+        """Testa o caminho crítico conforme dependências e conclusões mudam"""
+        self.assertEqual([t.titulo for t in self.gerenciador.caminho_critico("Portal")], ["Docs"])
+        self.gerenciador.adicionar_dependencia("Portal", "API", "Banco")
+        self.gerenciador.adicionar_dependencia("Portal", "Tela", "API")
+        self.assertEqual([t.titulo for t in self.gerenciador.caminho_critico("Portal")],
+                         ["Banco", "API", "Tela"])
+        self.assertTrue(self.gerenciador.prazo_em_risco("Portal"))
+
+        self.gerenciador.concluir_tarefa("Portal", "Banco")
+        projeto = self.gerenciador.buscar_projeto("Portal")
+        self.assertEqual(projeto.previsao_conclusao(), date.today() + timedelta(days=4))
+        self.assertFalse(self.gerenciador.prazo_em_risco("Portal"))
+        self.gerenciador.remover_tarefa("Portal", "API")
+        self.assertEqual([t.titulo for t in self.gerenciador.caminho_critico("Portal")], ["Docs"])
+
+    def test_ciclo_rejeitado(self):
+        """Testa a detecção de ciclo ao inserir uma dependência"""
+        self.gerenciador.adicionar_dependencia("Portal", "API", "Banco")
+        self.gerenciador.adicionar_dependencia("Portal", "Tela", "API")
+        with self.assertRaises(DependenciaCiclicaError):
+            self.gerenciador.adicionar_dependencia("Portal", "Banco", "Tela")
+        with self.assertRaises(DependenciaCiclicaError):
+            self.gerenciador.adicionar_dependencia("Portal", "Banco", "Banco")
+        projeto = self.gerenciador.buscar_projeto("Portal")
+        self.assertEqual([t.titulo for t in projeto.bloqueadoras(projeto.buscar_tarefa("Tela"))],
+                         ["API"])
+
+    def test_confere_com_calculo_completo(self):
+        """Testa os términos incrementais contra um cálculo do zero em grafo aleatório"""
+        aleatorio = random.Random(7)
+        membro = Membro("Bia", "Dev")
+        tarefas = [Tarefa(f"T{i}", "", membro, estimativa_dias=aleatorio.randint(1, 5))
+                   for i in range(200)]
+        grafo = GrafoDependencias()
+        for tarefa in tarefas:
+            grafo.adicionar_tarefa(tarefa)
+        arestas = set()
+        for _ in range(600):
+            a, b = aleatorio.sample(tarefas, 2)
+            try:
+                grafo.adicionar_dependencia(b, a)
+                arestas.add((a, b))
+            except DependenciaCiclicaError:
+                pass
+        for tarefa in aleatorio.sample(tarefas, 50):
+            tarefa.concluir()
+            grafo.atualizar_tarefa(tarefa)
+
+        termino = {}
+        def calcular(tarefa):
+            if tarefa not in termino:
+                duracao = 0 if tarefa.status == Tarefa.STATUS_CONCLUIDA else tarefa.estimativa_dias
+                termino[tarefa] = duracao + max(
+                    (calcular(a) for a, b in arestas if b is tarefa), default=0)
+            return termino[tarefa]
+        for tarefa in tarefas:
+            self.assertEqual(grafo.termino_mais_cedo(tarefa), calcular(tarefa))
+        self.assertEqual(grafo.duracao_total, max(termino.values()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+from modelo.eventos import Evento
+from modelo.duplicatas import DetectorDuplicatas
+
+class TestDetectorDuplicatas(unittest.TestCase):
+    """Testes para a detecção de tarefas quase duplicadas"""
+
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.gerenciador.cadastrar_membro(Membro("Ana", "Dev"))
+        for nome in ("Portal", "App"):
+            self.gerenciador.adicionar_projeto(Projeto(nome, nome))
+            self.gerenciador.adicionar_membro_projeto(nome, "Ana")
+        self.gerenciador.criar_tarefa("Portal", "Corrigir login do usuário",
+                                      "Erro 500 ao entrar com e-mail e senha", "Ana")
+        self.gerenciador.criar_tarefa("Portal", "Criar relatório mensal",
+                                      "Exportar vendas em CSV", "Ana")
+        self.gerenciador.ativar_deteccao_duplicatas()
+        self.suspeitas = []
+        self.gerenciador.eventos.assinar(self.suspeitas.append, tipos=[Evento.DUPLICATA_SUSPEITA])
+
+    def test_suspeita_na_criacao(self):
+        """Testa que uma tarefa quase igual em outro projeto é sinalizada"""
+        self.gerenciador.criar_tarefa("App", "Corrigir o login do usuario",
+                                      "Erro 500 ao entrar com email e senha", "Ana")
+        self.gerenciador.criar_tarefa("App", "Trocar ícone", "Novo ícone do app", "Ana")
+        self.assertEqual(len(self.suspeitas), 1)
+        projeto, titulo, similaridade = self.suspeitas[0].dados["semelhantes"][0]
+        self.assertEqual((projeto, titulo), ("Portal", "Corrigir login do usuário"))
+        self.assertGreaterEqual(similaridade, 0.7)
+        self.assertEqual([t.titulo for t in self.gerenciador.possiveis_duplicatas(
+            "Portal", "Corrigir login do usuário")], ["Corrigir o login do usuario"])
+
+    def test_grupos_e_remocao(self):
+        """Testa o agrupamento em lote e a saída de tarefas removidas"""
+        for i in range(3):
+            self.gerenciador.criar_tarefa("App", f"Exportar vendas em CSV - relatório mensal {i}",
+                                          "Criar relatório mensal", "Ana")
+        grupos = self.gerenciador.grupos_duplicados()
+        self.assertEqual(len(grupos), 1)
+        self.assertEqual(len(grupos[0]), 4)
+        self.assertEqual(grupos[0][0].titulo, "Criar relatório mensal")
+        self.gerenciador.remover_projeto("App")
+        self.assertEqual(self.gerenciador.grupos_duplicados(), [])
+
+    def test_estimativa_de_similaridade(self):
+        """Testa que a similaridade estimada acompanha a de Jaccard"""
+        detector = DetectorDuplicatas(permutacoes=128, bandas=32)
+        detector.adicionar("a", "o rato roeu a roupa do rei de roma")
+        detector.adicionar("b", "o rato roeu a roupa do rei da roma")
+        detector.adicionar("c", "três pratos de trigo para três tigres")
+        self.assertGreater(detector.similaridade("a", "b"), 0.7)
+        self.assertLess(detector.similaridade("a", "c"), 0.2)
+        self.assertEqual([item for item, _ in detector.semelhantes("a")], ["b"])
+
+    def test_grupos_concordam_com_semelhantes(self):
+        """Testa que os grupos são os componentes ligados de ``semelhantes``"""
+        detector = DetectorDuplicatas(limiar=0.5)
+        palavras = ("login senha usuário relatório vendas mensal exportar csv tela cadastro "
+                    "cliente pedido nota fiscal estoque produto").split()
+        for i in range(120):
+            texto = " ".join(palavras[(i * 7 + k * (i % 5 + 1)) % len(palavras)]
+                             for k in range(6))
+            detector.adicionar(i, texto)
+        componentes = set()
+        visitados = set()
+        for inicio in range(120):
+            if inicio in visitados:
+                continue
+            componente, pilha = set(), [inicio]
+            while pilha:
+                item = pilha.pop()
+                if item not in componente:
+                    componente.add(item)
+                    pilha.extend(outro for outro, _ in detector.semelhantes(item))
+            visitados |= componente
+            if len(componente) > 1:
+                componentes.add(frozenset(componente))
+        self.assertTrue(componentes)
+        self.assertEqual({frozenset(grupo) for grupo in detector.agrupar()}, componentes)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import random
+import unittest
+from datetime import date, timedelta
+from modelo.estatisticas import ContadorAtrasos, EsbocoDatas
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+
+class TestEsbocoDatas(unittest.TestCase):
+    """Testes para o esboço de quantis de datas"""
+    
+    def test_exato_dentro_da_capacidade(self):
+        """Testa quantis exatos e remoção enquanto há poucos dias distintos"""
+        esboco = EsbocoDatas()
+        for dia in range(100, 200):
+            esboco.adicionar(dia)
+        esboco.remover(199)
+        quantis = esboco.quantis_distancia(200, (50, 100))
+        self.assertEqual(quantis, {50: 51.0, 100: 100.0})
+        self.assertEqual(esboco.largura, 1)
+    
+    def test_erro_limitado_apos_compactacao(self):
+        """Testa memória limitada e erro de no máximo meia largura de balde"""
+        aleatorio = random.Random(5)
+        dias = [aleatorio.randint(0, 5000) for _ in range(20000)]
+        esboco = EsbocoDatas(capacidade=64)
+        for dia in dias:
+            esboco.adicionar(dia)
+        self.assertLessEqual(len(esboco._baldes), 64)
+        distancias = sorted(6000 - d for d in dias)
+        for p in (50, 90, 99):
+            exato = distancias[-(-len(distancias) * p // 100) - 1]
+            aproximado = esboco.quantis_distancia(6000, (p,))[p]
+            self.assertLessEqual(abs(aproximado - exato), esboco.largura)
+    
+    def test_mesclar(self):
+        """Testa que mesclar equivale a inserir tudo em um só esboço"""
+        a, b, junto = EsbocoDatas(16), EsbocoDatas(16), EsbocoDatas(16)
+        for dia in range(0, 300, 3):
+            a.adicionar(dia)
+            junto.adicionar(dia)
+        for dia in range(1000, 1010):
+            b.adicionar(dia)
+            junto.adicionar(dia)
+        a.mesclar(b)
+        self.assertEqual(len(a), len(junto))
+        self.assertEqual(a.quantis_distancia(2000, (50, 90)), junto.quantis_distancia(2000, (50, 90)))
+
+class TestContadorAtrasos(unittest.TestCase):
+    """Testes para o contador incremental de atrasos"""
+    
+    def test_virada_de_dia(self):
+        """Testa que prazos passam a contar como vencidos quando o dia vira"""
+        hoje = date.today()
+        contador = ContadorAtrasos()
+        contador.adicionar((hoje - timedelta(days=1)).toordinal(), hoje)
+        contador.adicionar((hoje + timedelta(days=2)).toordinal(), hoje)
+        self.assertEqual(contador.vencidas(hoje), 1)
+        self.assertEqual(contador.vencidas(hoje + timedelta(days=3)), 2)
+        contador.remover((hoje + timedelta(days=2)).toordinal(), hoje + timedelta(days=3))
+        self.assertEqual(contador.vencidas(hoje + timedelta(days=400)), 1)
+
+class TestRelatoriosComPercentis(unittest.TestCase):
+    """Testes dos percentis nos relatórios do gerenciador"""
+    
+    def test_percentis_de_atraso(self):
+        """Testa os dias de atraso nos relatórios de projeto e membro"""
+        hoje = date.today()
+        gerenciador = GerenciadorProjetos()
+        gerenciador.adicionar_projeto(Projeto("Portal", "Portal"))
+        gerenciador.cadastrar_membro(Membro("Ana", "Dev"))
+        gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        for dias in (1, 2, 3, 10):
+            gerenciador.criar_tarefa("Portal", f"T{dias}", "Descrição", "Ana",
+                                     prazo=hoje - timedelta(days=dias))
+        gerenciador.criar_tarefa("Portal", "Futura", "Descrição", "Ana",
+                                 prazo=hoje + timedelta(days=5))
+        gerenciador.concluir_tarefa("Portal", "T10")
+        
+        relatorio = gerenciador.relatorio_projeto("Portal")
+        self.assertEqual(relatorio["tarefas_atrasadas"], 3)
+        self.assertEqual((relatorio["atraso_p50"], relatorio["atraso_p99"]), (2.0, 3.0))
+        self.assertEqual(relatorio["idade_p90"], 0.0)
+        self.assertEqual(gerenciador.relatorio_membro("Ana")["atraso_p90"], 3.0)
+
+    def test_prazo_alterado_reindexa(self):
+        """Testa que trocar ``tarefa.prazo`` mantém relatórios, painel e cronograma em dia"""
+        hoje = date.today()
+        gerenciador = GerenciadorProjetos()
+        gerenciador.adicionar_projeto(Projeto("Portal", "Portal"))
+        gerenciador.cadastrar_membro(Membro("Ana", "Dev"))
+        gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        epico = gerenciador.criar_tarefa("Portal", "Épico", "Descrição", "Ana")
+        tarefa = gerenciador.criar_tarefa("Portal", "Login", "Descrição", "Ana",
+                                          prazo=hoje + timedelta(days=5))
+        gerenciador.definir_tarefa_pai("Portal", "Login", "Épico")
+        painel = gerenciador.criar_painel()
+        tarefa.prazo = hoje - timedelta(days=4)
+        self.assertEqual(gerenciador.relatorio_projeto("Portal")["tarefas_atrasadas"], 1)
+        self.assertEqual(gerenciador.relatorio_membro("Ana")["atraso_p50"], 4.0)
+        self.assertEqual(painel.atrasadas(), 1)
+        self.assertEqual(gerenciador.resumo_tarefa("Portal", "Épico")["ultimo_prazo"],
+                         hoje - timedelta(days=4))
+        self.assertNotIn(tarefa, gerenciador.tarefas_ativas_em(hoje + timedelta(days=1)))
+        tarefa.prazo = None
+        gerenciador.concluir_tarefa("Portal", "Login")
+        epico.prazo = hoje - timedelta(days=1)
+        relatorio = gerenciador.relatorio_projeto("Portal")
+        self.assertEqual((relatorio["tarefas_concluidas"], relatorio["tarefas_atrasadas"]), (1, 1))
+        self.assertEqual(painel.atrasadas(), 1)
+        self.assertTrue(painel.verificar(gerenciador.projetos))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import threading
+import unittest
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+from modelo.eventos import BarramentoEventos, Evento
+from modelo.excecoes import SequenciaIndisponivelError
+
+class TestBarramentoEventos(unittest.TestCase):
+    """Testes para o fluxo de eventos de mudança do gerenciador"""
+
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.recebidos = []
+        self.gerenciador.eventos.assinar(self.recebidos.append)
+
+    def _popular(self):
+        self.gerenciador.adicionar_projeto(Projeto("Portal", "Portal"))
+        self.gerenciador.cadastrar_membro(Membro("Ana", "Dev", "ana@x.com"))
+        self.gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        tarefa = self.gerenciador.criar_tarefa("Portal", "Login", "Tela", "Ana", prioridade=3)
+        tarefa.iniciar()
+        self.gerenciador.concluir_tarefa("Portal", "Login")
+
+    def test_eventos_tipados_em_ordem(self):
+        """Testa tipos, sequência e dados dos eventos emitidos"""
+        self._popular()
+        self.assertEqual([e.tipo for e in self.recebidos], [
+            Evento.PROJETO_ADICIONADO, Evento.MEMBRO_CADASTRADO, Evento.MEMBRO_ENTROU_PROJETO,
+            Evento.TAREFA_CRIADA, Evento.TAREFA_INICIADA, Evento.TAREFA_CONCLUIDA])
+        self.assertEqual([e.seq for e in self.recebidos], [1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.recebidos[1].dados["email"], "ana@x.com")
+        criada = self.recebidos[3].dados
+        self.assertEqual((criada["projeto"], criada["titulo"], criada["responsavel"],
+                          criada["prioridade"]), ("Portal", "Login", "Ana", 3))
+
+    def test_sem_consumidores_nao_publica(self):
+        """Testa que sem assinantes os eventos nem são montados"""
+        gerenciador = GerenciadorProjetos()
+        self.assertFalse(gerenciador.eventos.ativo)
+        gerenciador.adicionar_projeto(Projeto("Portal", "Portal"))
+        self.assertEqual(gerenciador.eventos.seq, 0)
+
+    def test_fila_com_lotes_e_retomada(self):
+        """Testa consumo em lotes e retomada a partir de uma sequência"""
+        self.gerenciador.eventos.configurar_retencao(100)
+        fila = self.gerenciador.eventos.fila(capacidade=10, tipos=[Evento.TAREFA_CRIADA,
+                                                                   Evento.TAREFA_CONCLUIDA])
+        self._popular()
+        self.assertEqual([e.seq for e in fila.lote(maximo=1)], [4])
+        self.assertEqual([e.seq for e in fila.lote()], [6])
+        fila.fechar()
+
+        retomada = self.gerenciador.eventos.fila(desde=3)
+        self.assertEqual([e.seq for e in retomada.lote()], [4, 5, 6])
+        self.assertEqual(self.gerenciador.eventos.desde(5), self.recebidos[5:])
+
+    def test_retencao_esgotada(self):
+        """Testa o erro ao retomar de uma sequência já descartada"""
+        barramento = BarramentoEventos(retencao=2)
+        for i in range(5):
+            barramento.publicar("teste", i=i)
+        self.assertEqual([e.seq for e in barramento.desde(3)], [4, 5])
+        with self.assertRaises(SequenciaIndisponivelError):
+            barramento.desde(1)
+
+    def test_contrapressao(self):
+        """Testa que a fila cheia segura o publicador ou descarta eventos"""
+        barramento = BarramentoEventos()
+        descartando = barramento.fila(capacidade=2, bloquear=False)
+        for i in range(4):
+            barramento.publicar("teste", i=i)
+        self.assertEqual((len(descartando), descartando.descartados), (2, 2))
+        descartando.fechar()
+
+        fila = barramento.fila(capacidade=1)
+        barramento.publicar("teste", i=0)
+        publicador = threading.Thread(target=barramento.publicar, args=("teste",))
+        publicador.start()
+        publicador.join(0.05)
+        self.assertTrue(publicador.is_alive())
+        self.assertEqual(len(fila.lote(timeout=1)), 1)
+        publicador.join(1)
+        self.assertFalse(publicador.is_alive())
+        self.assertEqual(fila.lote(timeout=1)[0].seq, 6)
+        fila.fechar()
+        self.assertEqual(list(fila), [])
+    def test_retomada_maior_que_a_capacidade(self):
+        """Testa que o reenvio não bloqueia sem consumidor e vem antes dos eventos novos"""
+        barramento = BarramentoEventos(retencao=100)
+        for i in range(20):
+            barramento.publicar("teste", i=i)
+        fila = barramento.fila(capacidade=5, desde=0, timeout=None)
+        self.assertEqual((len(fila), fila.descartados), (20, 0))
+        publicador = threading.Thread(target=barramento.publicar, args=("teste",))
+        publicador.start()
+        recebidos = []
+        while len(recebidos) < 21:
+            recebidos.extend(e.seq for e in fila.lote(maximo=3, timeout=1))
+        publicador.join(1)
+        self.assertEqual(recebidos, list(range(1, 22)))
+        fila.fechar()
+
+if __name__ == '__main__':
+    unittest.main()
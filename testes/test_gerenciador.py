@@ -7,7 +7,8 @@ from modelo.excecoes import (
     ProjetoNaoEncontradoError,
     MembroNaoEncontradoError,
     ResponsavelNaoEMembroError,
-    TarefaNaoEncontradaError
+    TarefaNaoEncontradaError,
+    OperacaoTarefaError
 )
 
 class TestGerenciadorProjetos(unittest.TestCase):
@@ -92,5 +93,47 @@ class TestGerenciadorProjetos(unittest.TestCase):
         self.assertEqual(rel_projeto["total_tarefas"], 1)
         self.assertEqual(rel_membro["total_tarefas"], 1)
 
+    def test_reatribuir_tarefa(self):
+        """Testa a transferência de uma tarefa entre membros"""
+        outro = Membro("Bruno Lima", "Desenvolvedor")
+        self.gerenciador.cadastrar_membro(outro)
+        self.gerenciador.adicionar_membro_projeto("Portal Corporativo", "Fernanda Rocha")
+        self.gerenciador.adicionar_membro_projeto("Portal Corporativo", "Bruno Lima")
+        tarefa = self.gerenciador.criar_tarefa(
+            "Portal Corporativo", "Tarefa Movida", "Descrição", "Fernanda Rocha")
+        
+        self.gerenciador.reatribuir_tarefa("Portal Corporativo", "tarefa movida", "Bruno Lima")
+        self.assertIs(tarefa.responsavel, outro)
+        self.assertEqual(self.membro.tarefas_atribuidas, [])
+        self.assertEqual(outro.tarefas_atribuidas, [tarefa])
+        self.assertEqual(self.gerenciador.relatorio_membro("Bruno Lima")["total_tarefas"], 1)
+    
+    def test_remover_membro_projeto_redistribui(self):
+        """Testa a saída de um membro com redistribuição das tarefas abertas"""
+        for nome in ("Bruno Lima", "Carla Dias"):
+            self.gerenciador.cadastrar_membro(Membro(nome, "Desenvolvedor"))
+        for nome in ("Fernanda Rocha", "Bruno Lima", "Carla Dias"):
+            self.gerenciador.adicionar_membro_projeto("Portal Corporativo", nome)
+        for i in range(4):
+            self.gerenciador.criar_tarefa("Portal Corporativo", f"T{i}", "Descrição", "Fernanda Rocha")
+        self.gerenciador.concluir_tarefa("Portal Corporativo", "T0")
+        
+        movidas = self.gerenciador.remover_membro_projeto("Portal Corporativo", "Fernanda Rocha")
+        self.assertEqual(len(movidas), 3)
+        self.assertNotIn(self.membro, self.projeto.membros)
+        self.assertEqual(len(self.membro.tarefas_atribuidas), 1)
+        donos = sorted(t.responsavel.nome for t in movidas)
+        self.assertEqual(donos.count("Bruno Lima") + donos.count("Carla Dias"), 3)
+        self.assertLessEqual(abs(donos.count("Bruno Lima") - donos.count("Carla Dias")), 1)
+    
+    def test_remover_membro_sem_redistribuir(self):
+        """Testa que sair sem redistribuir exige não ter tarefas abertas"""
+        self.gerenciador.adicionar_membro_projeto("Portal Corporativo", "Fernanda Rocha")
+        self.gerenciador.criar_tarefa("Portal Corporativo", "Aberta", "Descrição", "Fernanda Rocha")
+        with self.assertRaises(OperacaoTarefaError):
+            self.gerenciador.remover_membro_projeto(
+                "Portal Corporativo", "Fernanda Rocha", redistribuir=False)
+        self.assertIn(self.membro, self.projeto.membros)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
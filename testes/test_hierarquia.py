@@ -0,0 +1,61 @@
+import unittest
+from datetime import date, timedelta
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+from modelo.excecoes import OperacaoTarefaError
+
+class TestHierarquiaTarefas(unittest.TestCase):
+    """Testes para épicos, subtarefas e agregados por subárvore"""
+
+    def setUp(self):
+        self.hoje = date.today()
+        self.gerenciador = GerenciadorProjetos()
+        self.gerenciador.adicionar_projeto(Projeto("Portal", "Portal"))
+        self.gerenciador.cadastrar_membro(Membro("Ana", "Dev"))
+        self.gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        for titulo, prioridade, dias in [("Épico", 1, None), ("Login", 3, -2),
+                                         ("Senha", 2, 10), ("Cadastro", 4, 5)]:
+            prazo = self.hoje + timedelta(days=dias) if dias is not None else None
+            self.gerenciador.criar_tarefa("Portal", titulo, "Descrição", "Ana",
+                                          prioridade=prioridade, prazo=prazo)
+        self.gerenciador.definir_tarefa_pai("Portal", "Login", "Épico")
+        self.gerenciador.definir_tarefa_pai("Portal", "Senha", "Login")
+        self.gerenciador.definir_tarefa_pai("Portal", "Cadastro", "Épico")
+
+    def test_agregados_em_cada_nivel(self):
+        """Testa os resumos do épico e de um sub-épico"""
+        epico = self.gerenciador.resumo_tarefa("Portal", "Épico")
+        self.assertEqual(epico["total_tarefas"], 4)
+        self.assertEqual(epico["soma_prioridades"], 10)
+        self.assertEqual(epico["ultimo_prazo"], self.hoje + timedelta(days=10))
+        self.assertEqual(epico["tarefas_atrasadas"], 1)
+        self.assertEqual(self.gerenciador.resumo_tarefa("Portal", "Login")["total_tarefas"], 2)
+        self.assertEqual(self.gerenciador.resumo_tarefa("Portal", "Senha")["total_tarefas"], 1)
+
+    def test_conclusao_sobe_pela_arvore(self):
+        """Testa que concluir uma subtarefa atualiza todos os ancestrais"""
+        self.gerenciador.concluir_tarefa("Portal", "Login")
+        self.gerenciador.concluir_tarefa("Portal", "Senha")
+        epico = self.gerenciador.resumo_tarefa("Portal", "Épico")
+        self.assertEqual(epico["percentual_conclusao"], 50.0)
+        self.assertEqual(epico["tarefas_atrasadas"], 0)
+        self.assertEqual(self.gerenciador.resumo_tarefa("Portal", "Login")["percentual_conclusao"],
+                         100.0)
+
+    def test_mover_e_remover(self):
+        """Testa mover subárvores, rejeitar ciclos e promover filhas ao remover"""
+        with self.assertRaises(OperacaoTarefaError):
+            self.gerenciador.definir_tarefa_pai("Portal", "Épico", "Senha")
+        self.gerenciador.definir_tarefa_pai("Portal", "Login", None)
+        self.assertEqual(self.gerenciador.resumo_tarefa("Portal", "Épico")["total_tarefas"], 2)
+        self.gerenciador.definir_tarefa_pai("Portal", "Login", "Cadastro")
+        self.gerenciador.remover_tarefa("Portal", "Cadastro")
+        projeto = self.gerenciador.buscar_projeto("Portal")
+        login = projeto.buscar_tarefa("Login")
+        self.assertEqual(projeto.tarefa_pai(login).titulo, "Épico")
+        epico = self.gerenciador.resumo_tarefa("Portal", "Épico")
+        self.assertEqual((epico["total_tarefas"], epico["soma_prioridades"]), (3, 6))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from datetime import date, datetime
+from modelo.historico import HistoricoStatus, percentil
+from modelo.membro import Membro
+from modelo.tarefa import Tarefa
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+
+DIA = 86400.0
+
+class RelogioFalso:
+    """Relógio controlado pelo teste"""
+    
+    def __init__(self):
+        self.agora = datetime(2024, 3, 4, 12).timestamp()  # segunda-feira
+    
+    def __call__(self) -> float:
+        return self.agora
+
+class TestHistoricoStatus(unittest.TestCase):
+    """Testes para o log de mudanças de status"""
+    
+    def setUp(self):
+        self.relogio = RelogioFalso()
+        self.historico = HistoricoStatus(self.relogio)
+        self.ana = Membro("Ana", "Dev")
+        self.bruno = Membro("Bruno", "Dev")
+    
+    def _nova(self, titulo: str, membro: Membro, projeto: str = "Portal") -> Tarefa:
+        tarefa = Tarefa(titulo, "Descrição", membro)
+        self.historico.registrar_criacao(tarefa, projeto)
+        return tarefa
+    
+    def _mudar(self, tarefa: Tarefa, dias: float, acao: str) -> None:
+        self.relogio.agora += dias * DIA
+        getattr(tarefa, acao)()
+        self.historico.registrar_status(tarefa)
+    
+    def test_tempos_de_ciclo_e_lead(self):
+        """Testa os percentis por membro e gerais"""
+        a = self._nova("A", self.ana)
+        b = self._nova("B", self.bruno)
+        c = self._nova("C", self.ana, "Intranet")
+        self._mudar(a, 1, "iniciar")
+        self._mudar(a, 2, "concluir")
+        self._mudar(b, 0, "iniciar")
+        self._mudar(b, 4, "concluir")
+        self._mudar(c, 1, "concluir")
+        
+        self.assertEqual(self.historico.percentis_tempo('ciclo', percentis=(50,)), {50: 3.0})
+        self.assertEqual(self.historico.percentis_tempo('lead', agrupar_por='projeto', percentis=(100,)),
+                         {"Portal": {100: 7.0}, "Intranet": {100: 8.0}})
+        self.assertEqual(self.historico.percentis_tempo('ciclo', agrupar_por='membro', percentis=(50,)),
+                         {"Ana": {50: 2.0}, "Bruno": {50: 4.0}})
+    
+    def test_vazao_e_wip(self):
+        """Testa a vazão semanal e a série de trabalho em andamento"""
+        a = self._nova("A", self.ana)
+        b = self._nova("B", self.ana)
+        self._mudar(a, 0, "iniciar")
+        self._mudar(b, 1, "iniciar")
+        self._mudar(a, 1, "concluir")
+        self._mudar(b, 7, "concluir")
+        
+        self.assertEqual(self.historico.vazao('semana'), {date(2024, 3, 4): 1, date(2024, 3, 11): 1})
+        self.assertEqual(self.historico.wip(), {date(2024, 3, 4): 1, date(2024, 3, 5): 2,
+                                                date(2024, 3, 6): 1, date(2024, 3, 13): 0})
+        self.assertEqual(self.historico.vazao(membro="Bruno"), {})
+    
+    def test_percentil_interpolado(self):
+        """Testa a interpolação linear dos percentis"""
+        self.assertEqual(percentil([1.0, 2.0, 3.0, 4.0], 50), 2.5)
+        self.assertEqual(percentil([], 90), 0.0)
+    
+    def test_gerenciador_registra_transicoes(self):
+        """Testa que o gerenciador alimenta o histórico"""
+        gerenciador = GerenciadorProjetos()
+        gerenciador.adicionar_projeto(Projeto("Portal", "Portal"))
+        gerenciador.cadastrar_membro(self.ana)
+        gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        tarefa = gerenciador.criar_tarefa("Portal", "A", "Descrição", "Ana")
+        tarefa.iniciar()
+        gerenciador.concluir_tarefa("Portal", "A")
+        self.assertEqual(sum(gerenciador.vazao(nome_projeto="portal").values()), 1)
+        self.assertIn(50, gerenciador.percentis_tempo())
+
+    def test_tarefas_removidas_saem_do_wip(self):
+        """Testa que excluir tarefas (ou o projeto) as tira do WIP e dos tempos"""
+        relogio = RelogioFalso()
+        gerenciador = GerenciadorProjetos()
+        gerenciador._historico = HistoricoStatus(relogio)
+        gerenciador.cadastrar_membro(self.ana)
+        for nome in ("Portal", "Site"):
+            gerenciador.adicionar_projeto(Projeto(nome, nome))
+            gerenciador.adicionar_membro_projeto(nome, "Ana")
+        gerenciador.criar_tarefa("Portal", "A", "Descrição", "Ana")
+        gerenciador.criar_tarefa("Site", "B", "Descrição", "Ana")
+        gerenciador.criar_tarefa("Site", "C", "Descrição", "Ana")
+        gerenciador.iniciar_tarefa("Portal", "A")
+        gerenciador.iniciar_tarefa("Site", "B")
+        relogio.agora += DIA
+        gerenciador.iniciar_tarefa("Site", "C")
+        gerenciador.concluir_tarefa("Site", "C")
+        self.assertEqual(list(gerenciador.wip_por_dia().values())[-1], 2)
+        self.assertIn(50, gerenciador.percentis_tempo())
+        relogio.agora += DIA
+        gerenciador.remover_tarefa("Portal", "A")
+        gerenciador.remover_projeto("Site")
+        self.assertEqual(list(gerenciador.wip_por_dia().values())[-1], 0)
+        self.assertEqual(gerenciador.percentis_tempo(), {50: 0.0, 90: 0.0, 99: 0.0})
+        self.assertEqual(sum(gerenciador.vazao().values()), 1)
+
+if __name__ == '__main__':
+    unittest.main()
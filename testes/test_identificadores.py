@@ -0,0 +1,70 @@
+import unittest
+from datetime import date
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+from modelo.excecoes import (ProjetoNaoEncontradoError, MembroNaoEncontradoError,
+                             TarefaNaoEncontradaError, ResponsavelNaoEMembroError)
+
+class TestIdentificadores(unittest.TestCase):
+    """Testes para a API por ids inteiros"""
+
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.projeto = Projeto("Portal", "Site")
+        self.ana = Membro("Ana", "Dev")
+        self.bruno = Membro("Bruno", "QA")
+        self.gerenciador.adicionar_projeto(self.projeto)
+        self.gerenciador.cadastrar_membro(self.ana)
+        self.gerenciador.cadastrar_membro(self.bruno)
+
+    def test_operacoes_por_id(self):
+        """Testa o fluxo completo usando apenas ids"""
+        self.assertEqual((self.projeto.id, self.ana.id, self.bruno.id), (0, 0, 1))
+        self.gerenciador.adicionar_membro_projeto_por_id(self.projeto.id, self.ana.id)
+        with self.assertRaises(ResponsavelNaoEMembroError):
+            self.gerenciador.criar_tarefa_por_id(self.projeto.id, "Login", "Tela", self.bruno.id)
+        tarefa = self.gerenciador.criar_tarefa_por_id(self.projeto.id, "Login", "Tela",
+                                                      self.ana.id, prioridade=3)
+        self.assertIs(self.gerenciador.tarefa_por_id(tarefa.id), tarefa)
+        self.gerenciador.iniciar_tarefa_por_id(tarefa.id)
+        self.gerenciador.concluir_tarefa_por_id(tarefa.id)
+        self.assertEqual(self.gerenciador.relatorio_projeto_por_id(self.projeto.id),
+                         self.gerenciador.relatorio_projeto("Portal"))
+        self.assertEqual(self.gerenciador.relatorio_membro_por_id(self.ana.id)["projetos"],
+                         ["Portal"])
+
+    def test_ids_invalidos_e_removidos(self):
+        """Testa que ids inexistentes ou de entidades removidas deixam de resolver"""
+        self.gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        tarefa = self.gerenciador.criar_tarefa("Portal", "Login", "Tela", "Ana")
+        self.gerenciador.remover_tarefa("Portal", "Login")
+        with self.assertRaises(TarefaNaoEncontradaError):
+            self.gerenciador.concluir_tarefa_por_id(tarefa.id)
+        self.gerenciador.remover_projeto("Portal")
+        with self.assertRaises(ProjetoNaoEncontradoError):
+            self.gerenciador.projeto_por_id(self.projeto.id)
+        with self.assertRaises(MembroNaoEncontradoError):
+            self.gerenciador.membro_por_id(-1)
+        novo = Projeto("App", "Aplicativo")
+        self.gerenciador.adicionar_projeto(novo)
+        self.assertNotEqual(novo.id, self.projeto.id)
+        self.assertIs(self.gerenciador.projeto_por_id(novo.id), novo)
+        with self.assertRaises(ProjetoNaoEncontradoError):
+            self.gerenciador.projeto_por_id(self.projeto.id)
+
+    def test_id_sobrevive_a_camada_fria(self):
+        """Testa que a tarefa descarregada volta pelo mesmo id"""
+        self.gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        tarefa = self.gerenciador.criar_tarefa("Portal", "Login", "Tela", "Ana")
+        tarefa.concluir()
+        self.gerenciador.configurar_armazenamento_frio(idade_minima_dias=0)
+        self.assertEqual(self.gerenciador.descarregar_concluidas(date.max), 1)
+        recarregada = self.gerenciador.tarefa_por_id(tarefa.id)
+        self.assertIsNot(recarregada, tarefa)
+        self.assertEqual((recarregada.id, recarregada.titulo), (tarefa.id, "Login"))
+        self.assertIs(self.gerenciador.buscar_tarefa("Login"), recarregada)
+
+
+if __name__ == '__main__':
+    unittest.main()
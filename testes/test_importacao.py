@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+import unittest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def modulos_carregados(codigo: str) -> set:
+    """Módulos presentes em sys.modules depois de executar ``codigo`` num interpretador novo."""
+    saida = subprocess.run(
+        [sys.executable, "-c", f"{codigo}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True, text=True, check=True, cwd=RAIZ,
+        env=dict(os.environ, PYTHONPATH=RAIZ)).stdout
+    return set(saida.split())
+
+class TestImportacao(unittest.TestCase):
+    """Testes para a importação sob demanda do pacote"""
+
+    def test_import_modelo_nao_carrega_submodulos(self):
+        """Testa que ``import modelo`` não importa nenhum submódulo"""
+        carregados = modulos_carregados("import modelo")
+        self.assertEqual({m for m in carregados if m.startswith("modelo.")}, set())
+
+    def test_nomes_publicos_sob_demanda(self):
+        """Testa que o gerenciador não arrasta o pacote legado nem os subsistemas opcionais"""
+        carregados = modulos_carregados("import modelo\nassert modelo.GerenciadorProjetos")
+        self.assertIn("modelo.gerenciador", carregados)
+        self.assertNotIn("refatoracao.entidades_principais", carregados)
+        self.assertNotIn("sqlite3", carregados)
+        self.assertNotIn("modelo.duplicatas", carregados)
+        import modelo
+        from modelo.tarefa import Tarefa
+        self.assertIs(modelo.Tarefa, Tarefa)
+        with self.assertRaises(AttributeError):
+            modelo.NaoExiste
+
+    def test_subsistemas_carregados_ao_ativar(self):
+        """Testa que camada fria e duplicatas são importadas ao serem ativadas"""
+        carregados = modulos_carregados(
+            "from modelo.gerenciador import GerenciadorProjetos\n"
+            "g = GerenciadorProjetos()\n"
+            "g.configurar_armazenamento_frio()\n"
+            "g.ativar_deteccao_duplicatas()")
+        self.assertTrue({"sqlite3", "modelo.armazenamento", "modelo.duplicatas"} <= carregados)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from modelo.indices import IndicePrefixo
+from modelo.membro import Membro
+from modelo.projeto import Projeto
+from modelo.gerenciador import GerenciadorProjetos
+
+class TestIndicePrefixo(unittest.TestCase):
+    """Testes para o índice de busca por prefixo"""
+    
+    def setUp(self):
+        """Cria um índice com alguns nomes"""
+        self.indice = IndicePrefixo()
+        for nome in ["Ana Costa", "Ana Beatriz", "André Lima", "Bruno Alves", "Carla Dias"]:
+            self.indice.adicionar(nome, nome)
+    
+    def test_busca_exata_case_insensitive(self):
+        """Testa a busca exata ignorando maiúsculas"""
+        self.assertEqual(self.indice.buscar("ana costa"), "Ana Costa")
+        self.assertIsNone(self.indice.buscar("Ana"))
+    
+    def test_busca_prefixo_ordenada_e_limitada(self):
+        """Testa a ordem alfabética e o limite de resultados"""
+        self.assertEqual(self.indice.buscar_prefixo("an"), ["Ana Beatriz", "Ana Costa", "André Lima"])
+        self.assertEqual(self.indice.buscar_prefixo("AN", limite=2), ["Ana Beatriz", "Ana Costa"])
+        self.assertEqual(self.indice.buscar_prefixo("x"), [])
+    
+    def test_tolerancia_a_erro_de_digitacao(self):
+        """Testa prefixos a uma edição de distância"""
+        self.assertEqual(self.indice.buscar_prefixo("brumo"), [])
+        self.assertEqual(self.indice.buscar_prefixo("brumo", tolerancia=True), ["Bruno Alves"])
+        self.assertEqual(self.indice.buscar_prefixo("carka", tolerancia=True), ["Carla Dias"])
+    
+    def test_remover(self):
+        """Testa a remoção de itens do índice"""
+        self.indice.remover("Ana Costa", "Ana Costa")
+        self.assertEqual(self.indice.buscar_prefixo("ana"), ["Ana Beatriz"])
+        self.assertNotIn("ana costa", self.indice)
+    
+    def test_sincronia_com_gerenciador(self):
+        """Testa que cadastros alimentam as sugestões do gerenciador"""
+        gerenciador = GerenciadorProjetos()
+        gerenciador.cadastrar_membro(Membro("Fernanda Rocha", "UX Designer"))
+        gerenciador.adicionar_projeto(Projeto("Portal Corporativo", "Portal"))
+        self.assertEqual([m.nome for m in gerenciador.sugerir_membros("fer")], ["Fernanda Rocha"])
+        self.assertEqual([p.nome for p in gerenciador.sugerir_projetos("portla", tolerancia=True)],
+                         ["Portal Corporativo"])
+        with self.assertRaises(ValueError):
+            gerenciador.cadastrar_membro(Membro("FERNANDA ROCHA", "Dev"))
+
+if __name__ == '__main__':
+    unittest.main()
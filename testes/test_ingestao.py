@@ -0,0 +1,111 @@
+import threading
+import unittest
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.membro import Membro
+from modelo.projeto import Projeto
+from modelo.tarefa import Tarefa
+from modelo.excecoes import FilaCheiaError, ResponsavelNaoEMembroError, TarefaNaoEncontradaError
+from modelo.ingestao import FilaIngestao
+
+class TestIngestao(unittest.TestCase):
+    """Testes para a fila de ingestão com aplicação em lotes"""
+
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.gerenciador.cadastrar_membro(Membro("Ana", "Dev"))
+        self.gerenciador.cadastrar_membro(Membro("Bruno", "QA"))
+        self.gerenciador.adicionar_projeto(Projeto("Portal", "Site"))
+        self.gerenciador.adicionar_membro_projeto("Portal", "Ana")
+
+    def test_lotes_e_futuros(self):
+        """Testa que os pedidos são agrupados e cada futuro recebe resultado ou erro"""
+        with FilaIngestao(self.gerenciador, tamanho_lote=4, espera=0.0) as fila:
+            with fila.trava:
+                criacoes = [fila.criar_tarefa("Portal", f"T{i}", "", "Ana") for i in range(6)]
+                conclusao = fila.concluir_tarefa("Portal", "T0")
+                ausente = fila.iniciar_tarefa("Portal", "Nada")
+                fora = fila.reatribuir_tarefa("Portal", "T1", "Bruno")
+                adicao = fila.adicionar_membro_projeto("Portal", "Bruno")
+                reatribuicao = fila.reatribuir_tarefa("Portal", "T1", "Bruno")
+            self.assertTrue(fila.esvaziar(5))
+            estatisticas = fila.estatisticas()
+        self.assertIsInstance(criacoes[0].result(), Tarefa)
+        self.assertIsNone(conclusao.result())
+        self.assertIsNone(adicao.result())
+        self.assertIsInstance(ausente.exception(), TarefaNaoEncontradaError)
+        self.assertIsInstance(fora.exception(), ResponsavelNaoEMembroError)
+        self.assertEqual(reatribuicao.result().responsavel.nome, "Bruno")
+        self.assertEqual(self.gerenciador.buscar_tarefa("T0").status, Tarefa.STATUS_CONCLUIDA)
+        self.assertEqual((estatisticas["enviados"], estatisticas["aplicados"],
+                          estatisticas["erros"], estatisticas["pendentes"]), (11, 9, 2, 0))
+        self.assertEqual(estatisticas["maior_lote"], 4)
+        self.assertGreaterEqual(estatisticas["lotes"], 3)
+        with self.assertRaises(ValueError):
+            fila.enviar("remover_projeto", "Portal")
+        with self.assertRaises(RuntimeError):
+            fila.criar_tarefa("Portal", "Depois", "", "Ana")
+
+    def test_contrapressao_com_fila_cheia(self):
+        """Testa rejeição sem bloqueio, espera com timeout e produtor liberado ao abrir espaço"""
+        fila = FilaIngestao(self.gerenciador, capacidade=2, tamanho_lote=1, espera=0.0,
+                            bloquear=False)
+        with fila.trava:
+            with self.assertRaises(FilaCheiaError):
+                for i in range(10):
+                    fila.criar_tarefa("Portal", f"R{i}", "", "Ana")
+            self.assertLessEqual(fila.estatisticas()["enviados"], 3)
+        fila.fechar()
+        self.assertEqual(fila.estatisticas()["rejeitados"], 1)
+
+        fila = FilaIngestao(self.gerenciador, capacidade=1, tamanho_lote=1, espera=0.0,
+                            timeout=0.05)
+        enviados = []
+        with fila.trava:
+            with self.assertRaises(FilaCheiaError):
+                for i in range(10):
+                    enviados.append(fila.criar_tarefa("Portal", f"B{i}", "", "Ana"))
+            fila._timeout = None
+            produtor = threading.Thread(
+                target=lambda: enviados.append(fila.criar_tarefa("Portal", "Final", "", "Ana")))
+            produtor.start()
+            produtor.join(0.05)
+            self.assertTrue(produtor.is_alive())
+        produtor.join(5)
+        fila.fechar()
+        self.assertTrue(all(futuro.done() for futuro in enviados))
+        self.assertIsNotNone(self.gerenciador.buscar_tarefa("Final"))
+        self.assertGreaterEqual(fila.estatisticas()["contrapressao"], 2)
+
+    def test_produtores_concorrentes(self):
+        """Testa vários produtores criando e concluindo tarefas pela mesma fila"""
+        fila = FilaIngestao(self.gerenciador, capacidade=50, tamanho_lote=16)
+        falhas = []
+
+        def produzir(p: int) -> None:
+            futuros = []
+            for i in range(100):
+                futuros.append(fila.criar_tarefa("Portal", f"P{p}-{i}", "", "Ana"))
+                if i % 2:
+                    futuros.append(fila.concluir_tarefa("Portal", f"P{p}-{i - 1}"))
+            falhas.extend(f.exception() for f in futuros if f.exception() is not None)
+
+        produtores = [threading.Thread(target=produzir, args=(p,)) for p in range(4)]
+        for produtor in produtores:
+            produtor.start()
+        for produtor in produtores:
+            produtor.join()
+        with fila.trava:
+            cancelado = fila.criar_tarefa("Portal", "Cancelada", "", "Ana")
+            self.assertTrue(cancelado.cancel())
+        fila.fechar()
+        self.assertEqual(falhas, [])
+        relatorio = self.gerenciador.relatorio_projeto("Portal")
+        self.assertEqual((relatorio["total_tarefas"], relatorio["tarefas_concluidas"]), (400, 200))
+        self.assertIsNone(self.gerenciador.buscar_tarefa("Cancelada"))
+        estatisticas = fila.estatisticas()
+        self.assertEqual((estatisticas["aplicados"], estatisticas["cancelados"]), (600, 1))
+        self.assertGreater(estatisticas["ops_por_segundo"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import random
+import unittest
+from datetime import date, timedelta
+from modelo.intervalos import ArvoreIntervalos
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+
+class TestArvoreIntervalos(unittest.TestCase):
+    """Testes para a árvore de intervalos"""
+    
+    def test_consultas_conferem_com_varredura(self):
+        """Compara sobreposição e perfuração com uma varredura simples"""
+        aleatorio = random.Random(3)
+        arvore = ArvoreIntervalos()
+        intervalos = {}
+        for i in range(500):
+            inicio = aleatorio.randint(0, 1000)
+            intervalos[i] = (inicio, inicio + aleatorio.randint(0, 60))
+            arvore.inserir(i, *intervalos[i])
+        for i in range(0, 500, 3):
+            arvore.remover(i)
+            del intervalos[i]
+        
+        for _ in range(100):
+            a = aleatorio.randint(0, 1100)
+            b = a + aleatorio.randint(0, 30)
+            esperado = {i for i, (ini, fim) in intervalos.items() if ini <= b and fim >= a}
+            self.assertEqual(set(arvore.sobrepostos(a, b)), esperado)
+            self.assertEqual(set(arvore.contendo(a)),
+                             {i for i, (ini, fim) in intervalos.items() if ini <= a <= fim})
+        self.assertEqual(len(arvore), len(intervalos))
+
+
+class TestCronogramaGerenciador(unittest.TestCase):
+    """Testes das consultas de cronograma do gerenciador"""
+    
+    def setUp(self):
+        self.hoje = date.today()
+        self.gerenciador = GerenciadorProjetos()
+        self.gerenciador.adicionar_projeto(
+            Projeto("Portal", "Portal", self.hoje + timedelta(days=30)))
+        self.gerenciador.cadastrar_membro(Membro("Ana", "Dev"))
+        self.gerenciador.adicionar_membro_projeto("Portal", "Ana")
+        self.curta = self.gerenciador.criar_tarefa(
+            "Portal", "Curta", "Descrição", "Ana", prazo=self.hoje + timedelta(days=2))
+        self.longa = self.gerenciador.criar_tarefa(
+            "Portal", "Longa", "Descrição", "Ana", prazo=self.hoje + timedelta(days=20))
+    
+    def test_consultas_por_periodo(self):
+        """Testa as consultas de sobreposição e de perfuração"""
+        daqui_10 = self.hoje + timedelta(days=10)
+        self.assertEqual(self.gerenciador.tarefas_ativas_em(daqui_10), [self.longa])
+        self.assertEqual(len(self.gerenciador.tarefas_ativas_entre(self.hoje, daqui_10)), 2)
+        self.assertEqual(len(self.gerenciador.projetos_ativos_em(daqui_10)), 1)
+        self.assertEqual(self.gerenciador.projetos_ativos_em(self.hoje + timedelta(days=31)), [])
+        self.assertEqual(self.gerenciador.carga_membro_no_dia("Ana", self.hoje), 2)
+    
+    def test_conclusao_encerra_periodo(self):
+        """Testa que concluir uma tarefa atualiza o índice"""
+        self.gerenciador.concluir_tarefa("Portal", "Longa")
+        amanha = self.hoje + timedelta(days=1)
+        self.assertEqual(self.gerenciador.tarefas_ativas_em(amanha), [self.curta])
+        self.curta.concluir()
+        self.assertEqual(self.gerenciador.carga_membro_no_dia("Ana", amanha), 0)
+        self.assertEqual(self.gerenciador.carga_membro_no_dia("Ana", self.hoje), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from modelo.memoria import ORCAMENTOS_PADRAO, perfil_memoria, verificar_orcamentos
+
+class TestMemoria(unittest.TestCase):
+    """Orçamentos de memória por entidade (falham em regressões de tamanho)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.perfil = perfil_memoria(projetos=40, membros=20, tarefas_por_projeto=25)
+
+    def test_entidades_dentro_do_orcamento(self):
+        """Testa o custo por Tarefa, Membro, Projeto e vínculo contra os orçamentos padrão"""
+        self.assertEqual(verificar_orcamentos(self.perfil), [])
+        for entidade in ORCAMENTOS_PADRAO:
+            self.assertGreater(self.perfil["bytes_por_entidade"][entidade], 0)
+
+    def test_detalhamento_por_colecao(self):
+        """Testa que o detalhamento cobre índices do gerenciador e estruturas dos projetos"""
+        colecoes = self.perfil["colecoes"]
+        for chave in ("objetos.Tarefa", "GerenciadorProjetos._cronograma",
+                      "GerenciadorProjetos._historico", "Projeto._tarefas_por_titulo",
+                      "Membro._tarefas_atribuidas"):
+            self.assertGreater(colecoes[chave], 0, chave)
+        self.assertEqual(list(colecoes.values()), sorted(colecoes.values(), reverse=True))
+        self.assertLessEqual(sum(colecoes.values()), self.perfil["total_bytes"] * 1.2)
+        self.assertIn("modelo/gerenciador.py", self.perfil["alocacoes_por_arquivo"])
+
+    def test_violacao_reportada(self):
+        """Testa que um orçamento apertado vira uma violação legível"""
+        violacoes = verificar_orcamentos(self.perfil, {"Tarefa": 10})
+        self.assertEqual(len(violacoes), 1)
+        self.assertTrue(violacoes[0].startswith("Tarefa: "))
+
+
+if __name__ == '__main__':
+    unittest.main()
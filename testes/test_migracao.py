@@ -0,0 +1,95 @@
+import unittest
+from datetime import date
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.membro import Membro
+from modelo.tarefa import Tarefa
+from modelo.migracao import MigradorLegado, migrar_projetos_legados
+from refatoracao import entidades_principais as legado
+
+class TestMigracao(unittest.TestCase):
+    """Testes para a migração das entidades legadas"""
+
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.portal = legado.Projeto("Portal", "2030-06-30", "Site")
+        self.portal.adicionar_membro("Ana", "Dev")
+        self.portal.adicionar_membro("Bruno", "QA")
+        self.portal.adicionar_tarefa("Login", "Tela de login", "Ana")
+        self.portal.adicionar_tarefa("Testes", "Roteiro", self.portal.membros[1])
+        self.portal.tarefas[0].concluir()
+        self.app = legado.Projeto("App", "31/12/2030", "Aplicativo")
+        self.app.adicionar_membro("ana", "Dev")
+        self.app.adicionar_tarefa("Push", "Notificações", "ANA")
+
+    def test_migra_grafos_e_deduplica_membros(self):
+        """Testa projetos, membros deduplicados por nome e status convertidos"""
+        relatorio = migrar_projetos_legados(self.gerenciador, iter([self.portal, self.app]))
+        self.assertEqual((relatorio.projetos, relatorio.membros, relatorio.tarefas), (2, 2, 3))
+        self.assertEqual(relatorio.anomalias, {})
+        self.assertEqual([m.nome for m in self.gerenciador.membros], ["Ana", "Bruno"])
+        self.assertEqual(self.gerenciador.buscar_projeto("Portal").prazo, date(2030, 6, 30))
+        self.assertEqual(self.gerenciador.buscar_projeto("App").prazo, date(2030, 12, 31))
+        self.assertEqual(self.gerenciador.buscar_tarefa("Login").status, Tarefa.STATUS_CONCLUIDA)
+        self.assertEqual(self.gerenciador.relatorio_membro("Ana")["projetos"], ["Portal", "App"])
+        self.assertEqual(self.gerenciador.relatorio_projeto("Portal")["tarefas_concluidas"], 1)
+
+    def test_anomalias_contadas_sem_abortar(self):
+        """Testa que dados inconsistentes são corrigidos ou ignorados e contados"""
+        self.gerenciador.cadastrar_membro(Membro("Ana", "Gerente"))
+        estranho = legado.Projeto("Estranho", "amanhã", "Dados ruins")
+        estranho.adicionar_membro("Ana", "Dev")
+        estranho.adicionar_membro("Ana", "Dev")
+        estranho.adicionar_tarefa("Sem dono", "", None)
+        estranho.adicionar_tarefa("Externa", "", "Carla")
+        estranho.adicionar_tarefa("Bloqueada", "", "Ana")
+        estranho.tarefas[-1].status = "bloqueada"
+        migrador = MigradorLegado(self.gerenciador)
+        relatorio = migrador.migrar([estranho, legado.Projeto("estranho", None, "Repetido")])
+        self.assertEqual(relatorio.anomalias, {
+            "prazo_invalido": 1, "funcao_divergente": 2, "membro_repetido": 1,
+            "responsavel_invalido": 1, "responsavel_fora_do_projeto": 1,
+            "status_desconhecido": 1, "projeto_existente": 1})
+        self.assertEqual((relatorio.projetos, relatorio.membros, relatorio.tarefas), (1, 1, 2))
+        self.assertIsNone(self.gerenciador.buscar_projeto("Estranho").prazo)
+        self.assertEqual(self.gerenciador.buscar_membro("Ana").funcao, "Gerente")
+        self.assertEqual(self.gerenciador.buscar_tarefa("Bloqueada").status,
+                         Tarefa.STATUS_PENDENTE)
+
+    def test_nomes_e_titulos_que_nao_sao_texto(self):
+        """Testa que nomes e títulos ausentes ou não textuais viram anomalias"""
+        projeto = legado.Projeto("Portal", None, "Site")
+        projeto.adicionar_membro("Ana", "Dev")
+        projeto.adicionar_membro(None, "QA")
+        projeto.adicionar_membro(42, "QA")
+        projeto.adicionar_tarefa(None, "Sem título", "Ana")
+        projeto.adicionar_tarefa("   ", "Só espaços", "Ana")
+        projeto.adicionar_tarefa(7, "Número", "Ana")
+        projeto.adicionar_tarefa("Login", "Tela", "Ana")
+        relatorio = migrar_projetos_legados(
+            self.gerenciador, [projeto, legado.Projeto(None, None, "Sem nome")])
+        self.assertEqual(relatorio.anomalias, {
+            "membro_sem_nome": 2, "tarefa_sem_titulo": 3, "projeto_sem_nome": 1})
+        self.assertEqual((relatorio.projetos, relatorio.membros, relatorio.tarefas), (1, 1, 1))
+        self.assertEqual([t.titulo for t in self.gerenciador.tarefas], ["Login"])
+
+    def test_fluxo_em_lotes_e_vazao(self):
+        """Testa que um gerador grande é consumido em lotes com relatório acumulado"""
+        def gerar(inicio, fim):
+            for i in range(inicio, fim):
+                projeto = legado.Projeto(f"P{i}", None, "")
+                projeto.adicionar_membro(f"Membro {i % 7}", "Dev")
+                for t in range(20):
+                    projeto.adicionar_tarefa(f"T{i}-{t}", "", f"membro {i % 7}")
+                yield projeto
+
+        migrador = MigradorLegado(self.gerenciador)
+        migrador.migrar(gerar(0, 50))
+        relatorio = migrador.migrar(gerar(50, 100))
+        self.assertEqual((relatorio.projetos, relatorio.membros, relatorio.tarefas),
+                         (100, 7, 2000))
+        self.assertGreater(relatorio.tarefas_por_segundo, 0)
+        self.assertEqual(relatorio.resumo()["anomalias"], {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+from datetime import date, timedelta
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+
+class TestPainelOperacional(unittest.TestCase):
+    """Testes para a visão materializada do portfólio"""
+    
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.gerenciador.adicionar_projeto(Projeto("Portal", "Portal"))
+        for nome, funcao in [("Ana", "Dev"), ("Bruno", "Designer")]:
+            self.gerenciador.cadastrar_membro(Membro(nome, funcao))
+            self.gerenciador.adicionar_membro_projeto("Portal", nome)
+        self.gerenciador.criar_tarefa("Portal", "Antiga", "Descrição", "Ana", prioridade=2,
+                                      prazo=date.today() - timedelta(days=2))
+        self.painel = self.gerenciador.criar_painel()
+        self.eventos = []
+        self.painel.assinar(lambda painel, evento: self.eventos.append(evento))
+    
+    def test_atualizacao_incremental(self):
+        """Testa que as mutações do gerenciador alimentam a visão"""
+        projeto = self.gerenciador.buscar_projeto("Portal")
+        self.gerenciador.criar_tarefa("Portal", "Nova", "Descrição", "Bruno", prioridade=5)
+        self.assertEqual(self.painel.abertas_por_prioridade(), {2: 1, 5: 1})
+        self.assertEqual(self.painel.abertas_por_funcao(), {"Dev": 1, "Designer": 1})
+        self.assertEqual(self.painel.atrasadas(), 1)
+        
+        self.gerenciador.concluir_tarefa("Portal", "Antiga")
+        self.assertEqual(self.painel.percentual_conclusao(projeto), 50.0)
+        self.assertEqual(self.painel.atrasadas(), 0)
+        self.gerenciador.reatribuir_tarefa("Portal", "Nova", "Ana")
+        self.assertEqual(self.painel.abertas_por_funcao(), {"Dev": 1})
+        self.assertEqual(self.eventos, ["tarefa_adicionada", "status_alterado", "responsavel_alterado"])
+    
+    def test_reconstrucao_confere(self):
+        """Testa a verificação contra uma reconstrução completa"""
+        self.gerenciador.criar_tarefa("Portal", "Outra", "Descrição", "Ana")
+        self.gerenciador.remover_membro_projeto("Portal", "Bruno")
+        self.gerenciador.remover_tarefa("Portal", "Antiga")
+        self.assertEqual(self.painel.membros_por_funcao(), {"Dev": 1})
+        self.assertTrue(self.painel.verificar(self.gerenciador.projetos))
+        self.gerenciador.remover_painel(self.painel)
+        self.gerenciador.criar_tarefa("Portal", "Ignorada", "Descrição", "Ana")
+        self.assertFalse(self.painel.verificar(self.gerenciador.projetos))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from datetime import date, timedelta
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.particionamento import GerenciadorParticionado
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+from modelo.excecoes import ProjetoNaoEncontradoError, TarefaNaoEncontradaError
+
+class TestGerenciadorParticionado(unittest.TestCase):
+    """Testes para o gerenciador com projetos repartidos entre processos"""
+
+    def setUp(self):
+        self.particionado = GerenciadorParticionado(particoes=3)
+
+    def tearDown(self):
+        self.particionado.fechar()
+
+    def _popular(self, gerenciador):
+        ontem = date.today() - timedelta(days=1)
+        for nome in ("Ana", "Bia"):
+            gerenciador.cadastrar_membro(Membro(nome, "Dev"))
+        for i in range(6):
+            nome = f"Projeto {i}"
+            gerenciador.adicionar_projeto(Projeto(nome, "Desc"))
+            gerenciador.adicionar_membro_projeto(nome, "Ana")
+            gerenciador.criar_tarefa(nome, "Login", "Tela", "Ana", prazo=ontem)
+            gerenciador.criar_tarefa(nome, "Deploy", "CI", "Ana")
+            gerenciador.iniciar_tarefa(nome, "Deploy")
+            if i % 2:
+                gerenciador.concluir_tarefa(nome, "Login")
+
+    def test_mesmo_resultado_de_um_gerenciador(self):
+        """Testa que o relatório espalhado entre partições bate com o de um só processo"""
+        unico = GerenciadorProjetos()
+        self._popular(unico)
+        self._popular(self.particionado)
+        self.assertGreater(len({self.particionado.particao_do_projeto(p.nome)
+                                for p in self.particionado.projetos}), 1)
+        esperado = unico.relatorio_membro("Ana")
+        obtido = self.particionado.relatorio_membro("Ana")
+        self.assertEqual(sorted(obtido.pop("projetos")), sorted(esperado.pop("projetos")))
+        self.assertEqual(obtido, esperado)
+        self.assertEqual(self.particionado.relatorio_projeto("Projeto 3"),
+                         unico.relatorio_projeto("Projeto 3"))
+        self.assertEqual(self.particionado.wip_por_dia(), unico.wip_por_dia())
+        self.assertEqual(len(self.particionado.tarefas_ativas_em(date.today())),
+                         len(unico.tarefas_ativas_em(date.today())))
+
+    def test_consultas_do_portfolio(self):
+        """Testa percentis, exportação e estatísticas reunidos das partições"""
+        unico = GerenciadorProjetos()
+        self._popular(unico)
+        self._popular(self.particionado)
+        chave = lambda d: (d["projeto"], d["titulo"], d["status"], d["prazo"])
+        self.assertEqual(sorted(map(chave, self.particionado.exportar_tarefas())),
+                         sorted(map(chave, unico.exportar_tarefas())))
+        por_projeto = self.particionado.percentis_tempo('lead', 'projeto', percentis=(50,))
+        self.assertEqual(sorted(por_projeto), ["Projeto 1", "Projeto 3", "Projeto 5"])
+        self.assertEqual(set(self.particionado.percentis_tempo(percentis=(50, 99))), {50, 99})
+        for nome in ("Projeto 0", "Projeto 1", "Projeto 1"):
+            self.particionado.relatorio_projeto(nome)
+        cache = self.particionado.estatisticas_cache()
+        self.assertEqual((cache["acertos"], cache["falhas"]), (1, 2))
+        self.assertAlmostEqual(cache["taxa_acerto"], 1 / 3)
+        self.assertEqual(self.particionado.estatisticas_armazenamento()["residentes"], 12)
+
+    def test_lote_devolve_resultados_e_erros_em_ordem(self):
+        """Testa que o lote mantém a ordem e devolve as exceções no lugar"""
+        self.particionado.cadastrar_membro(Membro("Caio", "QA"))
+        for nome in ("Alfa", "Beta", "Gama"):
+            self.particionado.adicionar_projeto(Projeto(nome, "Desc"))
+            self.particionado.adicionar_membro_projeto(nome, "Caio")
+        resultados = self.particionado.executar_lote(
+            [("criar_tarefa", (nome, f"T {nome}", "Desc", "Caio"), {})
+             for nome in ("Alfa", "Beta", "Gama")] +
+            [("concluir_tarefa", ("Beta", "Inexistente"), {})])
+        self.assertEqual([t.titulo for t in resultados[:3]], ["T Alfa", "T Beta", "T Gama"])
+        self.assertEqual(resultados[0].responsavel.nome, "Caio")
+        self.assertIsInstance(resultados[3], TarefaNaoEncontradaError)
+        self.assertEqual(resultados[3].titulo_tarefa, "Inexistente")
+
+    def test_erros_atravessam_processos(self):
+        """Testa que exceções das partições chegam com tipo e atributos"""
+        with self.assertRaises(ProjetoNaoEncontradoError) as contexto:
+            self.particionado.concluir_tarefa("Nenhum", "Login")
+        self.assertEqual(contexto.exception.nome_projeto, "Nenhum")
+        self.assertEqual(str(contexto.exception), "Projeto 'Nenhum' não encontrado")
+
+if __name__ == '__main__':
+    unittest.main()
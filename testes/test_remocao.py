@@ -0,0 +1,98 @@
+import gc
+import tracemalloc
+import unittest
+from datetime import date, timedelta
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+from modelo.excecoes import OperacaoTarefaError, ProjetoNaoEncontradoError
+
+class TestRemocaoEmCascata(unittest.TestCase):
+    """Testes para a exclusão e o arquivamento de projetos e tarefas"""
+    
+    def setUp(self):
+        self.gerenciador = GerenciadorProjetos()
+        self.membros = [Membro(f"Membro {i}", "Dev") for i in range(3)]
+        for membro in self.membros:
+            self.gerenciador.cadastrar_membro(membro)
+    
+    def _popular(self, nome: str, tarefas: int) -> Projeto:
+        projeto = Projeto(nome, "Descrição", date.today() + timedelta(days=30))
+        self.gerenciador.adicionar_projeto(projeto)
+        for membro in self.membros:
+            self.gerenciador.adicionar_membro_projeto(nome, membro.nome)
+        for i in range(tarefas):
+            self.gerenciador.criar_tarefa(
+                nome, f"{nome} T{i}", "Descrição", self.membros[i % 3].nome,
+                prazo=date.today() + timedelta(days=i % 20))
+        return projeto
+    
+    def test_remover_tarefa(self):
+        """Testa que a tarefa some do projeto, do responsável e das buscas"""
+        projeto = self._popular("Portal", 3)
+        tarefa = self.gerenciador.remover_tarefa("Portal", "portal t0")
+        self.assertNotIn(tarefa, projeto.tarefas)
+        self.assertNotIn(tarefa, self.membros[0].tarefas_atribuidas)
+        self.assertIsNone(self.gerenciador.buscar_tarefa("Portal T0"))
+        self.assertNotIn(tarefa, self.gerenciador.tarefas_ativas_em(date.today()))
+        self.assertEqual(self.gerenciador.relatorio_projeto("Portal")["total_tarefas"], 2)
+    
+    def test_remover_projeto_em_cascata(self):
+        """Testa a remoção de um projeto com todas as suas tarefas"""
+        self._popular("Portal", 6)
+        self._popular("Intranet", 2)
+        self.gerenciador.cadastrar_membro(Membro("Exclusivo", "Dev"))
+        self.gerenciador.adicionar_membro_projeto("Portal", "Exclusivo")
+        self.gerenciador.remover_projeto("Portal")
+        self.assertIsNone(self.gerenciador.buscar_projeto("Portal"))
+        self.assertEqual(len(self.gerenciador.tarefas), 2)
+        self.assertEqual(sum(len(m.tarefas_atribuidas) for m in self.membros), 2)
+        self.assertEqual(self.gerenciador.sugerir_projetos("por"), [])
+        with self.assertRaises(ProjetoNaoEncontradoError):
+            self.gerenciador.criar_tarefa_automatica("Portal", "X", "Descrição")
+        # Só Membro 2 ficou sem tarefas da Intranet; a carga do Portal foi retirada
+        escolhidos = [self.gerenciador.criar_tarefa_automatica(
+            "Intranet", f"Nova {i}", "Descrição").responsavel.nome for i in range(5)]
+        self.assertEqual(escolhidos[:2], ["Membro 2", "Membro 2"])
+        self.assertEqual(sorted(escolhidos), ["Membro 0", "Membro 1"] + ["Membro 2"] * 3)
+    
+    def test_arquivar_projeto_concluido(self):
+        """Testa que só projetos concluídos são arquivados"""
+        self._popular("Portal", 2)
+        with self.assertRaises(OperacaoTarefaError):
+            self.gerenciador.arquivar_projeto("Portal")
+        for tarefa in self.gerenciador.tarefas:
+            tarefa.concluir()
+        self.assertEqual(self.gerenciador.arquivar_projetos_concluidos(), ["Portal"])
+        self.assertEqual(self.gerenciador.relatorio_arquivado("portal")["tarefas_concluidas"], 2)
+        with self.assertRaises(ProjetoNaoEncontradoError):
+            self.gerenciador.relatorio_projeto("Portal")
+    
+    def test_memoria_volta_ao_patamar_inicial(self):
+        """Soak: ciclos de criação e remoção não fazem a memória crescer"""
+        def ciclo():
+            for p in range(5):
+                self._popular(f"Projeto {p}", 200)
+            for p in range(5):
+                self.gerenciador.remover_projeto(f"Projeto {p}")
+        
+        tracemalloc.start()
+        try:
+            # O primeiro ciclo dimensiona as tabelas internas dos dicionários
+            ciclo()
+            gc.collect()
+            base, _ = tracemalloc.get_traced_memory()
+            historico_base = self.gerenciador._historico.tamanho_em_bytes()
+            for _ in range(5):
+                ciclo()
+            gc.collect()
+            atual, pico = tracemalloc.get_traced_memory()
+            # O histórico de status é um log que só cresce, por definição
+            atual -= self.gerenciador._historico.tamanho_em_bytes() - historico_base
+        finally:
+            tracemalloc.stop()
+        self.assertGreater(pico - base, 200_000)
+        self.assertLess(atual - base, 32_000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,204 @@
+import os
+import tempfile
+import time
+import unittest
+from datetime import date, timedelta
+from multiprocessing import Pipe
+from multiprocessing.connection import Client, Listener
+from modelo.gerenciador import GerenciadorProjetos
+from modelo.eventos import Evento
+from modelo.replicacao import PrimarioReplicacao, Replica, aplicar_evento, gerar_instantaneo
+from modelo.tarefa import Tarefa
+from modelo.projeto import Projeto
+from modelo.membro import Membro
+
+class TestReplicacao(unittest.TestCase):
+    """Testes para as réplicas de leitura alimentadas pelo primário"""
+
+    def setUp(self):
+        self.primario = GerenciadorProjetos()
+        for nome in ("Ana", "Bia"):
+            self.primario.cadastrar_membro(Membro(nome, "Dev"))
+        self.primario.adicionar_projeto(
+            Projeto("Portal", "Portal", prazo=date.today() + timedelta(days=2)))
+        for nome in ("Ana", "Bia"):
+            self.primario.adicionar_membro_projeto("Portal", nome)
+        self.primario.criar_tarefa("Portal", "Épico", "Login", "Ana", estimativa_dias=2)
+        self.primario.criar_tarefa("Portal", "Tela", "Login", "Bia", estimativa_dias=3)
+        self.primario.criar_tarefa("Portal", "Feita", "Login", "Bia",
+                                   prazo=date.today() - timedelta(days=1))
+        self.primario.concluir_tarefa("Portal", "Feita")
+        self.primario.adicionar_dependencia("Portal", "Tela", "Épico")
+        self.primario.definir_tarefa_pai("Portal", "Tela", "Épico")
+        self.replicacao = PrimarioReplicacao(self.primario)
+        self.replicas = []
+
+    def tearDown(self):
+        self.replicacao.fechar()
+        for replica in self.replicas:
+            replica.fechar()
+
+    def _conectar(self):
+        local, remota = Pipe()
+        replica = Replica(remota)
+        self.replicacao.conectar(local)
+        self.replicas.append(replica)
+        return replica
+
+    def _alterar(self):
+        self.primario.remover_membro_projeto("Portal", "Bia")
+        self.primario.iniciar_tarefa("Portal", "Épico")
+        self.primario.buscar_tarefa("Tela").prazo = date.today() - timedelta(days=3)
+        self.primario.adicionar_projeto(Projeto("Antigo", "Antigo"))
+        self.primario.adicionar_membro_projeto("Antigo", "Ana")
+        self.primario.criar_tarefa("Antigo", "Única", "Fim", "Ana")
+        self.primario.concluir_tarefa("Antigo", "Única")
+        self.primario.arquivar_projeto("Antigo")
+
+    def _assert_igual(self, replica):
+        token = self.replicacao.token()
+        for nome in ("Ana", "Bia"):
+            self.assertEqual(replica.relatorio_membro(nome, token=token, timeout=5),
+                             self.primario.relatorio_membro(nome))
+        self.assertEqual(replica.relatorio_projeto("Portal"),
+                         self.primario.relatorio_projeto("Portal"))
+        self.assertEqual(replica.resumo_tarefa("Portal", "Épico"),
+                         self.primario.resumo_tarefa("Portal", "Épico"))
+        self.assertEqual([t.titulo for t in replica.caminho_critico("Portal")],
+                         [t.titulo for t in self.primario.caminho_critico("Portal")])
+        self.assertEqual(replica.relatorio_arquivado("Antigo"),
+                         self.primario.relatorio_arquivado("Antigo"))
+
+    def test_instantaneo_e_fluxo_por_socket_unix(self):
+        """Testa a réplica nova (instantâneo) seguida do fluxo de mutações"""
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "replicacao.sock")
+            with Listener(caminho, 'AF_UNIX') as ouvinte:
+                replica = Replica(Client(caminho, 'AF_UNIX'))
+                self.replicas.append(replica)
+                self.replicacao.aceitar(ouvinte)
+                self.primario.criar_tarefa("Portal", "Nova", "Depois", "Ana")
+                self._alterar()
+                self._assert_igual(replica)
+                self.assertEqual(replica.buscar_tarefa("Nova").responsavel.nome, "Ana")
+                self.assertEqual(replica.atraso()["eventos"], 0)
+
+    def test_reconexao_retoma_da_retencao(self):
+        """Testa que a réplica reconectada recebe só o que perdeu"""
+        replica = self._conectar()
+        self.assertTrue(replica.aguardar(self.replicacao.token(), timeout=5))
+        gerenciador = replica.gerenciador
+        replica.fechar()
+        self._alterar()
+        local, remota = Pipe()
+        replica.conectar(remota)
+        self.replicacao.conectar(local)
+        self._assert_igual(replica)
+        self.assertIs(replica.gerenciador, gerenciador)
+
+    def test_token_no_futuro_expira(self):
+        """Testa que a leitura com token ainda não aplicado não responde dado velho"""
+        replica = self._conectar()
+        with self.assertRaises(TimeoutError):
+            replica.relatorio_projeto("Portal", token=self.replicacao.token() + 1, timeout=0.1)
+        self.assertFalse(replica.aguardar(self.replicacao.token() + 1, timeout=0.05))
+
+    def test_titulos_repetidos_e_data_de_conclusao(self):
+        """Testa que eventos acham a tarefa pelo id e reproduzem a data de conclusão"""
+        self.primario.criar_tarefa("Portal", "T", "Primeira", "Ana")
+        segunda = self.primario.criar_tarefa("Portal", "T", "Segunda", "Bia")
+        replica = self._conectar()
+        self.primario.concluir_tarefa_por_id(segunda.id)
+        self.primario.remover_tarefa("Portal", "Feita")
+        self.assertTrue(replica.aguardar(self.replicacao.token(), timeout=5))
+        copia = replica.gerenciador.tarefa_por_id(segunda.id)
+        self.assertEqual((copia.descricao, copia.status), ("Segunda", Tarefa.STATUS_CONCLUIDA))
+        self.assertEqual([t.status for t in replica.gerenciador.tarefas if t.titulo == "T"],
+                         [Tarefa.STATUS_PENDENTE, Tarefa.STATUS_CONCLUIDA])
+        self.assertIsNone(replica.gerenciador.buscar_tarefa("Feita"))
+
+        hoje = date.today()
+        gerenciador = GerenciadorProjetos()
+        for tipo, dados in gerar_instantaneo(self.primario).eventos:
+            aplicar_evento(gerenciador, tipo, dados)
+        aplicar_evento(gerenciador, Evento.TAREFA_CRIADA, {
+            "projeto": "Portal", "id": None, "titulo": "Antiga", "descricao": "",
+            "responsavel": "Ana", "prazo": None, "prioridade": 1, "estimativa_dias": 1,
+            "data_criacao": hoje - timedelta(days=30)})
+        aplicar_evento(gerenciador, Evento.TAREFA_CONCLUIDA, {
+            "projeto": "Portal", "titulo": "Antiga", "status": Tarefa.STATUS_CONCLUIDA,
+            "anterior": Tarefa.STATUS_PENDENTE, "data_conclusao": hoje - timedelta(days=15)})
+        self.assertEqual(gerenciador.buscar_tarefa("Antiga").data_conclusao,
+                         hoje - timedelta(days=15))
+        self.assertNotIn("Antiga", [t.titulo for t in
+                                    gerenciador.tarefas_ativas_em(hoje - timedelta(days=5))])
+        self.assertIn("Antiga", [t.titulo for t in
+                                 gerenciador.tarefas_ativas_em(hoje - timedelta(days=20))])
+
+    def test_evento_invalido_diverge_e_reconecta(self):
+        """Testa que uma falha ao aplicar é registrada e a reconexão traz um instantâneo"""
+        replica = self._conectar()
+        self.assertTrue(replica.aguardar(self.replicacao.token(), timeout=5))
+        # A réplica perde uma tarefa que o primário ainda vai alterar
+        local = replica.gerenciador
+        local._remover_tarefa(local.buscar_projeto("Portal"), local.buscar_tarefa("Épico"))
+        self._alterar()
+        self.assertFalse(replica.aguardar(self.replicacao.token(), timeout=5))
+        replica._receptor.join(5)
+        self.assertFalse(replica.conectada)
+        self.assertEqual(replica.falha["erro"], "TarefaNaoEncontradaError")
+        self.assertTrue(replica.atraso()["divergente"])
+        with self.assertRaises(RuntimeError):
+            replica.relatorio_projeto("Portal", token=self.replicacao.token(), timeout=5)
+        local, remota = Pipe()
+        replica.conectar(remota)
+        self.replicacao.conectar(local)
+        self._assert_igual(replica)
+        self.assertIsNone(replica.falha)
+    def test_ids_de_projetos_e_membros_apos_remocao(self):
+        """Testa que réplicas (fluxo e instantâneo) mantêm os ids do primário"""
+        replica = self._conectar()
+        for nome in ("A", "B", "C"):
+            self.primario.adicionar_projeto(Projeto(nome, nome))
+        self.primario.remover_projeto("A")
+        self.primario.adicionar_projeto(Projeto("D", "D"))
+        self.primario.cadastrar_membro(Membro("Caio", "QA"))
+        nova = self._conectar()
+        token = self.replicacao.token()
+        for copia in (replica, nova):
+            self.assertTrue(copia.aguardar(token, timeout=5))
+            for projeto in self.primario.projetos:
+                self.assertEqual(copia.relatorio_projeto_por_id(projeto.id),
+                                 self.primario.relatorio_projeto_por_id(projeto.id))
+            for membro in self.primario.membros:
+                self.assertEqual(copia.relatorio_membro_por_id(membro.id),
+                                 self.primario.relatorio_membro_por_id(membro.id))
+
+    def test_reconexao_muito_atrasada_recebe_instantaneo(self):
+        """Testa que a réplica atrasada além da fila recebe instantâneo sem travar o primário"""
+        replicacao = PrimarioReplicacao(self.primario, capacidade_fila=10, espera_maxima=0.2)
+        local, remota = Pipe()
+        replica = Replica(remota)
+        replicacao.conectar(local)
+        self.assertTrue(replica.aguardar(replicacao.token(), timeout=5))
+        replica.fechar()
+        self.assertTrue(replica.atraso()["atrasada"])
+        self.assertFalse(replica.atraso()["conectada"])
+        for i in range(30):
+            self.primario.criar_tarefa("Portal", f"Nova {i}", "", "Ana")
+        local, remota = Pipe()
+        replica.conectar(remota)
+        inicio = time.perf_counter()
+        replicacao.conectar(local)
+        self.assertLess(time.perf_counter() - inicio, 1.0)
+        self.assertTrue(replica.aguardar(replicacao.token(), timeout=5))
+        self.assertEqual(replica.relatorio_projeto("Portal"),
+                         self.primario.relatorio_projeto("Portal"))
+        atraso = replica.atraso()
+        self.assertEqual((atraso["seq_primario"], atraso["eventos"], atraso["atrasada"]),
+                         (replicacao.token(), 0, False))
+        replica.fechar()
+        replicacao.fechar()
+
+if __name__ == '__main__':
+    unittest.main()